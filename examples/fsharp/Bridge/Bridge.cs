@@ -32,6 +32,7 @@ namespace Npp.DotNet.Plugin.FSharp.Demo
         [UnmanagedCallersOnly(EntryPoint = "beNotified", CallConvs = new[] { typeof(CallConvCdecl) })]
         internal unsafe static void BeNotified(ScNotification* notification)
         {
+            ScintillaGateway.OnNotification(*notification);
             Instance.OnBeNotified(*notification);
         }
 
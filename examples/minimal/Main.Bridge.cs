@@ -24,6 +24,7 @@ namespace Npp.DotNet.Plugin.Demo
         [UnmanagedCallersOnly(EntryPoint = "beNotified", CallConvs = new[] { typeof(CallConvCdecl) })]
         internal unsafe static void BeNotified(ScNotification* notification)
         {
+            ScintillaGateway.OnNotification(*notification);
             Instance.OnBeNotified(*notification);
         }
 
@@ -0,0 +1,136 @@
+﻿/*
+ * SPDX-FileCopyrightText: 2026 Robert Di Pardo <dipardo.r@gmail.com>
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+#if NETCOREAPP
+using System;
+using System.Buffers;
+
+namespace Npp.DotNet.Plugin
+{
+    /// <summary>
+    /// A read-only view of the text of a Scintilla document, read straight from the editor's own buffer without copying it.
+    /// </summary>
+    /// <remarks>
+    /// A view is valid until its document is modified, until Notepad++ activates another buffer or the window is given
+    /// another document, or until the viewed text moves in memory, which happens when Scintilla's gap moves across it.
+    /// Reading a view only checks for the notifications passed to <see cref="ScintillaGateway.OnNotification"/>;
+    /// call <see cref="Revalidate"/> after anything that may have changed the document without one.
+    /// Reading an invalid view throws an <see cref="InvalidOperationException"/>, but a span that was read
+    /// before the view became invalid can't be checked: don't keep one across calls that may modify the document.
+    /// <para>
+    /// The text belongs to Scintilla and must never be written, even though <see cref="MemoryManager{T}.Memory"/> is writable.
+    /// Views are created by <see cref="ScintillaGateway.GetDocumentView()"/> and
+    /// <see cref="ScintillaGateway.GetDocumentView(Scintilla.Position, Scintilla.Position)"/>.
+    /// </para>
+    /// </remarks>
+    public sealed unsafe class DocumentView : MemoryManager<byte>
+    {
+        private readonly ScintillaGateway _gateway;
+        private readonly byte* _text;
+        private readonly long _start;
+        private readonly int _length;
+        private readonly bool _wholeDocument;
+        private readonly IntPtr _document;
+        private readonly long _documentLength;
+        private readonly long _generation;
+        private volatile bool _invalidated;
+
+        internal DocumentView(ScintillaGateway gateway, IntPtr text, long start, int length, bool wholeDocument,
+            IntPtr document, long documentLength, long generation)
+        {
+            _gateway = gateway;
+            _text = (byte*)text;
+            _start = start;
+            _length = length;
+            _wholeDocument = wholeDocument;
+            _document = document;
+            _documentLength = documentLength;
+            _generation = generation;
+        }
+
+        /// <summary>
+        /// The document position of the first byte of the view.
+        /// </summary>
+        public long Start => _start;
+
+        /// <summary>
+        /// The number of bytes in the view.
+        /// </summary>
+        public int Length => _length;
+
+        /// <summary>
+        /// <see langword="true"/> if no notification has invalidated the view since it was created,
+        /// and <see cref="Revalidate"/> hasn't found it invalid.
+        /// </summary>
+        /// <remarks>
+        /// Checking makes no calls to Scintilla, so it misses changes that aren't notified. Use <see cref="Revalidate"/> to find them.
+        /// </remarks>
+        public bool IsValid => !_invalidated && _generation == ScintillaGateway.DocumentGeneration;
+
+        /// <summary>
+        /// Checks with Scintilla that the viewed text is still where it was when the view was created.
+        /// Once found invalid, the view stays invalid.
+        /// </summary>
+        /// <remarks>
+        /// Checking costs three calls to Scintilla, since not every change is notified: edits made while
+        /// the modification event mask is off, or through another window sharing the document, and gap moves
+        /// caused by other views, are only found by comparing the document, its length and the address of the text
+        /// with those the view was created from.
+        /// Taking the address again moves Scintilla's gap out of the viewed range, like creating the view did.
+        /// </remarks>
+        /// <returns><see langword="true"/> if the view is still valid.</returns>
+        public bool Revalidate()
+        {
+            if (!IsValid)
+                return false;
+            IntPtr text = IntPtr.Zero;
+            if (_gateway.GetDocPointer() == _document && (long)_gateway.GetLength() == _documentLength)
+                text = _wholeDocument ? _gateway.GetCharacterPointer() : _gateway.GetRangePointer(_start, _length);
+            _invalidated = (byte*)text != _text;
+            return !_invalidated;
+        }
+
+        /// <summary>
+        /// The viewed text.
+        /// </summary>
+        /// <exception cref="InvalidOperationException">Thrown if the view is no longer valid.</exception>
+        public ReadOnlySpan<byte> Span => GetSpan();
+
+        /// <inheritdoc cref="Span"/>
+        public override Span<byte> GetSpan()
+        {
+            ThrowIfInvalid();
+            return new Span<byte>(_text, _length);
+        }
+
+        /// <summary>
+        /// Gets a pointer to the viewed text, which needs no pinning since Scintilla owns it.
+        /// </summary>
+        /// <exception cref="InvalidOperationException">Thrown if the view is no longer valid.</exception>
+        public override MemoryHandle Pin(int elementIndex = 0)
+        {
+            if ((uint)elementIndex > (uint)_length)
+                throw new ArgumentOutOfRangeException(nameof(elementIndex));
+            ThrowIfInvalid();
+            return new MemoryHandle(_text + elementIndex);
+        }
+
+        /// <inheritdoc/>
+        public override void Unpin() { }
+
+        /// <summary>
+        /// Does nothing: the text belongs to Scintilla.
+        /// </summary>
+        protected override void Dispose(bool disposing) { }
+
+        private void ThrowIfInvalid()
+        {
+            if (!IsValid)
+                throw new InvalidOperationException("The document has changed since the view was created");
+        }
+    }
+}
+#endif
@@ -9,6 +9,10 @@ using System;
 using Npp.DotNet.Plugin.Scintilla;
 using static Npp.DotNet.Plugin.Win32;
 
+#if NETCOREAPP
+using System.Buffers;
+#endif
+
 namespace Npp.DotNet.Plugin
 {
     using Accessibility = Scintilla.Accessibility;
@@ -43,19 +47,37 @@ namespace Npp.DotNet.Plugin
         /// <returns>A ScrollInfo struct with information of the current scroll state</returns>
         ScrollInfo GetScrollInfo(ScrollInfoMask mask = ScrollInfoMask.SIF_ALL, ScrollInfoBar scrollBar = ScrollInfoBar.SB_BOTH);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetDocumentView()"/>
+        DocumentView GetDocumentView();
+
+        /// <inheritdoc cref="ScintillaGateway.GetDocumentView(Position, Position)"/>
+        DocumentView GetDocumentView(Position start, Position lengthRange);
+#endif
+
         /* ++Autogenerated -- start of section automatically generated from Scintilla.iface */
-        /// <inheritdoc cref="ScintillaGateway.AddText"/>
+        /// <inheritdoc cref="ScintillaGateway.AddText(string)"/>
         void AddText(string text);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.AddText(ReadOnlySpan{byte})"/>
+        void AddText(ReadOnlySpan<byte> text);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.AddStyledText"/>
         unsafe void AddStyledText(Position length, Cells c);
 
         /// <inheritdoc cref="ScintillaGateway.InsertText"/>
         void InsertText(Position pos, string text);
 
-        /// <inheritdoc cref="ScintillaGateway.ChangeInsertion"/>
+        /// <inheritdoc cref="ScintillaGateway.ChangeInsertion(string)"/>
         void ChangeInsertion(string text);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.ChangeInsertion(ReadOnlySpan{byte})"/>
+        void ChangeInsertion(ReadOnlySpan<byte> text);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.ClearAll"/>
         void ClearAll();
 
@@ -71,6 +93,11 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.GetCharAt"/>
         int GetCharAt(Position pos);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetCharsInRange"/>
+        void GetCharsInRange(Position start, Span<byte> destination);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetCurrentPos"/>
         Position GetCurrentPos();
 
@@ -80,9 +107,19 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.GetStyleAt"/>
         int GetStyleAt(Position pos);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetStylesInRange"/>
+        void GetStylesInRange(Position start, Span<byte> destination);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetStyleIndexAt"/>
         int GetStyleIndexAt(Position pos);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetStyleIndicesInRange"/>
+        void GetStyleIndicesInRange(Position start, Span<byte> destination);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.Redo"/>
         void Redo();
 
@@ -95,9 +132,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetSavePoint"/>
         void SetSavePoint();
 
-        /// <inheritdoc cref="ScintillaGateway.GetStyledTextFull"/>
+        /// <inheritdoc cref="ScintillaGateway.GetStyledTextFull(TextRangeFull)"/>
         Position GetStyledTextFull(TextRangeFull tr);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetStyledTextFull(Position, Position, Span{byte})"/>
+        int GetStyledTextFull(Position start, Position end, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetStyledTextFull(Position, Position, IBufferWriter{byte})"/>
+        int GetStyledTextFull(Position start, Position end, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetStyledTextFull(Position, Position, ArrayPool{byte}, out int)"/>
+        byte[] GetStyledTextFull(Position start, Position end, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.CanRedo"/>
         bool CanRedo();
 
@@ -143,9 +191,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetAnchor"/>
         void SetAnchor(Position anchor);
 
-        /// <inheritdoc cref="ScintillaGateway.GetCurLine"/>
+        /// <inheritdoc cref="ScintillaGateway.GetCurLine()"/>
         string GetCurLine();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetCurLine(Span{byte})"/>
+        int GetCurLine(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetCurLine(IBufferWriter{byte})"/>
+        int GetCurLine(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetCurLine(ArrayPool{byte}, out int)"/>
+        byte[] GetCurLine(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetEndStyled"/>
         Position GetEndStyled();
 
@@ -197,9 +256,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetFontLocale"/>
         void SetFontLocale(string localeName);
 
-        /// <inheritdoc cref="ScintillaGateway.GetFontLocale"/>
+        /// <inheritdoc cref="ScintillaGateway.GetFontLocale()"/>
         string GetFontLocale();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetFontLocale(Span{byte})"/>
+        int GetFontLocale(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetFontLocale(IBufferWriter{byte})"/>
+        int GetFontLocale(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetFontLocale(ArrayPool{byte}, out int)"/>
+        byte[] GetFontLocale(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetIMEInteraction"/>
         IMEInteraction GetIMEInteraction();
 
@@ -353,9 +423,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.StyleGetSize"/>
         int StyleGetSize(int style);
 
-        /// <inheritdoc cref="ScintillaGateway.StyleGetFont"/>
+        /// <inheritdoc cref="ScintillaGateway.StyleGetFont(int)"/>
         string StyleGetFont(int style);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.StyleGetFont(int, Span{byte})"/>
+        int StyleGetFont(int style, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.StyleGetFont(int, IBufferWriter{byte})"/>
+        int StyleGetFont(int style, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.StyleGetFont(int, ArrayPool{byte}, out int)"/>
+        byte[] StyleGetFont(int style, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.StyleGetEOLFilled"/>
         bool StyleGetEOLFilled(int style);
 
@@ -413,9 +494,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.StyleSetInvisibleRepresentation"/>
         void StyleSetInvisibleRepresentation(int style, string representation);
 
-        /// <inheritdoc cref="ScintillaGateway.StyleGetInvisibleRepresentation"/>
+        /// <inheritdoc cref="ScintillaGateway.StyleGetInvisibleRepresentation(int)"/>
         string StyleGetInvisibleRepresentation(int style);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.StyleGetInvisibleRepresentation(int, Span{byte})"/>
+        int StyleGetInvisibleRepresentation(int style, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.StyleGetInvisibleRepresentation(int, IBufferWriter{byte})"/>
+        int StyleGetInvisibleRepresentation(int style, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.StyleGetInvisibleRepresentation(int, ArrayPool{byte}, out int)"/>
+        byte[] StyleGetInvisibleRepresentation(int style, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.SetElementColour"/>
         void SetElementColour(Element element, ColourAlpha colourElement);
 
@@ -502,9 +594,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetWordChars"/>
         void SetWordChars(string characters);
 
-        /// <inheritdoc cref="ScintillaGateway.GetWordChars"/>
+        /// <inheritdoc cref="ScintillaGateway.GetWordChars()"/>
         string GetWordChars();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetWordChars(Span{byte})"/>
+        int GetWordChars(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetWordChars(IBufferWriter{byte})"/>
+        int GetWordChars(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetWordChars(ArrayPool{byte}, out int)"/>
+        byte[] GetWordChars(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.SetCharacterCategoryOptimization"/>
         void SetCharacterCategoryOptimization(int countCharacters);
 
@@ -550,18 +653,34 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.PushUndoActionType"/>
         void PushUndoActionType(int type, Position pos);
 
-        /// <inheritdoc cref="ScintillaGateway.ChangeLastUndoActionText"/>
+        /// <inheritdoc cref="ScintillaGateway.ChangeLastUndoActionText(string)"/>
         void ChangeLastUndoActionText(string text);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.ChangeLastUndoActionText(ReadOnlySpan{byte})"/>
+        void ChangeLastUndoActionText(ReadOnlySpan<byte> text);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetUndoActionType"/>
         int GetUndoActionType(int action);
 
         /// <inheritdoc cref="ScintillaGateway.GetUndoActionPosition"/>
         Position GetUndoActionPosition(int action);
 
-        /// <inheritdoc cref="ScintillaGateway.GetUndoActionText"/>
+        /// <inheritdoc cref="ScintillaGateway.GetUndoActionText(int)"/>
         string GetUndoActionText(int action);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetUndoActionText(int, Span{byte})"/>
+        int GetUndoActionText(int action, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetUndoActionText(int, IBufferWriter{byte})"/>
+        int GetUndoActionText(int action, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetUndoActionText(int, ArrayPool{byte}, out int)"/>
+        byte[] GetUndoActionText(int action, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.IndicSetStyle"/>
         void IndicSetStyle(int indicator, IndicatorStyle indicatorStyle);
 
@@ -779,6 +898,11 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.GetColumn"/>
         Position GetColumn(Position pos);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetColumnsInRange"/>
+        void GetColumnsInRange(Position start, Span<Position> destination);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.CountCharacters"/>
         Position CountCharacters(Position start, Position end);
 
@@ -864,15 +988,37 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetSelectionSerialized"/>
         void SetSelectionSerialized(string selectionString);
 
-        /// <inheritdoc cref="ScintillaGateway.GetSelectionSerialized"/>
+        /// <inheritdoc cref="ScintillaGateway.GetSelectionSerialized()"/>
         string GetSelectionSerialized();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetSelectionSerialized(Span{byte})"/>
+        int GetSelectionSerialized(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetSelectionSerialized(IBufferWriter{byte})"/>
+        int GetSelectionSerialized(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetSelectionSerialized(ArrayPool{byte}, out int)"/>
+        byte[] GetSelectionSerialized(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetFirstVisibleLine"/>
         Position GetFirstVisibleLine();
 
-        /// <inheritdoc cref="ScintillaGateway.GetLine"/>
+        /// <inheritdoc cref="ScintillaGateway.GetLine(Position)"/>
         string GetLine(Position line);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetLine(Position, Span{byte})"/>
+        int GetLine(Position line, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetLine(Position, IBufferWriter{byte})"/>
+        int GetLine(Position line, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetLine(Position, ArrayPool{byte}, out int)"/>
+        byte[] GetLine(Position line, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetLineCount"/>
         Position GetLineCount();
 
@@ -897,12 +1043,34 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetSel"/>
         void SetSel(Position anchor, Position caret);
 
-        /// <inheritdoc cref="ScintillaGateway.GetSelText"/>
+        /// <inheritdoc cref="ScintillaGateway.GetSelText()"/>
         string GetSelText();
 
-        /// <inheritdoc cref="ScintillaGateway.GetTextRangeFull"/>
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetSelText(Span{byte})"/>
+        int GetSelText(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetSelText(IBufferWriter{byte})"/>
+        int GetSelText(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetSelText(ArrayPool{byte}, out int)"/>
+        byte[] GetSelText(ArrayPool<byte> pool, out int length);
+#endif
+
+        /// <inheritdoc cref="ScintillaGateway.GetTextRangeFull(TextRangeFull)"/>
         Position GetTextRangeFull(TextRangeFull tr);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetTextRangeFull(Position, Position, Span{byte})"/>
+        int GetTextRangeFull(Position start, Position end, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetTextRangeFull(Position, Position, IBufferWriter{byte})"/>
+        int GetTextRangeFull(Position start, Position end, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetTextRangeFull(Position, Position, ArrayPool{byte}, out int)"/>
+        byte[] GetTextRangeFull(Position start, Position end, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.HideSelection"/>
         void HideSelection(bool hide);
 
@@ -969,9 +1137,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetText"/>
         void SetText(string text);
 
-        /// <inheritdoc cref="ScintillaGateway.GetText"/>
+        /// <inheritdoc cref="ScintillaGateway.GetText()"/>
         string GetText();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetText(Span{byte})"/>
+        int GetText(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetText(IBufferWriter{byte})"/>
+        int GetText(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetText(ArrayPool{byte}, out int)"/>
+        byte[] GetText(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetTextLength"/>
         Position GetTextLength();
 
@@ -1023,27 +1202,58 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetTargetRange"/>
         void SetTargetRange(Position start, Position end);
 
-        /// <inheritdoc cref="ScintillaGateway.GetTargetText"/>
+        /// <inheritdoc cref="ScintillaGateway.GetTargetText()"/>
         string GetTargetText();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetTargetText(Span{byte})"/>
+        int GetTargetText(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetTargetText(IBufferWriter{byte})"/>
+        int GetTargetText(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetTargetText(ArrayPool{byte}, out int)"/>
+        byte[] GetTargetText(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.TargetFromSelection"/>
         void TargetFromSelection();
 
         /// <inheritdoc cref="ScintillaGateway.TargetWholeDocument"/>
         void TargetWholeDocument();
 
-        /// <inheritdoc cref="ScintillaGateway.ReplaceTarget"/>
+        /// <inheritdoc cref="ScintillaGateway.ReplaceTarget(string)"/>
         Position ReplaceTarget(string text);
 
-        /// <inheritdoc cref="ScintillaGateway.ReplaceTargetRE"/>
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.ReplaceTarget(ReadOnlySpan{byte})"/>
+        Position ReplaceTarget(ReadOnlySpan<byte> text);
+#endif
+
+        /// <inheritdoc cref="ScintillaGateway.ReplaceTargetRE(string)"/>
         Position ReplaceTargetRE(string text);
 
-        /// <inheritdoc cref="ScintillaGateway.ReplaceTargetMinimal"/>
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.ReplaceTargetRE(ReadOnlySpan{byte})"/>
+        Position ReplaceTargetRE(ReadOnlySpan<byte> text);
+#endif
+
+        /// <inheritdoc cref="ScintillaGateway.ReplaceTargetMinimal(string)"/>
         Position ReplaceTargetMinimal(string text);
 
-        /// <inheritdoc cref="ScintillaGateway.SearchInTarget"/>
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.ReplaceTargetMinimal(ReadOnlySpan{byte})"/>
+        Position ReplaceTargetMinimal(ReadOnlySpan<byte> text);
+#endif
+
+        /// <inheritdoc cref="ScintillaGateway.SearchInTarget(string)"/>
         Position SearchInTarget(string text);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.SearchInTarget(ReadOnlySpan{byte})"/>
+        Position SearchInTarget(ReadOnlySpan<byte> text);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.SetSearchFlags"/>
         void SetSearchFlags(FindOption searchFlags);
 
@@ -1137,9 +1347,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetDefaultFoldDisplayText"/>
         void SetDefaultFoldDisplayText(string text);
 
-        /// <inheritdoc cref="ScintillaGateway.GetDefaultFoldDisplayText"/>
+        /// <inheritdoc cref="ScintillaGateway.GetDefaultFoldDisplayText()"/>
         string GetDefaultFoldDisplayText();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetDefaultFoldDisplayText(Span{byte})"/>
+        int GetDefaultFoldDisplayText(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetDefaultFoldDisplayText(IBufferWriter{byte})"/>
+        int GetDefaultFoldDisplayText(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetDefaultFoldDisplayText(ArrayPool{byte}, out int)"/>
+        byte[] GetDefaultFoldDisplayText(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.FoldLine"/>
         void FoldLine(Position line, FoldAction action);
 
@@ -1266,9 +1487,14 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.GetVScrollBar"/>
         bool GetVScrollBar();
 
-        /// <inheritdoc cref="ScintillaGateway.AppendText"/>
+        /// <inheritdoc cref="ScintillaGateway.AppendText(string)"/>
         void AppendText(string text);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.AppendText(ReadOnlySpan{byte})"/>
+        void AppendText(ReadOnlySpan<byte> text);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetPhasesDraw"/>
         PhasesDraw GetPhasesDraw();
 
@@ -1290,9 +1516,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.GetMultiPaste"/>
         MultiPaste GetMultiPaste();
 
-        /// <inheritdoc cref="ScintillaGateway.GetTag"/>
+        /// <inheritdoc cref="ScintillaGateway.GetTag(int)"/>
         string GetTag(int tagNumber);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetTag(int, Span{byte})"/>
+        int GetTag(int tagNumber, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetTag(int, IBufferWriter{byte})"/>
+        int GetTag(int tagNumber, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetTag(int, ArrayPool{byte}, out int)"/>
+        byte[] GetTag(int tagNumber, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.LinesJoin"/>
         void LinesJoin();
 
@@ -1741,9 +1978,14 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.CopyRange"/>
         void CopyRange(Position start, Position end);
 
-        /// <inheritdoc cref="ScintillaGateway.CopyText"/>
+        /// <inheritdoc cref="ScintillaGateway.CopyText(string)"/>
         void CopyText(string text);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.CopyText(ReadOnlySpan{byte})"/>
+        void CopyText(ReadOnlySpan<byte> text);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.SetSelectionMode"/>
         void SetSelectionMode(SelectionMode selectionMode);
 
@@ -1819,24 +2061,57 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetWhitespaceChars"/>
         void SetWhitespaceChars(string characters);
 
-        /// <inheritdoc cref="ScintillaGateway.GetWhitespaceChars"/>
+        /// <inheritdoc cref="ScintillaGateway.GetWhitespaceChars()"/>
         string GetWhitespaceChars();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetWhitespaceChars(Span{byte})"/>
+        int GetWhitespaceChars(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetWhitespaceChars(IBufferWriter{byte})"/>
+        int GetWhitespaceChars(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetWhitespaceChars(ArrayPool{byte}, out int)"/>
+        byte[] GetWhitespaceChars(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.SetPunctuationChars"/>
         void SetPunctuationChars(string characters);
 
-        /// <inheritdoc cref="ScintillaGateway.GetPunctuationChars"/>
+        /// <inheritdoc cref="ScintillaGateway.GetPunctuationChars()"/>
         string GetPunctuationChars();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetPunctuationChars(Span{byte})"/>
+        int GetPunctuationChars(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetPunctuationChars(IBufferWriter{byte})"/>
+        int GetPunctuationChars(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetPunctuationChars(ArrayPool{byte}, out int)"/>
+        byte[] GetPunctuationChars(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.SetCharsDefault"/>
         void SetCharsDefault();
 
         /// <inheritdoc cref="ScintillaGateway.AutoCGetCurrent"/>
         int AutoCGetCurrent();
 
-        /// <inheritdoc cref="ScintillaGateway.AutoCGetCurrentText"/>
+        /// <inheritdoc cref="ScintillaGateway.AutoCGetCurrentText()"/>
         string AutoCGetCurrentText();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.AutoCGetCurrentText(Span{byte})"/>
+        int AutoCGetCurrentText(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.AutoCGetCurrentText(IBufferWriter{byte})"/>
+        int AutoCGetCurrentText(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.AutoCGetCurrentText(ArrayPool{byte}, out int)"/>
+        byte[] AutoCGetCurrentText(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.AutoCSetCaseInsensitiveBehaviour"/>
         void AutoCSetCaseInsensitiveBehaviour(CaseInsensitiveBehaviour behaviour);
 
@@ -1858,15 +2133,37 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.Allocate"/>
         void Allocate(Position bytes);
 
-        /// <inheritdoc cref="ScintillaGateway.TargetAsUTF8"/>
+        /// <inheritdoc cref="ScintillaGateway.TargetAsUTF8()"/>
         string TargetAsUTF8();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.TargetAsUTF8(Span{byte})"/>
+        int TargetAsUTF8(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.TargetAsUTF8(IBufferWriter{byte})"/>
+        int TargetAsUTF8(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.TargetAsUTF8(ArrayPool{byte}, out int)"/>
+        byte[] TargetAsUTF8(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.SetLengthForEncode"/>
         void SetLengthForEncode(Position bytes);
 
-        /// <inheritdoc cref="ScintillaGateway.EncodedFromUTF8"/>
+        /// <inheritdoc cref="ScintillaGateway.EncodedFromUTF8(string)"/>
         unsafe string EncodedFromUTF8(string utf8);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.EncodedFromUTF8(string, Span{byte})"/>
+        unsafe int EncodedFromUTF8(string utf8, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.EncodedFromUTF8(string, IBufferWriter{byte})"/>
+        unsafe int EncodedFromUTF8(string utf8, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.EncodedFromUTF8(string, ArrayPool{byte}, out int)"/>
+        unsafe byte[] EncodedFromUTF8(string utf8, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.FindColumn"/>
         Position FindColumn(Position line, Position column);
 
@@ -1885,9 +2182,14 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.GetPasteConvertEndings"/>
         bool GetPasteConvertEndings();
 
-        /// <inheritdoc cref="ScintillaGateway.ReplaceRectangular"/>
+        /// <inheritdoc cref="ScintillaGateway.ReplaceRectangular(string)"/>
         void ReplaceRectangular(string text);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.ReplaceRectangular(ReadOnlySpan{byte})"/>
+        void ReplaceRectangular(ReadOnlySpan<byte> text);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.SelectionDuplicate"/>
         void SelectionDuplicate();
 
@@ -1929,6 +2231,11 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.IndicatorValueAt"/>
         int IndicatorValueAt(int indicator, Position pos);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.IndicatorValuesInRange"/>
+        void IndicatorValuesInRange(int indicator, Position start, Span<int> destination);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.IndicatorStart"/>
         Position IndicatorStart(int indicator, Position pos);
 
@@ -1956,9 +2263,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetCopySeparator"/>
         void SetCopySeparator(string separator);
 
-        /// <inheritdoc cref="ScintillaGateway.GetCopySeparator"/>
+        /// <inheritdoc cref="ScintillaGateway.GetCopySeparator()"/>
         string GetCopySeparator();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetCopySeparator(Span{byte})"/>
+        int GetCopySeparator(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetCopySeparator(IBufferWriter{byte})"/>
+        int GetCopySeparator(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetCopySeparator(ArrayPool{byte}, out int)"/>
+        byte[] GetCopySeparator(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetCharacterPointer"/>
         IntPtr GetCharacterPointer();
 
@@ -1998,9 +2316,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.MarginSetText"/>
         void MarginSetText(Position line, string text);
 
-        /// <inheritdoc cref="ScintillaGateway.MarginGetText"/>
+        /// <inheritdoc cref="ScintillaGateway.MarginGetText(Position)"/>
         string MarginGetText(Position line);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.MarginGetText(Position, Span{byte})"/>
+        int MarginGetText(Position line, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.MarginGetText(Position, IBufferWriter{byte})"/>
+        int MarginGetText(Position line, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.MarginGetText(Position, ArrayPool{byte}, out int)"/>
+        byte[] MarginGetText(Position line, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.MarginSetStyle"/>
         void MarginSetStyle(Position line, int style);
 
@@ -2010,9 +2339,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.MarginSetStyles"/>
         void MarginSetStyles(Position line, string styles);
 
-        /// <inheritdoc cref="ScintillaGateway.MarginGetStyles"/>
+        /// <inheritdoc cref="ScintillaGateway.MarginGetStyles(Position)"/>
         string MarginGetStyles(Position line);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.MarginGetStyles(Position, Span{byte})"/>
+        int MarginGetStyles(Position line, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.MarginGetStyles(Position, IBufferWriter{byte})"/>
+        int MarginGetStyles(Position line, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.MarginGetStyles(Position, ArrayPool{byte}, out int)"/>
+        byte[] MarginGetStyles(Position line, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.MarginTextClearAll"/>
         void MarginTextClearAll();
 
@@ -2031,9 +2371,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.AnnotationSetText"/>
         void AnnotationSetText(Position line, string text);
 
-        /// <inheritdoc cref="ScintillaGateway.AnnotationGetText"/>
+        /// <inheritdoc cref="ScintillaGateway.AnnotationGetText(Position)"/>
         string AnnotationGetText(Position line);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.AnnotationGetText(Position, Span{byte})"/>
+        int AnnotationGetText(Position line, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.AnnotationGetText(Position, IBufferWriter{byte})"/>
+        int AnnotationGetText(Position line, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.AnnotationGetText(Position, ArrayPool{byte}, out int)"/>
+        byte[] AnnotationGetText(Position line, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.AnnotationSetStyle"/>
         void AnnotationSetStyle(Position line, int style);
 
@@ -2043,9 +2394,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.AnnotationSetStyles"/>
         void AnnotationSetStyles(Position line, string styles);
 
-        /// <inheritdoc cref="ScintillaGateway.AnnotationGetStyles"/>
+        /// <inheritdoc cref="ScintillaGateway.AnnotationGetStyles(Position)"/>
         string AnnotationGetStyles(Position line);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.AnnotationGetStyles(Position, Span{byte})"/>
+        int AnnotationGetStyles(Position line, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.AnnotationGetStyles(Position, IBufferWriter{byte})"/>
+        int AnnotationGetStyles(Position line, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.AnnotationGetStyles(Position, ArrayPool{byte}, out int)"/>
+        byte[] AnnotationGetStyles(Position line, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.AnnotationGetLines"/>
         int AnnotationGetLines(Position line);
 
@@ -2334,9 +2696,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetRepresentation"/>
         void SetRepresentation(string encodedCharacter, string representation);
 
-        /// <inheritdoc cref="ScintillaGateway.GetRepresentation"/>
+        /// <inheritdoc cref="ScintillaGateway.GetRepresentation(string)"/>
         unsafe string GetRepresentation(string encodedCharacter);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetRepresentation(string, Span{byte})"/>
+        unsafe int GetRepresentation(string encodedCharacter, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetRepresentation(string, IBufferWriter{byte})"/>
+        unsafe int GetRepresentation(string encodedCharacter, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetRepresentation(string, ArrayPool{byte}, out int)"/>
+        unsafe byte[] GetRepresentation(string encodedCharacter, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.ClearRepresentation"/>
         void ClearRepresentation(string encodedCharacter);
 
@@ -2358,9 +2731,20 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.EOLAnnotationSetText"/>
         void EOLAnnotationSetText(Position line, string text);
 
-        /// <inheritdoc cref="ScintillaGateway.EOLAnnotationGetText"/>
+        /// <inheritdoc cref="ScintillaGateway.EOLAnnotationGetText(Position)"/>
         string EOLAnnotationGetText(Position line);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.EOLAnnotationGetText(Position, Span{byte})"/>
+        int EOLAnnotationGetText(Position line, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.EOLAnnotationGetText(Position, IBufferWriter{byte})"/>
+        int EOLAnnotationGetText(Position line, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.EOLAnnotationGetText(Position, ArrayPool{byte}, out int)"/>
+        byte[] EOLAnnotationGetText(Position line, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.EOLAnnotationSetStyle"/>
         void EOLAnnotationSetStyle(Position line, int style);
 
@@ -2424,34 +2808,103 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.SetKeyWords"/>
         void SetKeyWords(int keyWordSet, string keyWords);
 
-        /// <inheritdoc cref="ScintillaGateway.GetProperty"/>
+        /// <inheritdoc cref="ScintillaGateway.GetProperty(string)"/>
         unsafe string GetProperty(string key);
 
-        /// <inheritdoc cref="ScintillaGateway.GetPropertyExpanded"/>
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetProperty(string, Span{byte})"/>
+        unsafe int GetProperty(string key, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetProperty(string, IBufferWriter{byte})"/>
+        unsafe int GetProperty(string key, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetProperty(string, ArrayPool{byte}, out int)"/>
+        unsafe byte[] GetProperty(string key, ArrayPool<byte> pool, out int length);
+#endif
+
+        /// <inheritdoc cref="ScintillaGateway.GetPropertyExpanded(string)"/>
         [Obsolete("This is now the same as SCI_GETPROPERTY - no expansion is performed. See https://www.scintilla.org/ScintillaDoc.html#SCI_GETPROPERTYEXPANDED")]
         unsafe string GetPropertyExpanded(string key);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetPropertyExpanded(string, Span{byte})"/>
+        [Obsolete("This is now the same as SCI_GETPROPERTY - no expansion is performed. See https://www.scintilla.org/ScintillaDoc.html#SCI_GETPROPERTYEXPANDED")]
+        unsafe int GetPropertyExpanded(string key, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetPropertyExpanded(string, IBufferWriter{byte})"/>
+        [Obsolete("This is now the same as SCI_GETPROPERTY - no expansion is performed. See https://www.scintilla.org/ScintillaDoc.html#SCI_GETPROPERTYEXPANDED")]
+        unsafe int GetPropertyExpanded(string key, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetPropertyExpanded(string, ArrayPool{byte}, out int)"/>
+        [Obsolete("This is now the same as SCI_GETPROPERTY - no expansion is performed. See https://www.scintilla.org/ScintillaDoc.html#SCI_GETPROPERTYEXPANDED")]
+        unsafe byte[] GetPropertyExpanded(string key, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetPropertyInt"/>
         int GetPropertyInt(string key, int defaultValue);
 
-        /// <inheritdoc cref="ScintillaGateway.GetLexerLanguage"/>
+        /// <inheritdoc cref="ScintillaGateway.GetLexerLanguage()"/>
         string GetLexerLanguage();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetLexerLanguage(Span{byte})"/>
+        int GetLexerLanguage(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetLexerLanguage(IBufferWriter{byte})"/>
+        int GetLexerLanguage(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetLexerLanguage(ArrayPool{byte}, out int)"/>
+        byte[] GetLexerLanguage(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.PrivateLexerCall"/>
         IntPtr PrivateLexerCall(int operation, IntPtr pointer);
 
-        /// <inheritdoc cref="ScintillaGateway.PropertyNames"/>
+        /// <inheritdoc cref="ScintillaGateway.PropertyNames()"/>
         string PropertyNames();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.PropertyNames(Span{byte})"/>
+        int PropertyNames(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.PropertyNames(IBufferWriter{byte})"/>
+        int PropertyNames(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.PropertyNames(ArrayPool{byte}, out int)"/>
+        byte[] PropertyNames(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.PropertyType"/>
         TypeProperty PropertyType(string name);
 
-        /// <inheritdoc cref="ScintillaGateway.DescribeProperty"/>
+        /// <inheritdoc cref="ScintillaGateway.DescribeProperty(string)"/>
         unsafe string DescribeProperty(string name);
 
-        /// <inheritdoc cref="ScintillaGateway.DescribeKeyWordSets"/>
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.DescribeProperty(string, Span{byte})"/>
+        unsafe int DescribeProperty(string name, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.DescribeProperty(string, IBufferWriter{byte})"/>
+        unsafe int DescribeProperty(string name, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.DescribeProperty(string, ArrayPool{byte}, out int)"/>
+        unsafe byte[] DescribeProperty(string name, ArrayPool<byte> pool, out int length);
+#endif
+
+        /// <inheritdoc cref="ScintillaGateway.DescribeKeyWordSets()"/>
         string DescribeKeyWordSets();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.DescribeKeyWordSets(Span{byte})"/>
+        int DescribeKeyWordSets(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.DescribeKeyWordSets(IBufferWriter{byte})"/>
+        int DescribeKeyWordSets(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.DescribeKeyWordSets(ArrayPool{byte}, out int)"/>
+        byte[] DescribeKeyWordSets(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetLineEndTypesSupported"/>
         LineEndType GetLineEndTypesSupported();
 
@@ -2479,21 +2932,65 @@ namespace Npp.DotNet.Plugin
         /// <inheritdoc cref="ScintillaGateway.DistanceToSecondaryStyles"/>
         int DistanceToSecondaryStyles();
 
-        /// <inheritdoc cref="ScintillaGateway.GetSubStyleBases"/>
+        /// <inheritdoc cref="ScintillaGateway.GetSubStyleBases()"/>
         string GetSubStyleBases();
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.GetSubStyleBases(Span{byte})"/>
+        int GetSubStyleBases(Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.GetSubStyleBases(IBufferWriter{byte})"/>
+        int GetSubStyleBases(IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.GetSubStyleBases(ArrayPool{byte}, out int)"/>
+        byte[] GetSubStyleBases(ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.GetNamedStyles"/>
         int GetNamedStyles();
 
-        /// <inheritdoc cref="ScintillaGateway.NameOfStyle"/>
+        /// <inheritdoc cref="ScintillaGateway.NameOfStyle(int)"/>
         string NameOfStyle(int style);
 
-        /// <inheritdoc cref="ScintillaGateway.TagsOfStyle"/>
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.NameOfStyle(int, Span{byte})"/>
+        int NameOfStyle(int style, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.NameOfStyle(int, IBufferWriter{byte})"/>
+        int NameOfStyle(int style, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.NameOfStyle(int, ArrayPool{byte}, out int)"/>
+        byte[] NameOfStyle(int style, ArrayPool<byte> pool, out int length);
+#endif
+
+        /// <inheritdoc cref="ScintillaGateway.TagsOfStyle(int)"/>
         string TagsOfStyle(int style);
 
-        /// <inheritdoc cref="ScintillaGateway.DescriptionOfStyle"/>
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.TagsOfStyle(int, Span{byte})"/>
+        int TagsOfStyle(int style, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.TagsOfStyle(int, IBufferWriter{byte})"/>
+        int TagsOfStyle(int style, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.TagsOfStyle(int, ArrayPool{byte}, out int)"/>
+        byte[] TagsOfStyle(int style, ArrayPool<byte> pool, out int length);
+#endif
+
+        /// <inheritdoc cref="ScintillaGateway.DescriptionOfStyle(int)"/>
         string DescriptionOfStyle(int style);
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ScintillaGateway.DescriptionOfStyle(int, Span{byte})"/>
+        int DescriptionOfStyle(int style, Span<byte> destination);
+
+        /// <inheritdoc cref="ScintillaGateway.DescriptionOfStyle(int, IBufferWriter{byte})"/>
+        int DescriptionOfStyle(int style, IBufferWriter<byte> writer);
+
+        /// <inheritdoc cref="ScintillaGateway.DescriptionOfStyle(int, ArrayPool{byte}, out int)"/>
+        byte[] DescriptionOfStyle(int style, ArrayPool<byte> pool, out int length);
+#endif
+
         /// <inheritdoc cref="ScintillaGateway.SetILexer"/>
         void SetILexer(IntPtr ilexer);
 
@@ -8,40 +8,168 @@
  */
 
 using System;
+using System.Collections.Concurrent;
 using System.Runtime.InteropServices;
 using System.Text;
+using System.Threading;
 using Npp.DotNet.Plugin.Scintilla;
 using static Npp.DotNet.Plugin.Win32;
 
+#if NETCOREAPP
+using System.Buffers;
+#endif
+
 namespace Npp.DotNet.Plugin
 {
     using Accessibility = Scintilla.Accessibility;
     using Colour = ColourAlpha;
 
     /// <inheritdoc cref="IScintillaGateway"/>
+    /// <remarks>
+    /// By default, messages are sent through the window's message queue. A gateway created with direct access
+    /// calls Scintilla's direct function instead, which bypasses message dispatch entirely. Build with the
+    /// <c>SCI_DIRECT_FUNCTION</c> symbol defined to make direct access the default.
+    /// </remarks>
     public class ScintillaGateway : IScintillaGateway
     {
         private static readonly UIntPtr UnusedW = UIntPtr.Zero;
         private static readonly IntPtr Unused = IntPtr.Zero;
         private readonly IntPtr _scintilla;
+        private readonly IntPtr _directPointer;
+#if NET5_0_OR_GREATER
+        private readonly unsafe delegate* unmanaged[Cdecl]<IntPtr, uint, UIntPtr, IntPtr, IntPtr> _directFunction;
+#else
+        private readonly SciFnDirect _directFunction;
+
+        [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+        private delegate IntPtr SciFnDirect(IntPtr ptr, uint iMessage, UIntPtr wParam, IntPtr lParam);
+#endif
+
+        /// <summary>
+        /// Whether gateways call Scintilla's direct function unless told otherwise.
+        /// </summary>
+#if SCI_DIRECT_FUNCTION
+        public const bool DirectAccessByDefault = true;
+#else
+        public const bool DirectAccessByDefault = false;
+#endif
+
+        /// <summary>
+        /// <see langword="true"/> if this gateway calls Scintilla's direct function rather than sending window messages.
+        /// </summary>
+        public bool IsDirect => _directPointer != IntPtr.Zero;
+
+        /// <summary>
+        /// Encodings returned by <see cref="CodePage"/>, keyed by the code page that Scintilla reports.
+        /// </summary>
+        private static readonly ConcurrentDictionary<int, Encoding> Encodings = new ConcurrentDictionary<int, Encoding>();
+        private static volatile bool _tracksNotifications;
+        private static int _hasV5Apis;
+
+        /// <summary>
+        /// Incremented by <see cref="OnNotification"/> whenever the text of a document may have moved in memory.
+        /// </summary>
+        private static long _documentGeneration;
+
+        /// <summary>
+        /// Incremented by <see cref="OnNotification"/> whenever the code page of a document may have changed.
+        /// </summary>
+        private static long _codePageGeneration;
+
+        /// <summary>
+        /// The code page last queried by <see cref="CodePage"/>, valid while <see cref="_codePageGeneration"/>
+        /// is still <see cref="_codePageQueriedAt"/>.
+        /// </summary>
+        private int _codePage;
+        private long _codePageQueriedAt = -1;
+
+        /// <summary>
+        /// The generation of document text that a <see cref="DocumentView"/> created now belongs to.
+        /// </summary>
+        internal static long DocumentGeneration => Interlocked.Read(ref _documentGeneration);
 
         /// <inheritdoc cref="IScintillaGateway.CodePage"/>
+        /// <remarks>
+        /// Once <see cref="OnNotification"/> is called, the code page is only queried again after a document is modified,
+        /// Notepad++ activates another buffer, or the code page or document is set through this gateway.
+        /// Until then, the code page is queried every time. Either way, the encoding of each code page is only looked up once.
+        /// </remarks>
         public Encoding CodePage
         {
             get
             {
+                int cp = GetRememberedCodePage();
+                if (Encodings.TryGetValue(cp, out Encoding cached))
+                    return cached;
+
                 Encoding encoding = Encoding.UTF8;
                 try
                 {
-                    int cp = GetCodePage();
                     encoding = Encoding.GetEncoding((cp == 0) ? (int)GetACP() : cp);
                 }
                 catch
                 {
                     encoding = Encoding.UTF8;
                 }
-                return encoding;
+                return Encodings.GetOrAdd(cp, encoding);
+            }
+        }
+
+        /// <summary>
+        /// Tells document views when they become invalid. Call this with every notification that Notepad++ sends
+        /// to the plugin's <c>beNotified</c> function, before passing it on to <see cref="IDotNetPlugin.OnBeNotified"/>.
+        /// </summary>
+        /// <remarks>
+        /// Every document view is invalidated when a document's text is changed by <see cref="SciMsg.SCN_MODIFIED"/>,
+        /// and when Notepad++ activates another buffer. Document views can't be created if this method is never called.
+        /// Every gateway queries the code page again after either notification.
+        /// </remarks>
+        public static void OnNotification(ScNotification notification)
+        {
+            _tracksNotifications = true;
+            switch (notification.Header.Code)
+            {
+                case (uint)SciMsg.SCN_MODIFIED:
+                    Interlocked.Increment(ref _codePageGeneration);
+                    if ((notification.ModificationType & (int)(ModificationFlags.SC_MOD_INSERTTEXT | ModificationFlags.SC_MOD_DELETETEXT)) != 0)
+                    {
+                        Interlocked.Increment(ref _documentGeneration);
+                    }
+                    break;
+                case (uint)NppMsg.NPPN_BUFFERACTIVATED:
+                    if (notification.Header.HwndFrom == PluginData.NppData.NppHandle)
+                    {
+                        Interlocked.Increment(ref _codePageGeneration);
+                        Interlocked.Increment(ref _documentGeneration);
+                    }
+                    break;
+            }
+        }
+
+        /// <summary>
+        /// Gets the code page of the document, querying it only if a notification or
+        /// <see cref="ForgetCodePage"/> may have changed it since the last time.
+        /// </summary>
+        private int GetRememberedCodePage()
+        {
+            if (!_tracksNotifications)
+                return GetCodePage();
+
+            long generation = Interlocked.Read(ref _codePageGeneration);
+            if (_codePageQueriedAt != generation)
+            {
+                _codePage = GetCodePage();
+                _codePageQueriedAt = generation;
             }
+            return _codePage;
+        }
+
+        /// <summary>
+        /// Makes <see cref="CodePage"/> query the code page again, after a message that may have changed it.
+        /// </summary>
+        private void ForgetCodePage()
+        {
+            _codePageQueriedAt = -1;
         }
 
         /// <inheritdoc cref="IScintillaGateway.LineDelimiter"/>
@@ -92,10 +220,18 @@ namespace Npp.DotNet.Plugin
         /// </para>
         /// Npp v8.4 is the first to use a Scintilla v5 interface.
         /// </summary>
+        /// <remarks>The answer is remembered for the life of the process, once Notepad++ can give it.</remarks>
         internal static bool HasV5Apis()
         {
-            (int x, int y, int _) = PluginData.Notepad.GetNppVersion();
-            return x > 8 || (x == 8 && y >= 4);
+            int hasV5Apis = _hasV5Apis;
+            if (hasV5Apis == 0)
+            {
+                (int x, int y, int _) = PluginData.Notepad.GetNppVersion();
+                hasV5Apis = x > 8 || (x == 8 && y >= 4) ? 1 : -1;
+                if (x > 0)
+                    _hasV5Apis = hasV5Apis;
+            }
+            return hasV5Apis > 0;
         }
 
         /// <summary>
@@ -139,30 +275,281 @@ namespace Npp.DotNet.Plugin
         /// <param name="wParam">another parameter for defining what the buffer should contain</param>
         private unsafe string GetNullStrippedStringFromMessageThatReturnsLength(SciMsg msg, Encoding encoding, UIntPtr wParam = default)
         {
-            int length = SendMessage(_scintilla, msg, wParam, Unused).ToInt32();
+            int length = Send(msg, wParam, Unused).ToInt32();
             bool lengthIsWPARAM = PadBufferForScintilla5(msg, encoding.GetByteCount("\0"), ref length);
             byte[] textBuffer = new byte[length];
             if (lengthIsWPARAM) // discount NULL from length
                 length -= encoding.GetByteCount("\0");
             fixed (byte* textPtr = textBuffer)
             {
-                SendMessage(_scintilla, msg, lengthIsWPARAM ? (UIntPtr)length : wParam, (IntPtr)textPtr);
+                Send(msg, lengthIsWPARAM ? (UIntPtr)length : wParam, (IntPtr)textPtr);
                 return NullTerminatedBufferToString(textBuffer, encoding);
             }
         }
 
-        public ScintillaGateway(IntPtr scintilla)
+#if NETCOREAPP
+        /// <summary>
+        /// Like <see cref="GetNullStrippedStringFromMessageThatReturnsLength"/>, but copies the result into
+        /// <paramref name="destination"/> without decoding it.
+        /// </summary>
+        /// <returns>The number of bytes copied, with all trailing NULL bytes discounted.</returns>
+        /// <exception cref="ArgumentException">
+        /// Thrown if <paramref name="destination"/> has no room for the result and its terminating <c>NULL</c>.
+        /// </exception>
+        private int GetBytesFromMessageThatReturnsLength(SciMsg msg, Span<byte> destination, UIntPtr wParam = default)
+        {
+            return CopyBytesFromMessage(msg, destination, Send(msg, wParam, Unused).ToInt32(), wParam);
+        }
+
+        /// <summary>
+        /// Like <see cref="GetNullStrippedStringFromMessageThatReturnsLength"/>, but writes the result to
+        /// <paramref name="writer"/> without decoding it.
+        /// </summary>
+        /// <returns>The number of bytes written, with all trailing NULL bytes discounted.</returns>
+        private int WriteBytesFromMessageThatReturnsLength(SciMsg msg, IBufferWriter<byte> writer, UIntPtr wParam = default)
+        {
+            int length = Send(msg, wParam, Unused).ToInt32();
+            int written = CopyBytesFromMessage(msg, writer.GetSpan(length + 1), length, wParam);
+            writer.Advance(written);
+            return written;
+        }
+
+        /// <summary>
+        /// Like <see cref="GetNullStrippedStringFromMessageThatReturnsLength"/>, but copies the result into
+        /// a buffer rented from <paramref name="pool"/> without decoding it.
+        /// </summary>
+        /// <returns>The rented buffer, of which <paramref name="length"/> bytes were copied, with all trailing NULL bytes discounted.</returns>
+        private byte[] RentBytesFromMessageThatReturnsLength(SciMsg msg, ArrayPool<byte> pool, out int length, UIntPtr wParam = default)
+        {
+            int bufLength = Send(msg, wParam, Unused).ToInt32();
+            byte[] buffer = pool.Rent(bufLength + 1);
+            length = CopyBytesFromMessage(msg, buffer, bufLength, wParam);
+            return buffer;
+        }
+
+        /// <summary>
+        /// The size of the stack buffer that string arguments of the raw byte overloads are encoded into.
+        /// </summary>
+        private const int StackEncodingLength = 256;
+
+        /// <summary>
+        /// Encodes <paramref name="text"/> followed by a terminating <c>NULL</c> into <paramref name="buffer"/>,
+        /// or into a buffer rented from the shared pool if it might not fit.
+        /// </summary>
+        /// <param name="rented">The rented buffer to return to the pool, or <see langword="null"/>.</param>
+        /// <returns>The encoded bytes, including the terminating <c>NULL</c>.</returns>
+        private static Span<byte> EncodeNullTerminated(Encoding encoding, string text, Span<byte> buffer, out byte[] rented)
+        {
+            int maxLength = encoding.GetMaxByteCount(text.Length) + 1;
+            rented = maxLength > buffer.Length ? ArrayPool<byte>.Shared.Rent(maxLength) : null;
+            Span<byte> destination = rented ?? buffer;
+            int length = encoding.GetBytes(text, destination);
+            destination[length] = 0;
+            return destination.Slice(0, length + 1);
+        }
+
+        /// <summary>
+        /// Sends <paramref name="msg"/> with a fixed pointer to <paramref name="destination"/>, which must have room for
+        /// the <paramref name="length"/> bytes that <paramref name="msg"/> just returned, plus a terminating <c>NULL</c>.
+        /// </summary>
+        private unsafe int CopyBytesFromMessage(SciMsg msg, Span<byte> destination, int length, UIntPtr wParam)
+        {
+            if (destination.Length <= length)
+            {
+                throw new ArgumentException($"{length + 1} bytes are needed to hold the result of {msg}", nameof(destination));
+            }
+            // before Scintilla 5.1.5 the length of these buffers counted the NULL; either way,
+            // it's what the message returned
+            bool lengthIsWPARAM = msg == SciMsg.SCI_GETTEXT || msg == SciMsg.SCI_GETCURLINE;
+            fixed (byte* textPtr = destination)
+            {
+                Send(msg, lengthIsWPARAM ? (UIntPtr)length : wParam, (IntPtr)textPtr);
+            }
+            return destination.Slice(0, length).TrimEnd((byte)0).Length;
+        }
+
+        /// <summary>
+        /// Fills <paramref name="destination"/> with the text range from <paramref name="start"/> to <paramref name="end"/>,
+        /// which is the end of the document if it's negative. The range is copied as <paramref name="cellSize"/> bytes per position.
+        /// </summary>
+        /// <returns>The number of bytes copied, not counting the terminating <c>NULL</c>s.</returns>
+        /// <exception cref="ArgumentException">
+        /// Thrown if <paramref name="destination"/> has no room for the range and its terminating <c>NULL</c>s.
+        /// </exception>
+        /// <exception cref="ArgumentOutOfRangeException">
+        /// Thrown if <paramref name="start"/> is negative, or if the range ends before it starts.
+        /// </exception>
+        private unsafe int GetBytesInRange(SciMsg msg, Position start, Position end, Span<byte> destination, int cellSize)
+        {
+            int bufLength = GetRangeBufferLength(start, ref end, cellSize);
+            if (destination.Length < bufLength)
+            {
+                throw new ArgumentException($"{bufLength} bytes are needed to hold the result of {msg}", nameof(destination));
+            }
+            fixed (byte* textPtr = destination)
+            {
+                TextRangeBuffer tr = new TextRangeBuffer
+                {
+                    ChRg = new CharacterRangeFull(start, end),
+                    LpStrText = (IntPtr)textPtr,
+                };
+                return Send(msg, UnusedW, (IntPtr)(&tr)).ToInt32();
+            }
+        }
+
+        /// <inheritdoc cref="GetBytesInRange"/>
+        /// <returns>The number of bytes written, not counting the terminating <c>NULL</c>s.</returns>
+        private int WriteBytesInRange(SciMsg msg, Position start, Position end, IBufferWriter<byte> writer, int cellSize)
+        {
+            int written = GetBytesInRange(msg, start, end, writer.GetSpan(GetRangeBufferLength(start, ref end, cellSize)), cellSize);
+            writer.Advance(written);
+            return written;
+        }
+
+        /// <inheritdoc cref="GetBytesInRange"/>
+        /// <returns>The rented buffer, of which <paramref name="length"/> bytes were copied, not counting the terminating <c>NULL</c>s.</returns>
+        private byte[] RentBytesInRange(SciMsg msg, Position start, Position end, ArrayPool<byte> pool, out int length, int cellSize)
+        {
+            byte[] buffer = pool.Rent(GetRangeBufferLength(start, ref end, cellSize));
+            length = GetBytesInRange(msg, start, end, buffer, cellSize);
+            return buffer;
+        }
+
+        /// <summary>
+        /// Gets the size of a buffer that can hold a text range and its terminating <c>NULL</c>s, resolving
+        /// a negative <paramref name="end"/> to the end of the document.
+        /// </summary>
+        /// <exception cref="ArgumentOutOfRangeException">
+        /// Thrown if <paramref name="start"/> is negative, or if the range ends before it starts.
+        /// </exception>
+        private int GetRangeBufferLength(Position start, ref Position end, int cellSize)
+        {
+            if (end < 0)
+                end = GetLength();
+            if (start < 0)
+                throw new ArgumentOutOfRangeException(nameof(start), "The range must not start before the document");
+            if (end < start)
+                throw new ArgumentOutOfRangeException(nameof(end), "The range must not end before it starts");
+            return checked((int)(((long)end - (long)start + 1) * cellSize));
+        }
+
+        /// <summary>
+        /// Copies the bytes of the document from <paramref name="start"/> on into <paramref name="destination"/>
+        /// straight from Scintilla's buffer, using the pointer returned by <c>SCI_GETRANGEPOINTER</c>.
+        /// Positions past the end of the document are read as 0, as with <see cref="GetCharAt"/>.
+        /// </summary>
+        private unsafe void CopyCharactersInRange(Position start, Span<byte> destination)
+        {
+            int count = ClearPastEndOfDocument(start, destination);
+            if (count == 0)
+                return;
+            IntPtr text = Send(SciMsg.SCI_GETRANGEPOINTER, (UIntPtr)start, (IntPtr)count);
+            new ReadOnlySpan<byte>((void*)text, count).CopyTo(destination);
+        }
+
+        /// <summary>
+        /// Copies the styles of the document from <paramref name="start"/> on into <paramref name="destination"/>,
+        /// taking every second byte of the text ranges returned by <c>SCI_GETSTYLEDTEXTFULL</c>.
+        /// Positions past the end of the document are read as 0, as with <see cref="GetStyleAt"/>.
+        /// </summary>
+        private void CopyStylesInRange(Position start, Span<byte> destination)
+        {
+            int count = ClearPastEndOfDocument(start, destination);
+            if (count == 0)
+                return;
+            // bound the size of the intermediate buffer, however long the range
+            int chunk = Math.Min(count, StyledTextChunk);
+            byte[] cells = ArrayPool<byte>.Shared.Rent(2 * (chunk + 1));
+            try
+            {
+                for (int done = 0; done < count; done += chunk)
+                {
+                    chunk = Math.Min(count - done, StyledTextChunk);
+                    GetBytesInRange(SciMsg.SCI_GETSTYLEDTEXTFULL, start + done, start + done + chunk, cells, 2);
+                    for (int i = 0; i < chunk; i++)
+                        destination[done + i] = cells[2 * i + 1];
+                }
+            }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(cells);
+            }
+        }
+
+        /// <summary>
+        /// Zeroes the part of <paramref name="destination"/> that lies past the end of the document when it's filled from <paramref name="start"/>.
+        /// </summary>
+        /// <returns>The number of positions of <paramref name="destination"/> that are inside the document.</returns>
+        private int ClearPastEndOfDocument(Position start, Span<byte> destination)
+        {
+            int count = (int)Math.Max(0L, Math.Min(destination.Length, (long)GetLength() - (long)start));
+            destination.Slice(count).Clear();
+            return count;
+        }
+
+        /// <summary>
+        /// The number of positions copied at a time by <see cref="CopyStylesInRange"/>.
+        /// </summary>
+        private const int StyledTextChunk = 0x10000;
+
+        /// <summary>
+        /// Compatible with Scintilla's <c>Sci_TextRangeFull</c>, for text ranges copied into managed buffers.
+        /// </summary>
+        [StructLayout(LayoutKind.Sequential)]
+        private struct TextRangeBuffer
+        {
+            public CharacterRangeFull ChRg;
+            public IntPtr LpStrText;
+        }
+#endif
+
+        public ScintillaGateway(IntPtr scintilla) : this(scintilla, DirectAccessByDefault) { }
+
+        /// <summary>
+        /// Creates a gateway to the given Scintilla window.
+        /// </summary>
+        /// <param name="scintilla">Handle of a Scintilla window.</param>
+        /// <param name="directAccess">
+        /// If <see langword="true"/>, call Scintilla's direct function instead of sending window messages.
+        /// The direct function must only be called from the thread that created the window, and
+        /// the gateway must not outlive the window.
+        /// </param>
+        public unsafe ScintillaGateway(IntPtr scintilla, bool directAccess)
         {
 #if NETCOREAPP
             // https://learn.microsoft.com/dotnet/api/system.text.codepagesencodingprovider#remarks
             Encoding.RegisterProvider(CodePagesEncodingProvider.Instance);
 #endif
             this._scintilla = scintilla;
+            if (!directAccess)
+                return;
+
+            IntPtr fn = SendMessage(scintilla, SciMsg.SCI_GETDIRECTFUNCTION, UnusedW, Unused);
+            IntPtr ptr = SendMessage(scintilla, SciMsg.SCI_GETDIRECTPOINTER, UnusedW, Unused);
+            if (fn == IntPtr.Zero || ptr == IntPtr.Zero)
+                return;
+#if NET5_0_OR_GREATER
+            _directFunction = (delegate* unmanaged[Cdecl]<IntPtr, uint, UIntPtr, IntPtr, IntPtr>)fn;
+#else
+            _directFunction = Marshal.GetDelegateForFunctionPointer<SciFnDirect>(fn);
+#endif
+            _directPointer = ptr;
+        }
+
+        /// <summary>
+        /// Sends a message to Scintilla, through its direct function if this gateway has direct access,
+        /// otherwise through the window's message queue.
+        /// </summary>
+        private unsafe IntPtr Send(SciMsg msg, UIntPtr wParam, IntPtr lParam)
+        {
+            if (_directPointer != IntPtr.Zero)
+                return _directFunction(_directPointer, (uint)msg, wParam, lParam);
+            return SendMessage(_scintilla, msg, wParam, lParam);
         }
 
         public int GetSelectionLength()
         {
-            var selectionLength = (int)SendMessage(_scintilla, SciMsg.SCI_GETSELTEXT, UnusedW, Unused);
+            var selectionLength = (int)Send(SciMsg.SCI_GETSELTEXT, UnusedW, Unused);
             if (!HasV5Apis())
                 selectionLength -= CodePage.GetByteCount("\0");
             return selectionLength;
@@ -219,6 +606,65 @@ namespace Npp.DotNet.Plugin
             return scrollInfo;
         }
 
+#if NETCOREAPP
+        /// <summary>
+        /// Whole-document views of Scintilla windows, kept for as long as they stay valid.
+        /// </summary>
+        private static readonly ConcurrentDictionary<IntPtr, DocumentView> DocumentViews = new ConcurrentDictionary<IntPtr, DocumentView>();
+
+        /// <summary>
+        /// Gets a view of the whole document that reads Scintilla's buffer in place, through <c>SCI_GETCHARACTERPOINTER</c>.
+        /// The view is reused for as long as <see cref="DocumentView.Revalidate"/> finds it valid, so repeated calls don't allocate.
+        /// </summary>
+        /// <remarks>
+        /// If the document isn't in one piece already, Scintilla moves its gap to the end,
+        /// which invalidates any range views that the gap crosses.
+        /// </remarks>
+        /// <exception cref="InvalidOperationException">Thrown if <see cref="OnNotification"/> is never called.</exception>
+        /// <exception cref="OverflowException">Thrown if the document is 2 GB or larger.</exception>
+        public DocumentView GetDocumentView()
+        {
+            ThrowIfNotTrackingDocuments();
+            if (DocumentViews.TryGetValue(_scintilla, out DocumentView cached) && cached.Revalidate())
+                return cached;
+
+            long generation = DocumentGeneration;
+            IntPtr text = Send(SciMsg.SCI_GETCHARACTERPOINTER, UnusedW, Unused);
+            Position length = GetLength();
+            DocumentView view = new DocumentView(this, text, 0, checked((int)(long)length), true, GetDocPointer(), length, generation);
+            DocumentViews[_scintilla] = view;
+            return view;
+        }
+
+        /// <summary>
+        /// Gets a view of <paramref name="lengthRange"/> bytes of the document from <paramref name="start"/>
+        /// that reads Scintilla's buffer in place, through <c>SCI_GETRANGEPOINTER</c>.
+        /// </summary>
+        /// <remarks>
+        /// If the range spans Scintilla's gap, the gap is moved out of the way,
+        /// which invalidates any views that it then crosses.
+        /// </remarks>
+        /// <exception cref="ArgumentOutOfRangeException">Thrown if the range isn't inside the document.</exception>
+        /// <exception cref="InvalidOperationException">Thrown if <see cref="OnNotification"/> is never called.</exception>
+        /// <exception cref="OverflowException">Thrown if <paramref name="lengthRange"/> is 2 GB or larger.</exception>
+        public DocumentView GetDocumentView(Position start, Position lengthRange)
+        {
+            ThrowIfNotTrackingDocuments();
+            if (start < 0 || lengthRange < 0 || (long)start + (long)lengthRange > (long)GetLength())
+                throw new ArgumentOutOfRangeException(nameof(lengthRange), "The range must be inside the document");
+
+            long generation = DocumentGeneration;
+            IntPtr text = Send(SciMsg.SCI_GETRANGEPOINTER, (UIntPtr)start, (IntPtr)lengthRange);
+            return new DocumentView(this, text, start, checked((int)(long)lengthRange), false, GetDocPointer(), GetLength(), generation);
+        }
+
+        private static void ThrowIfNotTrackingDocuments()
+        {
+            if (!_tracksNotifications)
+                throw new InvalidOperationException($"Document views need every notification to be passed to {nameof(ScintillaGateway)}.{nameof(OnNotification)}");
+        }
+#endif
+
         /* ++Autogenerated -- start of section automatically generated from Scintilla.iface */
         /// <summary>Add text to the document at current position. (Scintilla feature 2001)</summary>
         public void AddText(string text)
@@ -226,12 +672,21 @@ namespace Npp.DotNet.Plugin
             SendEncodedBytes(SciMsg.SCI_ADDTEXT, text);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="AddText(string)"/>
+        /// <remarks>The bytes of <paramref name="text"/> are sent as they are, without encoding.</remarks>
+        public void AddText(ReadOnlySpan<byte> text)
+        {
+            SendBytes(SciMsg.SCI_ADDTEXT, text);
+        }
+#endif
+
         /// <summary>Add array of cells to document. (Scintilla feature 2002)</summary>
         public unsafe void AddStyledText(Position length, Cells c)
         {
             fixed (char* cPtr = c.Value)
             {
-                SendMessage(_scintilla, SciMsg.SCI_ADDSTYLEDTEXT, (UIntPtr)length, (IntPtr)cPtr);
+                Send(SciMsg.SCI_ADDSTYLEDTEXT, (UIntPtr)length, (IntPtr)cPtr);
             }
         }
 
@@ -247,64 +702,103 @@ namespace Npp.DotNet.Plugin
             SendEncodedBytes(SciMsg.SCI_CHANGEINSERTION, text);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ChangeInsertion(string)"/>
+        /// <remarks>The bytes of <paramref name="text"/> are sent as they are, without encoding.</remarks>
+        public void ChangeInsertion(ReadOnlySpan<byte> text)
+        {
+            SendBytes(SciMsg.SCI_CHANGEINSERTION, text);
+        }
+#endif
+
         /// <summary>Delete all text in the document. (Scintilla feature 2004)</summary>
         public void ClearAll()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CLEARALL, UnusedW, Unused);
+            Send(SciMsg.SCI_CLEARALL, UnusedW, Unused);
         }
 
         /// <summary>Delete a range of text in the document. (Scintilla feature 2645)</summary>
         public void DeleteRange(Position start, Position lengthDelete)
         {
-            SendMessage(_scintilla, SciMsg.SCI_DELETERANGE, (UIntPtr)start, (IntPtr)lengthDelete);
+            Send(SciMsg.SCI_DELETERANGE, (UIntPtr)start, (IntPtr)lengthDelete);
         }
 
         /// <summary>Set all style bytes to 0, remove all folding information. (Scintilla feature 2005)</summary>
         public void ClearDocumentStyle()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CLEARDOCUMENTSTYLE, UnusedW, Unused);
+            Send(SciMsg.SCI_CLEARDOCUMENTSTYLE, UnusedW, Unused);
         }
 
         /// <summary>Returns the number of bytes in the document. (Scintilla feature 2006)</summary>
         public Position GetLength()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETLENGTH, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETLENGTH, UnusedW, Unused);
         }
 
         /// <summary>Returns the character byte at the position. (Scintilla feature 2007)</summary>
         public int GetCharAt(Position pos)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETCHARAT, (UIntPtr)pos, Unused);
+            return (int)Send(SciMsg.SCI_GETCHARAT, (UIntPtr)pos, Unused);
+        }
+
+#if NETCOREAPP
+        /// <summary>
+        /// Bulk variant of <see cref="GetCharAt"/>: gets its value at each position from <paramref name="start"/> on, one per element of <paramref name="destination"/>.
+        /// </summary>
+        public void GetCharsInRange(Position start, Span<byte> destination)
+        {
+            CopyCharactersInRange(start, destination);
         }
+#endif
 
         /// <summary>Returns the position of the caret. (Scintilla feature 2008)</summary>
         public Position GetCurrentPos()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETCURRENTPOS, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETCURRENTPOS, UnusedW, Unused);
         }
 
         /// <summary>Returns the position of the opposite end of the selection to the caret. (Scintilla feature 2009)</summary>
         public Position GetAnchor()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETANCHOR, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETANCHOR, UnusedW, Unused);
         }
 
         /// <summary>Returns the style byte at the position. (Scintilla feature 2010)</summary>
         public int GetStyleAt(Position pos)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETSTYLEAT, (UIntPtr)pos, Unused);
+            return (int)Send(SciMsg.SCI_GETSTYLEAT, (UIntPtr)pos, Unused);
+        }
+
+#if NETCOREAPP
+        /// <summary>
+        /// Bulk variant of <see cref="GetStyleAt"/>: gets its value at each position from <paramref name="start"/> on, one per element of <paramref name="destination"/>.
+        /// </summary>
+        public void GetStylesInRange(Position start, Span<byte> destination)
+        {
+            CopyStylesInRange(start, destination);
         }
+#endif
 
         /// <summary>Returns the unsigned style byte at the position. (Scintilla feature 2038)</summary>
         public int GetStyleIndexAt(Position pos)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETSTYLEINDEXAT, (UIntPtr)pos, Unused);
+            return (int)Send(SciMsg.SCI_GETSTYLEINDEXAT, (UIntPtr)pos, Unused);
+        }
+
+#if NETCOREAPP
+        /// <summary>
+        /// Bulk variant of <see cref="GetStyleIndexAt"/>: gets its value at each position from <paramref name="start"/> on, one per element of <paramref name="destination"/>.
+        /// </summary>
+        public void GetStyleIndicesInRange(Position start, Span<byte> destination)
+        {
+            CopyStylesInRange(start, destination);
         }
+#endif
 
         /// <summary>Redoes the next action on the undo history. (Scintilla feature 2011)</summary>
         public void Redo()
         {
-            SendMessage(_scintilla, SciMsg.SCI_REDO, UnusedW, Unused);
+            Send(SciMsg.SCI_REDO, UnusedW, Unused);
         }
 
         /// <summary>
@@ -314,13 +808,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetUndoCollection(bool collectUndo)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETUNDOCOLLECTION, new UIntPtr(collectUndo ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETUNDOCOLLECTION, new UIntPtr(collectUndo ? 1U : 0U), Unused);
         }
 
         /// <summary>Select all the text in the document. (Scintilla feature 2013)</summary>
         public void SelectAll()
         {
-            SendMessage(_scintilla, SciMsg.SCI_SELECTALL, UnusedW, Unused);
+            Send(SciMsg.SCI_SELECTALL, UnusedW, Unused);
         }
 
         /// <summary>
@@ -330,7 +824,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetSavePoint()
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSAVEPOINT, UnusedW, Unused);
+            Send(SciMsg.SCI_SETSAVEPOINT, UnusedW, Unused);
         }
 
         /// <summary>
@@ -340,43 +834,66 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position GetStyledTextFull(TextRangeFull tr)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSTYLEDTEXTFULL, UnusedW, tr.NativePointer);
+            return Send(SciMsg.SCI_GETSTYLEDTEXTFULL, UnusedW, tr.NativePointer);
+        }
+
+#if NETCOREAPP
+        /// <inheritdoc cref="GetStyledTextFull(TextRangeFull)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NULs.</returns>
+        public int GetStyledTextFull(Position start, Position end, Span<byte> destination)
+        {
+            return GetBytesInRange(SciMsg.SCI_GETSTYLEDTEXTFULL, start, end, destination, 2);
+        }
+
+        /// <inheritdoc cref="GetStyledTextFull(TextRangeFull)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetStyledTextFull(Position start, Position end, IBufferWriter<byte> writer)
+        {
+            return WriteBytesInRange(SciMsg.SCI_GETSTYLEDTEXTFULL, start, end, writer, 2);
+        }
+
+        /// <inheritdoc cref="GetStyledTextFull(TextRangeFull)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetStyledTextFull(Position start, Position end, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesInRange(SciMsg.SCI_GETSTYLEDTEXTFULL, start, end, pool, out length, 2);
         }
+#endif
 
         /// <summary>Are there any redoable actions in the undo history? (Scintilla feature 2016)</summary>
         public bool CanRedo()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_CANREDO, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_CANREDO, UnusedW, Unused);
         }
 
         /// <summary>Retrieve the line number at which a particular marker is located. (Scintilla feature 2017)</summary>
         public Position MarkerLineFromHandle(int markerHandle)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_MARKERLINEFROMHANDLE, (UIntPtr)markerHandle, Unused);
+            return Send(SciMsg.SCI_MARKERLINEFROMHANDLE, (UIntPtr)markerHandle, Unused);
         }
 
         /// <summary>Delete a marker. (Scintilla feature 2018)</summary>
         public void MarkerDeleteHandle(int markerHandle)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERDELETEHANDLE, (UIntPtr)markerHandle, Unused);
+            Send(SciMsg.SCI_MARKERDELETEHANDLE, (UIntPtr)markerHandle, Unused);
         }
 
         /// <summary>Retrieve marker handles of a line (Scintilla feature 2732)</summary>
         public int MarkerHandleFromLine(Position line, int which)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_MARKERHANDLEFROMLINE, (UIntPtr)line, (IntPtr)which);
+            return (int)Send(SciMsg.SCI_MARKERHANDLEFROMLINE, (UIntPtr)line, (IntPtr)which);
         }
 
         /// <summary>Retrieve marker number of a marker handle (Scintilla feature 2733)</summary>
         public int MarkerNumberFromLine(Position line, int which)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_MARKERNUMBERFROMLINE, (UIntPtr)line, (IntPtr)which);
+            return (int)Send(SciMsg.SCI_MARKERNUMBERFROMLINE, (UIntPtr)line, (IntPtr)which);
         }
 
         /// <summary>Is undo history being collected? (Scintilla feature 2019)</summary>
         public bool GetUndoCollection()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETUNDOCOLLECTION, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETUNDOCOLLECTION, UnusedW, Unused);
         }
 
         /// <summary>
@@ -386,13 +903,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public WhiteSpace GetViewWS()
         {
-            return (WhiteSpace)SendMessage(_scintilla, SciMsg.SCI_GETVIEWWS, UnusedW, Unused);
+            return (WhiteSpace)Send(SciMsg.SCI_GETVIEWWS, UnusedW, Unused);
         }
 
         /// <summary>Make white space characters invisible, always visible or visible outside indentation. (Scintilla feature 2021)</summary>
         public void SetViewWS(WhiteSpace viewWS)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETVIEWWS, (UIntPtr)viewWS, Unused);
+            Send(SciMsg.SCI_SETVIEWWS, (UIntPtr)viewWS, Unused);
         }
 
         /// <summary>
@@ -402,19 +919,19 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public TabDrawMode GetTabDrawMode()
         {
-            return (TabDrawMode)SendMessage(_scintilla, SciMsg.SCI_GETTABDRAWMODE, UnusedW, Unused);
+            return (TabDrawMode)Send(SciMsg.SCI_GETTABDRAWMODE, UnusedW, Unused);
         }
 
         /// <summary>Set how tabs are drawn when visible. (Scintilla feature 2699)</summary>
         public void SetTabDrawMode(TabDrawMode tabDrawMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETTABDRAWMODE, (UIntPtr)tabDrawMode, Unused);
+            Send(SciMsg.SCI_SETTABDRAWMODE, (UIntPtr)tabDrawMode, Unused);
         }
 
         /// <summary>Find the position from a point within the window. (Scintilla feature 2022)</summary>
         public Position PositionFromPoint(int x, int y)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_POSITIONFROMPOINT, (UIntPtr)x, (IntPtr)y);
+            return Send(SciMsg.SCI_POSITIONFROMPOINT, (UIntPtr)x, (IntPtr)y);
         }
 
         /// <summary>
@@ -424,19 +941,19 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position PositionFromPointClose(int x, int y)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_POSITIONFROMPOINTCLOSE, (UIntPtr)x, (IntPtr)y);
+            return Send(SciMsg.SCI_POSITIONFROMPOINTCLOSE, (UIntPtr)x, (IntPtr)y);
         }
 
         /// <summary>Set caret to start of a line and ensure it is visible. (Scintilla feature 2024)</summary>
         public void GotoLine(Position line)
         {
-            SendMessage(_scintilla, SciMsg.SCI_GOTOLINE, (UIntPtr)line, Unused);
+            Send(SciMsg.SCI_GOTOLINE, (UIntPtr)line, Unused);
         }
 
         /// <summary>Set caret to a position and ensure it is visible. (Scintilla feature 2025)</summary>
         public void GotoPos(Position caret)
         {
-            SendMessage(_scintilla, SciMsg.SCI_GOTOPOS, (UIntPtr)caret, Unused);
+            Send(SciMsg.SCI_GOTOPOS, (UIntPtr)caret, Unused);
         }
 
         /// <summary>
@@ -446,7 +963,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetAnchor(Position anchor)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETANCHOR, (UIntPtr)anchor, Unused);
+            Send(SciMsg.SCI_SETANCHOR, (UIntPtr)anchor, Unused);
         }
 
         /// <summary>
@@ -460,28 +977,51 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETCURLINE, CodePage);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetCurLine()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetCurLine(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETCURLINE, destination);
+        }
+
+        /// <inheritdoc cref="GetCurLine()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetCurLine(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETCURLINE, writer);
+        }
+
+        /// <inheritdoc cref="GetCurLine()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetCurLine(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETCURLINE, pool, out length);
+        }
+#endif
+
         /// <summary>Retrieve the position of the last correctly styled character. (Scintilla feature 2028)</summary>
         public Position GetEndStyled()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETENDSTYLED, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETENDSTYLED, UnusedW, Unused);
         }
 
         /// <summary>Convert all line endings in the document to one mode. (Scintilla feature 2029)</summary>
         public void ConvertEOLs(EndOfLine eolMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CONVERTEOLS, (UIntPtr)eolMode, Unused);
+            Send(SciMsg.SCI_CONVERTEOLS, (UIntPtr)eolMode, Unused);
         }
 
         /// <summary>Retrieve the current end of line mode - one of CRLF, CR, or LF. (Scintilla feature 2030)</summary>
         public EndOfLine GetEOLMode()
         {
-            return (EndOfLine)SendMessage(_scintilla, SciMsg.SCI_GETEOLMODE, UnusedW, Unused);
+            return (EndOfLine)Send(SciMsg.SCI_GETEOLMODE, UnusedW, Unused);
         }
 
         /// <summary>Set the current end of line mode. (Scintilla feature 2031)</summary>
         public void SetEOLMode(EndOfLine eolMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETEOLMODE, (UIntPtr)eolMode, Unused);
+            Send(SciMsg.SCI_SETEOLMODE, (UIntPtr)eolMode, Unused);
         }
 
         /// <summary>
@@ -491,7 +1031,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void StartStyling(Position start, int unused)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STARTSTYLING, (UIntPtr)start, (IntPtr)unused);
+            Send(SciMsg.SCI_STARTSTYLING, (UIntPtr)start, (IntPtr)unused);
         }
 
         /// <summary>
@@ -501,13 +1041,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetStyling(Position length, int style)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSTYLING, (UIntPtr)length, (IntPtr)style);
+            Send(SciMsg.SCI_SETSTYLING, (UIntPtr)length, (IntPtr)style);
         }
 
         /// <summary>Is drawing done first into a buffer or direct to the screen? (Scintilla feature 2034)</summary>
         public bool GetBufferedDraw()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETBUFFEREDDRAW, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETBUFFEREDDRAW, UnusedW, Unused);
         }
 
         /// <summary>
@@ -517,49 +1057,49 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetBufferedDraw(bool buffered)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETBUFFEREDDRAW, new UIntPtr(buffered ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETBUFFEREDDRAW, new UIntPtr(buffered ? 1U : 0U), Unused);
         }
 
         /// <summary>Change the visible size of a tab to be a multiple of the width of a space character. (Scintilla feature 2036)</summary>
         public void SetTabWidth(int tabWidth)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETTABWIDTH, (UIntPtr)tabWidth, Unused);
+            Send(SciMsg.SCI_SETTABWIDTH, (UIntPtr)tabWidth, Unused);
         }
 
         /// <summary>Retrieve the visible size of a tab. (Scintilla feature 2121)</summary>
         public int GetTabWidth()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETTABWIDTH, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETTABWIDTH, UnusedW, Unused);
         }
 
         /// <summary>Set the minimum visual width of a tab. (Scintilla feature 2724)</summary>
         public void SetTabMinimumWidth(int pixels)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETTABMINIMUMWIDTH, (UIntPtr)pixels, Unused);
+            Send(SciMsg.SCI_SETTABMINIMUMWIDTH, (UIntPtr)pixels, Unused);
         }
 
         /// <summary>Get the minimum visual width of a tab. (Scintilla feature 2725)</summary>
         public int GetTabMinimumWidth()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETTABMINIMUMWIDTH, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETTABMINIMUMWIDTH, UnusedW, Unused);
         }
 
         /// <summary>Clear explicit tabstops on a line. (Scintilla feature 2675)</summary>
         public void ClearTabStops(Position line)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CLEARTABSTOPS, (UIntPtr)line, Unused);
+            Send(SciMsg.SCI_CLEARTABSTOPS, (UIntPtr)line, Unused);
         }
 
         /// <summary>Add an explicit tab stop for a line. (Scintilla feature 2676)</summary>
         public void AddTabStop(Position line, int x)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ADDTABSTOP, (UIntPtr)line, (IntPtr)x);
+            Send(SciMsg.SCI_ADDTABSTOP, (UIntPtr)line, (IntPtr)x);
         }
 
         /// <summary>Find the next explicit tab stop position on a line after a position. (Scintilla feature 2677)</summary>
         public int GetNextTabStop(Position line, int x)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETNEXTTABSTOP, (UIntPtr)line, (IntPtr)x);
+            return (int)Send(SciMsg.SCI_GETNEXTTABSTOP, (UIntPtr)line, (IntPtr)x);
         }
 
         /// <summary>
@@ -569,7 +1109,8 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetCodePage(int codePage)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCODEPAGE, (UIntPtr)codePage, Unused);
+            Send(SciMsg.SCI_SETCODEPAGE, (UIntPtr)codePage, Unused);
+            ForgetCodePage();
         }
 
         /// <summary>Set the locale for displaying text. (Scintilla feature 2760)</summary>
@@ -584,94 +1125,117 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETFONTLOCALE, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetFontLocale()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetFontLocale(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETFONTLOCALE, destination);
+        }
+
+        /// <inheritdoc cref="GetFontLocale()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetFontLocale(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETFONTLOCALE, writer);
+        }
+
+        /// <inheritdoc cref="GetFontLocale()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetFontLocale(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETFONTLOCALE, pool, out length);
+        }
+#endif
+
         /// <summary>Is the IME displayed in a window or inline? (Scintilla feature 2678)</summary>
         public IMEInteraction GetIMEInteraction()
         {
-            return (IMEInteraction)SendMessage(_scintilla, SciMsg.SCI_GETIMEINTERACTION, UnusedW, Unused);
+            return (IMEInteraction)Send(SciMsg.SCI_GETIMEINTERACTION, UnusedW, Unused);
         }
 
         /// <summary>Choose to display the IME in a window or inline. (Scintilla feature 2679)</summary>
         public void SetIMEInteraction(IMEInteraction imeInteraction)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETIMEINTERACTION, (UIntPtr)imeInteraction, Unused);
+            Send(SciMsg.SCI_SETIMEINTERACTION, (UIntPtr)imeInteraction, Unused);
         }
 
         /// <summary>Set the symbol used for a particular marker number. (Scintilla feature 2040)</summary>
         public void MarkerDefine(int markerNumber, MarkerSymbol markerSymbol)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERDEFINE, (UIntPtr)markerNumber, (IntPtr)markerSymbol);
+            Send(SciMsg.SCI_MARKERDEFINE, (UIntPtr)markerNumber, (IntPtr)markerSymbol);
         }
 
         /// <summary>Set the foreground colour used for a particular marker number. (Scintilla feature 2041)</summary>
         public void MarkerSetFore(int markerNumber, Colour fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERSETFORE, (UIntPtr)markerNumber, (IntPtr)fore.Value);
+            Send(SciMsg.SCI_MARKERSETFORE, (UIntPtr)markerNumber, (IntPtr)fore.Value);
         }
 
         /// <summary>Set the background colour used for a particular marker number. (Scintilla feature 2042)</summary>
         public void MarkerSetBack(int markerNumber, Colour back)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERSETBACK, (UIntPtr)markerNumber, (IntPtr)back.Value);
+            Send(SciMsg.SCI_MARKERSETBACK, (UIntPtr)markerNumber, (IntPtr)back.Value);
         }
 
         /// <summary>Set the background colour used for a particular marker number when its folding block is selected. (Scintilla feature 2292)</summary>
         public void MarkerSetBackSelected(int markerNumber, Colour back)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERSETBACKSELECTED, (UIntPtr)markerNumber, (IntPtr)back.Value);
+            Send(SciMsg.SCI_MARKERSETBACKSELECTED, (UIntPtr)markerNumber, (IntPtr)back.Value);
         }
 
         /// <summary>Set the foreground colour used for a particular marker number. (Scintilla feature 2294)</summary>
         public void MarkerSetForeTranslucent(int markerNumber, ColourAlpha fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERSETFORETRANSLUCENT, (UIntPtr)markerNumber, (IntPtr)fore.Value);
+            Send(SciMsg.SCI_MARKERSETFORETRANSLUCENT, (UIntPtr)markerNumber, (IntPtr)fore.Value);
         }
 
         /// <summary>Set the background colour used for a particular marker number. (Scintilla feature 2295)</summary>
         public void MarkerSetBackTranslucent(int markerNumber, ColourAlpha back)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERSETBACKTRANSLUCENT, (UIntPtr)markerNumber, (IntPtr)back.Value);
+            Send(SciMsg.SCI_MARKERSETBACKTRANSLUCENT, (UIntPtr)markerNumber, (IntPtr)back.Value);
         }
 
         /// <summary>Set the background colour used for a particular marker number when its folding block is selected. (Scintilla feature 2296)</summary>
         public void MarkerSetBackSelectedTranslucent(int markerNumber, ColourAlpha back)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERSETBACKSELECTEDTRANSLUCENT, (UIntPtr)markerNumber, (IntPtr)back.Value);
+            Send(SciMsg.SCI_MARKERSETBACKSELECTEDTRANSLUCENT, (UIntPtr)markerNumber, (IntPtr)back.Value);
         }
 
         /// <summary>Set the width of strokes used in .01 pixels so 50 = 1/2 pixel width. (Scintilla feature 2297)</summary>
         public void MarkerSetStrokeWidth(int markerNumber, int hundredths)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERSETSTROKEWIDTH, (UIntPtr)markerNumber, (IntPtr)hundredths);
+            Send(SciMsg.SCI_MARKERSETSTROKEWIDTH, (UIntPtr)markerNumber, (IntPtr)hundredths);
         }
 
         /// <summary>Enable/disable highlight for current folding block (smallest one that contains the caret) (Scintilla feature 2293)</summary>
         public void MarkerEnableHighlight(bool enabled)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERENABLEHIGHLIGHT, new UIntPtr(enabled ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_MARKERENABLEHIGHLIGHT, new UIntPtr(enabled ? 1U : 0U), Unused);
         }
 
         /// <summary>Add a marker to a line, returning an ID which can be used to find or delete the marker. (Scintilla feature 2043)</summary>
         public int MarkerAdd(Position line, int markerNumber)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_MARKERADD, (UIntPtr)line, (IntPtr)markerNumber);
+            return (int)Send(SciMsg.SCI_MARKERADD, (UIntPtr)line, (IntPtr)markerNumber);
         }
 
         /// <summary>Delete a marker from a line. (Scintilla feature 2044)</summary>
         public void MarkerDelete(Position line, int markerNumber)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERDELETE, (UIntPtr)line, (IntPtr)markerNumber);
+            Send(SciMsg.SCI_MARKERDELETE, (UIntPtr)line, (IntPtr)markerNumber);
         }
 
         /// <summary>Delete all markers with a particular number from all lines. (Scintilla feature 2045)</summary>
         public void MarkerDeleteAll(int markerNumber)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERDELETEALL, (UIntPtr)markerNumber, Unused);
+            Send(SciMsg.SCI_MARKERDELETEALL, (UIntPtr)markerNumber, Unused);
         }
 
         /// <summary>Get a bit mask of all the markers set on a line. (Scintilla feature 2046)</summary>
         public int MarkerGet(Position line)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_MARKERGET, (UIntPtr)line, Unused);
+            return (int)Send(SciMsg.SCI_MARKERGET, (UIntPtr)line, Unused);
         }
 
         /// <summary>
@@ -681,13 +1245,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position MarkerNext(Position lineStart, int markerMask)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_MARKERNEXT, (UIntPtr)lineStart, (IntPtr)markerMask);
+            return Send(SciMsg.SCI_MARKERNEXT, (UIntPtr)lineStart, (IntPtr)markerMask);
         }
 
         /// <summary>Find the previous line before lineStart that includes a marker in mask. (Scintilla feature 2048)</summary>
         public Position MarkerPrevious(Position lineStart, int markerMask)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_MARKERPREVIOUS, (UIntPtr)lineStart, (IntPtr)markerMask);
+            return Send(SciMsg.SCI_MARKERPREVIOUS, (UIntPtr)lineStart, (IntPtr)markerMask);
         }
 
         /// <summary>Define a marker from a pixmap. (Scintilla feature 2049)</summary>
@@ -699,145 +1263,145 @@ namespace Npp.DotNet.Plugin
         /// <summary>Add a set of markers to a line. (Scintilla feature 2466)</summary>
         public void MarkerAddSet(Position line, int markerSet)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERADDSET, (UIntPtr)line, (IntPtr)markerSet);
+            Send(SciMsg.SCI_MARKERADDSET, (UIntPtr)line, (IntPtr)markerSet);
         }
 
         /// <summary>Set the alpha used for a marker that is drawn in the text area, not the margin. (Scintilla feature 2476)</summary>
         public void MarkerSetAlpha(int markerNumber, Alpha alpha)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERSETALPHA, (UIntPtr)markerNumber, (IntPtr)alpha);
+            Send(SciMsg.SCI_MARKERSETALPHA, (UIntPtr)markerNumber, (IntPtr)alpha);
         }
 
         /// <summary>Get the layer used for a marker that is drawn in the text area, not the margin. (Scintilla feature 2734)</summary>
         public Layer MarkerGetLayer(int markerNumber)
         {
-            return (Layer)SendMessage(_scintilla, SciMsg.SCI_MARKERGETLAYER, (UIntPtr)markerNumber, Unused);
+            return (Layer)Send(SciMsg.SCI_MARKERGETLAYER, (UIntPtr)markerNumber, Unused);
         }
 
         /// <summary>Set the layer used for a marker that is drawn in the text area, not the margin. (Scintilla feature 2735)</summary>
         public void MarkerSetLayer(int markerNumber, Layer layer)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARKERSETLAYER, (UIntPtr)markerNumber, (IntPtr)layer);
+            Send(SciMsg.SCI_MARKERSETLAYER, (UIntPtr)markerNumber, (IntPtr)layer);
         }
 
         /// <summary>Set a margin to be either numeric or symbolic. (Scintilla feature 2240)</summary>
         public void SetMarginTypeN(int margin, MarginType marginType)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMARGINTYPEN, (UIntPtr)margin, (IntPtr)marginType);
+            Send(SciMsg.SCI_SETMARGINTYPEN, (UIntPtr)margin, (IntPtr)marginType);
         }
 
         /// <summary>Retrieve the type of a margin. (Scintilla feature 2241)</summary>
         public MarginType GetMarginTypeN(int margin)
         {
-            return (MarginType)SendMessage(_scintilla, SciMsg.SCI_GETMARGINTYPEN, (UIntPtr)margin, Unused);
+            return (MarginType)Send(SciMsg.SCI_GETMARGINTYPEN, (UIntPtr)margin, Unused);
         }
 
         /// <summary>Set the width of a margin to a width expressed in pixels. (Scintilla feature 2242)</summary>
         public void SetMarginWidthN(int margin, int pixelWidth)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMARGINWIDTHN, (UIntPtr)margin, (IntPtr)pixelWidth);
+            Send(SciMsg.SCI_SETMARGINWIDTHN, (UIntPtr)margin, (IntPtr)pixelWidth);
         }
 
         /// <summary>Retrieve the width of a margin in pixels. (Scintilla feature 2243)</summary>
         public int GetMarginWidthN(int margin)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETMARGINWIDTHN, (UIntPtr)margin, Unused);
+            return (int)Send(SciMsg.SCI_GETMARGINWIDTHN, (UIntPtr)margin, Unused);
         }
 
         /// <summary>Set a mask that determines which markers are displayed in a margin. (Scintilla feature 2244)</summary>
         public void SetMarginMaskN(int margin, int mask)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMARGINMASKN, (UIntPtr)margin, (IntPtr)mask);
+            Send(SciMsg.SCI_SETMARGINMASKN, (UIntPtr)margin, (IntPtr)mask);
         }
 
         /// <summary>Retrieve the marker mask of a margin. (Scintilla feature 2245)</summary>
         public int GetMarginMaskN(int margin)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETMARGINMASKN, (UIntPtr)margin, Unused);
+            return (int)Send(SciMsg.SCI_GETMARGINMASKN, (UIntPtr)margin, Unused);
         }
 
         /// <summary>Make a margin sensitive or insensitive to mouse clicks. (Scintilla feature 2246)</summary>
         public void SetMarginSensitiveN(int margin, bool sensitive)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMARGINSENSITIVEN, (UIntPtr)margin, new IntPtr(sensitive ? 1 : 0));
+            Send(SciMsg.SCI_SETMARGINSENSITIVEN, (UIntPtr)margin, new IntPtr(sensitive ? 1 : 0));
         }
 
         /// <summary>Retrieve the mouse click sensitivity of a margin. (Scintilla feature 2247)</summary>
         public bool GetMarginSensitiveN(int margin)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETMARGINSENSITIVEN, (UIntPtr)margin, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETMARGINSENSITIVEN, (UIntPtr)margin, Unused);
         }
 
         /// <summary>Set the cursor shown when the mouse is inside a margin. (Scintilla feature 2248)</summary>
         public void SetMarginCursorN(int margin, CursorShape cursor)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMARGINCURSORN, (UIntPtr)margin, (IntPtr)cursor);
+            Send(SciMsg.SCI_SETMARGINCURSORN, (UIntPtr)margin, (IntPtr)cursor);
         }
 
         /// <summary>Retrieve the cursor shown in a margin. (Scintilla feature 2249)</summary>
         public CursorShape GetMarginCursorN(int margin)
         {
-            return (CursorShape)SendMessage(_scintilla, SciMsg.SCI_GETMARGINCURSORN, (UIntPtr)margin, Unused);
+            return (CursorShape)Send(SciMsg.SCI_GETMARGINCURSORN, (UIntPtr)margin, Unused);
         }
 
         /// <summary>Set the background colour of a margin. Only visible for SC_MARGIN_COLOUR. (Scintilla feature 2250)</summary>
         public void SetMarginBackN(int margin, Colour back)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMARGINBACKN, (UIntPtr)margin, (IntPtr)back.Value);
+            Send(SciMsg.SCI_SETMARGINBACKN, (UIntPtr)margin, (IntPtr)back.Value);
         }
 
         /// <summary>Retrieve the background colour of a margin (Scintilla feature 2251)</summary>
         public Colour GetMarginBackN(int margin)
         {
-            return new Colour((int)SendMessage(_scintilla, SciMsg.SCI_GETMARGINBACKN, (UIntPtr)margin, Unused));
+            return new Colour((int)Send(SciMsg.SCI_GETMARGINBACKN, (UIntPtr)margin, Unused));
         }
 
         /// <summary>Allocate a non-standard number of margins. (Scintilla feature 2252)</summary>
         public void SetMargins(int margins)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMARGINS, (UIntPtr)margins, Unused);
+            Send(SciMsg.SCI_SETMARGINS, (UIntPtr)margins, Unused);
         }
 
         /// <summary>How many margins are there?. (Scintilla feature 2253)</summary>
         public int GetMargins()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETMARGINS, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETMARGINS, UnusedW, Unused);
         }
 
         /// <summary>Clear all the styles and make equivalent to the global default style. (Scintilla feature 2050)</summary>
         public void StyleClearAll()
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLECLEARALL, UnusedW, Unused);
+            Send(SciMsg.SCI_STYLECLEARALL, UnusedW, Unused);
         }
 
         /// <summary>Set the foreground colour of a style. (Scintilla feature 2051)</summary>
         public void StyleSetFore(int style, Colour fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETFORE, (UIntPtr)style, (IntPtr)fore.Value);
+            Send(SciMsg.SCI_STYLESETFORE, (UIntPtr)style, (IntPtr)fore.Value);
         }
 
         /// <summary>Set the background colour of a style. (Scintilla feature 2052)</summary>
         public void StyleSetBack(int style, Colour back)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETBACK, (UIntPtr)style, (IntPtr)back.Value);
+            Send(SciMsg.SCI_STYLESETBACK, (UIntPtr)style, (IntPtr)back.Value);
         }
 
         /// <summary>Set a style to be bold or not. (Scintilla feature 2053)</summary>
         public void StyleSetBold(int style, bool bold)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETBOLD, (UIntPtr)style, new IntPtr(bold ? 1 : 0));
+            Send(SciMsg.SCI_STYLESETBOLD, (UIntPtr)style, new IntPtr(bold ? 1 : 0));
         }
 
         /// <summary>Set a style to be italic or not. (Scintilla feature 2054)</summary>
         public void StyleSetItalic(int style, bool italic)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETITALIC, (UIntPtr)style, new IntPtr(italic ? 1 : 0));
+            Send(SciMsg.SCI_STYLESETITALIC, (UIntPtr)style, new IntPtr(italic ? 1 : 0));
         }
 
         /// <summary>Set the size of characters of a style. (Scintilla feature 2055)</summary>
         public void StyleSetSize(int style, int sizePoints)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETSIZE, (UIntPtr)style, (IntPtr)sizePoints);
+            Send(SciMsg.SCI_STYLESETSIZE, (UIntPtr)style, (IntPtr)sizePoints);
         }
 
         /// <summary>Set the font of a style. (Scintilla feature 2056)</summary>
@@ -849,49 +1413,49 @@ namespace Npp.DotNet.Plugin
         /// <summary>Set a style to have its end of line filled or not. (Scintilla feature 2057)</summary>
         public void StyleSetEOLFilled(int style, bool eolFilled)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETEOLFILLED, (UIntPtr)style, new IntPtr(eolFilled ? 1 : 0));
+            Send(SciMsg.SCI_STYLESETEOLFILLED, (UIntPtr)style, new IntPtr(eolFilled ? 1 : 0));
         }
 
         /// <summary>Reset the default style to its state at startup (Scintilla feature 2058)</summary>
         public void StyleResetDefault()
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLERESETDEFAULT, UnusedW, Unused);
+            Send(SciMsg.SCI_STYLERESETDEFAULT, UnusedW, Unused);
         }
 
         /// <summary>Set a style to be underlined or not. (Scintilla feature 2059)</summary>
         public void StyleSetUnderline(int style, bool underline)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETUNDERLINE, (UIntPtr)style, new IntPtr(underline ? 1 : 0));
+            Send(SciMsg.SCI_STYLESETUNDERLINE, (UIntPtr)style, new IntPtr(underline ? 1 : 0));
         }
 
         /// <summary>Get the foreground colour of a style. (Scintilla feature 2481)</summary>
         public Colour StyleGetFore(int style)
         {
-            return new Colour((int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETFORE, (UIntPtr)style, Unused));
+            return new Colour((int)Send(SciMsg.SCI_STYLEGETFORE, (UIntPtr)style, Unused));
         }
 
         /// <summary>Get the background colour of a style. (Scintilla feature 2482)</summary>
         public Colour StyleGetBack(int style)
         {
-            return new Colour((int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETBACK, (UIntPtr)style, Unused));
+            return new Colour((int)Send(SciMsg.SCI_STYLEGETBACK, (UIntPtr)style, Unused));
         }
 
         /// <summary>Get is a style bold or not. (Scintilla feature 2483)</summary>
         public bool StyleGetBold(int style)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETBOLD, (UIntPtr)style, Unused);
+            return 1 == (int)Send(SciMsg.SCI_STYLEGETBOLD, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get is a style italic or not. (Scintilla feature 2484)</summary>
         public bool StyleGetItalic(int style)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETITALIC, (UIntPtr)style, Unused);
+            return 1 == (int)Send(SciMsg.SCI_STYLEGETITALIC, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get the size of characters of a style. (Scintilla feature 2485)</summary>
         public int StyleGetSize(int style)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETSIZE, (UIntPtr)style, Unused);
+            return (int)Send(SciMsg.SCI_STYLEGETSIZE, (UIntPtr)style, Unused);
         }
 
         /// <summary>
@@ -905,34 +1469,57 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_STYLEGETFONT, Encoding.UTF8, (UIntPtr)style);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="StyleGetFont(int)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int StyleGetFont(int style, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_STYLEGETFONT, destination, (UIntPtr)style);
+        }
+
+        /// <inheritdoc cref="StyleGetFont(int)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int StyleGetFont(int style, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_STYLEGETFONT, writer, (UIntPtr)style);
+        }
+
+        /// <inheritdoc cref="StyleGetFont(int)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] StyleGetFont(int style, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_STYLEGETFONT, pool, out length, (UIntPtr)style);
+        }
+#endif
+
         /// <summary>Get is a style to have its end of line filled or not. (Scintilla feature 2487)</summary>
         public bool StyleGetEOLFilled(int style)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETEOLFILLED, (UIntPtr)style, Unused);
+            return 1 == (int)Send(SciMsg.SCI_STYLEGETEOLFILLED, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get is a style underlined or not. (Scintilla feature 2488)</summary>
         public bool StyleGetUnderline(int style)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETUNDERLINE, (UIntPtr)style, Unused);
+            return 1 == (int)Send(SciMsg.SCI_STYLEGETUNDERLINE, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get is a style mixed case, or to force upper or lower case. (Scintilla feature 2489)</summary>
         public CaseVisible StyleGetCase(int style)
         {
-            return (CaseVisible)SendMessage(_scintilla, SciMsg.SCI_STYLEGETCASE, (UIntPtr)style, Unused);
+            return (CaseVisible)Send(SciMsg.SCI_STYLEGETCASE, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get the character get of the font in a style. (Scintilla feature 2490)</summary>
         public CharacterSet StyleGetCharacterSet(int style)
         {
-            return (CharacterSet)SendMessage(_scintilla, SciMsg.SCI_STYLEGETCHARACTERSET, (UIntPtr)style, Unused);
+            return (CharacterSet)Send(SciMsg.SCI_STYLEGETCHARACTERSET, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get is a style visible or not. (Scintilla feature 2491)</summary>
         public bool StyleGetVisible(int style)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETVISIBLE, (UIntPtr)style, Unused);
+            return 1 == (int)Send(SciMsg.SCI_STYLEGETVISIBLE, (UIntPtr)style, Unused);
         }
 
         /// <summary>
@@ -942,79 +1529,79 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public bool StyleGetChangeable(int style)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETCHANGEABLE, (UIntPtr)style, Unused);
+            return 1 == (int)Send(SciMsg.SCI_STYLEGETCHANGEABLE, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get is a style a hotspot or not. (Scintilla feature 2493)</summary>
         public bool StyleGetHotSpot(int style)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETHOTSPOT, (UIntPtr)style, Unused);
+            return 1 == (int)Send(SciMsg.SCI_STYLEGETHOTSPOT, (UIntPtr)style, Unused);
         }
 
         /// <summary>Set a style to be mixed case, or to force upper or lower case. (Scintilla feature 2060)</summary>
         public void StyleSetCase(int style, CaseVisible caseVisible)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETCASE, (UIntPtr)style, (IntPtr)caseVisible);
+            Send(SciMsg.SCI_STYLESETCASE, (UIntPtr)style, (IntPtr)caseVisible);
         }
 
         /// <summary>Set the size of characters of a style. Size is in points multiplied by 100. (Scintilla feature 2061)</summary>
         public void StyleSetSizeFractional(int style, int sizeHundredthPoints)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETSIZEFRACTIONAL, (UIntPtr)style, (IntPtr)sizeHundredthPoints);
+            Send(SciMsg.SCI_STYLESETSIZEFRACTIONAL, (UIntPtr)style, (IntPtr)sizeHundredthPoints);
         }
 
         /// <summary>Get the size of characters of a style in points multiplied by 100 (Scintilla feature 2062)</summary>
         public int StyleGetSizeFractional(int style)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETSIZEFRACTIONAL, (UIntPtr)style, Unused);
+            return (int)Send(SciMsg.SCI_STYLEGETSIZEFRACTIONAL, (UIntPtr)style, Unused);
         }
 
         /// <summary>Set the weight of characters of a style. (Scintilla feature 2063)</summary>
         public void StyleSetWeight(int style, FontWeight weight)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETWEIGHT, (UIntPtr)style, (IntPtr)weight);
+            Send(SciMsg.SCI_STYLESETWEIGHT, (UIntPtr)style, (IntPtr)weight);
         }
 
         /// <summary>Get the weight of characters of a style. (Scintilla feature 2064)</summary>
         public FontWeight StyleGetWeight(int style)
         {
-            return (FontWeight)SendMessage(_scintilla, SciMsg.SCI_STYLEGETWEIGHT, (UIntPtr)style, Unused);
+            return (FontWeight)Send(SciMsg.SCI_STYLEGETWEIGHT, (UIntPtr)style, Unused);
         }
 
         /// <summary>Set the character set of the font in a style. (Scintilla feature 2066)</summary>
         public void StyleSetCharacterSet(int style, CharacterSet characterSet)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETCHARACTERSET, (UIntPtr)style, (IntPtr)characterSet);
+            Send(SciMsg.SCI_STYLESETCHARACTERSET, (UIntPtr)style, (IntPtr)characterSet);
         }
 
         /// <summary>Set a style to be a hotspot or not. (Scintilla feature 2409)</summary>
         public void StyleSetHotSpot(int style, bool hotspot)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETHOTSPOT, (UIntPtr)style, new IntPtr(hotspot ? 1 : 0));
+            Send(SciMsg.SCI_STYLESETHOTSPOT, (UIntPtr)style, new IntPtr(hotspot ? 1 : 0));
         }
 
         /// <summary>Indicate that a style may be monospaced over ASCII graphics characters which enables optimizations. (Scintilla feature 2254)</summary>
         public void StyleSetCheckMonospaced(int style, bool checkMonospaced)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETCHECKMONOSPACED, (UIntPtr)style, new IntPtr(checkMonospaced ? 1 : 0));
+            Send(SciMsg.SCI_STYLESETCHECKMONOSPACED, (UIntPtr)style, new IntPtr(checkMonospaced ? 1 : 0));
         }
 
         /// <summary>Get whether a style may be monospaced. (Scintilla feature 2255)</summary>
         public bool StyleGetCheckMonospaced(int style)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_STYLEGETCHECKMONOSPACED, (UIntPtr)style, Unused);
+            return 1 == (int)Send(SciMsg.SCI_STYLEGETCHECKMONOSPACED, (UIntPtr)style, Unused);
         }
 
         /// <summary>Set the stretch of characters of a style. (Scintilla feature 2258)</summary>
         public void StyleSetStretch(int style, FontStretch stretch)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETSTRETCH, (UIntPtr)style, (IntPtr)stretch);
+            Send(SciMsg.SCI_STYLESETSTRETCH, (UIntPtr)style, (IntPtr)stretch);
         }
 
         /// <summary>Get the stretch of characters of a style. (Scintilla feature 2259)</summary>
         public FontStretch StyleGetStretch(int style)
         {
-            return (FontStretch)SendMessage(_scintilla, SciMsg.SCI_STYLEGETSTRETCH, (UIntPtr)style, Unused);
+            return (FontStretch)Send(SciMsg.SCI_STYLEGETSTRETCH, (UIntPtr)style, Unused);
         }
 
         /// <summary>Set the invisible representation for a style. (Scintilla feature 2256)</summary>
@@ -1029,6 +1616,29 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_STYLEGETINVISIBLEREPRESENTATION, CodePage, (UIntPtr)style);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="StyleGetInvisibleRepresentation(int)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int StyleGetInvisibleRepresentation(int style, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_STYLEGETINVISIBLEREPRESENTATION, destination, (UIntPtr)style);
+        }
+
+        /// <inheritdoc cref="StyleGetInvisibleRepresentation(int)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int StyleGetInvisibleRepresentation(int style, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_STYLEGETINVISIBLEREPRESENTATION, writer, (UIntPtr)style);
+        }
+
+        /// <inheritdoc cref="StyleGetInvisibleRepresentation(int)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] StyleGetInvisibleRepresentation(int style, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_STYLEGETINVISIBLEREPRESENTATION, pool, out length, (UIntPtr)style);
+        }
+#endif
+
         /// <summary>
         /// Set the colour of an element. Translucency (alpha) may or may not be significant
         /// and this may depend on the platform. The alpha byte should commonly be 0xff for opaque.
@@ -1036,19 +1646,19 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetElementColour(Element element, ColourAlpha colourElement)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETELEMENTCOLOUR, (UIntPtr)element, (IntPtr)colourElement.Value);
+            Send(SciMsg.SCI_SETELEMENTCOLOUR, (UIntPtr)element, (IntPtr)colourElement.Value);
         }
 
         /// <summary>Get the colour of an element. (Scintilla feature 2754)</summary>
         public ColourAlpha GetElementColour(Element element)
         {
-            return new ColourAlpha((int)SendMessage(_scintilla, SciMsg.SCI_GETELEMENTCOLOUR, (UIntPtr)element, Unused));
+            return new ColourAlpha((int)Send(SciMsg.SCI_GETELEMENTCOLOUR, (UIntPtr)element, Unused));
         }
 
         /// <summary>Use the default or platform-defined colour for an element. (Scintilla feature 2755)</summary>
         public void ResetElementColour(Element element)
         {
-            SendMessage(_scintilla, SciMsg.SCI_RESETELEMENTCOLOUR, (UIntPtr)element, Unused);
+            Send(SciMsg.SCI_RESETELEMENTCOLOUR, (UIntPtr)element, Unused);
         }
 
         /// <summary>
@@ -1058,19 +1668,19 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public bool GetElementIsSet(Element element)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETELEMENTISSET, (UIntPtr)element, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETELEMENTISSET, (UIntPtr)element, Unused);
         }
 
         /// <summary>Get whether an element supports translucency. (Scintilla feature 2757)</summary>
         public bool GetElementAllowsTranslucent(Element element)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETELEMENTALLOWSTRANSLUCENT, (UIntPtr)element, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETELEMENTALLOWSTRANSLUCENT, (UIntPtr)element, Unused);
         }
 
         /// <summary>Get the colour of an element. (Scintilla feature 2758)</summary>
         public ColourAlpha GetElementBaseColour(Element element)
         {
-            return new ColourAlpha((int)SendMessage(_scintilla, SciMsg.SCI_GETELEMENTBASECOLOUR, (UIntPtr)element, Unused));
+            return new ColourAlpha((int)Send(SciMsg.SCI_GETELEMENTBASECOLOUR, (UIntPtr)element, Unused));
         }
 
         /// <summary>Set the foreground colour of the main and additional selections and whether to use this setting. (Scintilla feature 2067)</summary>
@@ -1092,49 +1702,49 @@ namespace Npp.DotNet.Plugin
         /// <summary>Is the selection end of line filled? (Scintilla feature 2479)</summary>
         public bool GetSelEOLFilled()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETSELEOLFILLED, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETSELEOLFILLED, UnusedW, Unused);
         }
 
         /// <summary>Set the selection to have its end of line filled or not. (Scintilla feature 2480)</summary>
         public void SetSelEOLFilled(bool filled)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELEOLFILLED, new UIntPtr(filled ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETSELEOLFILLED, new UIntPtr(filled ? 1U : 0U), Unused);
         }
 
         /// <summary>Get the layer for drawing selections (Scintilla feature 2762)</summary>
         public Layer GetSelectionLayer()
         {
-            return (Layer)SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONLAYER, UnusedW, Unused);
+            return (Layer)Send(SciMsg.SCI_GETSELECTIONLAYER, UnusedW, Unused);
         }
 
         /// <summary>Set the layer for drawing selections: either opaquely on base layer or translucently over text (Scintilla feature 2763)</summary>
         public void SetSelectionLayer(Layer layer)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTIONLAYER, (UIntPtr)layer, Unused);
+            Send(SciMsg.SCI_SETSELECTIONLAYER, (UIntPtr)layer, Unused);
         }
 
         /// <summary>Get the layer of the background of the line containing the caret. (Scintilla feature 2764)</summary>
         public Layer GetCaretLineLayer()
         {
-            return (Layer)SendMessage(_scintilla, SciMsg.SCI_GETCARETLINELAYER, UnusedW, Unused);
+            return (Layer)Send(SciMsg.SCI_GETCARETLINELAYER, UnusedW, Unused);
         }
 
         /// <summary>Set the layer of the background of the line containing the caret. (Scintilla feature 2765)</summary>
         public void SetCaretLineLayer(Layer layer)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCARETLINELAYER, (UIntPtr)layer, Unused);
+            Send(SciMsg.SCI_SETCARETLINELAYER, (UIntPtr)layer, Unused);
         }
 
         /// <summary>Get only highlighting subline instead of whole line. (Scintilla feature 2773)</summary>
         public bool GetCaretLineHighlightSubLine()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETCARETLINEHIGHLIGHTSUBLINE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETCARETLINEHIGHLIGHTSUBLINE, UnusedW, Unused);
         }
 
         /// <summary>Set only highlighting subline instead of whole line. (Scintilla feature 2774)</summary>
         public void SetCaretLineHighlightSubLine(bool subLine)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCARETLINEHIGHLIGHTSUBLINE, new UIntPtr(subLine ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETCARETLINEHIGHLIGHTSUBLINE, new UIntPtr(subLine ? 1U : 0U), Unused);
         }
 
         /// <summary>Set the foreground colour of the caret. (Scintilla feature 2069)</summary>
@@ -1144,19 +1754,19 @@ namespace Npp.DotNet.Plugin
         /// <summary>When key+modifier combination keyDefinition is pressed perform sciCommand. (Scintilla feature 2070)</summary>
         public void AssignCmdKey(KeyModifier keyDefinition, int sciCommand)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ASSIGNCMDKEY, (UIntPtr)keyDefinition.Value, (IntPtr)sciCommand);
+            Send(SciMsg.SCI_ASSIGNCMDKEY, (UIntPtr)keyDefinition.Value, (IntPtr)sciCommand);
         }
 
         /// <summary>When key+modifier combination keyDefinition is pressed do nothing. (Scintilla feature 2071)</summary>
         public void ClearCmdKey(KeyModifier keyDefinition)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CLEARCMDKEY, (UIntPtr)keyDefinition.Value, Unused);
+            Send(SciMsg.SCI_CLEARCMDKEY, (UIntPtr)keyDefinition.Value, Unused);
         }
 
         /// <summary>Drop all key mappings. (Scintilla feature 2072)</summary>
         public void ClearAllCmdKeys()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CLEARALLCMDKEYS, UnusedW, Unused);
+            Send(SciMsg.SCI_CLEARALLCMDKEYS, UnusedW, Unused);
         }
 
         /// <summary>Set the styles for a segment of the document. (Scintilla feature 2073)</summary>
@@ -1168,19 +1778,19 @@ namespace Npp.DotNet.Plugin
         /// <summary>Set a style to be visible or not. (Scintilla feature 2074)</summary>
         public void StyleSetVisible(int style, bool visible)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETVISIBLE, (UIntPtr)style, new IntPtr(visible ? 1 : 0));
+            Send(SciMsg.SCI_STYLESETVISIBLE, (UIntPtr)style, new IntPtr(visible ? 1 : 0));
         }
 
         /// <summary>Get the time in milliseconds that the caret is on and off. (Scintilla feature 2075)</summary>
         public int GetCaretPeriod()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETCARETPERIOD, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETCARETPERIOD, UnusedW, Unused);
         }
 
         /// <summary>Get the time in milliseconds that the caret is on and off. 0 = steady on. (Scintilla feature 2076)</summary>
         public void SetCaretPeriod(int periodMilliseconds)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCARETPERIOD, (UIntPtr)periodMilliseconds, Unused);
+            Send(SciMsg.SCI_SETCARETPERIOD, (UIntPtr)periodMilliseconds, Unused);
         }
 
         /// <summary>
@@ -1203,98 +1813,121 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETWORDCHARS, Encoding.UTF8);
         }
 
-        /// <summary>Set the number of characters to have directly indexed categories (Scintilla feature 2720)</summary>
-        public void SetCharacterCategoryOptimization(int countCharacters)
+#if NETCOREAPP
+        /// <inheritdoc cref="GetWordChars()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetWordChars(Span<byte> destination)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCHARACTERCATEGORYOPTIMIZATION, (UIntPtr)countCharacters, Unused);
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETWORDCHARS, destination);
         }
 
-        /// <summary>Get the number of characters to have directly indexed categories (Scintilla feature 2721)</summary>
-        public int GetCharacterCategoryOptimization()
+        /// <inheritdoc cref="GetWordChars()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetWordChars(IBufferWriter<byte> writer)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETCHARACTERCATEGORYOPTIMIZATION, UnusedW, Unused);
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETWORDCHARS, writer);
         }
 
-        /// <summary>
+        /// <inheritdoc cref="GetWordChars()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetWordChars(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETWORDCHARS, pool, out length);
+        }
+#endif
+
+        /// <summary>Set the number of characters to have directly indexed categories (Scintilla feature 2720)</summary>
+        public void SetCharacterCategoryOptimization(int countCharacters)
+        {
+            Send(SciMsg.SCI_SETCHARACTERCATEGORYOPTIMIZATION, (UIntPtr)countCharacters, Unused);
+        }
+
+        /// <summary>Get the number of characters to have directly indexed categories (Scintilla feature 2721)</summary>
+        public int GetCharacterCategoryOptimization()
+        {
+            return (int)Send(SciMsg.SCI_GETCHARACTERCATEGORYOPTIMIZATION, UnusedW, Unused);
+        }
+
+        /// <summary>
         /// Start a sequence of actions that is undone and redone as a unit.
         /// May be nested.
         /// (Scintilla feature 2078)
         /// </summary>
         public void BeginUndoAction()
         {
-            SendMessage(_scintilla, SciMsg.SCI_BEGINUNDOACTION, UnusedW, Unused);
+            Send(SciMsg.SCI_BEGINUNDOACTION, UnusedW, Unused);
         }
 
         /// <summary>End a sequence of actions that is undone and redone as a unit. (Scintilla feature 2079)</summary>
         public void EndUndoAction()
         {
-            SendMessage(_scintilla, SciMsg.SCI_ENDUNDOACTION, UnusedW, Unused);
+            Send(SciMsg.SCI_ENDUNDOACTION, UnusedW, Unused);
         }
 
         /// <summary>Is an undo sequence active? (Scintilla feature 2799)</summary>
         public int GetUndoSequence()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETUNDOSEQUENCE, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETUNDOSEQUENCE, UnusedW, Unused);
         }
 
         /// <summary>How many undo actions are in the history? (Scintilla feature 2790)</summary>
         public int GetUndoActions()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETUNDOACTIONS, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETUNDOACTIONS, UnusedW, Unused);
         }
 
         /// <summary>Set action as the save point (Scintilla feature 2791)</summary>
         public void SetUndoSavePoint(int action)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETUNDOSAVEPOINT, (UIntPtr)action, Unused);
+            Send(SciMsg.SCI_SETUNDOSAVEPOINT, (UIntPtr)action, Unused);
         }
 
         /// <summary>Which action is the save point? (Scintilla feature 2792)</summary>
         public int GetUndoSavePoint()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETUNDOSAVEPOINT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETUNDOSAVEPOINT, UnusedW, Unused);
         }
 
         /// <summary>Set action as the detach point (Scintilla feature 2793)</summary>
         public void SetUndoDetach(int action)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETUNDODETACH, (UIntPtr)action, Unused);
+            Send(SciMsg.SCI_SETUNDODETACH, (UIntPtr)action, Unused);
         }
 
         /// <summary>Which action is the detach point? (Scintilla feature 2794)</summary>
         public int GetUndoDetach()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETUNDODETACH, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETUNDODETACH, UnusedW, Unused);
         }
 
         /// <summary>Set action as the tentative point (Scintilla feature 2795)</summary>
         public void SetUndoTentative(int action)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETUNDOTENTATIVE, (UIntPtr)action, Unused);
+            Send(SciMsg.SCI_SETUNDOTENTATIVE, (UIntPtr)action, Unused);
         }
 
         /// <summary>Which action is the tentative point? (Scintilla feature 2796)</summary>
         public int GetUndoTentative()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETUNDOTENTATIVE, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETUNDOTENTATIVE, UnusedW, Unused);
         }
 
         /// <summary>Set action as the current point (Scintilla feature 2797)</summary>
         public void SetUndoCurrent(int action)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETUNDOCURRENT, (UIntPtr)action, Unused);
+            Send(SciMsg.SCI_SETUNDOCURRENT, (UIntPtr)action, Unused);
         }
 
         /// <summary>Which action is the current point? (Scintilla feature 2798)</summary>
         public int GetUndoCurrent()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETUNDOCURRENT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETUNDOCURRENT, UnusedW, Unused);
         }
 
         /// <summary>Push one action onto undo history with no text (Scintilla feature 2800)</summary>
         public void PushUndoActionType(int type, Position pos)
         {
-            SendMessage(_scintilla, SciMsg.SCI_PUSHUNDOACTIONTYPE, (UIntPtr)type, (IntPtr)pos);
+            Send(SciMsg.SCI_PUSHUNDOACTIONTYPE, (UIntPtr)type, (IntPtr)pos);
         }
 
         /// <summary>Set the text and length of the most recently pushed action (Scintilla feature 2801)</summary>
@@ -1303,16 +1936,25 @@ namespace Npp.DotNet.Plugin
             SendEncodedBytes(SciMsg.SCI_CHANGELASTUNDOACTIONTEXT, text);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ChangeLastUndoActionText(string)"/>
+        /// <remarks>The bytes of <paramref name="text"/> are sent as they are, without encoding.</remarks>
+        public void ChangeLastUndoActionText(ReadOnlySpan<byte> text)
+        {
+            SendBytes(SciMsg.SCI_CHANGELASTUNDOACTIONTEXT, text);
+        }
+#endif
+
         /// <summary>What is the type of an action? (Scintilla feature 2802)</summary>
         public int GetUndoActionType(int action)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETUNDOACTIONTYPE, (UIntPtr)action, Unused);
+            return (int)Send(SciMsg.SCI_GETUNDOACTIONTYPE, (UIntPtr)action, Unused);
         }
 
         /// <summary>What is the position of an action? (Scintilla feature 2803)</summary>
         public Position GetUndoActionPosition(int action)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETUNDOACTIONPOSITION, (UIntPtr)action, Unused);
+            return Send(SciMsg.SCI_GETUNDOACTIONPOSITION, (UIntPtr)action, Unused);
         }
 
         /// <summary>What is the text of an action? (Scintilla feature 2804)</summary>
@@ -1321,130 +1963,153 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETUNDOACTIONTEXT, CodePage, (UIntPtr)action);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetUndoActionText(int)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetUndoActionText(int action, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETUNDOACTIONTEXT, destination, (UIntPtr)action);
+        }
+
+        /// <inheritdoc cref="GetUndoActionText(int)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetUndoActionText(int action, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETUNDOACTIONTEXT, writer, (UIntPtr)action);
+        }
+
+        /// <inheritdoc cref="GetUndoActionText(int)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetUndoActionText(int action, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETUNDOACTIONTEXT, pool, out length, (UIntPtr)action);
+        }
+#endif
+
         /// <summary>Set an indicator to plain, squiggle or TT. (Scintilla feature 2080)</summary>
         public void IndicSetStyle(int indicator, IndicatorStyle indicatorStyle)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICSETSTYLE, (UIntPtr)indicator, (IntPtr)indicatorStyle);
+            Send(SciMsg.SCI_INDICSETSTYLE, (UIntPtr)indicator, (IntPtr)indicatorStyle);
         }
 
         /// <summary>Retrieve the style of an indicator. (Scintilla feature 2081)</summary>
         public IndicatorStyle IndicGetStyle(int indicator)
         {
-            return (IndicatorStyle)SendMessage(_scintilla, SciMsg.SCI_INDICGETSTYLE, (UIntPtr)indicator, Unused);
+            return (IndicatorStyle)Send(SciMsg.SCI_INDICGETSTYLE, (UIntPtr)indicator, Unused);
         }
 
         /// <summary>Set the foreground colour of an indicator. (Scintilla feature 2082)</summary>
         public void IndicSetFore(int indicator, Colour fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICSETFORE, (UIntPtr)indicator, (IntPtr)fore.Value);
+            Send(SciMsg.SCI_INDICSETFORE, (UIntPtr)indicator, (IntPtr)fore.Value);
         }
 
         /// <summary>Retrieve the foreground colour of an indicator. (Scintilla feature 2083)</summary>
         public Colour IndicGetFore(int indicator)
         {
-            return new Colour((int)SendMessage(_scintilla, SciMsg.SCI_INDICGETFORE, (UIntPtr)indicator, Unused));
+            return new Colour((int)Send(SciMsg.SCI_INDICGETFORE, (UIntPtr)indicator, Unused));
         }
 
         /// <summary>Set an indicator to draw under text or over(default). (Scintilla feature 2510)</summary>
         public void IndicSetUnder(int indicator, bool under)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICSETUNDER, (UIntPtr)indicator, new IntPtr(under ? 1 : 0));
+            Send(SciMsg.SCI_INDICSETUNDER, (UIntPtr)indicator, new IntPtr(under ? 1 : 0));
         }
 
         /// <summary>Retrieve whether indicator drawn under or over text. (Scintilla feature 2511)</summary>
         public bool IndicGetUnder(int indicator)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_INDICGETUNDER, (UIntPtr)indicator, Unused);
+            return 1 == (int)Send(SciMsg.SCI_INDICGETUNDER, (UIntPtr)indicator, Unused);
         }
 
         /// <summary>Set a hover indicator to plain, squiggle or TT. (Scintilla feature 2680)</summary>
         public void IndicSetHoverStyle(int indicator, IndicatorStyle indicatorStyle)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICSETHOVERSTYLE, (UIntPtr)indicator, (IntPtr)indicatorStyle);
+            Send(SciMsg.SCI_INDICSETHOVERSTYLE, (UIntPtr)indicator, (IntPtr)indicatorStyle);
         }
 
         /// <summary>Retrieve the hover style of an indicator. (Scintilla feature 2681)</summary>
         public IndicatorStyle IndicGetHoverStyle(int indicator)
         {
-            return (IndicatorStyle)SendMessage(_scintilla, SciMsg.SCI_INDICGETHOVERSTYLE, (UIntPtr)indicator, Unused);
+            return (IndicatorStyle)Send(SciMsg.SCI_INDICGETHOVERSTYLE, (UIntPtr)indicator, Unused);
         }
 
         /// <summary>Set the foreground hover colour of an indicator. (Scintilla feature 2682)</summary>
         public void IndicSetHoverFore(int indicator, Colour fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICSETHOVERFORE, (UIntPtr)indicator, (IntPtr)fore.Value);
+            Send(SciMsg.SCI_INDICSETHOVERFORE, (UIntPtr)indicator, (IntPtr)fore.Value);
         }
 
         /// <summary>Retrieve the foreground hover colour of an indicator. (Scintilla feature 2683)</summary>
         public Colour IndicGetHoverFore(int indicator)
         {
-            return new Colour((int)SendMessage(_scintilla, SciMsg.SCI_INDICGETHOVERFORE, (UIntPtr)indicator, Unused));
+            return new Colour((int)Send(SciMsg.SCI_INDICGETHOVERFORE, (UIntPtr)indicator, Unused));
         }
 
         /// <summary>Set the attributes of an indicator. (Scintilla feature 2684)</summary>
         public void IndicSetFlags(int indicator, IndicFlag flags)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICSETFLAGS, (UIntPtr)indicator, (IntPtr)flags);
+            Send(SciMsg.SCI_INDICSETFLAGS, (UIntPtr)indicator, (IntPtr)flags);
         }
 
         /// <summary>Retrieve the attributes of an indicator. (Scintilla feature 2685)</summary>
         public IndicFlag IndicGetFlags(int indicator)
         {
-            return (IndicFlag)SendMessage(_scintilla, SciMsg.SCI_INDICGETFLAGS, (UIntPtr)indicator, Unused);
+            return (IndicFlag)Send(SciMsg.SCI_INDICGETFLAGS, (UIntPtr)indicator, Unused);
         }
 
         /// <summary>Set the stroke width of an indicator in hundredths of a pixel. (Scintilla feature 2751)</summary>
         public void IndicSetStrokeWidth(int indicator, int hundredths)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICSETSTROKEWIDTH, (UIntPtr)indicator, (IntPtr)hundredths);
+            Send(SciMsg.SCI_INDICSETSTROKEWIDTH, (UIntPtr)indicator, (IntPtr)hundredths);
         }
 
         /// <summary>Retrieve the stroke width of an indicator. (Scintilla feature 2752)</summary>
         public int IndicGetStrokeWidth(int indicator)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_INDICGETSTROKEWIDTH, (UIntPtr)indicator, Unused);
+            return (int)Send(SciMsg.SCI_INDICGETSTROKEWIDTH, (UIntPtr)indicator, Unused);
         }
 
         /// <summary>Set the foreground colour of all whitespace and whether to use this setting. (Scintilla feature 2084)</summary>
         public void SetWhitespaceFore(bool useSetting, Colour fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETWHITESPACEFORE, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)fore.Value);
+            Send(SciMsg.SCI_SETWHITESPACEFORE, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)fore.Value);
         }
 
         /// <summary>Set the background colour of all whitespace and whether to use this setting. (Scintilla feature 2085)</summary>
         public void SetWhitespaceBack(bool useSetting, Colour back)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETWHITESPACEBACK, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)back.Value);
+            Send(SciMsg.SCI_SETWHITESPACEBACK, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)back.Value);
         }
 
         /// <summary>Set the size of the dots used to mark space characters. (Scintilla feature 2086)</summary>
         public void SetWhitespaceSize(int size)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETWHITESPACESIZE, (UIntPtr)size, Unused);
+            Send(SciMsg.SCI_SETWHITESPACESIZE, (UIntPtr)size, Unused);
         }
 
         /// <summary>Get the size of the dots used to mark space characters. (Scintilla feature 2087)</summary>
         public int GetWhitespaceSize()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETWHITESPACESIZE, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETWHITESPACESIZE, UnusedW, Unused);
         }
 
         /// <summary>Used to hold extra styling information for each line. (Scintilla feature 2092)</summary>
         public void SetLineState(Position line, int state)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETLINESTATE, (UIntPtr)line, (IntPtr)state);
+            Send(SciMsg.SCI_SETLINESTATE, (UIntPtr)line, (IntPtr)state);
         }
 
         /// <summary>Retrieve the extra styling information for a line. (Scintilla feature 2093)</summary>
         public int GetLineState(Position line)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETLINESTATE, (UIntPtr)line, Unused);
+            return (int)Send(SciMsg.SCI_GETLINESTATE, (UIntPtr)line, Unused);
         }
 
         /// <summary>Retrieve the last line number that has line state. (Scintilla feature 2094)</summary>
         public int GetMaxLineState()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETMAXLINESTATE, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETMAXLINESTATE, UnusedW, Unused);
         }
 
         /// <summary>Is the background of the line containing the caret in a different colour? (Scintilla feature 2095)</summary>
@@ -1470,7 +2135,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public int GetCaretLineFrame()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETCARETLINEFRAME, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETCARETLINEFRAME, UnusedW, Unused);
         }
 
         /// <summary>
@@ -1480,7 +2145,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetCaretLineFrame(int width)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCARETLINEFRAME, (UIntPtr)width, Unused);
+            Send(SciMsg.SCI_SETCARETLINEFRAME, (UIntPtr)width, Unused);
         }
 
         /// <summary>
@@ -1490,7 +2155,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void StyleSetChangeable(int style, bool changeable)
         {
-            SendMessage(_scintilla, SciMsg.SCI_STYLESETCHANGEABLE, (UIntPtr)style, new IntPtr(changeable ? 1 : 0));
+            Send(SciMsg.SCI_STYLESETCHANGEABLE, (UIntPtr)style, new IntPtr(changeable ? 1 : 0));
         }
 
         /// <summary>
@@ -1507,25 +2172,25 @@ namespace Npp.DotNet.Plugin
         /// <summary>Remove the auto-completion list from the screen. (Scintilla feature 2101)</summary>
         public void AutoCCancel()
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCCANCEL, UnusedW, Unused);
+            Send(SciMsg.SCI_AUTOCCANCEL, UnusedW, Unused);
         }
 
         /// <summary>Is there an auto-completion list visible? (Scintilla feature 2102)</summary>
         public bool AutoCActive()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCACTIVE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_AUTOCACTIVE, UnusedW, Unused);
         }
 
         /// <summary>Retrieve the position of the caret when the auto-completion list was displayed. (Scintilla feature 2103)</summary>
         public Position AutoCPosStart()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_AUTOCPOSSTART, UnusedW, Unused);
+            return Send(SciMsg.SCI_AUTOCPOSSTART, UnusedW, Unused);
         }
 
         /// <summary>User has selected an item so remove the list and insert the selection. (Scintilla feature 2104)</summary>
         public void AutoCComplete()
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCCOMPLETE, UnusedW, Unused);
+            Send(SciMsg.SCI_AUTOCCOMPLETE, UnusedW, Unused);
         }
 
         /// <summary>Define a set of character that when typed cancel the auto-completion list. (Scintilla feature 2105)</summary>
@@ -1541,13 +2206,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void AutoCSetSeparator(int separatorCharacter)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETSEPARATOR, (UIntPtr)separatorCharacter, Unused);
+            Send(SciMsg.SCI_AUTOCSETSEPARATOR, (UIntPtr)separatorCharacter, Unused);
         }
 
         /// <summary>Retrieve the auto-completion list separator character. (Scintilla feature 2107)</summary>
         public int AutoCGetSeparator()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETSEPARATOR, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_AUTOCGETSEPARATOR, UnusedW, Unused);
         }
 
         /// <summary>Select the item in the auto-completion list that starts with a string. (Scintilla feature 2108)</summary>
@@ -1563,13 +2228,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void AutoCSetCancelAtStart(bool cancel)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETCANCELATSTART, new UIntPtr(cancel ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_AUTOCSETCANCELATSTART, new UIntPtr(cancel ? 1U : 0U), Unused);
         }
 
         /// <summary>Retrieve whether auto-completion cancelled by backspacing before start. (Scintilla feature 2111)</summary>
         public bool AutoCGetCancelAtStart()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETCANCELATSTART, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_AUTOCGETCANCELATSTART, UnusedW, Unused);
         }
 
         /// <summary>
@@ -1585,25 +2250,25 @@ namespace Npp.DotNet.Plugin
         /// <summary>Should a single item auto-completion list automatically choose the item. (Scintilla feature 2113)</summary>
         public void AutoCSetChooseSingle(bool chooseSingle)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETCHOOSESINGLE, new UIntPtr(chooseSingle ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_AUTOCSETCHOOSESINGLE, new UIntPtr(chooseSingle ? 1U : 0U), Unused);
         }
 
         /// <summary>Retrieve whether a single item auto-completion list automatically choose the item. (Scintilla feature 2114)</summary>
         public bool AutoCGetChooseSingle()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETCHOOSESINGLE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_AUTOCGETCHOOSESINGLE, UnusedW, Unused);
         }
 
         /// <summary>Set whether case is significant when performing auto-completion searches. (Scintilla feature 2115)</summary>
         public void AutoCSetIgnoreCase(bool ignoreCase)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETIGNORECASE, new UIntPtr(ignoreCase ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_AUTOCSETIGNORECASE, new UIntPtr(ignoreCase ? 1U : 0U), Unused);
         }
 
         /// <summary>Retrieve state of ignore case flag. (Scintilla feature 2116)</summary>
         public bool AutoCGetIgnoreCase()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETIGNORECASE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_AUTOCGETIGNORECASE, UnusedW, Unused);
         }
 
         /// <summary>Display a list of strings and send notification when user chooses one. (Scintilla feature 2117)</summary>
@@ -1615,25 +2280,25 @@ namespace Npp.DotNet.Plugin
         /// <summary>Set whether or not autocompletion is hidden automatically when nothing matches. (Scintilla feature 2118)</summary>
         public void AutoCSetAutoHide(bool autoHide)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETAUTOHIDE, new UIntPtr(autoHide ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_AUTOCSETAUTOHIDE, new UIntPtr(autoHide ? 1U : 0U), Unused);
         }
 
         /// <summary>Retrieve whether or not autocompletion is hidden automatically when nothing matches. (Scintilla feature 2119)</summary>
         public bool AutoCGetAutoHide()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETAUTOHIDE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_AUTOCGETAUTOHIDE, UnusedW, Unused);
         }
 
         /// <summary>Set autocompletion options. (Scintilla feature 2638)</summary>
         public void AutoCSetOptions(AutoCompleteOption options)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETOPTIONS, (UIntPtr)options, Unused);
+            Send(SciMsg.SCI_AUTOCSETOPTIONS, (UIntPtr)options, Unused);
         }
 
         /// <summary>Retrieve autocompletion options. (Scintilla feature 2639)</summary>
         public AutoCompleteOption AutoCGetOptions()
         {
-            return (AutoCompleteOption)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETOPTIONS, UnusedW, Unused);
+            return (AutoCompleteOption)Send(SciMsg.SCI_AUTOCGETOPTIONS, UnusedW, Unused);
         }
 
         /// <summary>
@@ -1643,7 +2308,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void AutoCSetDropRestOfWord(bool dropRestOfWord)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETDROPRESTOFWORD, new UIntPtr(dropRestOfWord ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_AUTOCSETDROPRESTOFWORD, new UIntPtr(dropRestOfWord ? 1U : 0U), Unused);
         }
 
         /// <summary>
@@ -1653,7 +2318,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public bool AutoCGetDropRestOfWord()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETDROPRESTOFWORD, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_AUTOCGETDROPRESTOFWORD, UnusedW, Unused);
         }
 
         /// <summary>Register an XPM image for use in autocompletion lists. (Scintilla feature 2405)</summary>
@@ -1665,13 +2330,13 @@ namespace Npp.DotNet.Plugin
         /// <summary>Clear all the registered XPM images. (Scintilla feature 2408)</summary>
         public void ClearRegisteredImages()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CLEARREGISTEREDIMAGES, UnusedW, Unused);
+            Send(SciMsg.SCI_CLEARREGISTEREDIMAGES, UnusedW, Unused);
         }
 
         /// <summary>Retrieve the auto-completion list type-separator character. (Scintilla feature 2285)</summary>
         public int AutoCGetTypeSeparator()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETTYPESEPARATOR, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_AUTOCGETTYPESEPARATOR, UnusedW, Unused);
         }
 
         /// <summary>
@@ -1681,7 +2346,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void AutoCSetTypeSeparator(int separatorCharacter)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETTYPESEPARATOR, (UIntPtr)separatorCharacter, Unused);
+            Send(SciMsg.SCI_AUTOCSETTYPESEPARATOR, (UIntPtr)separatorCharacter, Unused);
         }
 
         /// <summary>
@@ -1691,13 +2356,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void AutoCSetMaxWidth(int characterCount)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETMAXWIDTH, (UIntPtr)characterCount, Unused);
+            Send(SciMsg.SCI_AUTOCSETMAXWIDTH, (UIntPtr)characterCount, Unused);
         }
 
         /// <summary>Get the maximum width, in characters, of auto-completion and user lists. (Scintilla feature 2209)</summary>
         public int AutoCGetMaxWidth()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETMAXWIDTH, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_AUTOCGETMAXWIDTH, UnusedW, Unused);
         }
 
         /// <summary>
@@ -1707,49 +2372,49 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void AutoCSetMaxHeight(int rowCount)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETMAXHEIGHT, (UIntPtr)rowCount, Unused);
+            Send(SciMsg.SCI_AUTOCSETMAXHEIGHT, (UIntPtr)rowCount, Unused);
         }
 
         /// <summary>Set the maximum height, in rows, of auto-completion and user lists. (Scintilla feature 2211)</summary>
         public int AutoCGetMaxHeight()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETMAXHEIGHT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_AUTOCGETMAXHEIGHT, UnusedW, Unused);
         }
 
         /// <summary>Set the style number used for auto-completion and user lists fonts. (Scintilla feature 2109)</summary>
         public void AutoCSetStyle(int style)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETSTYLE, (UIntPtr)style, Unused);
+            Send(SciMsg.SCI_AUTOCSETSTYLE, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get the style number used for auto-completion and user lists fonts. (Scintilla feature 2120)</summary>
         public int AutoCGetStyle()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETSTYLE, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_AUTOCGETSTYLE, UnusedW, Unused);
         }
 
         /// <summary>Set the scale factor in percent for auto-completion list images. (Scintilla feature 2815)</summary>
         public void AutoCSetImageScale(int scalePercent)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETIMAGESCALE, (UIntPtr)scalePercent, Unused);
+            Send(SciMsg.SCI_AUTOCSETIMAGESCALE, (UIntPtr)scalePercent, Unused);
         }
 
         /// <summary>Get the scale factor in percent for auto-completion list images. (Scintilla feature 2816)</summary>
         public int AutoCGetImageScale()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETIMAGESCALE, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_AUTOCGETIMAGESCALE, UnusedW, Unused);
         }
 
         /// <summary>Set the number of spaces used for one level of indentation. (Scintilla feature 2122)</summary>
         public void SetIndent(int indentSize)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETINDENT, (UIntPtr)indentSize, Unused);
+            Send(SciMsg.SCI_SETINDENT, (UIntPtr)indentSize, Unused);
         }
 
         /// <summary>Retrieve indentation size. (Scintilla feature 2123)</summary>
         public int GetIndent()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETINDENT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETINDENT, UnusedW, Unused);
         }
 
         /// <summary>
@@ -1759,73 +2424,86 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetUseTabs(bool useTabs)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETUSETABS, new UIntPtr(useTabs ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETUSETABS, new UIntPtr(useTabs ? 1U : 0U), Unused);
         }
 
         /// <summary>Retrieve whether tabs will be used in indentation. (Scintilla feature 2125)</summary>
         public bool GetUseTabs()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETUSETABS, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETUSETABS, UnusedW, Unused);
         }
 
         /// <summary>Change the indentation of a line to a number of columns. (Scintilla feature 2126)</summary>
         public void SetLineIndentation(Position line, int indentation)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETLINEINDENTATION, (UIntPtr)line, (IntPtr)indentation);
+            Send(SciMsg.SCI_SETLINEINDENTATION, (UIntPtr)line, (IntPtr)indentation);
         }
 
         /// <summary>Retrieve the number of columns that a line is indented. (Scintilla feature 2127)</summary>
         public int GetLineIndentation(Position line)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETLINEINDENTATION, (UIntPtr)line, Unused);
+            return (int)Send(SciMsg.SCI_GETLINEINDENTATION, (UIntPtr)line, Unused);
         }
 
         /// <summary>Retrieve the position before the first non indentation character on a line. (Scintilla feature 2128)</summary>
         public Position GetLineIndentPosition(Position line)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETLINEINDENTPOSITION, (UIntPtr)line, Unused);
+            return Send(SciMsg.SCI_GETLINEINDENTPOSITION, (UIntPtr)line, Unused);
         }
 
         /// <summary>Retrieve the column number of a position, taking tab width into account. (Scintilla feature 2129)</summary>
         public Position GetColumn(Position pos)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETCOLUMN, (UIntPtr)pos, Unused);
+            return Send(SciMsg.SCI_GETCOLUMN, (UIntPtr)pos, Unused);
+        }
+
+#if NETCOREAPP
+        /// <summary>
+        /// Bulk variant of <see cref="GetColumn"/>: gets its value at each position from <paramref name="start"/> on, one per element of <paramref name="destination"/>.
+        /// </summary>
+        public void GetColumnsInRange(Position start, Span<Position> destination)
+        {
+            for (int i = 0; i < destination.Length; i++)
+            {
+                destination[i] = Send(SciMsg.SCI_GETCOLUMN, (UIntPtr)(start + i), Unused);
+            }
         }
+#endif
 
         /// <summary>Count characters between two positions. (Scintilla feature 2633)</summary>
         public Position CountCharacters(Position start, Position end)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_COUNTCHARACTERS, (UIntPtr)start, (IntPtr)end);
+            return Send(SciMsg.SCI_COUNTCHARACTERS, (UIntPtr)start, (IntPtr)end);
         }
 
         /// <summary>Count code units between two positions. (Scintilla feature 2715)</summary>
         public Position CountCodeUnits(Position start, Position end)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_COUNTCODEUNITS, (UIntPtr)start, (IntPtr)end);
+            return Send(SciMsg.SCI_COUNTCODEUNITS, (UIntPtr)start, (IntPtr)end);
         }
 
         /// <summary>Show or hide the horizontal scroll bar. (Scintilla feature 2130)</summary>
         public void SetHScrollBar(bool visible)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETHSCROLLBAR, new UIntPtr(visible ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETHSCROLLBAR, new UIntPtr(visible ? 1U : 0U), Unused);
         }
 
         /// <summary>Is the horizontal scroll bar visible? (Scintilla feature 2131)</summary>
         public bool GetHScrollBar()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETHSCROLLBAR, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETHSCROLLBAR, UnusedW, Unused);
         }
 
         /// <summary>Show or hide indentation guides. (Scintilla feature 2132)</summary>
         public void SetIndentationGuides(IndentView indentView)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETINDENTATIONGUIDES, (UIntPtr)indentView, Unused);
+            Send(SciMsg.SCI_SETINDENTATIONGUIDES, (UIntPtr)indentView, Unused);
         }
 
         /// <summary>Are the indentation guides visible? (Scintilla feature 2133)</summary>
         public IndentView GetIndentationGuides()
         {
-            return (IndentView)SendMessage(_scintilla, SciMsg.SCI_GETINDENTATIONGUIDES, UnusedW, Unused);
+            return (IndentView)Send(SciMsg.SCI_GETINDENTATIONGUIDES, UnusedW, Unused);
         }
 
         /// <summary>
@@ -1835,25 +2513,25 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetHighlightGuide(Position column)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETHIGHLIGHTGUIDE, (UIntPtr)column, Unused);
+            Send(SciMsg.SCI_SETHIGHLIGHTGUIDE, (UIntPtr)column, Unused);
         }
 
         /// <summary>Get the highlighted indentation guide column. (Scintilla feature 2135)</summary>
         public Position GetHighlightGuide()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETHIGHLIGHTGUIDE, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETHIGHLIGHTGUIDE, UnusedW, Unused);
         }
 
         /// <summary>Get the position after the last visible characters on a line. (Scintilla feature 2136)</summary>
         public Position GetLineEndPosition(Position line)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETLINEENDPOSITION, (UIntPtr)line, Unused);
+            return Send(SciMsg.SCI_GETLINEENDPOSITION, (UIntPtr)line, Unused);
         }
 
         /// <summary>Get the code page used to interpret the bytes of the document as characters. (Scintilla feature 2137)</summary>
         public int GetCodePage()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETCODEPAGE, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETCODEPAGE, UnusedW, Unused);
         }
 
         /// <summary>Get the foreground colour of the caret. (Scintilla feature 2138)</summary>
@@ -1863,97 +2541,97 @@ namespace Npp.DotNet.Plugin
         /// <summary>In read-only mode? (Scintilla feature 2140)</summary>
         public bool GetReadOnly()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETREADONLY, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETREADONLY, UnusedW, Unused);
         }
 
         /// <summary>Sets the position of the caret. (Scintilla feature 2141)</summary>
         public void SetCurrentPos(Position caret)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCURRENTPOS, (UIntPtr)caret, Unused);
+            Send(SciMsg.SCI_SETCURRENTPOS, (UIntPtr)caret, Unused);
         }
 
         /// <summary>Sets the position that starts the selection - this becomes the anchor. (Scintilla feature 2142)</summary>
         public void SetSelectionStart(Position anchor)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTIONSTART, (UIntPtr)anchor, Unused);
+            Send(SciMsg.SCI_SETSELECTIONSTART, (UIntPtr)anchor, Unused);
         }
 
         /// <summary>Returns the position at the start of the selection. (Scintilla feature 2143)</summary>
         public Position GetSelectionStart()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONSTART, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETSELECTIONSTART, UnusedW, Unused);
         }
 
         /// <summary>Sets the position that ends the selection - this becomes the caret. (Scintilla feature 2144)</summary>
         public void SetSelectionEnd(Position caret)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTIONEND, (UIntPtr)caret, Unused);
+            Send(SciMsg.SCI_SETSELECTIONEND, (UIntPtr)caret, Unused);
         }
 
         /// <summary>Returns the position at the end of the selection. (Scintilla feature 2145)</summary>
         public Position GetSelectionEnd()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONEND, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETSELECTIONEND, UnusedW, Unused);
         }
 
         /// <summary>Set caret to a position, while removing any existing selection. (Scintilla feature 2556)</summary>
         public void SetEmptySelection(Position caret)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETEMPTYSELECTION, (UIntPtr)caret, Unused);
+            Send(SciMsg.SCI_SETEMPTYSELECTION, (UIntPtr)caret, Unused);
         }
 
         /// <summary>Sets the print magnification added to the point size of each style for printing. (Scintilla feature 2146)</summary>
         public void SetPrintMagnification(int magnification)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETPRINTMAGNIFICATION, (UIntPtr)magnification, Unused);
+            Send(SciMsg.SCI_SETPRINTMAGNIFICATION, (UIntPtr)magnification, Unused);
         }
 
         /// <summary>Returns the print magnification. (Scintilla feature 2147)</summary>
         public int GetPrintMagnification()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETPRINTMAGNIFICATION, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETPRINTMAGNIFICATION, UnusedW, Unused);
         }
 
         /// <summary>Modify colours when printing for clearer printed text. (Scintilla feature 2148)</summary>
         public void SetPrintColourMode(PrintOption mode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETPRINTCOLOURMODE, (UIntPtr)mode, Unused);
+            Send(SciMsg.SCI_SETPRINTCOLOURMODE, (UIntPtr)mode, Unused);
         }
 
         /// <summary>Returns the print colour mode. (Scintilla feature 2149)</summary>
         public PrintOption GetPrintColourMode()
         {
-            return (PrintOption)SendMessage(_scintilla, SciMsg.SCI_GETPRINTCOLOURMODE, UnusedW, Unused);
+            return (PrintOption)Send(SciMsg.SCI_GETPRINTCOLOURMODE, UnusedW, Unused);
         }
 
         /// <summary>Find some text in the document. (Scintilla feature 2196)</summary>
         public Position FindTextFull(FindOption searchFlags, TextToFindFull ft)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_FINDTEXTFULL, (UIntPtr)searchFlags, ft.NativePointer);
+            return Send(SciMsg.SCI_FINDTEXTFULL, (UIntPtr)searchFlags, ft.NativePointer);
         }
 
         /// <summary>Enable or disable change history. (Scintilla feature 2780)</summary>
         public void SetChangeHistory(ChangeHistoryOption changeHistory)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCHANGEHISTORY, (UIntPtr)changeHistory, Unused);
+            Send(SciMsg.SCI_SETCHANGEHISTORY, (UIntPtr)changeHistory, Unused);
         }
 
         /// <summary>Report change history status. (Scintilla feature 2781)</summary>
         public ChangeHistoryOption GetChangeHistory()
         {
-            return (ChangeHistoryOption)SendMessage(_scintilla, SciMsg.SCI_GETCHANGEHISTORY, UnusedW, Unused);
+            return (ChangeHistoryOption)Send(SciMsg.SCI_GETCHANGEHISTORY, UnusedW, Unused);
         }
 
         /// <summary>Enable or disable undo selection history. (Scintilla feature 2782)</summary>
         public void SetUndoSelectionHistory(UndoSelectionHistoryOption undoSelectionHistory)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETUNDOSELECTIONHISTORY, (UIntPtr)undoSelectionHistory, Unused);
+            Send(SciMsg.SCI_SETUNDOSELECTIONHISTORY, (UIntPtr)undoSelectionHistory, Unused);
         }
 
         /// <summary>Report undo selection history status. (Scintilla feature 2783)</summary>
         public UndoSelectionHistoryOption GetUndoSelectionHistory()
         {
-            return (UndoSelectionHistoryOption)SendMessage(_scintilla, SciMsg.SCI_GETUNDOSELECTIONHISTORY, UnusedW, Unused);
+            return (UndoSelectionHistoryOption)Send(SciMsg.SCI_GETUNDOSELECTIONHISTORY, UnusedW, Unused);
         }
 
         /// <summary>Set selection from serialized form. (Scintilla feature 2784)</summary>
@@ -1968,10 +2646,33 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETSELECTIONSERIALIZED, CodePage);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetSelectionSerialized()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetSelectionSerialized(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETSELECTIONSERIALIZED, destination);
+        }
+
+        /// <inheritdoc cref="GetSelectionSerialized()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetSelectionSerialized(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETSELECTIONSERIALIZED, writer);
+        }
+
+        /// <inheritdoc cref="GetSelectionSerialized()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetSelectionSerialized(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETSELECTIONSERIALIZED, pool, out length);
+        }
+#endif
+
         /// <summary>Retrieve the display line at the top of the display. (Scintilla feature 2152)</summary>
         public Position GetFirstVisibleLine()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETFIRSTVISIBLELINE, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETFIRSTVISIBLELINE, UnusedW, Unused);
         }
 
         /// <summary>
@@ -1984,52 +2685,75 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETLINE, CodePage, (UIntPtr)line);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetLine(Position)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetLine(Position line, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETLINE, destination, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="GetLine(Position)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetLine(Position line, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETLINE, writer, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="GetLine(Position)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetLine(Position line, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETLINE, pool, out length, (UIntPtr)line);
+        }
+#endif
+
         /// <summary>Returns the number of lines in the document. There is always at least one. (Scintilla feature 2154)</summary>
         public Position GetLineCount()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETLINECOUNT, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETLINECOUNT, UnusedW, Unused);
         }
 
         /// <summary>Enlarge the number of lines allocated. (Scintilla feature 2089)</summary>
         public void AllocateLines(Position lines)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ALLOCATELINES, (UIntPtr)lines, Unused);
+            Send(SciMsg.SCI_ALLOCATELINES, (UIntPtr)lines, Unused);
         }
 
         /// <summary>Sets the size in pixels of the left margin. (Scintilla feature 2155)</summary>
         public void SetMarginLeft(int pixelWidth)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMARGINLEFT, UnusedW, (IntPtr)pixelWidth);
+            Send(SciMsg.SCI_SETMARGINLEFT, UnusedW, (IntPtr)pixelWidth);
         }
 
         /// <summary>Returns the size in pixels of the left margin. (Scintilla feature 2156)</summary>
         public int GetMarginLeft()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETMARGINLEFT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETMARGINLEFT, UnusedW, Unused);
         }
 
         /// <summary>Sets the size in pixels of the right margin. (Scintilla feature 2157)</summary>
         public void SetMarginRight(int pixelWidth)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMARGINRIGHT, UnusedW, (IntPtr)pixelWidth);
+            Send(SciMsg.SCI_SETMARGINRIGHT, UnusedW, (IntPtr)pixelWidth);
         }
 
         /// <summary>Returns the size in pixels of the right margin. (Scintilla feature 2158)</summary>
         public int GetMarginRight()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETMARGINRIGHT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETMARGINRIGHT, UnusedW, Unused);
         }
 
         /// <summary>Is the document different from when it was last saved? (Scintilla feature 2159)</summary>
         public bool GetModify()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETMODIFY, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETMODIFY, UnusedW, Unused);
         }
 
         /// <summary>Select a range of text. (Scintilla feature 2160)</summary>
         public void SetSel(Position anchor, Position caret)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSEL, (UIntPtr)anchor, (IntPtr)caret);
+            Send(SciMsg.SCI_SETSEL, (UIntPtr)anchor, (IntPtr)caret);
         }
 
         /// <summary>
@@ -2043,6 +2767,29 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETSELTEXT, CodePage);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetSelText()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetSelText(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETSELTEXT, destination);
+        }
+
+        /// <inheritdoc cref="GetSelText()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetSelText(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETSELTEXT, writer);
+        }
+
+        /// <inheritdoc cref="GetSelText()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetSelText(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETSELTEXT, pool, out length);
+        }
+#endif
+
         /// <summary>
         /// Retrieve a range of text that can be past 2GB.
         /// Return the length of the text.
@@ -2050,13 +2797,36 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position GetTextRangeFull(TextRangeFull tr)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETTEXTRANGEFULL, UnusedW, tr.NativePointer);
+            return Send(SciMsg.SCI_GETTEXTRANGEFULL, UnusedW, tr.NativePointer);
+        }
+
+#if NETCOREAPP
+        /// <inheritdoc cref="GetTextRangeFull(TextRangeFull)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NULs.</returns>
+        public int GetTextRangeFull(Position start, Position end, Span<byte> destination)
+        {
+            return GetBytesInRange(SciMsg.SCI_GETTEXTRANGEFULL, start, end, destination, 1);
+        }
+
+        /// <inheritdoc cref="GetTextRangeFull(TextRangeFull)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetTextRangeFull(Position start, Position end, IBufferWriter<byte> writer)
+        {
+            return WriteBytesInRange(SciMsg.SCI_GETTEXTRANGEFULL, start, end, writer, 1);
         }
 
+        /// <inheritdoc cref="GetTextRangeFull(TextRangeFull)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetTextRangeFull(Position start, Position end, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesInRange(SciMsg.SCI_GETTEXTRANGEFULL, start, end, pool, out length, 1);
+        }
+#endif
+
         /// <summary>Draw the selection either highlighted or in normal (non-highlighted) style. (Scintilla feature 2163)</summary>
         public void HideSelection(bool hide)
         {
-            SendMessage(_scintilla, SciMsg.SCI_HIDESELECTION, new UIntPtr(hide ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_HIDESELECTION, new UIntPtr(hide ? 1U : 0U), Unused);
         }
 
         /// <summary>
@@ -2064,49 +2834,49 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public bool GetSelectionHidden()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONHIDDEN, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETSELECTIONHIDDEN, UnusedW, Unused);
         }
 
         /// <summary>Retrieve the x value of the point in the window where a position is displayed. (Scintilla feature 2164)</summary>
         public int PointXFromPosition(Position pos)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_POINTXFROMPOSITION, UnusedW, (IntPtr)pos);
+            return (int)Send(SciMsg.SCI_POINTXFROMPOSITION, UnusedW, (IntPtr)pos);
         }
 
         /// <summary>Retrieve the y value of the point in the window where a position is displayed. (Scintilla feature 2165)</summary>
         public int PointYFromPosition(Position pos)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_POINTYFROMPOSITION, UnusedW, (IntPtr)pos);
+            return (int)Send(SciMsg.SCI_POINTYFROMPOSITION, UnusedW, (IntPtr)pos);
         }
 
         /// <summary>Retrieve the line containing a position. (Scintilla feature 2166)</summary>
         public Position LineFromPosition(Position pos)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_LINEFROMPOSITION, (UIntPtr)pos, Unused);
+            return Send(SciMsg.SCI_LINEFROMPOSITION, (UIntPtr)pos, Unused);
         }
 
         /// <summary>Retrieve the position at the start of a line. (Scintilla feature 2167)</summary>
         public Position PositionFromLine(Position line)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_POSITIONFROMLINE, (UIntPtr)line, Unused);
+            return Send(SciMsg.SCI_POSITIONFROMLINE, (UIntPtr)line, Unused);
         }
 
         /// <summary>Scroll horizontally and vertically. (Scintilla feature 2168)</summary>
         public void LineScroll(Position columns, Position lines)
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINESCROLL, (UIntPtr)columns, (IntPtr)lines);
+            Send(SciMsg.SCI_LINESCROLL, (UIntPtr)columns, (IntPtr)lines);
         }
 
         /// <summary>Scroll vertically with allowance for wrapping. (Scintilla feature 2817)</summary>
         public void ScrollVertical(Position docLine, Position subLine)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SCROLLVERTICAL, (UIntPtr)docLine, (IntPtr)subLine);
+            Send(SciMsg.SCI_SCROLLVERTICAL, (UIntPtr)docLine, (IntPtr)subLine);
         }
 
         /// <summary>Ensure the caret is visible. (Scintilla feature 2169)</summary>
         public void ScrollCaret()
         {
-            SendMessage(_scintilla, SciMsg.SCI_SCROLLCARET, UnusedW, Unused);
+            Send(SciMsg.SCI_SCROLLCARET, UnusedW, Unused);
         }
 
         /// <summary>
@@ -2117,7 +2887,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void ScrollRange(Position secondary, Position primary)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SCROLLRANGE, (UIntPtr)secondary, (IntPtr)primary);
+            Send(SciMsg.SCI_SCROLLRANGE, (UIntPtr)secondary, (IntPtr)primary);
         }
 
         /// <summary>Replace the selected text with the argument text. (Scintilla feature 2170)</summary>
@@ -2129,61 +2899,61 @@ namespace Npp.DotNet.Plugin
         /// <summary>Set to read only or read write. (Scintilla feature 2171)</summary>
         public void SetReadOnly(bool readOnly)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETREADONLY, new UIntPtr(readOnly ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETREADONLY, new UIntPtr(readOnly ? 1U : 0U), Unused);
         }
 
         /// <summary>Null operation. (Scintilla feature 2172)</summary>
         public void Null()
         {
-            SendMessage(_scintilla, SciMsg.SCI_NULL, UnusedW, Unused);
+            Send(SciMsg.SCI_NULL, UnusedW, Unused);
         }
 
         /// <summary>Will a paste succeed? (Scintilla feature 2173)</summary>
         public bool CanPaste()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_CANPASTE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_CANPASTE, UnusedW, Unused);
         }
 
         /// <summary>Are there any undoable actions in the undo history? (Scintilla feature 2174)</summary>
         public bool CanUndo()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_CANUNDO, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_CANUNDO, UnusedW, Unused);
         }
 
         /// <summary>Delete the undo history. (Scintilla feature 2175)</summary>
         public void EmptyUndoBuffer()
         {
-            SendMessage(_scintilla, SciMsg.SCI_EMPTYUNDOBUFFER, UnusedW, Unused);
+            Send(SciMsg.SCI_EMPTYUNDOBUFFER, UnusedW, Unused);
         }
 
         /// <summary>Undo one action in the undo history. (Scintilla feature 2176)</summary>
         public void Undo()
         {
-            SendMessage(_scintilla, SciMsg.SCI_UNDO, UnusedW, Unused);
+            Send(SciMsg.SCI_UNDO, UnusedW, Unused);
         }
 
         /// <summary>Cut the selection to the clipboard. (Scintilla feature 2177)</summary>
         public void Cut()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CUT, UnusedW, Unused);
+            Send(SciMsg.SCI_CUT, UnusedW, Unused);
         }
 
         /// <summary>Copy the selection to the clipboard. (Scintilla feature 2178)</summary>
         public void Copy()
         {
-            SendMessage(_scintilla, SciMsg.SCI_COPY, UnusedW, Unused);
+            Send(SciMsg.SCI_COPY, UnusedW, Unused);
         }
 
         /// <summary>Paste the contents of the clipboard into the document replacing the selection. (Scintilla feature 2179)</summary>
         public void Paste()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PASTE, UnusedW, Unused);
+            Send(SciMsg.SCI_PASTE, UnusedW, Unused);
         }
 
         /// <summary>Clear the selection. (Scintilla feature 2180)</summary>
         public void Clear()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CLEAR, UnusedW, Unused);
+            Send(SciMsg.SCI_CLEAR, UnusedW, Unused);
         }
 
         /// <summary>Replace the contents of the document with the argument text. (Scintilla feature 2181)</summary>
@@ -2203,22 +2973,45 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETTEXT, CodePage);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetText()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetText(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETTEXT, destination);
+        }
+
+        /// <inheritdoc cref="GetText()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetText(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETTEXT, writer);
+        }
+
+        /// <inheritdoc cref="GetText()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetText(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETTEXT, pool, out length);
+        }
+#endif
+
         /// <summary>Retrieve the number of characters in the document. (Scintilla feature 2183)</summary>
         public Position GetTextLength()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETTEXTLENGTH, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETTEXTLENGTH, UnusedW, Unused);
         }
 
         /// <summary>Retrieve a pointer to a function that processes messages for this Scintilla. (Scintilla feature 2184)</summary>
         public IntPtr GetDirectFunction()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETDIRECTFUNCTION, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETDIRECTFUNCTION, UnusedW, Unused);
         }
 
         /// <summary>Retrieve a pointer to a function that processes messages for this Scintilla and returns status. (Scintilla feature 2772)</summary>
         public IntPtr GetDirectStatusFunction()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETDIRECTSTATUSFUNCTION, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETDIRECTSTATUSFUNCTION, UnusedW, Unused);
         }
 
         /// <summary>
@@ -2228,31 +3021,31 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public IntPtr GetDirectPointer()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETDIRECTPOINTER, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETDIRECTPOINTER, UnusedW, Unused);
         }
 
         /// <summary>Set to overtype (true) or insert mode. (Scintilla feature 2186)</summary>
         public void SetOvertype(bool overType)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETOVERTYPE, new UIntPtr(overType ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETOVERTYPE, new UIntPtr(overType ? 1U : 0U), Unused);
         }
 
         /// <summary>Returns true if overtype mode is active otherwise false is returned. (Scintilla feature 2187)</summary>
         public bool GetOvertype()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETOVERTYPE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETOVERTYPE, UnusedW, Unused);
         }
 
         /// <summary>Set the width of the insert mode caret. (Scintilla feature 2188)</summary>
         public void SetCaretWidth(int pixelWidth)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCARETWIDTH, (UIntPtr)pixelWidth, Unused);
+            Send(SciMsg.SCI_SETCARETWIDTH, (UIntPtr)pixelWidth, Unused);
         }
 
         /// <summary>Returns the width of the insert mode caret. (Scintilla feature 2189)</summary>
         public int GetCaretWidth()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETCARETWIDTH, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETCARETWIDTH, UnusedW, Unused);
         }
 
         /// <summary>
@@ -2262,25 +3055,25 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetTargetStart(Position start)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETTARGETSTART, (UIntPtr)start, Unused);
+            Send(SciMsg.SCI_SETTARGETSTART, (UIntPtr)start, Unused);
         }
 
         /// <summary>Get the position that starts the target. (Scintilla feature 2191)</summary>
         public Position GetTargetStart()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETTARGETSTART, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETTARGETSTART, UnusedW, Unused);
         }
 
         /// <summary>Sets the virtual space of the target start (Scintilla feature 2728)</summary>
         public void SetTargetStartVirtualSpace(Position space)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETTARGETSTARTVIRTUALSPACE, (UIntPtr)space, Unused);
+            Send(SciMsg.SCI_SETTARGETSTARTVIRTUALSPACE, (UIntPtr)space, Unused);
         }
 
         /// <summary>Get the virtual space of the target start (Scintilla feature 2729)</summary>
         public Position GetTargetStartVirtualSpace()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETTARGETSTARTVIRTUALSPACE, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETTARGETSTARTVIRTUALSPACE, UnusedW, Unused);
         }
 
         /// <summary>
@@ -2290,31 +3083,31 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetTargetEnd(Position end)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETTARGETEND, (UIntPtr)end, Unused);
+            Send(SciMsg.SCI_SETTARGETEND, (UIntPtr)end, Unused);
         }
 
         /// <summary>Get the position that ends the target. (Scintilla feature 2193)</summary>
         public Position GetTargetEnd()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETTARGETEND, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETTARGETEND, UnusedW, Unused);
         }
 
         /// <summary>Sets the virtual space of the target end (Scintilla feature 2730)</summary>
         public void SetTargetEndVirtualSpace(Position space)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETTARGETENDVIRTUALSPACE, (UIntPtr)space, Unused);
+            Send(SciMsg.SCI_SETTARGETENDVIRTUALSPACE, (UIntPtr)space, Unused);
         }
 
         /// <summary>Get the virtual space of the target end (Scintilla feature 2731)</summary>
         public Position GetTargetEndVirtualSpace()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETTARGETENDVIRTUALSPACE, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETTARGETENDVIRTUALSPACE, UnusedW, Unused);
         }
 
         /// <summary>Sets both the start and end of the target in one call. (Scintilla feature 2686)</summary>
         public void SetTargetRange(Position start, Position end)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETTARGETRANGE, (UIntPtr)start, (IntPtr)end);
+            Send(SciMsg.SCI_SETTARGETRANGE, (UIntPtr)start, (IntPtr)end);
         }
 
         /// <summary>Retrieve the text in the target. (Scintilla feature 2687)</summary>
@@ -2323,16 +3116,39 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETTARGETTEXT, CodePage);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetTargetText()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetTargetText(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETTARGETTEXT, destination);
+        }
+
+        /// <inheritdoc cref="GetTargetText()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetTargetText(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETTARGETTEXT, writer);
+        }
+
+        /// <inheritdoc cref="GetTargetText()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetTargetText(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETTARGETTEXT, pool, out length);
+        }
+#endif
+
         /// <summary>Make the target range start and end be the same as the selection range start and end. (Scintilla feature 2287)</summary>
         public void TargetFromSelection()
         {
-            SendMessage(_scintilla, SciMsg.SCI_TARGETFROMSELECTION, UnusedW, Unused);
+            Send(SciMsg.SCI_TARGETFROMSELECTION, UnusedW, Unused);
         }
 
         /// <summary>Sets the target to the whole document. (Scintilla feature 2690)</summary>
         public void TargetWholeDocument()
         {
-            SendMessage(_scintilla, SciMsg.SCI_TARGETWHOLEDOCUMENT, UnusedW, Unused);
+            Send(SciMsg.SCI_TARGETWHOLEDOCUMENT, UnusedW, Unused);
         }
 
         /// <summary>
@@ -2346,6 +3162,15 @@ namespace Npp.DotNet.Plugin
             return SendEncodedBytes(SciMsg.SCI_REPLACETARGET, text);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ReplaceTarget(string)"/>
+        /// <remarks>The bytes of <paramref name="text"/> are sent as they are, without encoding.</remarks>
+        public Position ReplaceTarget(ReadOnlySpan<byte> text)
+        {
+            return SendBytes(SciMsg.SCI_REPLACETARGET, text);
+        }
+#endif
+
         /// <summary>
         /// Replace the target text with the argument text after \d processing.
         /// Text is counted so it can contain NULs.
@@ -2360,6 +3185,15 @@ namespace Npp.DotNet.Plugin
             return SendEncodedBytes(SciMsg.SCI_REPLACETARGETRE, text);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ReplaceTargetRE(string)"/>
+        /// <remarks>The bytes of <paramref name="text"/> are sent as they are, without encoding.</remarks>
+        public Position ReplaceTargetRE(ReadOnlySpan<byte> text)
+        {
+            return SendBytes(SciMsg.SCI_REPLACETARGETRE, text);
+        }
+#endif
+
         /// <summary>
         /// Replace the target text with the argument text but ignore prefix and suffix that
         /// are the same as current.
@@ -2370,6 +3204,15 @@ namespace Npp.DotNet.Plugin
             return SendEncodedBytes(SciMsg.SCI_REPLACETARGETMINIMAL, text);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ReplaceTargetMinimal(string)"/>
+        /// <remarks>The bytes of <paramref name="text"/> are sent as they are, without encoding.</remarks>
+        public Position ReplaceTargetMinimal(ReadOnlySpan<byte> text)
+        {
+            return SendBytes(SciMsg.SCI_REPLACETARGETMINIMAL, text);
+        }
+#endif
+
         /// <summary>
         /// Search for a counted string in the target and set the target to the found
         /// range. Text is counted so it can contain NULs.
@@ -2381,16 +3224,25 @@ namespace Npp.DotNet.Plugin
             return SendEncodedBytes(SciMsg.SCI_SEARCHINTARGET, text);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="SearchInTarget(string)"/>
+        /// <remarks>The bytes of <paramref name="text"/> are sent as they are, without encoding.</remarks>
+        public Position SearchInTarget(ReadOnlySpan<byte> text)
+        {
+            return SendBytes(SciMsg.SCI_SEARCHINTARGET, text);
+        }
+#endif
+
         /// <summary>Set the search flags used by SearchInTarget. (Scintilla feature 2198)</summary>
         public void SetSearchFlags(FindOption searchFlags)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSEARCHFLAGS, (UIntPtr)searchFlags, Unused);
+            Send(SciMsg.SCI_SETSEARCHFLAGS, (UIntPtr)searchFlags, Unused);
         }
 
         /// <summary>Get the search flags used by SearchInTarget. (Scintilla feature 2199)</summary>
         public FindOption GetSearchFlags()
         {
-            return (FindOption)SendMessage(_scintilla, SciMsg.SCI_GETSEARCHFLAGS, UnusedW, Unused);
+            return (FindOption)Send(SciMsg.SCI_GETSEARCHFLAGS, UnusedW, Unused);
         }
 
         /// <summary>Show a call tip containing a definition near position pos. (Scintilla feature 2200)</summary>
@@ -2402,79 +3254,79 @@ namespace Npp.DotNet.Plugin
         /// <summary>Remove the call tip from the screen. (Scintilla feature 2201)</summary>
         public void CallTipCancel()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CALLTIPCANCEL, UnusedW, Unused);
+            Send(SciMsg.SCI_CALLTIPCANCEL, UnusedW, Unused);
         }
 
         /// <summary>Is there an active call tip? (Scintilla feature 2202)</summary>
         public bool CallTipActive()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_CALLTIPACTIVE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_CALLTIPACTIVE, UnusedW, Unused);
         }
 
         /// <summary>Retrieve the position where the caret was before displaying the call tip. (Scintilla feature 2203)</summary>
         public Position CallTipPosStart()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_CALLTIPPOSSTART, UnusedW, Unused);
+            return Send(SciMsg.SCI_CALLTIPPOSSTART, UnusedW, Unused);
         }
 
         /// <summary>Set the start position in order to change when backspacing removes the calltip. (Scintilla feature 2214)</summary>
         public void CallTipSetPosStart(Position posStart)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CALLTIPSETPOSSTART, (UIntPtr)posStart, Unused);
+            Send(SciMsg.SCI_CALLTIPSETPOSSTART, (UIntPtr)posStart, Unused);
         }
 
         /// <summary>Highlight a segment of the definition. (Scintilla feature 2204)</summary>
         public void CallTipSetHlt(Position highlightStart, Position highlightEnd)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CALLTIPSETHLT, (UIntPtr)highlightStart, (IntPtr)highlightEnd);
+            Send(SciMsg.SCI_CALLTIPSETHLT, (UIntPtr)highlightStart, (IntPtr)highlightEnd);
         }
 
         /// <summary>Set the background colour for the call tip. (Scintilla feature 2205)</summary>
         public void CallTipSetBack(Colour back)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CALLTIPSETBACK, (UIntPtr)back.Value, Unused);
+            Send(SciMsg.SCI_CALLTIPSETBACK, (UIntPtr)back.Value, Unused);
         }
 
         /// <summary>Set the foreground colour for the call tip. (Scintilla feature 2206)</summary>
         public void CallTipSetFore(Colour fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CALLTIPSETFORE, (UIntPtr)fore.Value, Unused);
+            Send(SciMsg.SCI_CALLTIPSETFORE, (UIntPtr)fore.Value, Unused);
         }
 
         /// <summary>Set the foreground colour for the highlighted part of the call tip. (Scintilla feature 2207)</summary>
         public void CallTipSetForeHlt(Colour fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CALLTIPSETFOREHLT, (UIntPtr)fore.Value, Unused);
+            Send(SciMsg.SCI_CALLTIPSETFOREHLT, (UIntPtr)fore.Value, Unused);
         }
 
         /// <summary>Enable use of STYLE_CALLTIP and set call tip tab size in pixels. (Scintilla feature 2212)</summary>
         public void CallTipUseStyle(int tabSize)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CALLTIPUSESTYLE, (UIntPtr)tabSize, Unused);
+            Send(SciMsg.SCI_CALLTIPUSESTYLE, (UIntPtr)tabSize, Unused);
         }
 
         /// <summary>Set position of calltip, above or below text. (Scintilla feature 2213)</summary>
         public void CallTipSetPosition(bool above)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CALLTIPSETPOSITION, new UIntPtr(above ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_CALLTIPSETPOSITION, new UIntPtr(above ? 1U : 0U), Unused);
         }
 
         /// <summary>Find the display line of a document line taking hidden lines into account. (Scintilla feature 2220)</summary>
         public Position VisibleFromDocLine(Position docLine)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_VISIBLEFROMDOCLINE, (UIntPtr)docLine, Unused);
+            return Send(SciMsg.SCI_VISIBLEFROMDOCLINE, (UIntPtr)docLine, Unused);
         }
 
         /// <summary>Find the document line of a display line taking hidden lines into account. (Scintilla feature 2221)</summary>
         public Position DocLineFromVisible(Position displayLine)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_DOCLINEFROMVISIBLE, (UIntPtr)displayLine, Unused);
+            return Send(SciMsg.SCI_DOCLINEFROMVISIBLE, (UIntPtr)displayLine, Unused);
         }
 
         /// <summary>The number of display lines needed to wrap a document line (Scintilla feature 2235)</summary>
         public Position WrapCount(Position docLine)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_WRAPCOUNT, (UIntPtr)docLine, Unused);
+            return Send(SciMsg.SCI_WRAPCOUNT, (UIntPtr)docLine, Unused);
         }
 
         /// <summary>
@@ -2485,67 +3337,67 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetFoldLevel(Position line, FoldLevel level)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETFOLDLEVEL, (UIntPtr)line, (IntPtr)level);
+            Send(SciMsg.SCI_SETFOLDLEVEL, (UIntPtr)line, (IntPtr)level);
         }
 
         /// <summary>Retrieve the fold level of a line. (Scintilla feature 2223)</summary>
         public FoldLevel GetFoldLevel(Position line)
         {
-            return (FoldLevel)SendMessage(_scintilla, SciMsg.SCI_GETFOLDLEVEL, (UIntPtr)line, Unused);
+            return (FoldLevel)Send(SciMsg.SCI_GETFOLDLEVEL, (UIntPtr)line, Unused);
         }
 
         /// <summary>Find the last child line of a header line. (Scintilla feature 2224)</summary>
         public Position GetLastChild(Position line, FoldLevel level)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETLASTCHILD, (UIntPtr)line, (IntPtr)level);
+            return Send(SciMsg.SCI_GETLASTCHILD, (UIntPtr)line, (IntPtr)level);
         }
 
         /// <summary>Find the parent line of a child line. (Scintilla feature 2225)</summary>
         public Position GetFoldParent(Position line)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETFOLDPARENT, (UIntPtr)line, Unused);
+            return Send(SciMsg.SCI_GETFOLDPARENT, (UIntPtr)line, Unused);
         }
 
         /// <summary>Make a range of lines visible. (Scintilla feature 2226)</summary>
         public void ShowLines(Position lineStart, Position lineEnd)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SHOWLINES, (UIntPtr)lineStart, (IntPtr)lineEnd);
+            Send(SciMsg.SCI_SHOWLINES, (UIntPtr)lineStart, (IntPtr)lineEnd);
         }
 
         /// <summary>Make a range of lines invisible. (Scintilla feature 2227)</summary>
         public void HideLines(Position lineStart, Position lineEnd)
         {
-            SendMessage(_scintilla, SciMsg.SCI_HIDELINES, (UIntPtr)lineStart, (IntPtr)lineEnd);
+            Send(SciMsg.SCI_HIDELINES, (UIntPtr)lineStart, (IntPtr)lineEnd);
         }
 
         /// <summary>Is a line visible? (Scintilla feature 2228)</summary>
         public bool GetLineVisible(Position line)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETLINEVISIBLE, (UIntPtr)line, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETLINEVISIBLE, (UIntPtr)line, Unused);
         }
 
         /// <summary>Are all lines visible? (Scintilla feature 2236)</summary>
         public bool GetAllLinesVisible()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETALLLINESVISIBLE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETALLLINESVISIBLE, UnusedW, Unused);
         }
 
         /// <summary>Show the children of a header line. (Scintilla feature 2229)</summary>
         public void SetFoldExpanded(Position line, bool expanded)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETFOLDEXPANDED, (UIntPtr)line, new IntPtr(expanded ? 1 : 0));
+            Send(SciMsg.SCI_SETFOLDEXPANDED, (UIntPtr)line, new IntPtr(expanded ? 1 : 0));
         }
 
         /// <summary>Is a header line expanded? (Scintilla feature 2230)</summary>
         public bool GetFoldExpanded(Position line)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETFOLDEXPANDED, (UIntPtr)line, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETFOLDEXPANDED, (UIntPtr)line, Unused);
         }
 
         /// <summary>Switch a header line between expanded and contracted. (Scintilla feature 2231)</summary>
         public void ToggleFold(Position line)
         {
-            SendMessage(_scintilla, SciMsg.SCI_TOGGLEFOLD, (UIntPtr)line, Unused);
+            Send(SciMsg.SCI_TOGGLEFOLD, (UIntPtr)line, Unused);
         }
 
         /// <summary>Switch a header line between expanded and contracted and show some text after the line. (Scintilla feature 2700)</summary>
@@ -2557,13 +3409,13 @@ namespace Npp.DotNet.Plugin
         /// <summary>Set the style of fold display text. (Scintilla feature 2701)</summary>
         public void FoldDisplayTextSetStyle(FoldDisplayTextStyle style)
         {
-            SendMessage(_scintilla, SciMsg.SCI_FOLDDISPLAYTEXTSETSTYLE, (UIntPtr)style, Unused);
+            Send(SciMsg.SCI_FOLDDISPLAYTEXTSETSTYLE, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get the style of fold display text. (Scintilla feature 2707)</summary>
         public FoldDisplayTextStyle FoldDisplayTextGetStyle()
         {
-            return (FoldDisplayTextStyle)SendMessage(_scintilla, SciMsg.SCI_FOLDDISPLAYTEXTGETSTYLE, UnusedW, Unused);
+            return (FoldDisplayTextStyle)Send(SciMsg.SCI_FOLDDISPLAYTEXTGETSTYLE, UnusedW, Unused);
         }
 
         /// <summary>Set the default fold display text. (Scintilla feature 2722)</summary>
@@ -2578,52 +3430,75 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETDEFAULTFOLDDISPLAYTEXT, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetDefaultFoldDisplayText()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetDefaultFoldDisplayText(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETDEFAULTFOLDDISPLAYTEXT, destination);
+        }
+
+        /// <inheritdoc cref="GetDefaultFoldDisplayText()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetDefaultFoldDisplayText(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETDEFAULTFOLDDISPLAYTEXT, writer);
+        }
+
+        /// <inheritdoc cref="GetDefaultFoldDisplayText()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetDefaultFoldDisplayText(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETDEFAULTFOLDDISPLAYTEXT, pool, out length);
+        }
+#endif
+
         /// <summary>Expand or contract a fold header. (Scintilla feature 2237)</summary>
         public void FoldLine(Position line, FoldAction action)
         {
-            SendMessage(_scintilla, SciMsg.SCI_FOLDLINE, (UIntPtr)line, (IntPtr)action);
+            Send(SciMsg.SCI_FOLDLINE, (UIntPtr)line, (IntPtr)action);
         }
 
         /// <summary>Expand or contract a fold header and its children. (Scintilla feature 2238)</summary>
         public void FoldChildren(Position line, FoldAction action)
         {
-            SendMessage(_scintilla, SciMsg.SCI_FOLDCHILDREN, (UIntPtr)line, (IntPtr)action);
+            Send(SciMsg.SCI_FOLDCHILDREN, (UIntPtr)line, (IntPtr)action);
         }
 
         /// <summary>Expand a fold header and all children. Use the level argument instead of the line's current level. (Scintilla feature 2239)</summary>
         public void ExpandChildren(Position line, FoldLevel level)
         {
-            SendMessage(_scintilla, SciMsg.SCI_EXPANDCHILDREN, (UIntPtr)line, (IntPtr)level);
+            Send(SciMsg.SCI_EXPANDCHILDREN, (UIntPtr)line, (IntPtr)level);
         }
 
         /// <summary>Expand or contract all fold headers. (Scintilla feature 2662)</summary>
         public void FoldAll(FoldAction action)
         {
-            SendMessage(_scintilla, SciMsg.SCI_FOLDALL, (UIntPtr)action, Unused);
+            Send(SciMsg.SCI_FOLDALL, (UIntPtr)action, Unused);
         }
 
         /// <summary>Ensure a particular line is visible by expanding any header line hiding it. (Scintilla feature 2232)</summary>
         public void EnsureVisible(Position line)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ENSUREVISIBLE, (UIntPtr)line, Unused);
+            Send(SciMsg.SCI_ENSUREVISIBLE, (UIntPtr)line, Unused);
         }
 
         /// <summary>Set automatic folding behaviours. (Scintilla feature 2663)</summary>
         public void SetAutomaticFold(AutomaticFold automaticFold)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETAUTOMATICFOLD, (UIntPtr)automaticFold, Unused);
+            Send(SciMsg.SCI_SETAUTOMATICFOLD, (UIntPtr)automaticFold, Unused);
         }
 
         /// <summary>Get automatic folding behaviours. (Scintilla feature 2664)</summary>
         public AutomaticFold GetAutomaticFold()
         {
-            return (AutomaticFold)SendMessage(_scintilla, SciMsg.SCI_GETAUTOMATICFOLD, UnusedW, Unused);
+            return (AutomaticFold)Send(SciMsg.SCI_GETAUTOMATICFOLD, UnusedW, Unused);
         }
 
         /// <summary>Set some style options for folding. (Scintilla feature 2233)</summary>
         public void SetFoldFlags(FoldFlag flags)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETFOLDFLAGS, (UIntPtr)flags, Unused);
+            Send(SciMsg.SCI_SETFOLDFLAGS, (UIntPtr)flags, Unused);
         }
 
         /// <summary>
@@ -2633,169 +3508,169 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void EnsureVisibleEnforcePolicy(Position line)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ENSUREVISIBLEENFORCEPOLICY, (UIntPtr)line, Unused);
+            Send(SciMsg.SCI_ENSUREVISIBLEENFORCEPOLICY, (UIntPtr)line, Unused);
         }
 
         /// <summary>Sets whether a tab pressed when caret is within indentation indents. (Scintilla feature 2260)</summary>
         public void SetTabIndents(bool tabIndents)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETTABINDENTS, new UIntPtr(tabIndents ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETTABINDENTS, new UIntPtr(tabIndents ? 1U : 0U), Unused);
         }
 
         /// <summary>Does a tab pressed when caret is within indentation indent? (Scintilla feature 2261)</summary>
         public bool GetTabIndents()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETTABINDENTS, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETTABINDENTS, UnusedW, Unused);
         }
 
         /// <summary>Sets whether a backspace pressed when caret is within indentation unindents. (Scintilla feature 2262)</summary>
         public void SetBackSpaceUnIndents(bool bsUnIndents)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETBACKSPACEUNINDENTS, new UIntPtr(bsUnIndents ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETBACKSPACEUNINDENTS, new UIntPtr(bsUnIndents ? 1U : 0U), Unused);
         }
 
         /// <summary>Does a backspace pressed when caret is within indentation unindent? (Scintilla feature 2263)</summary>
         public bool GetBackSpaceUnIndents()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETBACKSPACEUNINDENTS, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETBACKSPACEUNINDENTS, UnusedW, Unused);
         }
 
         /// <summary>Sets the time the mouse must sit still to generate a mouse dwell event. (Scintilla feature 2264)</summary>
         public void SetMouseDwellTime(int periodMilliseconds)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMOUSEDWELLTIME, (UIntPtr)periodMilliseconds, Unused);
+            Send(SciMsg.SCI_SETMOUSEDWELLTIME, (UIntPtr)periodMilliseconds, Unused);
         }
 
         /// <summary>Retrieve the time the mouse must sit still to generate a mouse dwell event. (Scintilla feature 2265)</summary>
         public int GetMouseDwellTime()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETMOUSEDWELLTIME, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETMOUSEDWELLTIME, UnusedW, Unused);
         }
 
         /// <summary>Get position of start of word. (Scintilla feature 2266)</summary>
         public Position WordStartPosition(Position pos, bool onlyWordCharacters)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_WORDSTARTPOSITION, (UIntPtr)pos, new IntPtr(onlyWordCharacters ? 1 : 0));
+            return Send(SciMsg.SCI_WORDSTARTPOSITION, (UIntPtr)pos, new IntPtr(onlyWordCharacters ? 1 : 0));
         }
 
         /// <summary>Get position of end of word. (Scintilla feature 2267)</summary>
         public Position WordEndPosition(Position pos, bool onlyWordCharacters)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_WORDENDPOSITION, (UIntPtr)pos, new IntPtr(onlyWordCharacters ? 1 : 0));
+            return Send(SciMsg.SCI_WORDENDPOSITION, (UIntPtr)pos, new IntPtr(onlyWordCharacters ? 1 : 0));
         }
 
         /// <summary>Is the range start..end considered a word? (Scintilla feature 2691)</summary>
         public bool IsRangeWord(Position start, Position end)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_ISRANGEWORD, (UIntPtr)start, (IntPtr)end);
+            return 1 == (int)Send(SciMsg.SCI_ISRANGEWORD, (UIntPtr)start, (IntPtr)end);
         }
 
         /// <summary>Sets limits to idle styling. (Scintilla feature 2692)</summary>
         public void SetIdleStyling(IdleStyling idleStyling)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETIDLESTYLING, (UIntPtr)idleStyling, Unused);
+            Send(SciMsg.SCI_SETIDLESTYLING, (UIntPtr)idleStyling, Unused);
         }
 
         /// <summary>Retrieve the limits to idle styling. (Scintilla feature 2693)</summary>
         public IdleStyling GetIdleStyling()
         {
-            return (IdleStyling)SendMessage(_scintilla, SciMsg.SCI_GETIDLESTYLING, UnusedW, Unused);
+            return (IdleStyling)Send(SciMsg.SCI_GETIDLESTYLING, UnusedW, Unused);
         }
 
         /// <summary>Sets whether text is word wrapped. (Scintilla feature 2268)</summary>
         public void SetWrapMode(Wrap wrapMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETWRAPMODE, (UIntPtr)wrapMode, Unused);
+            Send(SciMsg.SCI_SETWRAPMODE, (UIntPtr)wrapMode, Unused);
         }
 
         /// <summary>Retrieve whether text is word wrapped. (Scintilla feature 2269)</summary>
         public Wrap GetWrapMode()
         {
-            return (Wrap)SendMessage(_scintilla, SciMsg.SCI_GETWRAPMODE, UnusedW, Unused);
+            return (Wrap)Send(SciMsg.SCI_GETWRAPMODE, UnusedW, Unused);
         }
 
         /// <summary>Set the display mode of visual flags for wrapped lines. (Scintilla feature 2460)</summary>
         public void SetWrapVisualFlags(WrapVisualFlag wrapVisualFlags)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETWRAPVISUALFLAGS, (UIntPtr)wrapVisualFlags, Unused);
+            Send(SciMsg.SCI_SETWRAPVISUALFLAGS, (UIntPtr)wrapVisualFlags, Unused);
         }
 
         /// <summary>Retrive the display mode of visual flags for wrapped lines. (Scintilla feature 2461)</summary>
         public WrapVisualFlag GetWrapVisualFlags()
         {
-            return (WrapVisualFlag)SendMessage(_scintilla, SciMsg.SCI_GETWRAPVISUALFLAGS, UnusedW, Unused);
+            return (WrapVisualFlag)Send(SciMsg.SCI_GETWRAPVISUALFLAGS, UnusedW, Unused);
         }
 
         /// <summary>Set the location of visual flags for wrapped lines. (Scintilla feature 2462)</summary>
         public void SetWrapVisualFlagsLocation(WrapVisualLocation wrapVisualFlagsLocation)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETWRAPVISUALFLAGSLOCATION, (UIntPtr)wrapVisualFlagsLocation, Unused);
+            Send(SciMsg.SCI_SETWRAPVISUALFLAGSLOCATION, (UIntPtr)wrapVisualFlagsLocation, Unused);
         }
 
         /// <summary>Retrive the location of visual flags for wrapped lines. (Scintilla feature 2463)</summary>
         public WrapVisualLocation GetWrapVisualFlagsLocation()
         {
-            return (WrapVisualLocation)SendMessage(_scintilla, SciMsg.SCI_GETWRAPVISUALFLAGSLOCATION, UnusedW, Unused);
+            return (WrapVisualLocation)Send(SciMsg.SCI_GETWRAPVISUALFLAGSLOCATION, UnusedW, Unused);
         }
 
         /// <summary>Set the start indent for wrapped lines. (Scintilla feature 2464)</summary>
         public void SetWrapStartIndent(int indent)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETWRAPSTARTINDENT, (UIntPtr)indent, Unused);
+            Send(SciMsg.SCI_SETWRAPSTARTINDENT, (UIntPtr)indent, Unused);
         }
 
         /// <summary>Retrive the start indent for wrapped lines. (Scintilla feature 2465)</summary>
         public int GetWrapStartIndent()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETWRAPSTARTINDENT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETWRAPSTARTINDENT, UnusedW, Unused);
         }
 
         /// <summary>Sets how wrapped sublines are placed. Default is fixed. (Scintilla feature 2472)</summary>
         public void SetWrapIndentMode(WrapIndentMode wrapIndentMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETWRAPINDENTMODE, (UIntPtr)wrapIndentMode, Unused);
+            Send(SciMsg.SCI_SETWRAPINDENTMODE, (UIntPtr)wrapIndentMode, Unused);
         }
 
         /// <summary>Retrieve how wrapped sublines are placed. Default is fixed. (Scintilla feature 2473)</summary>
         public WrapIndentMode GetWrapIndentMode()
         {
-            return (WrapIndentMode)SendMessage(_scintilla, SciMsg.SCI_GETWRAPINDENTMODE, UnusedW, Unused);
+            return (WrapIndentMode)Send(SciMsg.SCI_GETWRAPINDENTMODE, UnusedW, Unused);
         }
 
         /// <summary>Sets the degree of caching of layout information. (Scintilla feature 2272)</summary>
         public void SetLayoutCache(LineCache cacheMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETLAYOUTCACHE, (UIntPtr)cacheMode, Unused);
+            Send(SciMsg.SCI_SETLAYOUTCACHE, (UIntPtr)cacheMode, Unused);
         }
 
         /// <summary>Retrieve the degree of caching of layout information. (Scintilla feature 2273)</summary>
         public LineCache GetLayoutCache()
         {
-            return (LineCache)SendMessage(_scintilla, SciMsg.SCI_GETLAYOUTCACHE, UnusedW, Unused);
+            return (LineCache)Send(SciMsg.SCI_GETLAYOUTCACHE, UnusedW, Unused);
         }
 
         /// <summary>Sets the document width assumed for scrolling. (Scintilla feature 2274)</summary>
         public void SetScrollWidth(int pixelWidth)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSCROLLWIDTH, (UIntPtr)pixelWidth, Unused);
+            Send(SciMsg.SCI_SETSCROLLWIDTH, (UIntPtr)pixelWidth, Unused);
         }
 
         /// <summary>Retrieve the document width assumed for scrolling. (Scintilla feature 2275)</summary>
         public int GetScrollWidth()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETSCROLLWIDTH, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETSCROLLWIDTH, UnusedW, Unused);
         }
 
         /// <summary>Sets whether the maximum width line displayed is used to set scroll width. (Scintilla feature 2516)</summary>
         public void SetScrollWidthTracking(bool tracking)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSCROLLWIDTHTRACKING, new UIntPtr(tracking ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETSCROLLWIDTHTRACKING, new UIntPtr(tracking ? 1U : 0U), Unused);
         }
 
         /// <summary>Retrieve whether the scroll width tracks wide lines. (Scintilla feature 2517)</summary>
         public bool GetScrollWidthTracking()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETSCROLLWIDTHTRACKING, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETSCROLLWIDTHTRACKING, UnusedW, Unused);
         }
 
         /// <summary>
@@ -2817,7 +3692,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetEndAtLastLine(bool endAtLastLine)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETENDATLASTLINE, new UIntPtr(endAtLastLine ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETENDATLASTLINE, new UIntPtr(endAtLastLine ? 1U : 0U), Unused);
         }
 
         /// <summary>
@@ -2827,25 +3702,25 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public bool GetEndAtLastLine()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETENDATLASTLINE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETENDATLASTLINE, UnusedW, Unused);
         }
 
         /// <summary>Retrieve the height of a particular line of text in pixels. (Scintilla feature 2279)</summary>
         public int TextHeight(Position line)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_TEXTHEIGHT, (UIntPtr)line, Unused);
+            return (int)Send(SciMsg.SCI_TEXTHEIGHT, (UIntPtr)line, Unused);
         }
 
         /// <summary>Show or hide the vertical scroll bar. (Scintilla feature 2280)</summary>
         public void SetVScrollBar(bool visible)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETVSCROLLBAR, new UIntPtr(visible ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETVSCROLLBAR, new UIntPtr(visible ? 1U : 0U), Unused);
         }
 
         /// <summary>Is the vertical scroll bar visible? (Scintilla feature 2281)</summary>
         public bool GetVScrollBar()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETVSCROLLBAR, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETVSCROLLBAR, UnusedW, Unused);
         }
 
         /// <summary>Append a string to the end of the document without changing the selection. (Scintilla feature 2282)</summary>
@@ -2854,10 +3729,19 @@ namespace Npp.DotNet.Plugin
             SendEncodedBytes(SciMsg.SCI_APPENDTEXT, text);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="AppendText(string)"/>
+        /// <remarks>The bytes of <paramref name="text"/> are sent as they are, without encoding.</remarks>
+        public void AppendText(ReadOnlySpan<byte> text)
+        {
+            SendBytes(SciMsg.SCI_APPENDTEXT, text);
+        }
+#endif
+
         /// <summary>How many phases is drawing done in? (Scintilla feature 2673)</summary>
         public PhasesDraw GetPhasesDraw()
         {
-            return (PhasesDraw)SendMessage(_scintilla, SciMsg.SCI_GETPHASESDRAW, UnusedW, Unused);
+            return (PhasesDraw)Send(SciMsg.SCI_GETPHASESDRAW, UnusedW, Unused);
         }
 
         /// <summary>
@@ -2869,37 +3753,37 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetPhasesDraw(PhasesDraw phases)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETPHASESDRAW, (UIntPtr)phases, Unused);
+            Send(SciMsg.SCI_SETPHASESDRAW, (UIntPtr)phases, Unused);
         }
 
         /// <summary>Choose the quality level for text from the FontQuality enumeration. (Scintilla feature 2611)</summary>
         public void SetFontQuality(FontQuality fontQuality)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETFONTQUALITY, (UIntPtr)fontQuality, Unused);
+            Send(SciMsg.SCI_SETFONTQUALITY, (UIntPtr)fontQuality, Unused);
         }
 
         /// <summary>Retrieve the quality level for text. (Scintilla feature 2612)</summary>
         public FontQuality GetFontQuality()
         {
-            return (FontQuality)SendMessage(_scintilla, SciMsg.SCI_GETFONTQUALITY, UnusedW, Unused);
+            return (FontQuality)Send(SciMsg.SCI_GETFONTQUALITY, UnusedW, Unused);
         }
 
         /// <summary>Scroll so that a display line is at the top of the display. (Scintilla feature 2613)</summary>
         public void SetFirstVisibleLine(Position displayLine)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETFIRSTVISIBLELINE, (UIntPtr)displayLine, Unused);
+            Send(SciMsg.SCI_SETFIRSTVISIBLELINE, (UIntPtr)displayLine, Unused);
         }
 
         /// <summary>Change the effect of pasting when there are multiple selections. (Scintilla feature 2614)</summary>
         public void SetMultiPaste(MultiPaste multiPaste)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMULTIPASTE, (UIntPtr)multiPaste, Unused);
+            Send(SciMsg.SCI_SETMULTIPASTE, (UIntPtr)multiPaste, Unused);
         }
 
         /// <summary>Retrieve the effect of pasting when there are multiple selections. (Scintilla feature 2615)</summary>
         public MultiPaste GetMultiPaste()
         {
-            return (MultiPaste)SendMessage(_scintilla, SciMsg.SCI_GETMULTIPASTE, UnusedW, Unused);
+            return (MultiPaste)Send(SciMsg.SCI_GETMULTIPASTE, UnusedW, Unused);
         }
 
         /// <summary>
@@ -2917,10 +3801,45 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETTAG, CodePage, (UIntPtr)tagNumber);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetTag(int)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetTag(int tagNumber, Span<byte> destination)
+        {
+            if (tagNumber < 0)
+            {
+                throw new ArgumentException("tagNumber must be non-negative integer");
+            }
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETTAG, destination, (UIntPtr)tagNumber);
+        }
+
+        /// <inheritdoc cref="GetTag(int)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetTag(int tagNumber, IBufferWriter<byte> writer)
+        {
+            if (tagNumber < 0)
+            {
+                throw new ArgumentException("tagNumber must be non-negative integer");
+            }
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETTAG, writer, (UIntPtr)tagNumber);
+        }
+
+        /// <inheritdoc cref="GetTag(int)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetTag(int tagNumber, ArrayPool<byte> pool, out int length)
+        {
+            if (tagNumber < 0)
+            {
+                throw new ArgumentException("tagNumber must be non-negative integer");
+            }
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETTAG, pool, out length, (UIntPtr)tagNumber);
+        }
+#endif
+
         /// <summary>Join the lines in the target. (Scintilla feature 2288)</summary>
         public void LinesJoin()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINESJOIN, UnusedW, Unused);
+            Send(SciMsg.SCI_LINESJOIN, UnusedW, Unused);
         }
 
         /// <summary>
@@ -2930,193 +3849,193 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void LinesSplit(int pixelWidth)
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINESSPLIT, (UIntPtr)pixelWidth, Unused);
+            Send(SciMsg.SCI_LINESSPLIT, (UIntPtr)pixelWidth, Unused);
         }
 
         /// <summary>Set one of the colours used as a chequerboard pattern in the fold margin (Scintilla feature 2290)</summary>
         public void SetFoldMarginColour(bool useSetting, Colour back)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETFOLDMARGINCOLOUR, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)back.Value);
+            Send(SciMsg.SCI_SETFOLDMARGINCOLOUR, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)back.Value);
         }
 
         /// <summary>Set the other colour used as a chequerboard pattern in the fold margin (Scintilla feature 2291)</summary>
         public void SetFoldMarginHiColour(bool useSetting, Colour fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETFOLDMARGINHICOLOUR, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)fore.Value);
+            Send(SciMsg.SCI_SETFOLDMARGINHICOLOUR, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)fore.Value);
         }
 
         /// <summary>Enable or disable accessibility. (Scintilla feature 2702)</summary>
         public void SetAccessibility(Accessibility accessibility)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETACCESSIBILITY, (UIntPtr)accessibility, Unused);
+            Send(SciMsg.SCI_SETACCESSIBILITY, (UIntPtr)accessibility, Unused);
         }
 
         /// <summary>Report accessibility status. (Scintilla feature 2703)</summary>
         public Accessibility GetAccessibility()
         {
-            return (Accessibility)SendMessage(_scintilla, SciMsg.SCI_GETACCESSIBILITY, UnusedW, Unused);
+            return (Accessibility)Send(SciMsg.SCI_GETACCESSIBILITY, UnusedW, Unused);
         }
 
         /// <summary>Move caret down one line. (Scintilla feature 2300)</summary>
         public void LineDown()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEDOWN, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEDOWN, UnusedW, Unused);
         }
 
         /// <summary>Move caret down one line extending selection to new caret position. (Scintilla feature 2301)</summary>
         public void LineDownExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEDOWNEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEDOWNEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret up one line. (Scintilla feature 2302)</summary>
         public void LineUp()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEUP, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEUP, UnusedW, Unused);
         }
 
         /// <summary>Move caret up one line extending selection to new caret position. (Scintilla feature 2303)</summary>
         public void LineUpExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEUPEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEUPEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret left one character. (Scintilla feature 2304)</summary>
         public void CharLeft()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CHARLEFT, UnusedW, Unused);
+            Send(SciMsg.SCI_CHARLEFT, UnusedW, Unused);
         }
 
         /// <summary>Move caret left one character extending selection to new caret position. (Scintilla feature 2305)</summary>
         public void CharLeftExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CHARLEFTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_CHARLEFTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret right one character. (Scintilla feature 2306)</summary>
         public void CharRight()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CHARRIGHT, UnusedW, Unused);
+            Send(SciMsg.SCI_CHARRIGHT, UnusedW, Unused);
         }
 
         /// <summary>Move caret right one character extending selection to new caret position. (Scintilla feature 2307)</summary>
         public void CharRightExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CHARRIGHTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_CHARRIGHTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret left one word. (Scintilla feature 2308)</summary>
         public void WordLeft()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDLEFT, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDLEFT, UnusedW, Unused);
         }
 
         /// <summary>Move caret left one word extending selection to new caret position. (Scintilla feature 2309)</summary>
         public void WordLeftExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDLEFTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDLEFTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret right one word. (Scintilla feature 2310)</summary>
         public void WordRight()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDRIGHT, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDRIGHT, UnusedW, Unused);
         }
 
         /// <summary>Move caret right one word extending selection to new caret position. (Scintilla feature 2311)</summary>
         public void WordRightExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDRIGHTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDRIGHTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to first position on line. (Scintilla feature 2312)</summary>
         public void Home()
         {
-            SendMessage(_scintilla, SciMsg.SCI_HOME, UnusedW, Unused);
+            Send(SciMsg.SCI_HOME, UnusedW, Unused);
         }
 
         /// <summary>Move caret to first position on line extending selection to new caret position. (Scintilla feature 2313)</summary>
         public void HomeExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_HOMEEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_HOMEEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to last position on line. (Scintilla feature 2314)</summary>
         public void LineEnd()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEEND, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to last position on line extending selection to new caret position. (Scintilla feature 2315)</summary>
         public void LineEndExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEENDEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEENDEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to first position in document. (Scintilla feature 2316)</summary>
         public void DocumentStart()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DOCUMENTSTART, UnusedW, Unused);
+            Send(SciMsg.SCI_DOCUMENTSTART, UnusedW, Unused);
         }
 
         /// <summary>Move caret to first position in document extending selection to new caret position. (Scintilla feature 2317)</summary>
         public void DocumentStartExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DOCUMENTSTARTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_DOCUMENTSTARTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to last position in document. (Scintilla feature 2318)</summary>
         public void DocumentEnd()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DOCUMENTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_DOCUMENTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to last position in document extending selection to new caret position. (Scintilla feature 2319)</summary>
         public void DocumentEndExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DOCUMENTENDEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_DOCUMENTENDEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret one page up. (Scintilla feature 2320)</summary>
         public void PageUp()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PAGEUP, UnusedW, Unused);
+            Send(SciMsg.SCI_PAGEUP, UnusedW, Unused);
         }
 
         /// <summary>Move caret one page up extending selection to new caret position. (Scintilla feature 2321)</summary>
         public void PageUpExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PAGEUPEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_PAGEUPEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret one page down. (Scintilla feature 2322)</summary>
         public void PageDown()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PAGEDOWN, UnusedW, Unused);
+            Send(SciMsg.SCI_PAGEDOWN, UnusedW, Unused);
         }
 
         /// <summary>Move caret one page down extending selection to new caret position. (Scintilla feature 2323)</summary>
         public void PageDownExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PAGEDOWNEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_PAGEDOWNEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Switch from insert to overtype mode or the reverse. (Scintilla feature 2324)</summary>
         public void EditToggleOvertype()
         {
-            SendMessage(_scintilla, SciMsg.SCI_EDITTOGGLEOVERTYPE, UnusedW, Unused);
+            Send(SciMsg.SCI_EDITTOGGLEOVERTYPE, UnusedW, Unused);
         }
 
         /// <summary>Cancel any modes such as call tip or auto-completion list display. (Scintilla feature 2325)</summary>
         public void Cancel()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CANCEL, UnusedW, Unused);
+            Send(SciMsg.SCI_CANCEL, UnusedW, Unused);
         }
 
         /// <summary>Delete the selection or if no selection, the character before the caret. (Scintilla feature 2326)</summary>
         public void DeleteBack()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DELETEBACK, UnusedW, Unused);
+            Send(SciMsg.SCI_DELETEBACK, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3126,13 +4045,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void Tab()
         {
-            SendMessage(_scintilla, SciMsg.SCI_TAB, UnusedW, Unused);
+            Send(SciMsg.SCI_TAB, UnusedW, Unused);
         }
 
         /// <summary>Indent the current and selected lines. (Scintilla feature 2813)</summary>
         public void LineIndent()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEINDENT, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEINDENT, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3142,25 +4061,25 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void BackTab()
         {
-            SendMessage(_scintilla, SciMsg.SCI_BACKTAB, UnusedW, Unused);
+            Send(SciMsg.SCI_BACKTAB, UnusedW, Unused);
         }
 
         /// <summary>Dedent the current and selected lines. (Scintilla feature 2814)</summary>
         public void LineDedent()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEDEDENT, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEDEDENT, UnusedW, Unused);
         }
 
         /// <summary>Insert a new line, may use a CRLF, CR or LF depending on EOL mode. (Scintilla feature 2329)</summary>
         public void NewLine()
         {
-            SendMessage(_scintilla, SciMsg.SCI_NEWLINE, UnusedW, Unused);
+            Send(SciMsg.SCI_NEWLINE, UnusedW, Unused);
         }
 
         /// <summary>Insert a Form Feed character. (Scintilla feature 2330)</summary>
         public void FormFeed()
         {
-            SendMessage(_scintilla, SciMsg.SCI_FORMFEED, UnusedW, Unused);
+            Send(SciMsg.SCI_FORMFEED, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3170,97 +4089,97 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void VCHome()
         {
-            SendMessage(_scintilla, SciMsg.SCI_VCHOME, UnusedW, Unused);
+            Send(SciMsg.SCI_VCHOME, UnusedW, Unused);
         }
 
         /// <summary>Like VCHome but extending selection to new caret position. (Scintilla feature 2332)</summary>
         public void VCHomeExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_VCHOMEEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_VCHOMEEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Magnify the displayed text by increasing the sizes by 1 point. (Scintilla feature 2333)</summary>
         public void ZoomIn()
         {
-            SendMessage(_scintilla, SciMsg.SCI_ZOOMIN, UnusedW, Unused);
+            Send(SciMsg.SCI_ZOOMIN, UnusedW, Unused);
         }
 
         /// <summary>Make the displayed text smaller by decreasing the sizes by 1 point. (Scintilla feature 2334)</summary>
         public void ZoomOut()
         {
-            SendMessage(_scintilla, SciMsg.SCI_ZOOMOUT, UnusedW, Unused);
+            Send(SciMsg.SCI_ZOOMOUT, UnusedW, Unused);
         }
 
         /// <summary>Delete the word to the left of the caret. (Scintilla feature 2335)</summary>
         public void DelWordLeft()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DELWORDLEFT, UnusedW, Unused);
+            Send(SciMsg.SCI_DELWORDLEFT, UnusedW, Unused);
         }
 
         /// <summary>Delete the word to the right of the caret. (Scintilla feature 2336)</summary>
         public void DelWordRight()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DELWORDRIGHT, UnusedW, Unused);
+            Send(SciMsg.SCI_DELWORDRIGHT, UnusedW, Unused);
         }
 
         /// <summary>Delete the word to the right of the caret, but not the trailing non-word characters. (Scintilla feature 2518)</summary>
         public void DelWordRightEnd()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DELWORDRIGHTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_DELWORDRIGHTEND, UnusedW, Unused);
         }
 
         /// <summary>Cut the line containing the caret. (Scintilla feature 2337)</summary>
         public void LineCut()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINECUT, UnusedW, Unused);
+            Send(SciMsg.SCI_LINECUT, UnusedW, Unused);
         }
 
         /// <summary>Delete the line containing the caret. (Scintilla feature 2338)</summary>
         public void LineDelete()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEDELETE, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEDELETE, UnusedW, Unused);
         }
 
         /// <summary>Switch the current line with the previous. (Scintilla feature 2339)</summary>
         public void LineTranspose()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINETRANSPOSE, UnusedW, Unused);
+            Send(SciMsg.SCI_LINETRANSPOSE, UnusedW, Unused);
         }
 
         /// <summary>Reverse order of selected lines. (Scintilla feature 2354)</summary>
         public void LineReverse()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEREVERSE, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEREVERSE, UnusedW, Unused);
         }
 
         /// <summary>Duplicate the current line. (Scintilla feature 2404)</summary>
         public void LineDuplicate()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEDUPLICATE, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEDUPLICATE, UnusedW, Unused);
         }
 
         /// <summary>Transform the selection to lower case. (Scintilla feature 2340)</summary>
         public void LowerCase()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LOWERCASE, UnusedW, Unused);
+            Send(SciMsg.SCI_LOWERCASE, UnusedW, Unused);
         }
 
         /// <summary>Transform the selection to upper case. (Scintilla feature 2341)</summary>
         public void UpperCase()
         {
-            SendMessage(_scintilla, SciMsg.SCI_UPPERCASE, UnusedW, Unused);
+            Send(SciMsg.SCI_UPPERCASE, UnusedW, Unused);
         }
 
         /// <summary>Scroll the document down, keeping the caret visible. (Scintilla feature 2342)</summary>
         public void LineScrollDown()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINESCROLLDOWN, UnusedW, Unused);
+            Send(SciMsg.SCI_LINESCROLLDOWN, UnusedW, Unused);
         }
 
         /// <summary>Scroll the document up, keeping the caret visible. (Scintilla feature 2343)</summary>
         public void LineScrollUp()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINESCROLLUP, UnusedW, Unused);
+            Send(SciMsg.SCI_LINESCROLLUP, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3270,13 +4189,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void DeleteBackNotLine()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DELETEBACKNOTLINE, UnusedW, Unused);
+            Send(SciMsg.SCI_DELETEBACKNOTLINE, UnusedW, Unused);
         }
 
         /// <summary>Move caret to first position on display line. (Scintilla feature 2345)</summary>
         public void HomeDisplay()
         {
-            SendMessage(_scintilla, SciMsg.SCI_HOMEDISPLAY, UnusedW, Unused);
+            Send(SciMsg.SCI_HOMEDISPLAY, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3286,13 +4205,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void HomeDisplayExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_HOMEDISPLAYEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_HOMEDISPLAYEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to last position on display line. (Scintilla feature 2347)</summary>
         public void LineEndDisplay()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEENDDISPLAY, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEENDDISPLAY, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3302,7 +4221,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void LineEndDisplayExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEENDDISPLAYEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEENDDISPLAYEXTEND, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3312,7 +4231,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void HomeWrap()
         {
-            SendMessage(_scintilla, SciMsg.SCI_HOMEWRAP, UnusedW, Unused);
+            Send(SciMsg.SCI_HOMEWRAP, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3322,7 +4241,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void HomeWrapExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_HOMEWRAPEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_HOMEWRAPEXTEND, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3332,7 +4251,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void LineEndWrap()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEENDWRAP, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEENDWRAP, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3342,7 +4261,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void LineEndWrapExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEENDWRAPEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEENDWRAPEXTEND, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3352,7 +4271,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void VCHomeWrap()
         {
-            SendMessage(_scintilla, SciMsg.SCI_VCHOMEWRAP, UnusedW, Unused);
+            Send(SciMsg.SCI_VCHOMEWRAP, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3362,49 +4281,49 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void VCHomeWrapExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_VCHOMEWRAPEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_VCHOMEWRAPEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Copy the line containing the caret. (Scintilla feature 2455)</summary>
         public void LineCopy()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINECOPY, UnusedW, Unused);
+            Send(SciMsg.SCI_LINECOPY, UnusedW, Unused);
         }
 
         /// <summary>Move the caret inside current view if it's not there already. (Scintilla feature 2401)</summary>
         public void MoveCaretInsideView()
         {
-            SendMessage(_scintilla, SciMsg.SCI_MOVECARETINSIDEVIEW, UnusedW, Unused);
+            Send(SciMsg.SCI_MOVECARETINSIDEVIEW, UnusedW, Unused);
         }
 
         /// <summary>How many characters are on a line, including end of line characters? (Scintilla feature 2350)</summary>
         public Position LineLength(Position line)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_LINELENGTH, (UIntPtr)line, Unused);
+            return Send(SciMsg.SCI_LINELENGTH, (UIntPtr)line, Unused);
         }
 
         /// <summary>Highlight the characters at two positions. (Scintilla feature 2351)</summary>
         public void BraceHighlight(Position posA, Position posB)
         {
-            SendMessage(_scintilla, SciMsg.SCI_BRACEHIGHLIGHT, (UIntPtr)posA, (IntPtr)posB);
+            Send(SciMsg.SCI_BRACEHIGHLIGHT, (UIntPtr)posA, (IntPtr)posB);
         }
 
         /// <summary>Use specified indicator to highlight matching braces instead of changing their style. (Scintilla feature 2498)</summary>
         public void BraceHighlightIndicator(bool useSetting, int indicator)
         {
-            SendMessage(_scintilla, SciMsg.SCI_BRACEHIGHLIGHTINDICATOR, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)indicator);
+            Send(SciMsg.SCI_BRACEHIGHLIGHTINDICATOR, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)indicator);
         }
 
         /// <summary>Highlight the character at a position indicating there is no matching brace. (Scintilla feature 2352)</summary>
         public void BraceBadLight(Position pos)
         {
-            SendMessage(_scintilla, SciMsg.SCI_BRACEBADLIGHT, (UIntPtr)pos, Unused);
+            Send(SciMsg.SCI_BRACEBADLIGHT, (UIntPtr)pos, Unused);
         }
 
         /// <summary>Use specified indicator to highlight non matching brace instead of changing its style. (Scintilla feature 2499)</summary>
         public void BraceBadLightIndicator(bool useSetting, int indicator)
         {
-            SendMessage(_scintilla, SciMsg.SCI_BRACEBADLIGHTINDICATOR, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)indicator);
+            Send(SciMsg.SCI_BRACEBADLIGHTINDICATOR, new UIntPtr(useSetting ? 1U : 0U), (IntPtr)indicator);
         }
 
         /// <summary>
@@ -3414,49 +4333,50 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position BraceMatch(Position pos, int maxReStyle)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_BRACEMATCH, (UIntPtr)pos, (IntPtr)maxReStyle);
+            return Send(SciMsg.SCI_BRACEMATCH, (UIntPtr)pos, (IntPtr)maxReStyle);
         }
 
         /// <summary>Similar to BraceMatch, but matching starts at the explicit start position. (Scintilla feature 2369)</summary>
         public Position BraceMatchNext(Position pos, Position startPos)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_BRACEMATCHNEXT, (UIntPtr)pos, (IntPtr)startPos);
+            return Send(SciMsg.SCI_BRACEMATCHNEXT, (UIntPtr)pos, (IntPtr)startPos);
         }
 
         /// <summary>Are the end of line characters visible? (Scintilla feature 2355)</summary>
         public bool GetViewEOL()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETVIEWEOL, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETVIEWEOL, UnusedW, Unused);
         }
 
         /// <summary>Make the end of line characters visible or invisible. (Scintilla feature 2356)</summary>
         public void SetViewEOL(bool visible)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETVIEWEOL, new UIntPtr(visible ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETVIEWEOL, new UIntPtr(visible ? 1U : 0U), Unused);
         }
 
         /// <summary>Retrieve a pointer to the document object. (Scintilla feature 2357)</summary>
         public IntPtr GetDocPointer()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETDOCPOINTER, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETDOCPOINTER, UnusedW, Unused);
         }
 
         /// <summary>Change the document object used. (Scintilla feature 2358)</summary>
         public void SetDocPointer(IntPtr doc)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETDOCPOINTER, UnusedW, (IntPtr)doc);
+            Send(SciMsg.SCI_SETDOCPOINTER, UnusedW, (IntPtr)doc);
+            ForgetCodePage();
         }
 
         /// <summary>Set which document modification events are sent to the container. (Scintilla feature 2359)</summary>
         public void SetModEventMask(ModificationFlags eventMask)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMODEVENTMASK, (UIntPtr)eventMask, Unused);
+            Send(SciMsg.SCI_SETMODEVENTMASK, (UIntPtr)eventMask, Unused);
         }
 
         /// <summary>Retrieve the column number which text should be kept within. (Scintilla feature 2360)</summary>
         public Position GetEdgeColumn()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETEDGECOLUMN, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETEDGECOLUMN, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3466,13 +4386,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetEdgeColumn(Position column)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETEDGECOLUMN, (UIntPtr)column, Unused);
+            Send(SciMsg.SCI_SETEDGECOLUMN, (UIntPtr)column, Unused);
         }
 
         /// <summary>Retrieve the edge highlight mode. (Scintilla feature 2362)</summary>
         public EdgeVisualStyle GetEdgeMode()
         {
-            return (EdgeVisualStyle)SendMessage(_scintilla, SciMsg.SCI_GETEDGEMODE, UnusedW, Unused);
+            return (EdgeVisualStyle)Send(SciMsg.SCI_GETEDGEMODE, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3482,43 +4402,43 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetEdgeMode(EdgeVisualStyle edgeMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETEDGEMODE, (UIntPtr)edgeMode, Unused);
+            Send(SciMsg.SCI_SETEDGEMODE, (UIntPtr)edgeMode, Unused);
         }
 
         /// <summary>Retrieve the colour used in edge indication. (Scintilla feature 2364)</summary>
         public Colour GetEdgeColour()
         {
-            return new Colour((int)SendMessage(_scintilla, SciMsg.SCI_GETEDGECOLOUR, UnusedW, Unused));
+            return new Colour((int)Send(SciMsg.SCI_GETEDGECOLOUR, UnusedW, Unused));
         }
 
         /// <summary>Change the colour used in edge indication. (Scintilla feature 2365)</summary>
         public void SetEdgeColour(Colour edgeColour)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETEDGECOLOUR, (UIntPtr)edgeColour.Value, Unused);
+            Send(SciMsg.SCI_SETEDGECOLOUR, (UIntPtr)edgeColour.Value, Unused);
         }
 
         /// <summary>Add a new vertical edge to the view. (Scintilla feature 2694)</summary>
         public void MultiEdgeAddLine(Position column, Colour edgeColour)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MULTIEDGEADDLINE, (UIntPtr)column, (IntPtr)edgeColour.Value);
+            Send(SciMsg.SCI_MULTIEDGEADDLINE, (UIntPtr)column, (IntPtr)edgeColour.Value);
         }
 
         /// <summary>Clear all vertical edges. (Scintilla feature 2695)</summary>
         public void MultiEdgeClearAll()
         {
-            SendMessage(_scintilla, SciMsg.SCI_MULTIEDGECLEARALL, UnusedW, Unused);
+            Send(SciMsg.SCI_MULTIEDGECLEARALL, UnusedW, Unused);
         }
 
         /// <summary>Get multi edge positions. (Scintilla feature 2749)</summary>
         public Position GetMultiEdgeColumn(int which)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETMULTIEDGECOLUMN, (UIntPtr)which, Unused);
+            return Send(SciMsg.SCI_GETMULTIEDGECOLUMN, (UIntPtr)which, Unused);
         }
 
         /// <summary>Sets the current caret position to be the search anchor. (Scintilla feature 2366)</summary>
         public void SearchAnchor()
         {
-            SendMessage(_scintilla, SciMsg.SCI_SEARCHANCHOR, UnusedW, Unused);
+            Send(SciMsg.SCI_SEARCHANCHOR, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3544,7 +4464,7 @@ namespace Npp.DotNet.Plugin
         /// <summary>Retrieves the number of lines completely visible. (Scintilla feature 2370)</summary>
         public Position LinesOnScreen()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_LINESONSCREEN, UnusedW, Unused);
+            return Send(SciMsg.SCI_LINESONSCREEN, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3554,13 +4474,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void UsePopUp(PopUp popUpMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_USEPOPUP, (UIntPtr)popUpMode, Unused);
+            Send(SciMsg.SCI_USEPOPUP, (UIntPtr)popUpMode, Unused);
         }
 
         /// <summary>Is the selection rectangular? The alternative is the more common stream selection. (Scintilla feature 2372)</summary>
         public bool SelectionIsRectangle()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_SELECTIONISRECTANGLE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_SELECTIONISRECTANGLE, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3570,13 +4490,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetZoom(int zoomInPoints)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETZOOM, (UIntPtr)zoomInPoints, Unused);
+            Send(SciMsg.SCI_SETZOOM, (UIntPtr)zoomInPoints, Unused);
         }
 
         /// <summary>Retrieve the zoom level. (Scintilla feature 2374)</summary>
         public int GetZoom()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETZOOM, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETZOOM, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3586,103 +4506,103 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public IntPtr CreateDocument(Position bytes, DocumentOption documentOptions)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_CREATEDOCUMENT, (UIntPtr)bytes, (IntPtr)documentOptions);
+            return Send(SciMsg.SCI_CREATEDOCUMENT, (UIntPtr)bytes, (IntPtr)documentOptions);
         }
 
         /// <summary>Extend life of document. (Scintilla feature 2376)</summary>
         public void AddRefDocument(IntPtr doc)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ADDREFDOCUMENT, UnusedW, (IntPtr)doc);
+            Send(SciMsg.SCI_ADDREFDOCUMENT, UnusedW, (IntPtr)doc);
         }
 
         /// <summary>Release a reference to the document, deleting document if it fades to black. (Scintilla feature 2377)</summary>
         public void ReleaseDocument(IntPtr doc)
         {
-            SendMessage(_scintilla, SciMsg.SCI_RELEASEDOCUMENT, UnusedW, (IntPtr)doc);
+            Send(SciMsg.SCI_RELEASEDOCUMENT, UnusedW, (IntPtr)doc);
         }
 
         /// <summary>Get which document options are set. (Scintilla feature 2379)</summary>
         public DocumentOption GetDocumentOptions()
         {
-            return (DocumentOption)SendMessage(_scintilla, SciMsg.SCI_GETDOCUMENTOPTIONS, UnusedW, Unused);
+            return (DocumentOption)Send(SciMsg.SCI_GETDOCUMENTOPTIONS, UnusedW, Unused);
         }
 
         /// <summary>Get which document modification events are sent to the container. (Scintilla feature 2378)</summary>
         public ModificationFlags GetModEventMask()
         {
-            return (ModificationFlags)SendMessage(_scintilla, SciMsg.SCI_GETMODEVENTMASK, UnusedW, Unused);
+            return (ModificationFlags)Send(SciMsg.SCI_GETMODEVENTMASK, UnusedW, Unused);
         }
 
         /// <summary>Set whether command events are sent to the container. (Scintilla feature 2717)</summary>
         public void SetCommandEvents(bool commandEvents)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCOMMANDEVENTS, new UIntPtr(commandEvents ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETCOMMANDEVENTS, new UIntPtr(commandEvents ? 1U : 0U), Unused);
         }
 
         /// <summary>Get whether command events are sent to the container. (Scintilla feature 2718)</summary>
         public bool GetCommandEvents()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETCOMMANDEVENTS, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETCOMMANDEVENTS, UnusedW, Unused);
         }
 
         /// <summary>Change internal focus flag. (Scintilla feature 2380)</summary>
         public void SetFocus(bool focus)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETFOCUS, new UIntPtr(focus ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETFOCUS, new UIntPtr(focus ? 1U : 0U), Unused);
         }
 
         /// <summary>Get internal focus flag. (Scintilla feature 2381)</summary>
         public bool GetFocus()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETFOCUS, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETFOCUS, UnusedW, Unused);
         }
 
         /// <summary>Change error status - 0 = OK. (Scintilla feature 2382)</summary>
         public void SetStatus(Status status)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSTATUS, (UIntPtr)status, Unused);
+            Send(SciMsg.SCI_SETSTATUS, (UIntPtr)status, Unused);
         }
 
         /// <summary>Get error status. (Scintilla feature 2383)</summary>
         public Status GetStatus()
         {
-            return (Status)SendMessage(_scintilla, SciMsg.SCI_GETSTATUS, UnusedW, Unused);
+            return (Status)Send(SciMsg.SCI_GETSTATUS, UnusedW, Unused);
         }
 
         /// <summary>Set whether the mouse is captured when its button is pressed. (Scintilla feature 2384)</summary>
         public void SetMouseDownCaptures(bool captures)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMOUSEDOWNCAPTURES, new UIntPtr(captures ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETMOUSEDOWNCAPTURES, new UIntPtr(captures ? 1U : 0U), Unused);
         }
 
         /// <summary>Get whether mouse gets captured. (Scintilla feature 2385)</summary>
         public bool GetMouseDownCaptures()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETMOUSEDOWNCAPTURES, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETMOUSEDOWNCAPTURES, UnusedW, Unused);
         }
 
         /// <summary>Set whether the mouse wheel can be active outside the window. (Scintilla feature 2696)</summary>
         public void SetMouseWheelCaptures(bool captures)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMOUSEWHEELCAPTURES, new UIntPtr(captures ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETMOUSEWHEELCAPTURES, new UIntPtr(captures ? 1U : 0U), Unused);
         }
 
         /// <summary>Get whether mouse wheel can be active outside the window. (Scintilla feature 2697)</summary>
         public bool GetMouseWheelCaptures()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETMOUSEWHEELCAPTURES, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETMOUSEWHEELCAPTURES, UnusedW, Unused);
         }
 
         /// <summary>Sets the cursor to one of the SC_CURSOR* values. (Scintilla feature 2386)</summary>
         public void SetCursor(CursorShape cursorType)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCURSOR, (UIntPtr)cursorType, Unused);
+            Send(SciMsg.SCI_SETCURSOR, (UIntPtr)cursorType, Unused);
         }
 
         /// <summary>Get cursor type. (Scintilla feature 2387)</summary>
         public CursorShape GetCursor()
         {
-            return (CursorShape)SendMessage(_scintilla, SciMsg.SCI_GETCURSOR, UnusedW, Unused);
+            return (CursorShape)Send(SciMsg.SCI_GETCURSOR, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3692,19 +4612,19 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetControlCharSymbol(int symbol)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCONTROLCHARSYMBOL, (UIntPtr)symbol, Unused);
+            Send(SciMsg.SCI_SETCONTROLCHARSYMBOL, (UIntPtr)symbol, Unused);
         }
 
         /// <summary>Get the way control characters are displayed. (Scintilla feature 2389)</summary>
         public int GetControlCharSymbol()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETCONTROLCHARSYMBOL, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETCONTROLCHARSYMBOL, UnusedW, Unused);
         }
 
         /// <summary>Move to the previous change in capitalisation. (Scintilla feature 2390)</summary>
         public void WordPartLeft()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDPARTLEFT, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDPARTLEFT, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3714,13 +4634,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void WordPartLeftExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDPARTLEFTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDPARTLEFTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move to the change next in capitalisation. (Scintilla feature 2392)</summary>
         public void WordPartRight()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDPARTRIGHT, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDPARTRIGHT, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3730,7 +4650,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void WordPartRightExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDPARTRIGHTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDPARTRIGHTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3740,43 +4660,43 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetVisiblePolicy(VisiblePolicy visiblePolicy, int visibleSlop)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETVISIBLEPOLICY, (UIntPtr)visiblePolicy, (IntPtr)visibleSlop);
+            Send(SciMsg.SCI_SETVISIBLEPOLICY, (UIntPtr)visiblePolicy, (IntPtr)visibleSlop);
         }
 
         /// <summary>Delete back from the current position to the start of the line. (Scintilla feature 2395)</summary>
         public void DelLineLeft()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DELLINELEFT, UnusedW, Unused);
+            Send(SciMsg.SCI_DELLINELEFT, UnusedW, Unused);
         }
 
         /// <summary>Delete forwards from the current position to the end of the line. (Scintilla feature 2396)</summary>
         public void DelLineRight()
         {
-            SendMessage(_scintilla, SciMsg.SCI_DELLINERIGHT, UnusedW, Unused);
+            Send(SciMsg.SCI_DELLINERIGHT, UnusedW, Unused);
         }
 
         /// <summary>Set the xOffset (ie, horizontal scroll position). (Scintilla feature 2397)</summary>
         public void SetXOffset(int xOffset)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETXOFFSET, (UIntPtr)xOffset, Unused);
+            Send(SciMsg.SCI_SETXOFFSET, (UIntPtr)xOffset, Unused);
         }
 
         /// <summary>Get the xOffset (ie, horizontal scroll position). (Scintilla feature 2398)</summary>
         public int GetXOffset()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETXOFFSET, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETXOFFSET, UnusedW, Unused);
         }
 
         /// <summary>Set the last x chosen value to be the caret x position. (Scintilla feature 2399)</summary>
         public void ChooseCaretX()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CHOOSECARETX, UnusedW, Unused);
+            Send(SciMsg.SCI_CHOOSECARETX, UnusedW, Unused);
         }
 
         /// <summary>Set the focus to this Scintilla widget. (Scintilla feature 2400)</summary>
         public void GrabFocus()
         {
-            SendMessage(_scintilla, SciMsg.SCI_GRABFOCUS, UnusedW, Unused);
+            Send(SciMsg.SCI_GRABFOCUS, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3786,7 +4706,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetXCaretPolicy(CaretPolicy caretPolicy, int caretSlop)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETXCARETPOLICY, (UIntPtr)caretPolicy, (IntPtr)caretSlop);
+            Send(SciMsg.SCI_SETXCARETPOLICY, (UIntPtr)caretPolicy, (IntPtr)caretSlop);
         }
 
         /// <summary>
@@ -3796,19 +4716,19 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetYCaretPolicy(CaretPolicy caretPolicy, int caretSlop)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETYCARETPOLICY, (UIntPtr)caretPolicy, (IntPtr)caretSlop);
+            Send(SciMsg.SCI_SETYCARETPOLICY, (UIntPtr)caretPolicy, (IntPtr)caretSlop);
         }
 
         /// <summary>Set printing to line wrapped (SC_WRAP_WORD) or not line wrapped (SC_WRAP_NONE). (Scintilla feature 2406)</summary>
         public void SetPrintWrapMode(Wrap wrapMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETPRINTWRAPMODE, (UIntPtr)wrapMode, Unused);
+            Send(SciMsg.SCI_SETPRINTWRAPMODE, (UIntPtr)wrapMode, Unused);
         }
 
         /// <summary>Is printing line wrapped? (Scintilla feature 2407)</summary>
         public Wrap GetPrintWrapMode()
         {
-            return (Wrap)SendMessage(_scintilla, SciMsg.SCI_GETPRINTWRAPMODE, UnusedW, Unused);
+            return (Wrap)Send(SciMsg.SCI_GETPRINTWRAPMODE, UnusedW, Unused);
         }
 
         /// <summary>Set a fore colour for active hotspots. (Scintilla feature 2410)</summary>
@@ -3830,49 +4750,49 @@ namespace Npp.DotNet.Plugin
         /// <summary>Enable / Disable underlining active hotspots. (Scintilla feature 2412)</summary>
         public void SetHotspotActiveUnderline(bool underline)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETHOTSPOTACTIVEUNDERLINE, new UIntPtr(underline ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETHOTSPOTACTIVEUNDERLINE, new UIntPtr(underline ? 1U : 0U), Unused);
         }
 
         /// <summary>Get whether underlining for active hotspots. (Scintilla feature 2496)</summary>
         public bool GetHotspotActiveUnderline()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETHOTSPOTACTIVEUNDERLINE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETHOTSPOTACTIVEUNDERLINE, UnusedW, Unused);
         }
 
         /// <summary>Limit hotspots to single line so hotspots on two lines don't merge. (Scintilla feature 2421)</summary>
         public void SetHotspotSingleLine(bool singleLine)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETHOTSPOTSINGLELINE, new UIntPtr(singleLine ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETHOTSPOTSINGLELINE, new UIntPtr(singleLine ? 1U : 0U), Unused);
         }
 
         /// <summary>Get the HotspotSingleLine property (Scintilla feature 2497)</summary>
         public bool GetHotspotSingleLine()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETHOTSPOTSINGLELINE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETHOTSPOTSINGLELINE, UnusedW, Unused);
         }
 
         /// <summary>Move caret down one paragraph (delimited by empty lines). (Scintilla feature 2413)</summary>
         public void ParaDown()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PARADOWN, UnusedW, Unused);
+            Send(SciMsg.SCI_PARADOWN, UnusedW, Unused);
         }
 
         /// <summary>Extend selection down one paragraph (delimited by empty lines). (Scintilla feature 2414)</summary>
         public void ParaDownExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PARADOWNEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_PARADOWNEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret up one paragraph (delimited by empty lines). (Scintilla feature 2415)</summary>
         public void ParaUp()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PARAUP, UnusedW, Unused);
+            Send(SciMsg.SCI_PARAUP, UnusedW, Unused);
         }
 
         /// <summary>Extend selection up one paragraph (delimited by empty lines). (Scintilla feature 2416)</summary>
         public void ParaUpExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PARAUPEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_PARAUPEXTEND, UnusedW, Unused);
         }
 
         /// <summary>
@@ -3882,7 +4802,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position PositionBefore(Position pos)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_POSITIONBEFORE, (UIntPtr)pos, Unused);
+            return Send(SciMsg.SCI_POSITIONBEFORE, (UIntPtr)pos, Unused);
         }
 
         /// <summary>
@@ -3892,7 +4812,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position PositionAfter(Position pos)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_POSITIONAFTER, (UIntPtr)pos, Unused);
+            return Send(SciMsg.SCI_POSITIONAFTER, (UIntPtr)pos, Unused);
         }
 
         /// <summary>
@@ -3902,7 +4822,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position PositionRelative(Position pos, Position relative)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_POSITIONRELATIVE, (UIntPtr)pos, (IntPtr)relative);
+            return Send(SciMsg.SCI_POSITIONRELATIVE, (UIntPtr)pos, (IntPtr)relative);
         }
 
         /// <summary>
@@ -3913,13 +4833,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position PositionRelativeCodeUnits(Position pos, Position relative)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_POSITIONRELATIVECODEUNITS, (UIntPtr)pos, (IntPtr)relative);
+            return Send(SciMsg.SCI_POSITIONRELATIVECODEUNITS, (UIntPtr)pos, (IntPtr)relative);
         }
 
         /// <summary>Copy a range of text to the clipboard. Positions are clipped into the document. (Scintilla feature 2419)</summary>
         public void CopyRange(Position start, Position end)
         {
-            SendMessage(_scintilla, SciMsg.SCI_COPYRANGE, (UIntPtr)start, (IntPtr)end);
+            Send(SciMsg.SCI_COPYRANGE, (UIntPtr)start, (IntPtr)end);
         }
 
         /// <summary>Copy argument text to the clipboard. (Scintilla feature 2420)</summary>
@@ -3928,6 +4848,15 @@ namespace Npp.DotNet.Plugin
             SendEncodedBytes(SciMsg.SCI_COPYTEXT, text);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="CopyText(string)"/>
+        /// <remarks>The bytes of <paramref name="text"/> are sent as they are, without encoding.</remarks>
+        public void CopyText(ReadOnlySpan<byte> text)
+        {
+            SendBytes(SciMsg.SCI_COPYTEXT, text);
+        }
+#endif
+
         /// <summary>
         /// Set the selection mode to stream (SC_SEL_STREAM) or rectangular (SC_SEL_RECTANGLE/SC_SEL_THIN) or
         /// by lines (SC_SEL_LINES).
@@ -3935,7 +4864,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetSelectionMode(SelectionMode selectionMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTIONMODE, (UIntPtr)selectionMode, Unused);
+            Send(SciMsg.SCI_SETSELECTIONMODE, (UIntPtr)selectionMode, Unused);
         }
 
         /// <summary>
@@ -3945,67 +4874,67 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void ChangeSelectionMode(SelectionMode selectionMode)
         {
-            SendMessage(_scintilla, SciMsg.SCI_CHANGESELECTIONMODE, (UIntPtr)selectionMode, Unused);
+            Send(SciMsg.SCI_CHANGESELECTIONMODE, (UIntPtr)selectionMode, Unused);
         }
 
         /// <summary>Get the mode of the current selection. (Scintilla feature 2423)</summary>
         public SelectionMode GetSelectionMode()
         {
-            return (SelectionMode)SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONMODE, UnusedW, Unused);
+            return (SelectionMode)Send(SciMsg.SCI_GETSELECTIONMODE, UnusedW, Unused);
         }
 
         /// <summary>Set whether or not regular caret moves will extend or reduce the selection. (Scintilla feature 2719)</summary>
         public void SetMoveExtendsSelection(bool moveExtendsSelection)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMOVEEXTENDSSELECTION, new UIntPtr(moveExtendsSelection ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETMOVEEXTENDSSELECTION, new UIntPtr(moveExtendsSelection ? 1U : 0U), Unused);
         }
 
         /// <summary>Get whether or not regular caret moves will extend or reduce the selection. (Scintilla feature 2706)</summary>
         public bool GetMoveExtendsSelection()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETMOVEEXTENDSSELECTION, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETMOVEEXTENDSSELECTION, UnusedW, Unused);
         }
 
         /// <summary>Retrieve the position of the start of the selection at the given line (INVALID_POSITION if no selection on this line). (Scintilla feature 2424)</summary>
         public Position GetLineSelStartPosition(Position line)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETLINESELSTARTPOSITION, (UIntPtr)line, Unused);
+            return Send(SciMsg.SCI_GETLINESELSTARTPOSITION, (UIntPtr)line, Unused);
         }
 
         /// <summary>Retrieve the position of the end of the selection at the given line (INVALID_POSITION if no selection on this line). (Scintilla feature 2425)</summary>
         public Position GetLineSelEndPosition(Position line)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETLINESELENDPOSITION, (UIntPtr)line, Unused);
+            return Send(SciMsg.SCI_GETLINESELENDPOSITION, (UIntPtr)line, Unused);
         }
 
         /// <summary>Move caret down one line, extending rectangular selection to new caret position. (Scintilla feature 2426)</summary>
         public void LineDownRectExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEDOWNRECTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEDOWNRECTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret up one line, extending rectangular selection to new caret position. (Scintilla feature 2427)</summary>
         public void LineUpRectExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEUPRECTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEUPRECTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret left one character, extending rectangular selection to new caret position. (Scintilla feature 2428)</summary>
         public void CharLeftRectExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CHARLEFTRECTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_CHARLEFTRECTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret right one character, extending rectangular selection to new caret position. (Scintilla feature 2429)</summary>
         public void CharRightRectExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CHARRIGHTRECTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_CHARRIGHTRECTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to first position on line, extending rectangular selection to new caret position. (Scintilla feature 2430)</summary>
         public void HomeRectExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_HOMERECTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_HOMERECTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>
@@ -4016,73 +4945,73 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void VCHomeRectExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_VCHOMERECTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_VCHOMERECTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to last position on line, extending rectangular selection to new caret position. (Scintilla feature 2432)</summary>
         public void LineEndRectExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_LINEENDRECTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_LINEENDRECTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret one page up, extending rectangular selection to new caret position. (Scintilla feature 2433)</summary>
         public void PageUpRectExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PAGEUPRECTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_PAGEUPRECTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret one page down, extending rectangular selection to new caret position. (Scintilla feature 2434)</summary>
         public void PageDownRectExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_PAGEDOWNRECTEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_PAGEDOWNRECTEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to top of page, or one page up if already at top of page. (Scintilla feature 2435)</summary>
         public void StutteredPageUp()
         {
-            SendMessage(_scintilla, SciMsg.SCI_STUTTEREDPAGEUP, UnusedW, Unused);
+            Send(SciMsg.SCI_STUTTEREDPAGEUP, UnusedW, Unused);
         }
 
         /// <summary>Move caret to top of page, or one page up if already at top of page, extending selection to new caret position. (Scintilla feature 2436)</summary>
         public void StutteredPageUpExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_STUTTEREDPAGEUPEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_STUTTEREDPAGEUPEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret to bottom of page, or one page down if already at bottom of page. (Scintilla feature 2437)</summary>
         public void StutteredPageDown()
         {
-            SendMessage(_scintilla, SciMsg.SCI_STUTTEREDPAGEDOWN, UnusedW, Unused);
+            Send(SciMsg.SCI_STUTTEREDPAGEDOWN, UnusedW, Unused);
         }
 
         /// <summary>Move caret to bottom of page, or one page down if already at bottom of page, extending selection to new caret position. (Scintilla feature 2438)</summary>
         public void StutteredPageDownExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_STUTTEREDPAGEDOWNEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_STUTTEREDPAGEDOWNEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret left one word, position cursor at end of word. (Scintilla feature 2439)</summary>
         public void WordLeftEnd()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDLEFTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDLEFTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret left one word, position cursor at end of word, extending selection to new caret position. (Scintilla feature 2440)</summary>
         public void WordLeftEndExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDLEFTENDEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDLEFTENDEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret right one word, position cursor at end of word. (Scintilla feature 2441)</summary>
         public void WordRightEnd()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDRIGHTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDRIGHTEND, UnusedW, Unused);
         }
 
         /// <summary>Move caret right one word, position cursor at end of word, extending selection to new caret position. (Scintilla feature 2442)</summary>
         public void WordRightEndExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_WORDRIGHTENDEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_WORDRIGHTENDEXTEND, UnusedW, Unused);
         }
 
         /// <summary>
@@ -4101,6 +5030,29 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETWHITESPACECHARS, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetWhitespaceChars()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetWhitespaceChars(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETWHITESPACECHARS, destination);
+        }
+
+        /// <inheritdoc cref="GetWhitespaceChars()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetWhitespaceChars(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETWHITESPACECHARS, writer);
+        }
+
+        /// <inheritdoc cref="GetWhitespaceChars()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetWhitespaceChars(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETWHITESPACECHARS, pool, out length);
+        }
+#endif
+
         /// <summary>
         /// Set the set of characters making up punctuation characters
         /// Should be called after SetWordChars.
@@ -4117,16 +5069,39 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETPUNCTUATIONCHARS, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetPunctuationChars()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetPunctuationChars(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETPUNCTUATIONCHARS, destination);
+        }
+
+        /// <inheritdoc cref="GetPunctuationChars()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetPunctuationChars(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETPUNCTUATIONCHARS, writer);
+        }
+
+        /// <inheritdoc cref="GetPunctuationChars()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetPunctuationChars(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETPUNCTUATIONCHARS, pool, out length);
+        }
+#endif
+
         /// <summary>Reset the set of characters for whitespace and word characters to the defaults. (Scintilla feature 2444)</summary>
         public void SetCharsDefault()
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCHARSDEFAULT, UnusedW, Unused);
+            Send(SciMsg.SCI_SETCHARSDEFAULT, UnusedW, Unused);
         }
 
         /// <summary>Get currently selected item position in the auto-completion list (Scintilla feature 2445)</summary>
         public int AutoCGetCurrent()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETCURRENT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_AUTOCGETCURRENT, UnusedW, Unused);
         }
 
         /// <summary>
@@ -4140,46 +5115,69 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_AUTOCGETCURRENTTEXT, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="AutoCGetCurrentText()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int AutoCGetCurrentText(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_AUTOCGETCURRENTTEXT, destination);
+        }
+
+        /// <inheritdoc cref="AutoCGetCurrentText()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int AutoCGetCurrentText(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_AUTOCGETCURRENTTEXT, writer);
+        }
+
+        /// <inheritdoc cref="AutoCGetCurrentText()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] AutoCGetCurrentText(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_AUTOCGETCURRENTTEXT, pool, out length);
+        }
+#endif
+
         /// <summary>Set auto-completion case insensitive behaviour to either prefer case-sensitive matches or have no preference. (Scintilla feature 2634)</summary>
         public void AutoCSetCaseInsensitiveBehaviour(CaseInsensitiveBehaviour behaviour)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETCASEINSENSITIVEBEHAVIOUR, (UIntPtr)behaviour, Unused);
+            Send(SciMsg.SCI_AUTOCSETCASEINSENSITIVEBEHAVIOUR, (UIntPtr)behaviour, Unused);
         }
 
         /// <summary>Get auto-completion case insensitive behaviour. (Scintilla feature 2635)</summary>
         public CaseInsensitiveBehaviour AutoCGetCaseInsensitiveBehaviour()
         {
-            return (CaseInsensitiveBehaviour)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETCASEINSENSITIVEBEHAVIOUR, UnusedW, Unused);
+            return (CaseInsensitiveBehaviour)Send(SciMsg.SCI_AUTOCGETCASEINSENSITIVEBEHAVIOUR, UnusedW, Unused);
         }
 
         /// <summary>Change the effect of autocompleting when there are multiple selections. (Scintilla feature 2636)</summary>
         public void AutoCSetMulti(MultiAutoComplete multi)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETMULTI, (UIntPtr)multi, Unused);
+            Send(SciMsg.SCI_AUTOCSETMULTI, (UIntPtr)multi, Unused);
         }
 
         /// <summary>Retrieve the effect of autocompleting when there are multiple selections. (Scintilla feature 2637)</summary>
         public MultiAutoComplete AutoCGetMulti()
         {
-            return (MultiAutoComplete)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETMULTI, UnusedW, Unused);
+            return (MultiAutoComplete)Send(SciMsg.SCI_AUTOCGETMULTI, UnusedW, Unused);
         }
 
         /// <summary>Set the way autocompletion lists are ordered. (Scintilla feature 2660)</summary>
         public void AutoCSetOrder(Ordering order)
         {
-            SendMessage(_scintilla, SciMsg.SCI_AUTOCSETORDER, (UIntPtr)order, Unused);
+            Send(SciMsg.SCI_AUTOCSETORDER, (UIntPtr)order, Unused);
         }
 
         /// <summary>Get the way autocompletion lists are ordered. (Scintilla feature 2661)</summary>
         public Ordering AutoCGetOrder()
         {
-            return (Ordering)SendMessage(_scintilla, SciMsg.SCI_AUTOCGETORDER, UnusedW, Unused);
+            return (Ordering)Send(SciMsg.SCI_AUTOCGETORDER, UnusedW, Unused);
         }
 
         /// <summary>Enlarge the document to a particular size of text bytes. (Scintilla feature 2446)</summary>
         public void Allocate(Position bytes)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ALLOCATE, (UIntPtr)bytes, Unused);
+            Send(SciMsg.SCI_ALLOCATE, (UIntPtr)bytes, Unused);
         }
 
         /// <summary>
@@ -4192,6 +5190,29 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_TARGETASUTF8, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="TargetAsUTF8()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int TargetAsUTF8(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_TARGETASUTF8, destination);
+        }
+
+        /// <inheritdoc cref="TargetAsUTF8()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int TargetAsUTF8(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_TARGETASUTF8, writer);
+        }
+
+        /// <inheritdoc cref="TargetAsUTF8()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] TargetAsUTF8(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_TARGETASUTF8, pool, out length);
+        }
+#endif
+
         /// <summary>
         /// Set the length of the utf8 argument for calling EncodedFromUTF8.
         /// Set to -1 and the string will be measured to the first nul.
@@ -4199,7 +5220,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetLengthForEncode(Position bytes)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETLENGTHFORENCODE, (UIntPtr)bytes, Unused);
+            Send(SciMsg.SCI_SETLENGTHFORENCODE, (UIntPtr)bytes, Unused);
         }
 
         /// <summary>
@@ -4216,6 +5237,71 @@ namespace Npp.DotNet.Plugin
             }
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="EncodedFromUTF8(string)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public unsafe int EncodedFromUTF8(string utf8, Span<byte> destination)
+        {
+            Span<byte> utf8Bytes = EncodeNullTerminated(Encoding.UTF8, utf8, stackalloc byte[StackEncodingLength], out byte[] utf8Rented);
+            try
+            {
+                fixed (byte* utf8Ptr = utf8Bytes)
+                {
+                    return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_ENCODEDFROMUTF8, destination, (UIntPtr)utf8Ptr);
+                }
+            }
+            finally
+            {
+                if (utf8Rented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(utf8Rented);
+                }
+            }
+        }
+
+        /// <inheritdoc cref="EncodedFromUTF8(string)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public unsafe int EncodedFromUTF8(string utf8, IBufferWriter<byte> writer)
+        {
+            Span<byte> utf8Bytes = EncodeNullTerminated(Encoding.UTF8, utf8, stackalloc byte[StackEncodingLength], out byte[] utf8Rented);
+            try
+            {
+                fixed (byte* utf8Ptr = utf8Bytes)
+                {
+                    return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_ENCODEDFROMUTF8, writer, (UIntPtr)utf8Ptr);
+                }
+            }
+            finally
+            {
+                if (utf8Rented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(utf8Rented);
+                }
+            }
+        }
+
+        /// <inheritdoc cref="EncodedFromUTF8(string)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public unsafe byte[] EncodedFromUTF8(string utf8, ArrayPool<byte> pool, out int length)
+        {
+            Span<byte> utf8Bytes = EncodeNullTerminated(Encoding.UTF8, utf8, stackalloc byte[StackEncodingLength], out byte[] utf8Rented);
+            try
+            {
+                fixed (byte* utf8Ptr = utf8Bytes)
+                {
+                    return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_ENCODEDFROMUTF8, pool, out length, (UIntPtr)utf8Ptr);
+                }
+            }
+            finally
+            {
+                if (utf8Rented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(utf8Rented);
+                }
+            }
+        }
+#endif
+
         /// <summary>
         /// Find the position of a column on a line taking into account tabs and
         /// multi-byte characters. If beyond end of line, return line end position.
@@ -4223,37 +5309,37 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position FindColumn(Position line, Position column)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_FINDCOLUMN, (UIntPtr)line, (IntPtr)column);
+            return Send(SciMsg.SCI_FINDCOLUMN, (UIntPtr)line, (IntPtr)column);
         }
 
         /// <summary>Can the caret preferred x position only be changed by explicit movement commands? (Scintilla feature 2457)</summary>
         public CaretSticky GetCaretSticky()
         {
-            return (CaretSticky)SendMessage(_scintilla, SciMsg.SCI_GETCARETSTICKY, UnusedW, Unused);
+            return (CaretSticky)Send(SciMsg.SCI_GETCARETSTICKY, UnusedW, Unused);
         }
 
         /// <summary>Stop the caret preferred x position changing when the user types. (Scintilla feature 2458)</summary>
         public void SetCaretSticky(CaretSticky useCaretStickyBehaviour)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCARETSTICKY, (UIntPtr)useCaretStickyBehaviour, Unused);
+            Send(SciMsg.SCI_SETCARETSTICKY, (UIntPtr)useCaretStickyBehaviour, Unused);
         }
 
         /// <summary>Switch between sticky and non-sticky: meant to be bound to a key. (Scintilla feature 2459)</summary>
         public void ToggleCaretSticky()
         {
-            SendMessage(_scintilla, SciMsg.SCI_TOGGLECARETSTICKY, UnusedW, Unused);
+            Send(SciMsg.SCI_TOGGLECARETSTICKY, UnusedW, Unused);
         }
 
         /// <summary>Enable/Disable convert-on-paste for line endings (Scintilla feature 2467)</summary>
         public void SetPasteConvertEndings(bool convert)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETPASTECONVERTENDINGS, new UIntPtr(convert ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETPASTECONVERTENDINGS, new UIntPtr(convert ? 1U : 0U), Unused);
         }
 
         /// <summary>Get convert-on-paste setting (Scintilla feature 2468)</summary>
         public bool GetPasteConvertEndings()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETPASTECONVERTENDINGS, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETPASTECONVERTENDINGS, UnusedW, Unused);
         }
 
         /// <summary>Replace the selection with text like a rectangular paste. (Scintilla feature 2771)</summary>
@@ -4262,10 +5348,19 @@ namespace Npp.DotNet.Plugin
             SendEncodedBytes(SciMsg.SCI_REPLACERECTANGULAR, text);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="ReplaceRectangular(string)"/>
+        /// <remarks>The bytes of <paramref name="text"/> are sent as they are, without encoding.</remarks>
+        public void ReplaceRectangular(ReadOnlySpan<byte> text)
+        {
+            SendBytes(SciMsg.SCI_REPLACERECTANGULAR, text);
+        }
+#endif
+
         /// <summary>Duplicate the selection. If selection empty duplicate the line containing the caret. (Scintilla feature 2469)</summary>
         public void SelectionDuplicate()
         {
-            SendMessage(_scintilla, SciMsg.SCI_SELECTIONDUPLICATE, UnusedW, Unused);
+            Send(SciMsg.SCI_SELECTIONDUPLICATE, UnusedW, Unused);
         }
 
         /// <summary>Set background alpha of the caret line. (Scintilla feature 2470)</summary>
@@ -4279,109 +5374,122 @@ namespace Npp.DotNet.Plugin
         /// <summary>Set the style of the caret to be drawn. (Scintilla feature 2512)</summary>
         public void SetCaretStyle(CaretStyle caretStyle)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCARETSTYLE, (UIntPtr)caretStyle, Unused);
+            Send(SciMsg.SCI_SETCARETSTYLE, (UIntPtr)caretStyle, Unused);
         }
 
         /// <summary>Returns the current style of the caret. (Scintilla feature 2513)</summary>
         public CaretStyle GetCaretStyle()
         {
-            return (CaretStyle)SendMessage(_scintilla, SciMsg.SCI_GETCARETSTYLE, UnusedW, Unused);
+            return (CaretStyle)Send(SciMsg.SCI_GETCARETSTYLE, UnusedW, Unused);
         }
 
         /// <summary>Set the indicator used for IndicatorFillRange and IndicatorClearRange (Scintilla feature 2500)</summary>
         public void SetIndicatorCurrent(int indicator)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETINDICATORCURRENT, (UIntPtr)indicator, Unused);
+            Send(SciMsg.SCI_SETINDICATORCURRENT, (UIntPtr)indicator, Unused);
         }
 
         /// <summary>Get the current indicator (Scintilla feature 2501)</summary>
         public int GetIndicatorCurrent()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETINDICATORCURRENT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETINDICATORCURRENT, UnusedW, Unused);
         }
 
         /// <summary>Set the value used for IndicatorFillRange (Scintilla feature 2502)</summary>
         public void SetIndicatorValue(int value)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETINDICATORVALUE, (UIntPtr)value, Unused);
+            Send(SciMsg.SCI_SETINDICATORVALUE, (UIntPtr)value, Unused);
         }
 
         /// <summary>Get the current indicator value (Scintilla feature 2503)</summary>
         public int GetIndicatorValue()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETINDICATORVALUE, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETINDICATORVALUE, UnusedW, Unused);
         }
 
         /// <summary>Turn a indicator on over a range. (Scintilla feature 2504)</summary>
         public void IndicatorFillRange(Position start, Position lengthFill)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICATORFILLRANGE, (UIntPtr)start, (IntPtr)lengthFill);
+            Send(SciMsg.SCI_INDICATORFILLRANGE, (UIntPtr)start, (IntPtr)lengthFill);
         }
 
         /// <summary>Turn a indicator off over a range. (Scintilla feature 2505)</summary>
         public void IndicatorClearRange(Position start, Position lengthClear)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICATORCLEARRANGE, (UIntPtr)start, (IntPtr)lengthClear);
+            Send(SciMsg.SCI_INDICATORCLEARRANGE, (UIntPtr)start, (IntPtr)lengthClear);
         }
 
         /// <summary>Are any indicators present at pos? (Scintilla feature 2506)</summary>
         public int IndicatorAllOnFor(Position pos)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_INDICATORALLONFOR, (UIntPtr)pos, Unused);
+            return (int)Send(SciMsg.SCI_INDICATORALLONFOR, (UIntPtr)pos, Unused);
         }
 
         /// <summary>What value does a particular indicator have at a position? (Scintilla feature 2507)</summary>
         public int IndicatorValueAt(int indicator, Position pos)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_INDICATORVALUEAT, (UIntPtr)indicator, (IntPtr)pos);
+            return (int)Send(SciMsg.SCI_INDICATORVALUEAT, (UIntPtr)indicator, (IntPtr)pos);
         }
 
-        /// <summary>Where does a particular indicator start? (Scintilla feature 2508)</summary>
-        public Position IndicatorStart(int indicator, Position pos)
+#if NETCOREAPP
+        /// <summary>
+        /// Bulk variant of <see cref="IndicatorValueAt"/>: gets its value at each position from <paramref name="start"/> on, one per element of <paramref name="destination"/>.
+        /// </summary>
+        public void IndicatorValuesInRange(int indicator, Position start, Span<int> destination)
+        {
+            for (int i = 0; i < destination.Length; i++)
+            {
+                destination[i] = (int)Send(SciMsg.SCI_INDICATORVALUEAT, (UIntPtr)indicator, (IntPtr)(start + i));
+            }
+        }
+#endif
+
+        /// <summary>Where does a particular indicator start? (Scintilla feature 2508)</summary>
+        public Position IndicatorStart(int indicator, Position pos)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_INDICATORSTART, (UIntPtr)indicator, (IntPtr)pos);
+            return Send(SciMsg.SCI_INDICATORSTART, (UIntPtr)indicator, (IntPtr)pos);
         }
 
         /// <summary>Where does a particular indicator end? (Scintilla feature 2509)</summary>
         public Position IndicatorEnd(int indicator, Position pos)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_INDICATOREND, (UIntPtr)indicator, (IntPtr)pos);
+            return Send(SciMsg.SCI_INDICATOREND, (UIntPtr)indicator, (IntPtr)pos);
         }
 
         /// <summary>Set number of entries in position cache (Scintilla feature 2514)</summary>
         public void SetPositionCache(int size)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETPOSITIONCACHE, (UIntPtr)size, Unused);
+            Send(SciMsg.SCI_SETPOSITIONCACHE, (UIntPtr)size, Unused);
         }
 
         /// <summary>How many entries are allocated to the position cache? (Scintilla feature 2515)</summary>
         public int GetPositionCache()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETPOSITIONCACHE, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETPOSITIONCACHE, UnusedW, Unused);
         }
 
         /// <summary>Set maximum number of threads used for layout (Scintilla feature 2775)</summary>
         public void SetLayoutThreads(int threads)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETLAYOUTTHREADS, (UIntPtr)threads, Unused);
+            Send(SciMsg.SCI_SETLAYOUTTHREADS, (UIntPtr)threads, Unused);
         }
 
         /// <summary>Get maximum number of threads used for layout (Scintilla feature 2776)</summary>
         public int GetLayoutThreads()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETLAYOUTTHREADS, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETLAYOUTTHREADS, UnusedW, Unused);
         }
 
         /// <summary>Copy the selection, if selection empty copy the line with the caret (Scintilla feature 2519)</summary>
         public void CopyAllowLine()
         {
-            SendMessage(_scintilla, SciMsg.SCI_COPYALLOWLINE, UnusedW, Unused);
+            Send(SciMsg.SCI_COPYALLOWLINE, UnusedW, Unused);
         }
 
         /// <summary>Cut the selection, if selection empty cut the line with the caret (Scintilla feature 2810)</summary>
         public void CutAllowLine()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CUTALLOWLINE, UnusedW, Unused);
+            Send(SciMsg.SCI_CUTALLOWLINE, UnusedW, Unused);
         }
 
         /// <summary>Set the string to separate parts when copying a multiple selection. (Scintilla feature 2811)</summary>
@@ -4396,6 +5504,29 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETCOPYSEPARATOR, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetCopySeparator()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetCopySeparator(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETCOPYSEPARATOR, destination);
+        }
+
+        /// <inheritdoc cref="GetCopySeparator()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetCopySeparator(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETCOPYSEPARATOR, writer);
+        }
+
+        /// <inheritdoc cref="GetCopySeparator()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetCopySeparator(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETCOPYSEPARATOR, pool, out length);
+        }
+#endif
+
         /// <summary>
         /// Compact the document buffer and return a read-only pointer to the
         /// characters in the document.
@@ -4403,7 +5534,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public IntPtr GetCharacterPointer()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETCHARACTERPOINTER, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETCHARACTERPOINTER, UnusedW, Unused);
         }
 
         /// <summary>
@@ -4414,7 +5545,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public IntPtr GetRangePointer(Position start, Position lengthRange)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETRANGEPOINTER, (UIntPtr)start, (IntPtr)lengthRange);
+            return Send(SciMsg.SCI_GETRANGEPOINTER, (UIntPtr)start, (IntPtr)lengthRange);
         }
 
         /// <summary>
@@ -4424,61 +5555,61 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position GetGapPosition()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETGAPPOSITION, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETGAPPOSITION, UnusedW, Unused);
         }
 
         /// <summary>Set the alpha fill colour of the given indicator. (Scintilla feature 2523)</summary>
         public void IndicSetAlpha(int indicator, Alpha alpha)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICSETALPHA, (UIntPtr)indicator, (IntPtr)alpha);
+            Send(SciMsg.SCI_INDICSETALPHA, (UIntPtr)indicator, (IntPtr)alpha);
         }
 
         /// <summary>Get the alpha fill colour of the given indicator. (Scintilla feature 2524)</summary>
         public Alpha IndicGetAlpha(int indicator)
         {
-            return (Alpha)SendMessage(_scintilla, SciMsg.SCI_INDICGETALPHA, (UIntPtr)indicator, Unused);
+            return (Alpha)Send(SciMsg.SCI_INDICGETALPHA, (UIntPtr)indicator, Unused);
         }
 
         /// <summary>Set the alpha outline colour of the given indicator. (Scintilla feature 2558)</summary>
         public void IndicSetOutlineAlpha(int indicator, Alpha alpha)
         {
-            SendMessage(_scintilla, SciMsg.SCI_INDICSETOUTLINEALPHA, (UIntPtr)indicator, (IntPtr)alpha);
+            Send(SciMsg.SCI_INDICSETOUTLINEALPHA, (UIntPtr)indicator, (IntPtr)alpha);
         }
 
         /// <summary>Get the alpha outline colour of the given indicator. (Scintilla feature 2559)</summary>
         public Alpha IndicGetOutlineAlpha(int indicator)
         {
-            return (Alpha)SendMessage(_scintilla, SciMsg.SCI_INDICGETOUTLINEALPHA, (UIntPtr)indicator, Unused);
+            return (Alpha)Send(SciMsg.SCI_INDICGETOUTLINEALPHA, (UIntPtr)indicator, Unused);
         }
 
         /// <summary>Set extra ascent for each line (Scintilla feature 2525)</summary>
         public void SetExtraAscent(int extraAscent)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETEXTRAASCENT, (UIntPtr)extraAscent, Unused);
+            Send(SciMsg.SCI_SETEXTRAASCENT, (UIntPtr)extraAscent, Unused);
         }
 
         /// <summary>Get extra ascent for each line (Scintilla feature 2526)</summary>
         public int GetExtraAscent()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETEXTRAASCENT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETEXTRAASCENT, UnusedW, Unused);
         }
 
         /// <summary>Set extra descent for each line (Scintilla feature 2527)</summary>
         public void SetExtraDescent(int extraDescent)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETEXTRADESCENT, (UIntPtr)extraDescent, Unused);
+            Send(SciMsg.SCI_SETEXTRADESCENT, (UIntPtr)extraDescent, Unused);
         }
 
         /// <summary>Get extra descent for each line (Scintilla feature 2528)</summary>
         public int GetExtraDescent()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETEXTRADESCENT, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETEXTRADESCENT, UnusedW, Unused);
         }
 
         /// <summary>Which symbol was defined for markerNumber with MarkerDefine (Scintilla feature 2529)</summary>
         public MarkerSymbol MarkerSymbolDefined(int markerNumber)
         {
-            return (MarkerSymbol)SendMessage(_scintilla, SciMsg.SCI_MARKERSYMBOLDEFINED, (UIntPtr)markerNumber, Unused);
+            return (MarkerSymbol)Send(SciMsg.SCI_MARKERSYMBOLDEFINED, (UIntPtr)markerNumber, Unused);
         }
 
         /// <summary>Set the text in the text margin for a line (Scintilla feature 2530)</summary>
@@ -4493,16 +5624,39 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_MARGINGETTEXT, Encoding.UTF8, (UIntPtr)line);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="MarginGetText(Position)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int MarginGetText(Position line, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_MARGINGETTEXT, destination, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="MarginGetText(Position)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int MarginGetText(Position line, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_MARGINGETTEXT, writer, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="MarginGetText(Position)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] MarginGetText(Position line, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_MARGINGETTEXT, pool, out length, (UIntPtr)line);
+        }
+#endif
+
         /// <summary>Set the style number for the text margin for a line (Scintilla feature 2532)</summary>
         public void MarginSetStyle(Position line, int style)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARGINSETSTYLE, (UIntPtr)line, (IntPtr)style);
+            Send(SciMsg.SCI_MARGINSETSTYLE, (UIntPtr)line, (IntPtr)style);
         }
 
         /// <summary>Get the style number for the text margin for a line (Scintilla feature 2533)</summary>
         public int MarginGetStyle(Position line)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_MARGINGETSTYLE, (UIntPtr)line, Unused);
+            return (int)Send(SciMsg.SCI_MARGINGETSTYLE, (UIntPtr)line, Unused);
         }
 
         /// <summary>Set the style in the text margin for a line (Scintilla feature 2534)</summary>
@@ -4517,34 +5671,57 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_MARGINGETSTYLES, Encoding.UTF8, (UIntPtr)line);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="MarginGetStyles(Position)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int MarginGetStyles(Position line, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_MARGINGETSTYLES, destination, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="MarginGetStyles(Position)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int MarginGetStyles(Position line, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_MARGINGETSTYLES, writer, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="MarginGetStyles(Position)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] MarginGetStyles(Position line, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_MARGINGETSTYLES, pool, out length, (UIntPtr)line);
+        }
+#endif
+
         /// <summary>Clear the margin text on all lines (Scintilla feature 2536)</summary>
         public void MarginTextClearAll()
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARGINTEXTCLEARALL, UnusedW, Unused);
+            Send(SciMsg.SCI_MARGINTEXTCLEARALL, UnusedW, Unused);
         }
 
         /// <summary>Get the start of the range of style numbers used for margin text (Scintilla feature 2537)</summary>
         public void MarginSetStyleOffset(int style)
         {
-            SendMessage(_scintilla, SciMsg.SCI_MARGINSETSTYLEOFFSET, (UIntPtr)style, Unused);
+            Send(SciMsg.SCI_MARGINSETSTYLEOFFSET, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get the start of the range of style numbers used for margin text (Scintilla feature 2538)</summary>
         public int MarginGetStyleOffset()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_MARGINGETSTYLEOFFSET, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_MARGINGETSTYLEOFFSET, UnusedW, Unused);
         }
 
         /// <summary>Set the margin options. (Scintilla feature 2539)</summary>
         public void SetMarginOptions(MarginOption marginOptions)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMARGINOPTIONS, (UIntPtr)marginOptions, Unused);
+            Send(SciMsg.SCI_SETMARGINOPTIONS, (UIntPtr)marginOptions, Unused);
         }
 
         /// <summary>Get the margin options. (Scintilla feature 2557)</summary>
         public MarginOption GetMarginOptions()
         {
-            return (MarginOption)SendMessage(_scintilla, SciMsg.SCI_GETMARGINOPTIONS, UnusedW, Unused);
+            return (MarginOption)Send(SciMsg.SCI_GETMARGINOPTIONS, UnusedW, Unused);
         }
 
         /// <summary>Set the annotation text for a line (Scintilla feature 2540)</summary>
@@ -4559,16 +5736,39 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_ANNOTATIONGETTEXT, Encoding.UTF8, (UIntPtr)line);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="AnnotationGetText(Position)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int AnnotationGetText(Position line, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_ANNOTATIONGETTEXT, destination, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="AnnotationGetText(Position)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int AnnotationGetText(Position line, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_ANNOTATIONGETTEXT, writer, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="AnnotationGetText(Position)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] AnnotationGetText(Position line, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_ANNOTATIONGETTEXT, pool, out length, (UIntPtr)line);
+        }
+#endif
+
         /// <summary>Set the style number for the annotations for a line (Scintilla feature 2542)</summary>
         public void AnnotationSetStyle(Position line, int style)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ANNOTATIONSETSTYLE, (UIntPtr)line, (IntPtr)style);
+            Send(SciMsg.SCI_ANNOTATIONSETSTYLE, (UIntPtr)line, (IntPtr)style);
         }
 
         /// <summary>Get the style number for the annotations for a line (Scintilla feature 2543)</summary>
         public int AnnotationGetStyle(Position line)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_ANNOTATIONGETSTYLE, (UIntPtr)line, Unused);
+            return (int)Send(SciMsg.SCI_ANNOTATIONGETSTYLE, (UIntPtr)line, Unused);
         }
 
         /// <summary>Set the annotation styles for a line (Scintilla feature 2544)</summary>
@@ -4583,64 +5783,87 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_ANNOTATIONGETSTYLES, Encoding.UTF8, (UIntPtr)line);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="AnnotationGetStyles(Position)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int AnnotationGetStyles(Position line, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_ANNOTATIONGETSTYLES, destination, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="AnnotationGetStyles(Position)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int AnnotationGetStyles(Position line, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_ANNOTATIONGETSTYLES, writer, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="AnnotationGetStyles(Position)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] AnnotationGetStyles(Position line, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_ANNOTATIONGETSTYLES, pool, out length, (UIntPtr)line);
+        }
+#endif
+
         /// <summary>Get the number of annotation lines for a line (Scintilla feature 2546)</summary>
         public int AnnotationGetLines(Position line)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_ANNOTATIONGETLINES, (UIntPtr)line, Unused);
+            return (int)Send(SciMsg.SCI_ANNOTATIONGETLINES, (UIntPtr)line, Unused);
         }
 
         /// <summary>Clear the annotations from all lines (Scintilla feature 2547)</summary>
         public void AnnotationClearAll()
         {
-            SendMessage(_scintilla, SciMsg.SCI_ANNOTATIONCLEARALL, UnusedW, Unused);
+            Send(SciMsg.SCI_ANNOTATIONCLEARALL, UnusedW, Unused);
         }
 
         /// <summary>Set the visibility for the annotations for a view (Scintilla feature 2548)</summary>
         public void AnnotationSetVisible(AnnotationVisible visible)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ANNOTATIONSETVISIBLE, (UIntPtr)visible, Unused);
+            Send(SciMsg.SCI_ANNOTATIONSETVISIBLE, (UIntPtr)visible, Unused);
         }
 
         /// <summary>Get the visibility for the annotations for a view (Scintilla feature 2549)</summary>
         public AnnotationVisible AnnotationGetVisible()
         {
-            return (AnnotationVisible)SendMessage(_scintilla, SciMsg.SCI_ANNOTATIONGETVISIBLE, UnusedW, Unused);
+            return (AnnotationVisible)Send(SciMsg.SCI_ANNOTATIONGETVISIBLE, UnusedW, Unused);
         }
 
         /// <summary>Get the start of the range of style numbers used for annotations (Scintilla feature 2550)</summary>
         public void AnnotationSetStyleOffset(int style)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ANNOTATIONSETSTYLEOFFSET, (UIntPtr)style, Unused);
+            Send(SciMsg.SCI_ANNOTATIONSETSTYLEOFFSET, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get the start of the range of style numbers used for annotations (Scintilla feature 2551)</summary>
         public int AnnotationGetStyleOffset()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_ANNOTATIONGETSTYLEOFFSET, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_ANNOTATIONGETSTYLEOFFSET, UnusedW, Unused);
         }
 
         /// <summary>Release all extended (&gt;255) style numbers (Scintilla feature 2552)</summary>
         public void ReleaseAllExtendedStyles()
         {
-            SendMessage(_scintilla, SciMsg.SCI_RELEASEALLEXTENDEDSTYLES, UnusedW, Unused);
+            Send(SciMsg.SCI_RELEASEALLEXTENDEDSTYLES, UnusedW, Unused);
         }
 
         /// <summary>Allocate some extended (&gt;255) style numbers and return the start of the range (Scintilla feature 2553)</summary>
         public int AllocateExtendedStyles(int numberStyles)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_ALLOCATEEXTENDEDSTYLES, (UIntPtr)numberStyles, Unused);
+            return (int)Send(SciMsg.SCI_ALLOCATEEXTENDEDSTYLES, (UIntPtr)numberStyles, Unused);
         }
 
         /// <summary>Add a container action to the undo stack (Scintilla feature 2560)</summary>
         public void AddUndoAction(int token, UndoFlags flags)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ADDUNDOACTION, (UIntPtr)token, (IntPtr)flags);
+            Send(SciMsg.SCI_ADDUNDOACTION, (UIntPtr)token, (IntPtr)flags);
         }
 
         /// <summary>Find the position of a character from a point within the window. (Scintilla feature 2561)</summary>
         public Position CharPositionFromPoint(int x, int y)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_CHARPOSITIONFROMPOINT, (UIntPtr)x, (IntPtr)y);
+            return Send(SciMsg.SCI_CHARPOSITIONFROMPOINT, (UIntPtr)x, (IntPtr)y);
         }
 
         /// <summary>
@@ -4650,265 +5873,265 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position CharPositionFromPointClose(int x, int y)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_CHARPOSITIONFROMPOINTCLOSE, (UIntPtr)x, (IntPtr)y);
+            return Send(SciMsg.SCI_CHARPOSITIONFROMPOINTCLOSE, (UIntPtr)x, (IntPtr)y);
         }
 
         /// <summary>Set whether switching to rectangular mode while selecting with the mouse is allowed. (Scintilla feature 2668)</summary>
         public void SetMouseSelectionRectangularSwitch(bool mouseSelectionRectangularSwitch)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMOUSESELECTIONRECTANGULARSWITCH, new UIntPtr(mouseSelectionRectangularSwitch ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETMOUSESELECTIONRECTANGULARSWITCH, new UIntPtr(mouseSelectionRectangularSwitch ? 1U : 0U), Unused);
         }
 
         /// <summary>Whether switching to rectangular mode while selecting with the mouse is allowed. (Scintilla feature 2669)</summary>
         public bool GetMouseSelectionRectangularSwitch()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETMOUSESELECTIONRECTANGULARSWITCH, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETMOUSESELECTIONRECTANGULARSWITCH, UnusedW, Unused);
         }
 
         /// <summary>Set whether multiple selections can be made (Scintilla feature 2563)</summary>
         public void SetMultipleSelection(bool multipleSelection)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMULTIPLESELECTION, new UIntPtr(multipleSelection ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETMULTIPLESELECTION, new UIntPtr(multipleSelection ? 1U : 0U), Unused);
         }
 
         /// <summary>Whether multiple selections can be made (Scintilla feature 2564)</summary>
         public bool GetMultipleSelection()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETMULTIPLESELECTION, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETMULTIPLESELECTION, UnusedW, Unused);
         }
 
         /// <summary>Set whether typing can be performed into multiple selections (Scintilla feature 2565)</summary>
         public void SetAdditionalSelectionTyping(bool additionalSelectionTyping)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETADDITIONALSELECTIONTYPING, new UIntPtr(additionalSelectionTyping ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETADDITIONALSELECTIONTYPING, new UIntPtr(additionalSelectionTyping ? 1U : 0U), Unused);
         }
 
         /// <summary>Whether typing can be performed into multiple selections (Scintilla feature 2566)</summary>
         public bool GetAdditionalSelectionTyping()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETADDITIONALSELECTIONTYPING, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETADDITIONALSELECTIONTYPING, UnusedW, Unused);
         }
 
         /// <summary>Set whether additional carets will blink (Scintilla feature 2567)</summary>
         public void SetAdditionalCaretsBlink(bool additionalCaretsBlink)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETADDITIONALCARETSBLINK, new UIntPtr(additionalCaretsBlink ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETADDITIONALCARETSBLINK, new UIntPtr(additionalCaretsBlink ? 1U : 0U), Unused);
         }
 
         /// <summary>Whether additional carets will blink (Scintilla feature 2568)</summary>
         public bool GetAdditionalCaretsBlink()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETADDITIONALCARETSBLINK, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETADDITIONALCARETSBLINK, UnusedW, Unused);
         }
 
         /// <summary>Set whether additional carets are visible (Scintilla feature 2608)</summary>
         public void SetAdditionalCaretsVisible(bool additionalCaretsVisible)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETADDITIONALCARETSVISIBLE, new UIntPtr(additionalCaretsVisible ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETADDITIONALCARETSVISIBLE, new UIntPtr(additionalCaretsVisible ? 1U : 0U), Unused);
         }
 
         /// <summary>Whether additional carets are visible (Scintilla feature 2609)</summary>
         public bool GetAdditionalCaretsVisible()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETADDITIONALCARETSVISIBLE, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETADDITIONALCARETSVISIBLE, UnusedW, Unused);
         }
 
         /// <summary>How many selections are there? (Scintilla feature 2570)</summary>
         public int GetSelections()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONS, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETSELECTIONS, UnusedW, Unused);
         }
 
         /// <summary>Is every selected range empty? (Scintilla feature 2650)</summary>
         public bool GetSelectionEmpty()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONEMPTY, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETSELECTIONEMPTY, UnusedW, Unused);
         }
 
         /// <summary>Clear selections to a single empty stream selection (Scintilla feature 2571)</summary>
         public void ClearSelections()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CLEARSELECTIONS, UnusedW, Unused);
+            Send(SciMsg.SCI_CLEARSELECTIONS, UnusedW, Unused);
         }
 
         /// <summary>Set a simple selection (Scintilla feature 2572)</summary>
         public void SetSelection(Position caret, Position anchor)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTION, (UIntPtr)caret, (IntPtr)anchor);
+            Send(SciMsg.SCI_SETSELECTION, (UIntPtr)caret, (IntPtr)anchor);
         }
 
         /// <summary>Add a selection (Scintilla feature 2573)</summary>
         public void AddSelection(Position caret, Position anchor)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ADDSELECTION, (UIntPtr)caret, (IntPtr)anchor);
+            Send(SciMsg.SCI_ADDSELECTION, (UIntPtr)caret, (IntPtr)anchor);
         }
 
         /// <summary>Find the selection index for a point. -1 when not at a selection. (Scintilla feature 2474)</summary>
         public int SelectionFromPoint(int x, int y)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_SELECTIONFROMPOINT, (UIntPtr)x, (IntPtr)y);
+            return (int)Send(SciMsg.SCI_SELECTIONFROMPOINT, (UIntPtr)x, (IntPtr)y);
         }
 
         /// <summary>Drop one selection (Scintilla feature 2671)</summary>
         public void DropSelectionN(int selection)
         {
-            SendMessage(_scintilla, SciMsg.SCI_DROPSELECTIONN, (UIntPtr)selection, Unused);
+            Send(SciMsg.SCI_DROPSELECTIONN, (UIntPtr)selection, Unused);
         }
 
         /// <summary>Set the main selection (Scintilla feature 2574)</summary>
         public void SetMainSelection(int selection)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETMAINSELECTION, (UIntPtr)selection, Unused);
+            Send(SciMsg.SCI_SETMAINSELECTION, (UIntPtr)selection, Unused);
         }
 
         /// <summary>Which selection is the main selection (Scintilla feature 2575)</summary>
         public int GetMainSelection()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETMAINSELECTION, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETMAINSELECTION, UnusedW, Unused);
         }
 
         /// <summary>Set the caret position of the nth selection. (Scintilla feature 2576)</summary>
         public void SetSelectionNCaret(int selection, Position caret)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTIONNCARET, (UIntPtr)selection, (IntPtr)caret);
+            Send(SciMsg.SCI_SETSELECTIONNCARET, (UIntPtr)selection, (IntPtr)caret);
         }
 
         /// <summary>Return the caret position of the nth selection. (Scintilla feature 2577)</summary>
         public Position GetSelectionNCaret(int selection)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONNCARET, (UIntPtr)selection, Unused);
+            return Send(SciMsg.SCI_GETSELECTIONNCARET, (UIntPtr)selection, Unused);
         }
 
         /// <summary>Set the anchor position of the nth selection. (Scintilla feature 2578)</summary>
         public void SetSelectionNAnchor(int selection, Position anchor)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTIONNANCHOR, (UIntPtr)selection, (IntPtr)anchor);
+            Send(SciMsg.SCI_SETSELECTIONNANCHOR, (UIntPtr)selection, (IntPtr)anchor);
         }
 
         /// <summary>Return the anchor position of the nth selection. (Scintilla feature 2579)</summary>
         public Position GetSelectionNAnchor(int selection)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONNANCHOR, (UIntPtr)selection, Unused);
+            return Send(SciMsg.SCI_GETSELECTIONNANCHOR, (UIntPtr)selection, Unused);
         }
 
         /// <summary>Set the virtual space of the caret of the nth selection. (Scintilla feature 2580)</summary>
         public void SetSelectionNCaretVirtualSpace(int selection, Position space)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTIONNCARETVIRTUALSPACE, (UIntPtr)selection, (IntPtr)space);
+            Send(SciMsg.SCI_SETSELECTIONNCARETVIRTUALSPACE, (UIntPtr)selection, (IntPtr)space);
         }
 
         /// <summary>Return the virtual space of the caret of the nth selection. (Scintilla feature 2581)</summary>
         public Position GetSelectionNCaretVirtualSpace(int selection)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONNCARETVIRTUALSPACE, (UIntPtr)selection, Unused);
+            return Send(SciMsg.SCI_GETSELECTIONNCARETVIRTUALSPACE, (UIntPtr)selection, Unused);
         }
 
         /// <summary>Set the virtual space of the anchor of the nth selection. (Scintilla feature 2582)</summary>
         public void SetSelectionNAnchorVirtualSpace(int selection, Position space)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTIONNANCHORVIRTUALSPACE, (UIntPtr)selection, (IntPtr)space);
+            Send(SciMsg.SCI_SETSELECTIONNANCHORVIRTUALSPACE, (UIntPtr)selection, (IntPtr)space);
         }
 
         /// <summary>Return the virtual space of the anchor of the nth selection. (Scintilla feature 2583)</summary>
         public Position GetSelectionNAnchorVirtualSpace(int selection)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONNANCHORVIRTUALSPACE, (UIntPtr)selection, Unused);
+            return Send(SciMsg.SCI_GETSELECTIONNANCHORVIRTUALSPACE, (UIntPtr)selection, Unused);
         }
 
         /// <summary>Sets the position that starts the selection - this becomes the anchor. (Scintilla feature 2584)</summary>
         public void SetSelectionNStart(int selection, Position anchor)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTIONNSTART, (UIntPtr)selection, (IntPtr)anchor);
+            Send(SciMsg.SCI_SETSELECTIONNSTART, (UIntPtr)selection, (IntPtr)anchor);
         }
 
         /// <summary>Returns the position at the start of the selection. (Scintilla feature 2585)</summary>
         public Position GetSelectionNStart(int selection)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONNSTART, (UIntPtr)selection, Unused);
+            return Send(SciMsg.SCI_GETSELECTIONNSTART, (UIntPtr)selection, Unused);
         }
 
         /// <summary>Returns the virtual space at the start of the selection. (Scintilla feature 2726)</summary>
         public Position GetSelectionNStartVirtualSpace(int selection)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONNSTARTVIRTUALSPACE, (UIntPtr)selection, Unused);
+            return Send(SciMsg.SCI_GETSELECTIONNSTARTVIRTUALSPACE, (UIntPtr)selection, Unused);
         }
 
         /// <summary>Sets the position that ends the selection - this becomes the currentPosition. (Scintilla feature 2586)</summary>
         public void SetSelectionNEnd(int selection, Position caret)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETSELECTIONNEND, (UIntPtr)selection, (IntPtr)caret);
+            Send(SciMsg.SCI_SETSELECTIONNEND, (UIntPtr)selection, (IntPtr)caret);
         }
 
         /// <summary>Returns the virtual space at the end of the selection. (Scintilla feature 2727)</summary>
         public Position GetSelectionNEndVirtualSpace(int selection)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONNENDVIRTUALSPACE, (UIntPtr)selection, Unused);
+            return Send(SciMsg.SCI_GETSELECTIONNENDVIRTUALSPACE, (UIntPtr)selection, Unused);
         }
 
         /// <summary>Returns the position at the end of the selection. (Scintilla feature 2587)</summary>
         public Position GetSelectionNEnd(int selection)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETSELECTIONNEND, (UIntPtr)selection, Unused);
+            return Send(SciMsg.SCI_GETSELECTIONNEND, (UIntPtr)selection, Unused);
         }
 
         /// <summary>Set the caret position of the rectangular selection. (Scintilla feature 2588)</summary>
         public void SetRectangularSelectionCaret(Position caret)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETRECTANGULARSELECTIONCARET, (UIntPtr)caret, Unused);
+            Send(SciMsg.SCI_SETRECTANGULARSELECTIONCARET, (UIntPtr)caret, Unused);
         }
 
         /// <summary>Return the caret position of the rectangular selection. (Scintilla feature 2589)</summary>
         public Position GetRectangularSelectionCaret()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETRECTANGULARSELECTIONCARET, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETRECTANGULARSELECTIONCARET, UnusedW, Unused);
         }
 
         /// <summary>Set the anchor position of the rectangular selection. (Scintilla feature 2590)</summary>
         public void SetRectangularSelectionAnchor(Position anchor)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETRECTANGULARSELECTIONANCHOR, (UIntPtr)anchor, Unused);
+            Send(SciMsg.SCI_SETRECTANGULARSELECTIONANCHOR, (UIntPtr)anchor, Unused);
         }
 
         /// <summary>Return the anchor position of the rectangular selection. (Scintilla feature 2591)</summary>
         public Position GetRectangularSelectionAnchor()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETRECTANGULARSELECTIONANCHOR, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETRECTANGULARSELECTIONANCHOR, UnusedW, Unused);
         }
 
         /// <summary>Set the virtual space of the caret of the rectangular selection. (Scintilla feature 2592)</summary>
         public void SetRectangularSelectionCaretVirtualSpace(Position space)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETRECTANGULARSELECTIONCARETVIRTUALSPACE, (UIntPtr)space, Unused);
+            Send(SciMsg.SCI_SETRECTANGULARSELECTIONCARETVIRTUALSPACE, (UIntPtr)space, Unused);
         }
 
         /// <summary>Return the virtual space of the caret of the rectangular selection. (Scintilla feature 2593)</summary>
         public Position GetRectangularSelectionCaretVirtualSpace()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETRECTANGULARSELECTIONCARETVIRTUALSPACE, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETRECTANGULARSELECTIONCARETVIRTUALSPACE, UnusedW, Unused);
         }
 
         /// <summary>Set the virtual space of the anchor of the rectangular selection. (Scintilla feature 2594)</summary>
         public void SetRectangularSelectionAnchorVirtualSpace(Position space)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETRECTANGULARSELECTIONANCHORVIRTUALSPACE, (UIntPtr)space, Unused);
+            Send(SciMsg.SCI_SETRECTANGULARSELECTIONANCHORVIRTUALSPACE, (UIntPtr)space, Unused);
         }
 
         /// <summary>Return the virtual space of the anchor of the rectangular selection. (Scintilla feature 2595)</summary>
         public Position GetRectangularSelectionAnchorVirtualSpace()
         {
-            return SendMessage(_scintilla, SciMsg.SCI_GETRECTANGULARSELECTIONANCHORVIRTUALSPACE, UnusedW, Unused);
+            return Send(SciMsg.SCI_GETRECTANGULARSELECTIONANCHORVIRTUALSPACE, UnusedW, Unused);
         }
 
         /// <summary>Set options for virtual space behaviour. (Scintilla feature 2596)</summary>
         public void SetVirtualSpaceOptions(VirtualSpace virtualSpaceOptions)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETVIRTUALSPACEOPTIONS, (UIntPtr)virtualSpaceOptions, Unused);
+            Send(SciMsg.SCI_SETVIRTUALSPACEOPTIONS, (UIntPtr)virtualSpaceOptions, Unused);
         }
 
         /// <summary>Return options for virtual space behaviour. (Scintilla feature 2597)</summary>
         public VirtualSpace GetVirtualSpaceOptions()
         {
-            return (VirtualSpace)SendMessage(_scintilla, SciMsg.SCI_GETVIRTUALSPACEOPTIONS, UnusedW, Unused);
+            return (VirtualSpace)Send(SciMsg.SCI_GETVIRTUALSPACEOPTIONS, UnusedW, Unused);
         }
 
         /// <summary>
@@ -4920,13 +6143,13 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void SetRectangularSelectionModifier(int modifier)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETRECTANGULARSELECTIONMODIFIER, (UIntPtr)modifier, Unused);
+            Send(SciMsg.SCI_SETRECTANGULARSELECTIONMODIFIER, (UIntPtr)modifier, Unused);
         }
 
         /// <summary>Get the modifier key used for rectangular selection. (Scintilla feature 2599)</summary>
         public int GetRectangularSelectionModifier()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETRECTANGULARSELECTIONMODIFIER, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETRECTANGULARSELECTIONMODIFIER, UnusedW, Unused);
         }
 
         /// <summary>
@@ -4937,7 +6160,7 @@ namespace Npp.DotNet.Plugin
         [Obsolete("Use the element colours APIs instead: https://www.scintilla.org/ScintillaDoc.html#ElementColours")]
         public void SetAdditionalSelFore(Colour fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETADDITIONALSELFORE, (UIntPtr)fore.Value, Unused);
+            Send(SciMsg.SCI_SETADDITIONALSELFORE, (UIntPtr)fore.Value, Unused);
         }
 
         /// <summary>
@@ -4948,47 +6171,47 @@ namespace Npp.DotNet.Plugin
         [Obsolete("Use the element colours APIs instead: https://www.scintilla.org/ScintillaDoc.html#ElementColours")]
         public void SetAdditionalSelBack(Colour back)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETADDITIONALSELBACK, (UIntPtr)back.Value, Unused);
+            Send(SciMsg.SCI_SETADDITIONALSELBACK, (UIntPtr)back.Value, Unused);
         }
 
         /// <summary>Set the alpha of the selection. (Scintilla feature 2602)</summary>
         [Obsolete("Use the element colours APIs instead: https://www.scintilla.org/ScintillaDoc.html#ElementColours")]
         public void SetAdditionalSelAlpha(Alpha alpha)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETADDITIONALSELALPHA, (UIntPtr)alpha, Unused);
+            Send(SciMsg.SCI_SETADDITIONALSELALPHA, (UIntPtr)alpha, Unused);
         }
 
         /// <summary>Get the alpha of the selection. (Scintilla feature 2603)</summary>
         [Obsolete("Use the element colours APIs instead: https://www.scintilla.org/ScintillaDoc.html#ElementColours")]
         public Alpha GetAdditionalSelAlpha()
         {
-            return (Alpha)SendMessage(_scintilla, SciMsg.SCI_GETADDITIONALSELALPHA, UnusedW, Unused);
+            return (Alpha)Send(SciMsg.SCI_GETADDITIONALSELALPHA, UnusedW, Unused);
         }
 
         /// <summary>Set the foreground colour of additional carets. (Scintilla feature 2604)</summary>
         [Obsolete("Use the element colours APIs instead: https://www.scintilla.org/ScintillaDoc.html#ElementColours")]
         public void SetAdditionalCaretFore(Colour fore)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETADDITIONALCARETFORE, (UIntPtr)fore.Value, Unused);
+            Send(SciMsg.SCI_SETADDITIONALCARETFORE, (UIntPtr)fore.Value, Unused);
         }
 
         /// <summary>Get the foreground colour of additional carets. (Scintilla feature 2605)</summary>
         [Obsolete("Use the element colours APIs instead: https://www.scintilla.org/ScintillaDoc.html#ElementColours")]
         public Colour GetAdditionalCaretFore()
         {
-            return new Colour((int)SendMessage(_scintilla, SciMsg.SCI_GETADDITIONALCARETFORE, UnusedW, Unused));
+            return new Colour((int)Send(SciMsg.SCI_GETADDITIONALCARETFORE, UnusedW, Unused));
         }
 
         /// <summary>Set the main selection to the next selection. (Scintilla feature 2606)</summary>
         public void RotateSelection()
         {
-            SendMessage(_scintilla, SciMsg.SCI_ROTATESELECTION, UnusedW, Unused);
+            Send(SciMsg.SCI_ROTATESELECTION, UnusedW, Unused);
         }
 
         /// <summary>Swap that caret and anchor of the main selection. (Scintilla feature 2607)</summary>
         public void SwapMainAnchorCaret()
         {
-            SendMessage(_scintilla, SciMsg.SCI_SWAPMAINANCHORCARET, UnusedW, Unused);
+            Send(SciMsg.SCI_SWAPMAINANCHORCARET, UnusedW, Unused);
         }
 
         /// <summary>
@@ -4998,7 +6221,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void MultipleSelectAddNext()
         {
-            SendMessage(_scintilla, SciMsg.SCI_MULTIPLESELECTADDNEXT, UnusedW, Unused);
+            Send(SciMsg.SCI_MULTIPLESELECTADDNEXT, UnusedW, Unused);
         }
 
         /// <summary>
@@ -5008,7 +6231,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void MultipleSelectAddEach()
         {
-            SendMessage(_scintilla, SciMsg.SCI_MULTIPLESELECTADDEACH, UnusedW, Unused);
+            Send(SciMsg.SCI_MULTIPLESELECTADDEACH, UnusedW, Unused);
         }
 
         /// <summary>
@@ -5018,7 +6241,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public int ChangeLexerState(Position start, Position end)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_CHANGELEXERSTATE, (UIntPtr)start, (IntPtr)end);
+            return (int)Send(SciMsg.SCI_CHANGELEXERSTATE, (UIntPtr)start, (IntPtr)end);
         }
 
         /// <summary>
@@ -5028,55 +6251,55 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public Position ContractedFoldNext(Position lineStart)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_CONTRACTEDFOLDNEXT, (UIntPtr)lineStart, Unused);
+            return Send(SciMsg.SCI_CONTRACTEDFOLDNEXT, (UIntPtr)lineStart, Unused);
         }
 
         /// <summary>Centre current line in window. (Scintilla feature 2619)</summary>
         public void VerticalCentreCaret()
         {
-            SendMessage(_scintilla, SciMsg.SCI_VERTICALCENTRECARET, UnusedW, Unused);
+            Send(SciMsg.SCI_VERTICALCENTRECARET, UnusedW, Unused);
         }
 
         /// <summary>Move the selected lines up one line, shifting the line above after the selection (Scintilla feature 2620)</summary>
         public void MoveSelectedLinesUp()
         {
-            SendMessage(_scintilla, SciMsg.SCI_MOVESELECTEDLINESUP, UnusedW, Unused);
+            Send(SciMsg.SCI_MOVESELECTEDLINESUP, UnusedW, Unused);
         }
 
         /// <summary>Move the selected lines down one line, shifting the line below before the selection (Scintilla feature 2621)</summary>
         public void MoveSelectedLinesDown()
         {
-            SendMessage(_scintilla, SciMsg.SCI_MOVESELECTEDLINESDOWN, UnusedW, Unused);
+            Send(SciMsg.SCI_MOVESELECTEDLINESDOWN, UnusedW, Unused);
         }
 
         /// <summary>Set the identifier reported as idFrom in notification messages. (Scintilla feature 2622)</summary>
         public void SetIdentifier(int identifier)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETIDENTIFIER, (UIntPtr)identifier, Unused);
+            Send(SciMsg.SCI_SETIDENTIFIER, (UIntPtr)identifier, Unused);
         }
 
         /// <summary>Get the identifier. (Scintilla feature 2623)</summary>
         public int GetIdentifier()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETIDENTIFIER, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETIDENTIFIER, UnusedW, Unused);
         }
 
         /// <summary>Set the width for future RGBA image data. (Scintilla feature 2624)</summary>
         public void RGBAImageSetWidth(int width)
         {
-            SendMessage(_scintilla, SciMsg.SCI_RGBAIMAGESETWIDTH, (UIntPtr)width, Unused);
+            Send(SciMsg.SCI_RGBAIMAGESETWIDTH, (UIntPtr)width, Unused);
         }
 
         /// <summary>Set the height for future RGBA image data. (Scintilla feature 2625)</summary>
         public void RGBAImageSetHeight(int height)
         {
-            SendMessage(_scintilla, SciMsg.SCI_RGBAIMAGESETHEIGHT, (UIntPtr)height, Unused);
+            Send(SciMsg.SCI_RGBAIMAGESETHEIGHT, (UIntPtr)height, Unused);
         }
 
         /// <summary>Set the scale factor in percent for future RGBA image data. (Scintilla feature 2651)</summary>
         public void RGBAImageSetScale(int scalePercent)
         {
-            SendMessage(_scintilla, SciMsg.SCI_RGBAIMAGESETSCALE, (UIntPtr)scalePercent, Unused);
+            Send(SciMsg.SCI_RGBAIMAGESETSCALE, (UIntPtr)scalePercent, Unused);
         }
 
         /// <summary>
@@ -5102,49 +6325,49 @@ namespace Npp.DotNet.Plugin
         /// <summary>Scroll to start of document. (Scintilla feature 2628)</summary>
         public void ScrollToStart()
         {
-            SendMessage(_scintilla, SciMsg.SCI_SCROLLTOSTART, UnusedW, Unused);
+            Send(SciMsg.SCI_SCROLLTOSTART, UnusedW, Unused);
         }
 
         /// <summary>Scroll to end of document. (Scintilla feature 2629)</summary>
         public void ScrollToEnd()
         {
-            SendMessage(_scintilla, SciMsg.SCI_SCROLLTOEND, UnusedW, Unused);
+            Send(SciMsg.SCI_SCROLLTOEND, UnusedW, Unused);
         }
 
         /// <summary>Set the technology used. (Scintilla feature 2630)</summary>
         public void SetTechnology(Technology technology)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETTECHNOLOGY, (UIntPtr)technology, Unused);
+            Send(SciMsg.SCI_SETTECHNOLOGY, (UIntPtr)technology, Unused);
         }
 
         /// <summary>Get the tech. (Scintilla feature 2631)</summary>
         public Technology GetTechnology()
         {
-            return (Technology)SendMessage(_scintilla, SciMsg.SCI_GETTECHNOLOGY, UnusedW, Unused);
+            return (Technology)Send(SciMsg.SCI_GETTECHNOLOGY, UnusedW, Unused);
         }
 
         /// <summary>Create an ILoader*. (Scintilla feature 2632)</summary>
         public IntPtr CreateLoader(Position bytes, DocumentOption documentOptions)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_CREATELOADER, (UIntPtr)bytes, (IntPtr)documentOptions);
+            return Send(SciMsg.SCI_CREATELOADER, (UIntPtr)bytes, (IntPtr)documentOptions);
         }
 
         /// <summary>On macOS, show a find indicator. (Scintilla feature 2640)</summary>
         public void FindIndicatorShow(Position start, Position end)
         {
-            SendMessage(_scintilla, SciMsg.SCI_FINDINDICATORSHOW, (UIntPtr)start, (IntPtr)end);
+            Send(SciMsg.SCI_FINDINDICATORSHOW, (UIntPtr)start, (IntPtr)end);
         }
 
         /// <summary>On macOS, flash a find indicator, then fade out. (Scintilla feature 2641)</summary>
         public void FindIndicatorFlash(Position start, Position end)
         {
-            SendMessage(_scintilla, SciMsg.SCI_FINDINDICATORFLASH, (UIntPtr)start, (IntPtr)end);
+            Send(SciMsg.SCI_FINDINDICATORFLASH, (UIntPtr)start, (IntPtr)end);
         }
 
         /// <summary>On macOS, hide the find indicator. (Scintilla feature 2642)</summary>
         public void FindIndicatorHide()
         {
-            SendMessage(_scintilla, SciMsg.SCI_FINDINDICATORHIDE, UnusedW, Unused);
+            Send(SciMsg.SCI_FINDINDICATORHIDE, UnusedW, Unused);
         }
 
         /// <summary>
@@ -5154,43 +6377,43 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public void VCHomeDisplay()
         {
-            SendMessage(_scintilla, SciMsg.SCI_VCHOMEDISPLAY, UnusedW, Unused);
+            Send(SciMsg.SCI_VCHOMEDISPLAY, UnusedW, Unused);
         }
 
         /// <summary>Like VCHomeDisplay but extending selection to new caret position. (Scintilla feature 2653)</summary>
         public void VCHomeDisplayExtend()
         {
-            SendMessage(_scintilla, SciMsg.SCI_VCHOMEDISPLAYEXTEND, UnusedW, Unused);
+            Send(SciMsg.SCI_VCHOMEDISPLAYEXTEND, UnusedW, Unused);
         }
 
         /// <summary>Is the caret line always visible? (Scintilla feature 2654)</summary>
         public bool GetCaretLineVisibleAlways()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETCARETLINEVISIBLEALWAYS, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETCARETLINEVISIBLEALWAYS, UnusedW, Unused);
         }
 
         /// <summary>Sets the caret line to always visible. (Scintilla feature 2655)</summary>
         public void SetCaretLineVisibleAlways(bool alwaysVisible)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETCARETLINEVISIBLEALWAYS, new UIntPtr(alwaysVisible ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETCARETLINEVISIBLEALWAYS, new UIntPtr(alwaysVisible ? 1U : 0U), Unused);
         }
 
         /// <summary>Set the line end types that the application wants to use. May not be used if incompatible with lexer or encoding. (Scintilla feature 2656)</summary>
         public void SetLineEndTypesAllowed(LineEndType lineEndBitSet)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETLINEENDTYPESALLOWED, (UIntPtr)lineEndBitSet, Unused);
+            Send(SciMsg.SCI_SETLINEENDTYPESALLOWED, (UIntPtr)lineEndBitSet, Unused);
         }
 
         /// <summary>Get the line end types currently allowed. (Scintilla feature 2657)</summary>
         public LineEndType GetLineEndTypesAllowed()
         {
-            return (LineEndType)SendMessage(_scintilla, SciMsg.SCI_GETLINEENDTYPESALLOWED, UnusedW, Unused);
+            return (LineEndType)Send(SciMsg.SCI_GETLINEENDTYPESALLOWED, UnusedW, Unused);
         }
 
         /// <summary>Get the line end types currently recognised. May be a subset of the allowed types due to lexer limitation. (Scintilla feature 2658)</summary>
         public LineEndType GetLineEndTypesActive()
         {
-            return (LineEndType)SendMessage(_scintilla, SciMsg.SCI_GETLINEENDTYPESACTIVE, UnusedW, Unused);
+            return (LineEndType)Send(SciMsg.SCI_GETLINEENDTYPESACTIVE, UnusedW, Unused);
         }
 
         /// <summary>
@@ -5206,6 +6429,71 @@ namespace Npp.DotNet.Plugin
             }
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetRepresentation(string)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public unsafe int GetRepresentation(string encodedCharacter, Span<byte> destination)
+        {
+            Span<byte> encodedCharacterBytes = EncodeNullTerminated(CodePage, encodedCharacter, stackalloc byte[StackEncodingLength], out byte[] encodedCharacterRented);
+            try
+            {
+                fixed (byte* encodedCharacterPtr = encodedCharacterBytes)
+                {
+                    return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETREPRESENTATION, destination, (UIntPtr)encodedCharacterPtr);
+                }
+            }
+            finally
+            {
+                if (encodedCharacterRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(encodedCharacterRented);
+                }
+            }
+        }
+
+        /// <inheritdoc cref="GetRepresentation(string)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public unsafe int GetRepresentation(string encodedCharacter, IBufferWriter<byte> writer)
+        {
+            Span<byte> encodedCharacterBytes = EncodeNullTerminated(CodePage, encodedCharacter, stackalloc byte[StackEncodingLength], out byte[] encodedCharacterRented);
+            try
+            {
+                fixed (byte* encodedCharacterPtr = encodedCharacterBytes)
+                {
+                    return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETREPRESENTATION, writer, (UIntPtr)encodedCharacterPtr);
+                }
+            }
+            finally
+            {
+                if (encodedCharacterRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(encodedCharacterRented);
+                }
+            }
+        }
+
+        /// <inheritdoc cref="GetRepresentation(string)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public unsafe byte[] GetRepresentation(string encodedCharacter, ArrayPool<byte> pool, out int length)
+        {
+            Span<byte> encodedCharacterBytes = EncodeNullTerminated(CodePage, encodedCharacter, stackalloc byte[StackEncodingLength], out byte[] encodedCharacterRented);
+            try
+            {
+                fixed (byte* encodedCharacterPtr = encodedCharacterBytes)
+                {
+                    return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETREPRESENTATION, pool, out length, (UIntPtr)encodedCharacterPtr);
+                }
+            }
+            finally
+            {
+                if (encodedCharacterRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(encodedCharacterRented);
+                }
+            }
+        }
+#endif
+
         /// <summary>Remove a character representation. (Scintilla feature 2667)</summary>
         public void ClearRepresentation(string encodedCharacter)
         {
@@ -5215,7 +6503,7 @@ namespace Npp.DotNet.Plugin
         /// <summary>Clear representations to default. (Scintilla feature 2770)</summary>
         public void ClearAllRepresentations()
         {
-            SendMessage(_scintilla, SciMsg.SCI_CLEARALLREPRESENTATIONS, UnusedW, Unused);
+            Send(SciMsg.SCI_CLEARALLREPRESENTATIONS, UnusedW, Unused);
         }
 
         /// <summary>Set the appearance of a representation. (Scintilla feature 2766)</summary>
@@ -5254,118 +6542,141 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_EOLANNOTATIONGETTEXT, Encoding.UTF8, (UIntPtr)line);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="EOLAnnotationGetText(Position)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int EOLAnnotationGetText(Position line, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_EOLANNOTATIONGETTEXT, destination, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="EOLAnnotationGetText(Position)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int EOLAnnotationGetText(Position line, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_EOLANNOTATIONGETTEXT, writer, (UIntPtr)line);
+        }
+
+        /// <inheritdoc cref="EOLAnnotationGetText(Position)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] EOLAnnotationGetText(Position line, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_EOLANNOTATIONGETTEXT, pool, out length, (UIntPtr)line);
+        }
+#endif
+
         /// <summary>Set the style number for the end of line annotations for a line (Scintilla feature 2742)</summary>
         public void EOLAnnotationSetStyle(Position line, int style)
         {
-            SendMessage(_scintilla, SciMsg.SCI_EOLANNOTATIONSETSTYLE, (UIntPtr)line, (IntPtr)style);
+            Send(SciMsg.SCI_EOLANNOTATIONSETSTYLE, (UIntPtr)line, (IntPtr)style);
         }
 
         /// <summary>Get the style number for the end of line annotations for a line (Scintilla feature 2743)</summary>
         public int EOLAnnotationGetStyle(Position line)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_EOLANNOTATIONGETSTYLE, (UIntPtr)line, Unused);
+            return (int)Send(SciMsg.SCI_EOLANNOTATIONGETSTYLE, (UIntPtr)line, Unused);
         }
 
         /// <summary>Clear the end of annotations from all lines (Scintilla feature 2744)</summary>
         public void EOLAnnotationClearAll()
         {
-            SendMessage(_scintilla, SciMsg.SCI_EOLANNOTATIONCLEARALL, UnusedW, Unused);
+            Send(SciMsg.SCI_EOLANNOTATIONCLEARALL, UnusedW, Unused);
         }
 
         /// <summary>Set the visibility for the end of line annotations for a view (Scintilla feature 2745)</summary>
         public void EOLAnnotationSetVisible(EOLAnnotationVisible visible)
         {
-            SendMessage(_scintilla, SciMsg.SCI_EOLANNOTATIONSETVISIBLE, (UIntPtr)visible, Unused);
+            Send(SciMsg.SCI_EOLANNOTATIONSETVISIBLE, (UIntPtr)visible, Unused);
         }
 
         /// <summary>Get the visibility for the end of line annotations for a view (Scintilla feature 2746)</summary>
         public EOLAnnotationVisible EOLAnnotationGetVisible()
         {
-            return (EOLAnnotationVisible)SendMessage(_scintilla, SciMsg.SCI_EOLANNOTATIONGETVISIBLE, UnusedW, Unused);
+            return (EOLAnnotationVisible)Send(SciMsg.SCI_EOLANNOTATIONGETVISIBLE, UnusedW, Unused);
         }
 
         /// <summary>Get the start of the range of style numbers used for end of line annotations (Scintilla feature 2747)</summary>
         public void EOLAnnotationSetStyleOffset(int style)
         {
-            SendMessage(_scintilla, SciMsg.SCI_EOLANNOTATIONSETSTYLEOFFSET, (UIntPtr)style, Unused);
+            Send(SciMsg.SCI_EOLANNOTATIONSETSTYLEOFFSET, (UIntPtr)style, Unused);
         }
 
         /// <summary>Get the start of the range of style numbers used for end of line annotations (Scintilla feature 2748)</summary>
         public int EOLAnnotationGetStyleOffset()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_EOLANNOTATIONGETSTYLEOFFSET, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_EOLANNOTATIONGETSTYLEOFFSET, UnusedW, Unused);
         }
 
         /// <summary>Get whether a feature is supported (Scintilla feature 2750)</summary>
         public bool SupportsFeature(Supports feature)
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_SUPPORTSFEATURE, (UIntPtr)feature, Unused);
+            return 1 == (int)Send(SciMsg.SCI_SUPPORTSFEATURE, (UIntPtr)feature, Unused);
         }
 
         /// <summary>Retrieve line character index state. (Scintilla feature 2710)</summary>
         public LineCharacterIndexType GetLineCharacterIndex()
         {
-            return (LineCharacterIndexType)SendMessage(_scintilla, SciMsg.SCI_GETLINECHARACTERINDEX, UnusedW, Unused);
+            return (LineCharacterIndexType)Send(SciMsg.SCI_GETLINECHARACTERINDEX, UnusedW, Unused);
         }
 
         /// <summary>Request line character index be created or its use count increased. (Scintilla feature 2711)</summary>
         public void AllocateLineCharacterIndex(LineCharacterIndexType lineCharacterIndex)
         {
-            SendMessage(_scintilla, SciMsg.SCI_ALLOCATELINECHARACTERINDEX, (UIntPtr)lineCharacterIndex, Unused);
+            Send(SciMsg.SCI_ALLOCATELINECHARACTERINDEX, (UIntPtr)lineCharacterIndex, Unused);
         }
 
         /// <summary>Decrease use count of line character index and remove if 0. (Scintilla feature 2712)</summary>
         public void ReleaseLineCharacterIndex(LineCharacterIndexType lineCharacterIndex)
         {
-            SendMessage(_scintilla, SciMsg.SCI_RELEASELINECHARACTERINDEX, (UIntPtr)lineCharacterIndex, Unused);
+            Send(SciMsg.SCI_RELEASELINECHARACTERINDEX, (UIntPtr)lineCharacterIndex, Unused);
         }
 
         /// <summary>Retrieve the document line containing a position measured in index units. (Scintilla feature 2713)</summary>
         public Position LineFromIndexPosition(Position pos, LineCharacterIndexType lineCharacterIndex)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_LINEFROMINDEXPOSITION, (UIntPtr)pos, (IntPtr)lineCharacterIndex);
+            return Send(SciMsg.SCI_LINEFROMINDEXPOSITION, (UIntPtr)pos, (IntPtr)lineCharacterIndex);
         }
 
         /// <summary>Retrieve the position measured in index units at the start of a document line. (Scintilla feature 2714)</summary>
         public Position IndexPositionFromLine(Position line, LineCharacterIndexType lineCharacterIndex)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_INDEXPOSITIONFROMLINE, (UIntPtr)line, (IntPtr)lineCharacterIndex);
+            return Send(SciMsg.SCI_INDEXPOSITIONFROMLINE, (UIntPtr)line, (IntPtr)lineCharacterIndex);
         }
 
         /// <summary>Get whether drag-and-drop is enabled or disabled (Scintilla feature 2818)</summary>
         public bool GetDragDropEnabled()
         {
-            return 1 == (int)SendMessage(_scintilla, SciMsg.SCI_GETDRAGDROPENABLED, UnusedW, Unused);
+            return 1 == (int)Send(SciMsg.SCI_GETDRAGDROPENABLED, UnusedW, Unused);
         }
 
         /// <summary>Enable or disable drag-and-drop (Scintilla feature 2819)</summary>
         public void SetDragDropEnabled(bool dragDropEnabled)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETDRAGDROPENABLED, new UIntPtr(dragDropEnabled ? 1U : 0U), Unused);
+            Send(SciMsg.SCI_SETDRAGDROPENABLED, new UIntPtr(dragDropEnabled ? 1U : 0U), Unused);
         }
 
         /// <summary>Start notifying the container of all key presses and commands. (Scintilla feature 3001)</summary>
         public void StartRecord()
         {
-            SendMessage(_scintilla, SciMsg.SCI_STARTRECORD, UnusedW, Unused);
+            Send(SciMsg.SCI_STARTRECORD, UnusedW, Unused);
         }
 
         /// <summary>Stop notifying the container of all key presses and commands. (Scintilla feature 3002)</summary>
         public void StopRecord()
         {
-            SendMessage(_scintilla, SciMsg.SCI_STOPRECORD, UnusedW, Unused);
+            Send(SciMsg.SCI_STOPRECORD, UnusedW, Unused);
         }
 
         /// <summary>Retrieve the lexing language of the document. (Scintilla feature 4002)</summary>
         public int GetLexer()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETLEXER, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETLEXER, UnusedW, Unused);
         }
 
         /// <summary>Colourise a segment of the document using the current lexing language. (Scintilla feature 4003)</summary>
         public void Colourise(Position start, Position end)
         {
-            SendMessage(_scintilla, SciMsg.SCI_COLOURISE, (UIntPtr)start, (IntPtr)end);
+            Send(SciMsg.SCI_COLOURISE, (UIntPtr)start, (IntPtr)end);
         }
 
         /// <summary>Set up a value that may be used by a lexer for some optional feature. (Scintilla feature 4004)</summary>
@@ -5393,6 +6704,71 @@ namespace Npp.DotNet.Plugin
             }
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetProperty(string)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public unsafe int GetProperty(string key, Span<byte> destination)
+        {
+            Span<byte> keyBytes = EncodeNullTerminated(Encoding.UTF8, key, stackalloc byte[StackEncodingLength], out byte[] keyRented);
+            try
+            {
+                fixed (byte* keyPtr = keyBytes)
+                {
+                    return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETPROPERTY, destination, (UIntPtr)keyPtr);
+                }
+            }
+            finally
+            {
+                if (keyRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(keyRented);
+                }
+            }
+        }
+
+        /// <inheritdoc cref="GetProperty(string)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public unsafe int GetProperty(string key, IBufferWriter<byte> writer)
+        {
+            Span<byte> keyBytes = EncodeNullTerminated(Encoding.UTF8, key, stackalloc byte[StackEncodingLength], out byte[] keyRented);
+            try
+            {
+                fixed (byte* keyPtr = keyBytes)
+                {
+                    return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETPROPERTY, writer, (UIntPtr)keyPtr);
+                }
+            }
+            finally
+            {
+                if (keyRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(keyRented);
+                }
+            }
+        }
+
+        /// <inheritdoc cref="GetProperty(string)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public unsafe byte[] GetProperty(string key, ArrayPool<byte> pool, out int length)
+        {
+            Span<byte> keyBytes = EncodeNullTerminated(Encoding.UTF8, key, stackalloc byte[StackEncodingLength], out byte[] keyRented);
+            try
+            {
+                fixed (byte* keyPtr = keyBytes)
+                {
+                    return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETPROPERTY, pool, out length, (UIntPtr)keyPtr);
+                }
+            }
+            finally
+            {
+                if (keyRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(keyRented);
+                }
+            }
+        }
+#endif
+
         /// <summary>
         /// Retrieve a "property" value previously set with SetProperty,
         /// with "$()" variable replacement on returned buffer.
@@ -5408,6 +6784,74 @@ namespace Npp.DotNet.Plugin
             }
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetPropertyExpanded(string)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        [Obsolete("This is now the same as SCI_GETPROPERTY - no expansion is performed. See https://www.scintilla.org/ScintillaDoc.html#SCI_GETPROPERTYEXPANDED")]
+        public unsafe int GetPropertyExpanded(string key, Span<byte> destination)
+        {
+            Span<byte> keyBytes = EncodeNullTerminated(Encoding.UTF8, key, stackalloc byte[StackEncodingLength], out byte[] keyRented);
+            try
+            {
+                fixed (byte* keyPtr = keyBytes)
+                {
+                    return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETPROPERTYEXPANDED, destination, (UIntPtr)keyPtr);
+                }
+            }
+            finally
+            {
+                if (keyRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(keyRented);
+                }
+            }
+        }
+
+        /// <inheritdoc cref="GetPropertyExpanded(string)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        [Obsolete("This is now the same as SCI_GETPROPERTY - no expansion is performed. See https://www.scintilla.org/ScintillaDoc.html#SCI_GETPROPERTYEXPANDED")]
+        public unsafe int GetPropertyExpanded(string key, IBufferWriter<byte> writer)
+        {
+            Span<byte> keyBytes = EncodeNullTerminated(Encoding.UTF8, key, stackalloc byte[StackEncodingLength], out byte[] keyRented);
+            try
+            {
+                fixed (byte* keyPtr = keyBytes)
+                {
+                    return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETPROPERTYEXPANDED, writer, (UIntPtr)keyPtr);
+                }
+            }
+            finally
+            {
+                if (keyRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(keyRented);
+                }
+            }
+        }
+
+        /// <inheritdoc cref="GetPropertyExpanded(string)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        [Obsolete("This is now the same as SCI_GETPROPERTY - no expansion is performed. See https://www.scintilla.org/ScintillaDoc.html#SCI_GETPROPERTYEXPANDED")]
+        public unsafe byte[] GetPropertyExpanded(string key, ArrayPool<byte> pool, out int length)
+        {
+            Span<byte> keyBytes = EncodeNullTerminated(Encoding.UTF8, key, stackalloc byte[StackEncodingLength], out byte[] keyRented);
+            try
+            {
+                fixed (byte* keyPtr = keyBytes)
+                {
+                    return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETPROPERTYEXPANDED, pool, out length, (UIntPtr)keyPtr);
+                }
+            }
+            finally
+            {
+                if (keyRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(keyRented);
+                }
+            }
+        }
+#endif
+
         /// <summary>
         /// Retrieve a "property" value previously set with SetProperty,
         /// interpreted as an int AFTER any "$()" variable replacement.
@@ -5429,10 +6873,33 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETLEXERLANGUAGE, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetLexerLanguage()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetLexerLanguage(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETLEXERLANGUAGE, destination);
+        }
+
+        /// <inheritdoc cref="GetLexerLanguage()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetLexerLanguage(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETLEXERLANGUAGE, writer);
+        }
+
+        /// <inheritdoc cref="GetLexerLanguage()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetLexerLanguage(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETLEXERLANGUAGE, pool, out length);
+        }
+#endif
+
         /// <summary>For private communication between an application and a known lexer. (Scintilla feature 4013)</summary>
         public IntPtr PrivateLexerCall(int operation, IntPtr pointer)
         {
-            return SendMessage(_scintilla, SciMsg.SCI_PRIVATELEXERCALL, (UIntPtr)operation, (IntPtr)pointer);
+            return Send(SciMsg.SCI_PRIVATELEXERCALL, (UIntPtr)operation, (IntPtr)pointer);
         }
 
         /// <summary>
@@ -5445,6 +6912,29 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_PROPERTYNAMES, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="PropertyNames()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int PropertyNames(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_PROPERTYNAMES, destination);
+        }
+
+        /// <inheritdoc cref="PropertyNames()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int PropertyNames(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_PROPERTYNAMES, writer);
+        }
+
+        /// <inheritdoc cref="PropertyNames()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] PropertyNames(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_PROPERTYNAMES, pool, out length);
+        }
+#endif
+
         /// <summary>Retrieve the type of a property. (Scintilla feature 4015)</summary>
         public TypeProperty PropertyType(string name)
         {
@@ -5464,6 +6954,71 @@ namespace Npp.DotNet.Plugin
             }
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="DescribeProperty(string)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public unsafe int DescribeProperty(string name, Span<byte> destination)
+        {
+            Span<byte> nameBytes = EncodeNullTerminated(Encoding.UTF8, name, stackalloc byte[StackEncodingLength], out byte[] nameRented);
+            try
+            {
+                fixed (byte* namePtr = nameBytes)
+                {
+                    return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_DESCRIBEPROPERTY, destination, (UIntPtr)namePtr);
+                }
+            }
+            finally
+            {
+                if (nameRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(nameRented);
+                }
+            }
+        }
+
+        /// <inheritdoc cref="DescribeProperty(string)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public unsafe int DescribeProperty(string name, IBufferWriter<byte> writer)
+        {
+            Span<byte> nameBytes = EncodeNullTerminated(Encoding.UTF8, name, stackalloc byte[StackEncodingLength], out byte[] nameRented);
+            try
+            {
+                fixed (byte* namePtr = nameBytes)
+                {
+                    return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_DESCRIBEPROPERTY, writer, (UIntPtr)namePtr);
+                }
+            }
+            finally
+            {
+                if (nameRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(nameRented);
+                }
+            }
+        }
+
+        /// <inheritdoc cref="DescribeProperty(string)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public unsafe byte[] DescribeProperty(string name, ArrayPool<byte> pool, out int length)
+        {
+            Span<byte> nameBytes = EncodeNullTerminated(Encoding.UTF8, name, stackalloc byte[StackEncodingLength], out byte[] nameRented);
+            try
+            {
+                fixed (byte* namePtr = nameBytes)
+                {
+                    return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_DESCRIBEPROPERTY, pool, out length, (UIntPtr)namePtr);
+                }
+            }
+            finally
+            {
+                if (nameRented != null)
+                {
+                    ArrayPool<byte>.Shared.Return(nameRented);
+                }
+            }
+        }
+#endif
+
         /// <summary>
         /// Retrieve a '\n' separated list of descriptions of the keyword sets understood by the current lexer.
         /// Result is NUL-terminated.
@@ -5474,6 +7029,29 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_DESCRIBEKEYWORDSETS, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="DescribeKeyWordSets()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int DescribeKeyWordSets(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_DESCRIBEKEYWORDSETS, destination);
+        }
+
+        /// <inheritdoc cref="DescribeKeyWordSets()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int DescribeKeyWordSets(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_DESCRIBEKEYWORDSETS, writer);
+        }
+
+        /// <inheritdoc cref="DescribeKeyWordSets()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] DescribeKeyWordSets(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_DESCRIBEKEYWORDSETS, pool, out length);
+        }
+#endif
+
         /// <summary>
         /// Bit set of LineEndType enumertion for which line ends beyond the standard
         /// LF, CR, and CRLF are supported by the lexer.
@@ -5481,43 +7059,43 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public LineEndType GetLineEndTypesSupported()
         {
-            return (LineEndType)SendMessage(_scintilla, SciMsg.SCI_GETLINEENDTYPESSUPPORTED, UnusedW, Unused);
+            return (LineEndType)Send(SciMsg.SCI_GETLINEENDTYPESSUPPORTED, UnusedW, Unused);
         }
 
         /// <summary>Allocate a set of sub styles for a particular base style, returning start of range (Scintilla feature 4020)</summary>
         public int AllocateSubStyles(int styleBase, int numberStyles)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_ALLOCATESUBSTYLES, (UIntPtr)styleBase, (IntPtr)numberStyles);
+            return (int)Send(SciMsg.SCI_ALLOCATESUBSTYLES, (UIntPtr)styleBase, (IntPtr)numberStyles);
         }
 
         /// <summary>The starting style number for the sub styles associated with a base style (Scintilla feature 4021)</summary>
         public int GetSubStylesStart(int styleBase)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETSUBSTYLESSTART, (UIntPtr)styleBase, Unused);
+            return (int)Send(SciMsg.SCI_GETSUBSTYLESSTART, (UIntPtr)styleBase, Unused);
         }
 
         /// <summary>The number of sub styles associated with a base style (Scintilla feature 4022)</summary>
         public int GetSubStylesLength(int styleBase)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETSUBSTYLESLENGTH, (UIntPtr)styleBase, Unused);
+            return (int)Send(SciMsg.SCI_GETSUBSTYLESLENGTH, (UIntPtr)styleBase, Unused);
         }
 
         /// <summary>For a sub style, return the base style, else return the argument. (Scintilla feature 4027)</summary>
         public int GetStyleFromSubStyle(int subStyle)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETSTYLEFROMSUBSTYLE, (UIntPtr)subStyle, Unused);
+            return (int)Send(SciMsg.SCI_GETSTYLEFROMSUBSTYLE, (UIntPtr)subStyle, Unused);
         }
 
         /// <summary>For a secondary style, return the primary style, else return the argument. (Scintilla feature 4028)</summary>
         public int GetPrimaryStyleFromStyle(int style)
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETPRIMARYSTYLEFROMSTYLE, (UIntPtr)style, Unused);
+            return (int)Send(SciMsg.SCI_GETPRIMARYSTYLEFROMSTYLE, (UIntPtr)style, Unused);
         }
 
         /// <summary>Free allocated sub styles (Scintilla feature 4023)</summary>
         public void FreeSubStyles()
         {
-            SendMessage(_scintilla, SciMsg.SCI_FREESUBSTYLES, UnusedW, Unused);
+            Send(SciMsg.SCI_FREESUBSTYLES, UnusedW, Unused);
         }
 
         /// <summary>Set the identifiers that are shown in a particular style (Scintilla feature 4024)</summary>
@@ -5533,7 +7111,7 @@ namespace Npp.DotNet.Plugin
         /// </summary>
         public int DistanceToSecondaryStyles()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_DISTANCETOSECONDARYSTYLES, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_DISTANCETOSECONDARYSTYLES, UnusedW, Unused);
         }
 
         /// <summary>
@@ -5546,10 +7124,33 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_GETSUBSTYLEBASES, Encoding.UTF8);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="GetSubStyleBases()"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int GetSubStyleBases(Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_GETSUBSTYLEBASES, destination);
+        }
+
+        /// <inheritdoc cref="GetSubStyleBases()"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int GetSubStyleBases(IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_GETSUBSTYLEBASES, writer);
+        }
+
+        /// <inheritdoc cref="GetSubStyleBases()"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] GetSubStyleBases(ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_GETSUBSTYLEBASES, pool, out length);
+        }
+#endif
+
         /// <summary>Retrieve the number of named styles for the lexer. (Scintilla feature 4029)</summary>
         public int GetNamedStyles()
         {
-            return (int)SendMessage(_scintilla, SciMsg.SCI_GETNAMEDSTYLES, UnusedW, Unused);
+            return (int)Send(SciMsg.SCI_GETNAMEDSTYLES, UnusedW, Unused);
         }
 
         /// <summary>
@@ -5562,6 +7163,29 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_NAMEOFSTYLE, Encoding.UTF8, (UIntPtr)style);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="NameOfStyle(int)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int NameOfStyle(int style, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_NAMEOFSTYLE, destination, (UIntPtr)style);
+        }
+
+        /// <inheritdoc cref="NameOfStyle(int)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int NameOfStyle(int style, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_NAMEOFSTYLE, writer, (UIntPtr)style);
+        }
+
+        /// <inheritdoc cref="NameOfStyle(int)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] NameOfStyle(int style, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_NAMEOFSTYLE, pool, out length, (UIntPtr)style);
+        }
+#endif
+
         /// <summary>
         /// Retrieve a ' ' separated list of style tags like "literal quoted string".
         /// Result is NUL-terminated.
@@ -5572,6 +7196,29 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_TAGSOFSTYLE, Encoding.UTF8, (UIntPtr)style);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="TagsOfStyle(int)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int TagsOfStyle(int style, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_TAGSOFSTYLE, destination, (UIntPtr)style);
+        }
+
+        /// <inheritdoc cref="TagsOfStyle(int)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int TagsOfStyle(int style, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_TAGSOFSTYLE, writer, (UIntPtr)style);
+        }
+
+        /// <inheritdoc cref="TagsOfStyle(int)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] TagsOfStyle(int style, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_TAGSOFSTYLE, pool, out length, (UIntPtr)style);
+        }
+#endif
+
         /// <summary>
         /// Retrieve a description of a style.
         /// Result is NUL-terminated.
@@ -5582,17 +7229,40 @@ namespace Npp.DotNet.Plugin
             return GetNullStrippedStringFromMessageThatReturnsLength(SciMsg.SCI_DESCRIPTIONOFSTYLE, Encoding.UTF8, (UIntPtr)style);
         }
 
+#if NETCOREAPP
+        /// <inheritdoc cref="DescriptionOfStyle(int)"/>
+        /// <returns>The number of bytes copied to <paramref name="destination"/>, not counting the terminating NUL.</returns>
+        public int DescriptionOfStyle(int style, Span<byte> destination)
+        {
+            return GetBytesFromMessageThatReturnsLength(SciMsg.SCI_DESCRIPTIONOFSTYLE, destination, (UIntPtr)style);
+        }
+
+        /// <inheritdoc cref="DescriptionOfStyle(int)"/>
+        /// <returns>The number of bytes written to <paramref name="writer"/>.</returns>
+        public int DescriptionOfStyle(int style, IBufferWriter<byte> writer)
+        {
+            return WriteBytesFromMessageThatReturnsLength(SciMsg.SCI_DESCRIPTIONOFSTYLE, writer, (UIntPtr)style);
+        }
+
+        /// <inheritdoc cref="DescriptionOfStyle(int)"/>
+        /// <returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes of the result. Return it to the pool when done.</returns>
+        public byte[] DescriptionOfStyle(int style, ArrayPool<byte> pool, out int length)
+        {
+            return RentBytesFromMessageThatReturnsLength(SciMsg.SCI_DESCRIPTIONOFSTYLE, pool, out length, (UIntPtr)style);
+        }
+#endif
+
         /// <summary>Set the lexer from an ILexer*. (Scintilla feature 4033)</summary>
         public void SetILexer(IntPtr ilexer)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETILEXER, UnusedW, (IntPtr)ilexer);
+            Send(SciMsg.SCI_SETILEXER, UnusedW, (IntPtr)ilexer);
         }
 
 #if !SCI_DISABLE_PROVISIONAL
         /// <summary>Retrieve bidirectional text display state. (Scintilla feature 2708)</summary>
         public Bidirectional GetBidirectional()
         {
-            return (Bidirectional)SendMessage(_scintilla, SciMsg.SCI_GETBIDIRECTIONAL, UnusedW, Unused);
+            return (Bidirectional)Send(SciMsg.SCI_GETBIDIRECTIONAL, UnusedW, Unused);
         }
 #endif
 
@@ -5600,7 +7270,7 @@ namespace Npp.DotNet.Plugin
         /// <summary>Set bidirectional text display state. (Scintilla feature 2709)</summary>
         public void SetBidirectional(Bidirectional bidirectional)
         {
-            SendMessage(_scintilla, SciMsg.SCI_SETBIDIRECTIONAL, (UIntPtr)bidirectional, Unused);
+            Send(SciMsg.SCI_SETBIDIRECTIONAL, (UIntPtr)bidirectional, Unused);
         }
 #endif
 
@@ -5665,7 +7335,7 @@ namespace Npp.DotNet.Plugin
             {
                 fixed (byte* representationPtr = Encoding.UTF8.GetBytes($"{representation}\0"))
                 {
-                    SendMessage(_scintilla, SciMsg.SCI_SETREPRESENTATION, (UIntPtr)encodedCharacterPtr, (IntPtr)representationPtr);
+                    Send(SciMsg.SCI_SETREPRESENTATION, (UIntPtr)encodedCharacterPtr, (IntPtr)representationPtr);
                 }
             }
         }
@@ -5677,7 +7347,7 @@ namespace Npp.DotNet.Plugin
         {
             fixed (byte* pText = CodePage.GetBytes($"{text}\0"))
             {
-                return SendMessage(_scintilla, msg, (UIntPtr)pText, lParam);
+                return Send(msg, (UIntPtr)pText, lParam);
             }
         }
 
@@ -5688,7 +7358,7 @@ namespace Npp.DotNet.Plugin
         {
             fixed (byte* pText = CodePage.GetBytes($"{text}\0"))
             {
-                return SendMessage(_scintilla, msg, wParam, (IntPtr)pText);
+                return Send(msg, wParam, (IntPtr)pText);
             }
         }
 
@@ -5702,10 +7372,23 @@ namespace Npp.DotNet.Plugin
             int length = cp.GetByteCount(pszText);
             fixed (byte* pText = cp.GetBytes(pszText))
             {
-                return SendMessage(_scintilla, msg, (UIntPtr)(length - cp.GetByteCount("\0")), (IntPtr)pText);
+                return Send(msg, (UIntPtr)(length - cp.GetByteCount("\0")), (IntPtr)pText);
             }
         }
 
+#if NETCOREAPP
+        /// <summary>
+        /// Sends the length of an already encoded buffer as a WPARAM, along with a fixed pointer to the buffer as an LPARAM.
+        /// </summary>
+        unsafe IntPtr SendBytes(SciMsg msg, ReadOnlySpan<byte> text)
+        {
+            fixed (byte* pText = text)
+            {
+                return Send(msg, (UIntPtr)text.Length, (IntPtr)pText);
+            }
+        }
+#endif
+
         /// <summary>
         /// Encodes a .NET string in the CLR's default code page and sends a fixed pointer to the resulting buffer as a WPARAM.
         /// </summary>
@@ -5713,7 +7396,7 @@ namespace Npp.DotNet.Plugin
         {
             fixed (byte* pText = Encoding.UTF8.GetBytes($"{text}\0"))
             {
-                return SendMessage(_scintilla, msg, (UIntPtr)pText, lParam);
+                return Send(msg, (UIntPtr)pText, lParam);
             }
         }
 
@@ -5724,7 +7407,7 @@ namespace Npp.DotNet.Plugin
         {
             fixed (byte* pText = Encoding.UTF8.GetBytes($"{text}\0"))
             {
-                return SendMessage(_scintilla, msg, wParam, (IntPtr)pText);
+                return Send(msg, wParam, (IntPtr)pText);
             }
         }
 
@@ -5737,7 +7420,7 @@ namespace Npp.DotNet.Plugin
             {
                 fixed (byte* lParamBuf = Encoding.UTF8.GetBytes($"{lParam}\0"))
                 {
-                    return SendMessage(_scintilla, SciMsg.SCI_SETPROPERTY, (UIntPtr)wParamBuf, (IntPtr)lParamBuf);
+                    return Send(SciMsg.SCI_SETPROPERTY, (UIntPtr)wParamBuf, (IntPtr)lParamBuf);
                 }
             }
         }
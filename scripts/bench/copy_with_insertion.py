@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+ SPDX-FileCopyrightText: (c) 2026 Robert Di Pardo
+ SPDX-License-Identifier: 0BSD
+
+Compare FileGenerator.CopyWithInsertion with the implementation it replaced,
+regenerating the checked-in C# sources from their own autogenerated sections.
+"""
+import os
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scintilla import FileGenerator
+
+SOURCES = [
+    os.path.join(os.path.dirname(__file__), '..', '..', 'lib', 'Plugin', file)
+    for file in ['ScintillaGateway.cs', 'IScintillaGateway.cs', 'GatewayDomain.cs']
+]
+
+# The implementation as it was before sections were scanned in a single pass
+def LegacyCopyWithInsertion(input, commentPrefix, retainDefs, lists, eol=None):
+    eol = eol or FileGenerator.lineEnd
+    copying = 1
+    generated = False
+    listid = 0
+    output = []
+    for line in input.splitlines(0):
+        isStartGenerated = line.lstrip().startswith(commentPrefix + "++Autogenerated")
+        if copying and not isStartGenerated:
+            output.append(line)
+        if isStartGenerated:
+            if retainDefs:
+                output.append(line)
+            copying = 0
+            generated = False
+        elif not copying and not generated:
+            # Generating
+            if line.startswith(commentPrefix + "**"):
+                # Pattern to transform input data
+                if retainDefs:
+                    output.append(line)
+                definition = line[len(commentPrefix + "**"):]
+                if (commentPrefix == "<!--") and (" -->" in definition):
+                    definition = definition.replace(" -->", "")
+                listid = 0
+                if definition[0] in string.digits:
+                    listid = int(definition[:1])
+                    definition = definition[2:]
+                # Hide double slashes as a control character
+                definition = definition.replace("\\\\", "\001")
+                # Do some normal C style transforms
+                definition = definition.replace("\\n", "\n")
+                definition = definition.replace("\\t", "\t")
+                # Get the doubled backslashes back as single backslashes
+                definition = definition.replace("\001", "\\")
+                startRepeat = definition.find("\\(")
+                endRepeat = definition.find("\\)")
+                intro = definition[:startRepeat]
+                out = ""
+                if intro.endswith("\n"):
+                    pos = 0
+                else:
+                    pos = len(intro)
+                out += intro
+                middle = definition[startRepeat+2:endRepeat]
+                for i in lists[listid]:
+                    item = middle.replace("\\*", i)
+                    if pos and (pos + len(item) >= 80):
+                        out += "\\\n"
+                        pos = 0
+                    out += item
+                    pos += len(item)
+                    if item.endswith("\n"):
+                        pos = 0
+                outro = definition[endRepeat+2:]
+                out += outro
+                out = out.replace("\n", eol) # correct EOLs in generated content
+                output.append(out)
+            else:
+                # Simple form with no rule to transform input
+                output.extend(item.replace("\n", eol) for item in lists[0])
+            generated = True
+        if line.lstrip().startswith(commentPrefix + "--Autogenerated") or \
+            line.lstrip().startswith(commentPrefix + "~~Autogenerated"):
+            copying = 1
+            if retainDefs:
+                output.append(line)
+    output = [line.rstrip(" \t") for line in output] # trim trailing whitespace
+    return eol.join(output) + eol
+
+def generatedSection(text: str, commentPrefix='/* ') -> list[str]:
+    """
+    Return the lines of the first autogenerated section of the given text.
+    """
+    lines = text.splitlines()
+    start = next(i for i, ln in enumerate(lines) if ln.lstrip().startswith(f'{commentPrefix}++Autogenerated'))
+    end = next(i for i, ln in enumerate(lines) if ln.lstrip().startswith(f'{commentPrefix}--Autogenerated'))
+    return lines[start + 1:end]
+
+def benchmark(path: str, number=20):
+    """
+    Time both implementations on the given file and check that their output is identical.
+    """
+    with open(path, 'r', encoding='utf-8-sig') as source:
+        text = source.read()
+    lists = (generatedSection(text),)
+
+    legacy = LegacyCopyWithInsertion(text, '/* ', True, lists, '\r\n')
+    current = FileGenerator.CopyWithInsertion(text, '/* ', True, lists, '\r\n')
+    if legacy != current:
+        raise AssertionError(f'Output differs for {path}')
+
+    legacyTime = min(timeit.repeat(
+        lambda: LegacyCopyWithInsertion(text, '/* ', True, lists, '\r\n'), number=number, repeat=5)) / number
+    currentTime = min(timeit.repeat(
+        lambda: FileGenerator.CopyWithInsertion(text, '/* ', True, lists, '\r\n'), number=number, repeat=5)) / number
+
+    print(f'{os.path.basename(path):<22}{len(text.splitlines()):>6} lines  '
+          f'legacy {legacyTime * 1000:8.3f} ms  current {currentTime * 1000:8.3f} ms  '
+          f'({legacyTime / currentTime:.2f}x)')
+
+# -------------------------------------------------------------------
+if __name__ == '__main__':
+    for source_path in (sys.argv[1:] or SOURCES):
+        benchmark(source_path)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+ SPDX-FileCopyrightText: (c) 2026 Robert Di Pardo
+ SPDX-License-Identifier: 0BSD
+
+Compare the ScintillaDefinitions scraper with the implementation it replaced,
+parsing Scintilla's online documentation unless the path to a local copy is given.
+"""
+import os
+import re
+import sys
+import timeit
+from html.parser import HTMLParser
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import cache
+from get_sci_doc import ScintillaDefinitions, fetch_docs
+
+# The implementation as it was before tags were classified by table lookup
+class LegacyScintillaDefinitions(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.defs = {}
+        self.current_symbol = ''
+        self.skip_content = False
+        self.code_span = False
+
+    def handle_starttag(self, tag, attrs):
+        _tag = tag.lower()
+
+        self.skip_content = \
+            bool(re.match(r'h[1-6]', _tag)) or \
+            _tag in [ 'pre', 'table', 'thead', 'tbody', 'tfoot', 'th', 'td', 'caption' ] or \
+            bool({ v for a, v in attrs if a.lower() == 'class' and v.startswith('S')})
+
+        if not self.skip_content and _tag in [ 'a', 'b', 'br', 'code' ]:
+            for name, value in attrs:
+                if name.lower() == 'id' and re.match(r'^SC[IN]?_', value):
+                    self.current_symbol = value.upper()
+                    self.defs[self.current_symbol] = ''
+
+            if _tag == 'br' and bool(self.current_symbol):
+                self.defs[self.current_symbol] += '<br/>'
+
+            self.code_span = _tag == 'code'
+            # revisit parent element
+            self.handle_starttag('p', [])
+
+    def handle_data(self, data):
+        doc = data if self.code_span else re.sub(fr'^({self.current_symbol})$', '', data).strip()
+        if not self.skip_content and bool(self.current_symbol) and bool(doc):
+            self.defs[self.current_symbol] += f"{doc}\r\n"
+
+    def handle_endtag(self, tag):
+        if tag.lower() == 'p':
+            self.current_symbol = ''
+
+def legacyParse(html: str) -> dict[str, str]:
+    parser = LegacyScintillaDefinitions()
+    parser.feed(html)
+    return parser.defs
+
+def benchmark(html: str, number=5):
+    """
+    Time both implementations on the given HTML and check that their symbol indexes are identical.
+    """
+    legacy = legacyParse(html)
+    current = ScintillaDefinitions().parse(html)
+    if legacy != current:
+        changed = sorted(set(legacy.items()) ^ set(current.items()))
+        raise AssertionError(f'Definitions differ, starting with {changed[0][0]}')
+
+    legacyTime = min(timeit.repeat(lambda: legacyParse(html), number=number, repeat=3)) / number
+    currentTime = min(timeit.repeat(lambda: ScintillaDefinitions().parse(html), number=number, repeat=3)) / number
+
+    print(f'{len(html):>9} chars  {len(current):>5} symbols  '
+          f'legacy {legacyTime * 1000:8.3f} ms  current {currentTime * 1000:8.3f} ms  '
+          f'({legacyTime / currentTime:.2f}x)')
+
+# -------------------------------------------------------------------
+if __name__ == '__main__':
+    ARGS = cache.strip_offline_flag(sys.argv[1:])
+    if ARGS:
+        with open(ARGS[0], 'r', encoding='utf-8') as doc:
+            benchmark(doc.read())
+    else:
+        benchmark(fetch_docs())
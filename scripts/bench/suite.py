@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+ SPDX-FileCopyrightText: (c) 2026 Robert Di Pardo
+ SPDX-License-Identifier: 0BSD
+
+Time every stage of the code generation pipeline against pinned copies of the upstream sources,
+measure the memory it uses, and compare the results with a stored baseline.
+
+The fixtures are listed in fixtures/manifest.json with their SHA-256 digests, and every run works
+offline and refuses fixtures that don't match the manifest. The committed fixtures were rebuilt from
+the C# sources generated from them, which they regenerate unchanged; the manifest names the file each
+one was rebuilt from. Scintilla's HTML documentation can't be rebuilt that way, so the stages that
+need it are skipped until it is pinned.
+
+To pin or refresh the fixtures, run with --pin [--tag vX.Y.Z]. This copies the upstream sources of
+the tag from the resource cache, downloading whatever isn't cached, replaces every fixture and
+rewrites the manifest, but only once all of them could be obtained. Commit the fixtures together
+with the manifest, then measure a new baseline with --baseline FILE --save-baseline, since timings
+on other fixtures aren't compared.
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+from io import StringIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import cache
+import generate_iface
+import generate_menu_ids
+import generate_sci_msgs
+import sources
+import utils as u
+from get_sci_doc import CommentLineStyle, ScintillaDefinitions
+from scintilla import Face, FileGenerator
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+MANIFEST = os.path.join(FIXTURE_DIR, 'manifest.json')
+GATEWAY = os.path.join(os.path.dirname(__file__), '..', '..', 'lib', 'Plugin', 'ScintillaGateway.cs')
+
+# Fixture files, mapped to the upstream sources they are pinned from
+FIXTURES = {
+    'Scintilla.iface': 'SCINTILLA_IFACE',
+    'Scintilla.h': 'SCINTILLA_H',
+    'version.txt': 'VERSION_TXT',
+    'ScintillaDoc.html': 'SCINTILLA_DOC',
+    'menuCmdID.h': 'MENUCMDID_H',
+    'resource.h': 'RESOURCE_H',
+    'preference_rc.h': 'PREFERNECE_RC_H',
+}
+
+# Relative slowdown or growth in peak memory that counts as a regression
+TOLERANCE = 0.25
+
+# Slowdowns shorter than this are timer noise, whatever their relative size
+MIN_SLOWDOWN_S = 0.0005
+
+def load_manifest() -> dict:
+    with open(MANIFEST, 'r', encoding='utf-8') as manifest:
+        return json.load(manifest)
+
+def pin(tag: str) -> bool:
+    """
+    Copy every fixture of the given tag from the resource cache into the fixture directory
+    and record its digest in a new manifest. Nothing is replaced unless all fixtures could be
+    obtained, in which case ``True`` is returned.
+    """
+    upstream = dict(sources.for_tag(tag), SCINTILLA_DOC=sources.SCINTILLA_DOC)
+    store = cache.default_cache()
+    fetched = {}
+
+    for file, source in FIXTURES.items():
+        url = upstream[source]
+        data = store.get_bytes(url, '' if source == 'SCINTILLA_DOC' else tag)
+        if data is None:
+            print(f'Failed to get {url}', file=sys.stderr)
+        else:
+            fetched[file] = data
+
+    if len(fetched) < len(FIXTURES):
+        return False
+
+    manifest = {'tag': tag, 'fixtures': {}}
+    for file, data in fetched.items():
+        FileGenerator.WriteFileAtomically(os.path.join(FIXTURE_DIR, file), data)
+        manifest['fixtures'][file] = {'source': FIXTURES[file], 'sha256': hashlib.sha256(data).hexdigest()}
+        print(f"{manifest['fixtures'][file]['sha256'][:12]} {len(data):>9} {file}")
+
+    FileGenerator.WriteFileAtomically(MANIFEST, (json.dumps(manifest, indent=1) + '\n').encode('utf-8'))
+    return True
+
+def load_fixtures(manifest: dict) -> dict[str, bytes]:
+    """
+    Read every fixture, checking it against the digest in the manifest.
+    """
+    fixtures = {}
+    for file, fixture in manifest['fixtures'].items():
+        path = os.path.join(FIXTURE_DIR, file)
+        try:
+            with open(path, 'rb') as src:
+                data = src.read()
+        except IOError:
+            raise IOError(f'Missing fixture {file}: run with --pin to fetch it') from None
+
+        if fixture['sha256'] != hashlib.sha256(data).hexdigest():
+            raise IOError(f'Fixture {file} does not match the manifest: run with --pin to re-pin it')
+        fixtures[file] = data
+    return fixtures
+
+def stages(fixtures: dict[str, bytes], tag: str) -> dict[str, callable]:
+    """
+    Map the name of each stage of the pipeline to a function that runs it on the fixtures.
+    Inputs of later stages are prepared up front, so each stage is measured on its own.
+    Stages that need Scintilla's HTML documentation are left out unless it has been pinned.
+    """
+    text = {file: data.decode('utf-8') for file, data in fixtures.items()}
+    iface_path = os.path.join(FIXTURE_DIR, 'Scintilla.iface')
+    face = Face.Face(typed=True)
+    face.ReadFromFile(iface_path)
+    style = CommentLineStyle()
+    headers = {enum: text[os.path.basename(sources.for_tag(tag)[key])]
+               for enum, key in generate_menu_ids.HEADERS.items()}
+
+    with open(GATEWAY, 'r', encoding='utf-8-sig') as gateway:
+        template = gateway.read()
+    gateway_lines = (generate_iface.printLexGatewayFile(face, style),)
+
+    def parse_face():
+        f = Face.Face(typed=True)
+        f.ReadFromFile(iface_path)
+        return f
+
+    pipeline = {
+        'face.ReadFromFile': parse_face,
+        'iface.printLexGatewayFile': lambda: generate_iface.printLexGatewayFile(face, style),
+        'iface.printLexIGatewayFile': lambda: generate_iface.printLexIGatewayFile(face, style),
+        'iface.printEnumDefinitions': lambda: generate_iface.printEnumDefinitions(face, style),
+        'filegen.CopyWithInsertion':
+            lambda: FileGenerator.CopyWithInsertion(template, '/* ', True, gateway_lines, '\r\n'),
+        'headers.scan_c_header': lambda: list(u.scan_c_header(StringIO(text['Scintilla.h']))),
+        'headers.menu_ids': lambda: generate_menu_ids.render(headers, tag),
+    }
+    if 'ScintillaDoc.html' not in text:
+        return pipeline
+
+    defs = ScintillaDefinitions().parse(text['ScintillaDoc.html'])
+    comments = ScintillaDefinitions(defs).describe_many(list(defs))
+    pipeline.update({
+        'docs.parse': lambda: ScintillaDefinitions().parse(text['ScintillaDoc.html']),
+        'docs.describe_many': lambda: ScintillaDefinitions(defs).describe_many(list(defs)),
+        'headers.sci_msgs':
+            lambda: generate_sci_msgs.render(StringIO(text['Scintilla.h']), text['version.txt'], comments),
+    })
+    return pipeline
+
+def measure(stage: callable, repeat=5) -> dict:
+    """
+    Return the best and mean wall time of a stage, the peak memory it traces,
+    and the number of memory blocks still allocated for its result.
+    """
+    stage() # warm up caches and lazy imports
+    number = 1
+    while min(timeit.repeat(stage, number=number, repeat=1)) < 0.2 and number < 1000:
+        number *= 2
+    times = [t / number for t in timeit.repeat(stage, number=number, repeat=repeat)]
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = stage()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    retained = sum(stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0)
+    del result
+    return {
+        'best_s': min(times),
+        'mean_s': sum(times) / len(times),
+        'peak_bytes': peak,
+        'retained_blocks': retained,
+    }
+
+def run(selected=None, repeat=5) -> dict:
+    """
+    Measure every stage, or the selected ones, and return a report.
+    """
+    manifest = load_manifest()
+    fixtures = load_fixtures(manifest)
+    pipeline = stages(fixtures, manifest['tag'])
+    results = {}
+    for name, stage in pipeline.items():
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        results[name] = measure(stage, repeat)
+        print(f"{name:<30}{results[name]['best_s'] * 1000:10.3f} ms"
+              f"{results[name]['peak_bytes'] / 1024:12.1f} KiB peak"
+              f"{results[name]['retained_blocks']:>10} blocks", file=sys.stderr)
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'fixtures': {file: fixture['sha256'] for file, fixture in manifest['fixtures'].items()},
+        'stages': results,
+    }
+
+def compare(report: dict, baseline: dict, tolerance=TOLERANCE) -> list[str]:
+    """
+    Return a description of every stage that got slower or used more memory than its baseline allows.
+    """
+    if report['fixtures'] != baseline.get('fixtures'):
+        print('Baseline was measured on other fixtures; skipping comparison', file=sys.stderr)
+        return []
+
+    regressions = []
+    for name, result in report['stages'].items():
+        base = baseline.get('stages', {}).get(name)
+        if base is None:
+            continue
+        for metric in ['best_s', 'peak_bytes']:
+            if metric == 'best_s' and result[metric] - base[metric] < MIN_SLOWDOWN_S:
+                continue
+            if base[metric] and result[metric] > base[metric] * (1 + tolerance):
+                regressions.append(f'{name}: {metric} {base[metric]:.6g} -> {result[metric]:.6g} '
+                                   f'(+{(result[metric] / base[metric] - 1) * 100:.0f}%)')
+    return regressions
+
+# -------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the code generation pipeline on pinned fixtures.')
+    parser.add_argument('stages', nargs='*', help='only run stages whose names start with these prefixes')
+    parser.add_argument('--pin', action='store_true', help='copy the fixtures from the resource cache and exit')
+    parser.add_argument('--tag', default=sources.TAG, help=f'Notepad++ version to pin (default: {sources.TAG})')
+    parser.add_argument('--offline', action='store_true', help='pin only from what is already cached')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per stage')
+    parser.add_argument('--output', help='write the JSON report to this file instead of standard output')
+    parser.add_argument('--baseline', help='compare with the JSON report in this file')
+    parser.add_argument('--save-baseline', action='store_true', help='overwrite the baseline with this report')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help=f'relative increase that counts as a regression (default: {TOLERANCE})')
+    ARGS = parser.parse_args()
+
+    if ARGS.pin:
+        if ARGS.offline:
+            cache.set_offline()
+        sys.exit(0 if pin(ARGS.tag) else 1)
+
+    # measurements never touch the network
+    cache.set_offline()
+    try:
+        REPORT = run(ARGS.stages, ARGS.repeat)
+    except IOError as err:
+        print(str(err), file=sys.stderr)
+        sys.exit(2)
+
+    OUTPUT = json.dumps(REPORT, indent=1) + '\n'
+    if ARGS.output:
+        FileGenerator.WriteFileAtomically(ARGS.output, OUTPUT.encode('utf-8'))
+    else:
+        print(OUTPUT, end='')
+
+    REGRESSIONS = []
+    if ARGS.baseline:
+        if ARGS.save_baseline:
+            FileGenerator.WriteFileAtomically(ARGS.baseline, OUTPUT.encode('utf-8'))
+        elif os.path.exists(ARGS.baseline):
+            with open(ARGS.baseline, 'r', encoding='utf-8') as baseline_file:
+                REGRESSIONS = compare(REPORT, json.load(baseline_file), ARGS.tolerance)
+        else:
+            print(f'No baseline at {ARGS.baseline}; run with --save-baseline to create it', file=sys.stderr)
+
+    for regression in REGRESSIONS:
+        print(f'Regression: {regression}', file=sys.stderr)
+    sys.exit(1 if REGRESSIONS else 0)
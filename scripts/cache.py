@@ -0,0 +1,431 @@
+"""
+ SPDX-FileCopyrightText: (c) 2026 Robert Di Pardo
+ SPDX-License-Identifier: 0BSD
+"""
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http import client
+from urllib import request, error as urllib_error
+
+from sources import TAG
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+__all__ = [
+    'ResourceCache', 'default_cache', 'get_resource', 'set_offline', 'strip_offline_flag',
+    'artifact_key', 'load_artifact', 'store_artifact',
+]
+
+def _user_cache_dir() -> str:
+    """
+    Return the directory where the current user's cached files belong.
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    return os.path.join(base, 'npp.dotnet.plugin')
+
+# Where cached resources are kept, unless overridden by the environment
+CACHE_DIR = os.environ.get('NPP_DOTNET_CACHE_DIR', _user_cache_dir())
+
+# Upper bound on the total size of cached content, in bytes
+MAX_BYTES = int(os.environ.get('NPP_DOTNET_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+
+# Seconds a cached entry is used as-is before it is revalidated upstream
+MAX_AGE = int(os.environ.get('NPP_DOTNET_CACHE_MAX_AGE', 24 * 60 * 60))
+
+# When set, only cached content is used and no connection is ever attempted
+OFFLINE = os.environ.get('NPP_DOTNET_OFFLINE', '') not in ['', '0']
+
+_INDEX = 'index.json'
+_INDEX_LOCK = 'index.lock'
+_OBJECTS = 'objects'
+_ARTIFACTS = 'artifacts'
+
+class ResourceCache():
+    """
+    A content-addressed store of Web resources, keyed by URL and source tag.
+
+    Each entry in the index records the SHA-256 digest of the resource's content, which is
+    also the name of the blob holding it, so identical resources from different tags are only
+    stored once. Blobs are verified against their digest on every read.
+
+    Several processes may share a cache: the index on disk is only changed under an inter-process
+    lock, by merging this process's changes into whatever is there. Access times are only recorded
+    in memory when entries are read, and merged in when the index is next written, or at exit.
+    """
+    def __init__(self, root=CACHE_DIR, max_bytes=MAX_BYTES, max_age=MAX_AGE, offline=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.offline = OFFLINE if offline is None else offline
+        self.lock = threading.RLock()
+        self.entries = None
+        self.touched = {}
+        self.flush_at_exit = False
+
+    @staticmethod
+    def key(url: str, tag=TAG) -> str:
+        """
+        Return the index key of the given resource.
+        """
+        return hashlib.sha256(f'{tag}\n{url}'.encode('utf-8')).hexdigest()
+
+    def get(self, url: str, tag=TAG) -> str:
+        """
+        Return the content of the given resource, downloading it only if not cached or stale.
+        """
+        data = self.get_bytes(url, tag)
+        return data.decode('utf-8') if data is not None else ''
+
+    def get_bytes(self, url: str, tag=TAG):
+        """
+        Return the raw content of the given resource, or ``None`` if it can't be obtained.
+        """
+        key = self.key(url, tag)
+        with self.lock:
+            entry = self._load_index().get(key)
+            if entry is None:
+                # another process may have fetched it since the index was read
+                self.entries = self._read_index()
+                entry = self.entries.get(key)
+            data = self._read_blob(entry) if entry else None
+
+        if data is not None and (self.offline or time.time() - entry['fetched'] < self.max_age):
+            self._touch(key)
+            return data
+
+        if self.offline:
+            print(f'Offline: no cached copy of {url} for {tag}', file=sys.stderr)
+            return None
+
+        headers = {}
+        if data is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            with request.urlopen(request.Request(url, headers=headers)) as response:
+                if response.status != 200:
+                    print(f'Got response [{response.status}] requesting {url}', file=sys.stderr)
+                    return data
+                body = response.read()
+                self.put(url, tag, body,
+                         etag=response.headers.get('ETag'),
+                         last_modified=response.headers.get('Last-Modified'))
+                return body
+
+        except urllib_error.HTTPError as err:
+            if err.code == 304 and data is not None:
+                self._touch(key, revalidated=True)
+                return data
+            print(repr(err), file=sys.stderr)
+        except (urllib_error.URLError, client.IncompleteRead, OSError) as err:
+            print(repr(err), file=sys.stderr)
+
+        # serve a stale copy rather than nothing
+        return data
+
+    def put(self, url: str, tag, data: bytes, etag=None, last_modified=None):
+        """
+        Store the given content and index it under the resource's key.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        now = time.time()
+        entry = {
+            'url': url,
+            'tag': tag,
+            'sha256': digest,
+            'size': len(data),
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched': now,
+            'accessed': now,
+        }
+        key = self.key(url, tag)
+
+        def update(entries):
+            # the blob is written under the lock, so no other process can evict it before it's indexed
+            blob = self._blob_path(digest)
+            if not os.path.exists(blob):
+                _make_private_dirs(self.root, _OBJECTS, digest[:2])
+                _write_atomic(blob, data)
+            entries[key] = entry
+            self.touched.pop(key, None)
+
+        self._update_index(update)
+
+    def clear(self):
+        """
+        Drop every cached resource.
+        """
+        def update(entries):
+            for digest in {e['sha256'] for e in entries.values()}:
+                self._remove_blob(digest)
+            entries.clear()
+            self.touched.clear()
+
+        self._update_index(update)
+
+    def flush(self):
+        """
+        Record the access times of the entries read since the index was last written.
+        """
+        with self.lock:
+            if self.touched:
+                self._update_index(lambda entries: None)
+
+    def _evict(self, entries: dict):
+        """
+        Drop the least recently used entries until the cache fits in ``max_bytes``.
+        """
+        sizes = {e['sha256']: e['size'] for e in entries.values()}
+        total = sum(sizes.values())
+        for key, entry in sorted(entries.items(), key=lambda kv: kv[1]['accessed']):
+            if total <= self.max_bytes:
+                break
+            del entries[key]
+            digest = entry['sha256']
+            if all(e['sha256'] != digest for e in entries.values()):
+                total -= sizes[digest]
+                self._remove_blob(digest)
+
+    def _touch(self, key: str, revalidated=False):
+        with self.lock:
+            now = time.time()
+            self.touched[key] = (now, now if revalidated else None)
+            entry = self._load_index().get(key)
+            if entry:
+                entry['accessed'] = now
+                if revalidated:
+                    entry['fetched'] = now
+            if not self.flush_at_exit:
+                self.flush_at_exit = True
+                atexit.register(self.flush)
+
+    def _read_blob(self, entry):
+        """
+        Return the content of the given entry's blob if it's intact, otherwise ``None``.
+        """
+        try:
+            with open(self._blob_path(entry['sha256']), 'rb') as blob:
+                data = blob.read()
+        except OSError:
+            return None
+
+        if hashlib.sha256(data).hexdigest() != entry['sha256']:
+            print(f"Discarding corrupt cache entry for {entry['url']}", file=sys.stderr)
+            self._remove_blob(entry['sha256'])
+            return None
+
+        return data
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, _OBJECTS, digest[:2], digest)
+
+    def _remove_blob(self, digest: str):
+        try:
+            os.unlink(self._blob_path(digest))
+        except OSError:
+            pass
+
+    def _load_index(self) -> dict:
+        if self.entries is None:
+            self.entries = self._read_index()
+        return self.entries
+
+    def _read_index(self) -> dict:
+        try:
+            with open(os.path.join(self.root, _INDEX), 'r', encoding='utf-8') as index:
+                return json.load(index)
+        except (OSError, ValueError):
+            return {}
+
+    def _update_index(self, update: callable):
+        """
+        Apply the given change, and any access times recorded since the last write, to the index on disk,
+        as it is now that no other process can change it; then evict what no longer fits and save the result.
+        """
+        with self.lock:
+            try:
+                _make_private_dirs(self.root)
+                with _FileLock(os.path.join(self.root, _INDEX_LOCK)):
+                    entries = self._read_index()
+                    update(entries)
+                    for key, (accessed, fetched) in self.touched.items():
+                        entry = entries.get(key)
+                        if entry:
+                            entry['accessed'] = max(entry['accessed'], accessed)
+                            if fetched:
+                                entry['fetched'] = max(entry['fetched'], fetched)
+                    self.touched.clear()
+                    self._evict(entries)
+                    _write_atomic(os.path.join(self.root, _INDEX),
+                                  json.dumps(entries, indent=1, sort_keys=True).encode('utf-8'))
+                    self.entries = entries
+            except OSError as err:
+                print(repr(err), file=sys.stderr)
+
+class _FileLock():
+    """
+    An exclusive lock on a file, held by at most one process at a time.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.path, 'a+b')
+        if os.name == 'nt':
+            self.file.seek(0)
+            # LK_LOCK gives up after 10 attempts a second apart
+            while True:
+                try:
+                    msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *_):
+        try:
+            if os.name == 'nt':
+                self.file.seek(0)
+                msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self.file.close()
+
+# -------------------------------------------------------------------
+_DEFAULT_CACHE = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+def default_cache() -> ResourceCache:
+    """
+    Return the cache shared by all generators.
+    """
+    global _DEFAULT_CACHE
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = ResourceCache()
+    return _DEFAULT_CACHE
+
+def get_resource(resource: str, tag=TAG) -> str:
+    """
+    Return the content of a Web resource, from the shared cache if possible.
+    """
+    return default_cache().get(resource, tag)
+
+def set_offline(offline=True):
+    """
+    Enable or disable offline mode for the shared cache.
+    """
+    global OFFLINE
+    OFFLINE = offline
+    default_cache().offline = offline
+
+def strip_offline_flag(argv: list[str]) -> list[str]:
+    """
+    Enable offline mode if ``--offline`` is among the given arguments and return the rest.
+    """
+    if '--offline' in argv:
+        set_offline()
+    return [arg for arg in argv if arg != '--offline']
+
+def artifact_key(content: bytes, *producers: str) -> str:
+    """
+    Return a key identifying whatever the given modules derive from the given content.
+    The key changes whenever the content or the source of any producer does.
+    """
+    digest = hashlib.sha256(content)
+    for module_path in producers:
+        with open(module_path, 'rb') as module:
+            digest.update(hashlib.sha256(module.read()).digest())
+    return digest.hexdigest()
+
+def load_artifact(key: str, root=CACHE_DIR):
+    """
+    Return the data stored under the given key, or ``None`` if there isn't a usable one.
+    Artifacts are plain JSON, and are only read from directories that no other user can write to.
+    """
+    path = os.path.join(root, _ARTIFACTS, f'{key}.json')
+    if not os.path.exists(path):
+        return None
+    if not all(_is_private(p) for p in [root, os.path.dirname(path), path]):
+        print(f'Ignoring cached artifact {key}: {os.path.dirname(path)} is writable by other users', file=sys.stderr)
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as artifact:
+            return json.load(artifact)
+    except (OSError, ValueError) as err:
+        print(f'Discarding cached artifact {key}: {err!r}', file=sys.stderr)
+    return None
+
+def store_artifact(key: str, data, root=CACHE_DIR):
+    """
+    Store the given plain data (dicts, lists, strings, numbers) under the given key.
+    """
+    try:
+        _make_private_dirs(root, _ARTIFACTS)
+        _write_atomic(os.path.join(root, _ARTIFACTS, f'{key}.json'),
+                      json.dumps(data, separators=(',', ':')).encode('utf-8'))
+    except (OSError, TypeError, ValueError) as err:
+        print(repr(err), file=sys.stderr)
+
+def _make_private_dirs(root: str, *parts: str):
+    """
+    Create the given directory under ``root``, and ``root`` itself, readable only by the current user.
+    """
+    os.makedirs(root, mode=0o700, exist_ok=True)
+    path = root
+    for part in parts:
+        path = os.path.join(path, part)
+        os.makedirs(path, mode=0o700, exist_ok=True)
+
+def _is_private(path: str) -> bool:
+    """
+    Return ``True`` if the given path belongs to the current user and nobody else can write to it.
+    Windows keeps per-user directories private through their ACLs instead.
+    """
+    if os.name == 'nt':
+        return True
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+def _write_atomic(path: str, data: bytes):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            out.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        os.unlink(tmp)
+        raise
+
+# -------------------------------------------------------------------
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'clear':
+        default_cache().clear()
+        shutil.rmtree(os.path.join(CACHE_DIR, _ARTIFACTS), ignore_errors=True)
+    else:
+        for _, v in sorted(default_cache()._load_index().items(), key=lambda kv: kv[1]['url']):
+            print(f"{v['tag']}\t{v['size']:>9}\t{v['sha256'][:12]}\t{v['url']}")
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+ SPDX-FileCopyrightText: (c) 2026 Robert Di Pardo
+ SPDX-License-Identifier: 0BSD
+
+Report the API changes between two versions of Scintilla.iface.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import NamedTuple
+
+import cache
+import sources
+from generate_iface import parseFace
+from scintilla import Face
+
+# Fields that make up a feature's calling convention
+TYPE_FIELDS = ('FeatureType', 'ReturnType', 'Param1Type', 'Param1Name', 'Param2Type', 'Param2Name')
+
+class Change(NamedTuple):
+    """
+    A feature present in both versions, with what it was and what it became.
+    """
+    name: str
+    old: str
+    new: str
+
+class FaceDiff():
+    """
+    The features added to, removed from and changed between two versions of an interface.
+    """
+    def __init__(self, old: Face.Face, new: Face.Face):
+        self.added = [name for name in new.order if name not in old.features]
+        self.removed = [name for name in old.order if name not in new.features]
+        self.retyped = []
+        self.recategorised = []
+        self.renumbered = []
+        self.redocumented = []
+        self.values = {name: new.features[name].get('Value', '') for name in new.order}
+        self.values.update({name: old.features[name].get('Value', '') for name in self.removed})
+
+        for name in new.order:
+            was = old.features.get(name)
+            now = new.features[name]
+            # nearly every feature is unchanged, so compare whole records first
+            if was is None or was == now:
+                continue
+
+            if any(was.get(field) != now.get(field) for field in TYPE_FIELDS):
+                self.retyped.append(Change(name, describe(name, was), describe(name, now)))
+            if was.get('Category') != now.get('Category'):
+                self.recategorised.append(Change(name, was.get('Category', ''), now.get('Category', '')))
+            if was.get('Value') != now.get('Value'):
+                self.renumbered.append(Change(name, was.get('Value', ''), now.get('Value', '')))
+            if was.get('Comment') != now.get('Comment'):
+                self.redocumented.append(Change(name, '\n'.join(was.get('Comment', [])), '\n'.join(now.get('Comment', []))))
+
+    def __bool__(self):
+        return any(self.sections().values())
+
+    def sections(self) -> dict[str, list]:
+        """
+        Map the kinds of change to the features they apply to.
+        """
+        return {
+            'added': self.added,
+            'removed': self.removed,
+            'retyped': self.retyped,
+            'recategorised': self.recategorised,
+            'renumbered': self.renumbered,
+            'redocumented': self.redocumented,
+        }
+
+    def changed(self) -> set[str]:
+        """
+        Return the names of all features listed in any section of the report.
+        """
+        names = set(self.added) | set(self.removed)
+        for kind in [self.retyped, self.recategorised, self.renumbered, self.redocumented]:
+            names.update(change.name for change in kind)
+        return names
+
+    def to_json(self) -> dict:
+        """
+        Return the changes as plain data, with the iface value of every feature involved.
+        """
+        report = {}
+        for kind, entries in self.sections().items():
+            report[kind] = [
+                {'name': entry, 'value': self.values[entry]} if isinstance(entry, str) else
+                {'name': entry.name, 'value': self.values[entry.name], 'old': entry.old, 'new': entry.new}
+                for entry in entries
+            ]
+        return report
+
+    def changelog(self) -> str:
+        """
+        Summarise the changes as a Markdown list.
+        """
+        lines = []
+        for name in self.added:
+            lines.append(f'- Added `{name}` ({self.values[name]})')
+        for name in self.removed:
+            lines.append(f'- Removed `{name}` ({self.values[name]})')
+        for change in self.retyped:
+            lines.append(f'- Changed `{change.old}` to `{change.new}`')
+        for change in self.recategorised:
+            lines.append(f'- `{change.name}` is now {change.new or "stable"} (was {change.old or "stable"})')
+        for change in self.renumbered:
+            lines.append(f'- Renumbered `{change.name}` from {change.old} to {change.new}')
+        for change in self.redocumented:
+            lines.append(f'- Updated the description of `{change.name}`')
+        return '\n'.join(lines)
+
+def describe(name: str, feature) -> str:
+    """
+    Render a feature's declaration the way it's written in Scintilla.iface.
+    """
+    if feature['FeatureType'] not in ['fun', 'get', 'set', 'evt']:
+        return f"{feature['FeatureType']} {name}"
+
+    params = ', '.join(
+        f"{feature.get(f'Param{i}Type', '')} {feature.get(f'Param{i}Name', '')}".strip() for i in [1, 2])
+    return f"{feature['FeatureType']} {feature.get('ReturnType', '')} {name}({params})"
+
+def load_face(source: str) -> Face.Face:
+    """
+    Parse the Scintilla.iface at the given path, or the upstream one of the given Notepad++ tag.
+    """
+    if os.path.isfile(source):
+        with open(source, 'rb') as iface:
+            return parseFace(iface.read(), typed=True)
+
+    url = sources.for_tag(source)['SCINTILLA_IFACE']
+    iface = cache.default_cache().get_bytes(url, source)
+    if iface is None:
+        raise IOError(f'Failed to get {url}')
+    return parseFace(iface, typed=True)
+
+# -------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Report the API changes between two versions of Scintilla.iface.')
+    parser.add_argument('old', help='path to the old Scintilla.iface, or a Notepad++ tag')
+    parser.add_argument('new', nargs='?', default=sources.TAG,
+                        help=f'path to the new Scintilla.iface, or a Notepad++ tag (default: {sources.TAG})')
+    parser.add_argument('--json', action='store_true', help='print the changes as JSON')
+    parser.add_argument('--offline', action='store_true', help='only use cached upstream sources')
+    ARGS = parser.parse_args()
+
+    if ARGS.offline:
+        cache.set_offline()
+
+    try:
+        DIFF = FaceDiff(load_face(ARGS.old), load_face(ARGS.new))
+    except IOError as err:
+        print(str(err), file=sys.stderr)
+        sys.exit(2)
+
+    if ARGS.json:
+        print(json.dumps(DIFF.to_json(), indent=1))
+    elif DIFF:
+        print(DIFF.changelog())
+    sys.exit(1 if DIFF else 0)
@@ -10,16 +10,18 @@ SPDX-FileCopyrightText:  2016 Justin Dailey <https://github.com/dail8859>
 
 SPDX-License-Identifier: Apache-2.0
 """
+import argparse
 import os
-import subprocess
 import sys
-import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import cache
 import deprecated
 import specs
 from scintilla import Face, FileGenerator
 from sources import SCINTILLA_IFACE
-from get_sci_doc import CommentLineStyle, get_resource, xmlify
+from get_sci_doc import CommentLineStyle, ScintillaDefinitions, xmlify
 
 _TAB = ' ' * 4
 
@@ -48,15 +50,20 @@ def translateType(t):
         'keymod': 'KeyModifier',
     }).get(t, t)
 
-def appendComment(style: CommentLineStyle, out, v):
-    """Format API descriptions in .NET comment doc style."""
-    if 'Comment' in v:
-        if len (v['Comment']) == 1 and len (v['Comment'][0]) < 120:
-            out.append(style.format(f'<summary>{xmlify(v["Comment"][0])} (Scintilla feature {v["Value"]})</summary>'))
+def appendComment(style: CommentLineStyle, out, v, summary=''):
+    """
+    Format API descriptions in .NET comment doc style.
+    A ``summary`` already rendered from Scintilla's HTML documentation takes precedence over the iface comment.
+    """
+    if summary:
+        out.extend(summary.splitlines())
+    elif 'Comment' in v:
+        if len (v.Comment) == 1 and len (v.Comment[0]) < 120:
+            out.append(style.format(f'<summary>{xmlify(v.Comment[0])} (Scintilla feature {v.Value})</summary>'))
         else:
             out.append(style.format('<summary>'))
-            out.extend([style.format(xmlify(line)) for line in v['Comment']])
-            out.append(style.format(f'(Scintilla feature {v["Value"]})'))
+            out.extend([style.format(xmlify(line)) for line in v.Comment])
+            out.append(style.format(f'(Scintilla feature {v.Value})'))
             out.append(style.format('</summary>'))
 
 def getExceptionDoc(style: CommentLineStyle, reason, exception='ArgumentException'):
@@ -85,7 +92,7 @@ def translateReturnType(v, param1Type, param2Type):
     """Get the CLR type of the API's return value."""
     return 'string' \
         if param1Type == 'stringresult' or param2Type == 'stringresult' \
-        else translateType(v['ReturnType'])
+        else translateType(v.ReturnType)
 
 def getParameterList(param1Type, param1Name, param2Type, param2Name):
     """Format the API's parameter list."""
@@ -94,35 +101,226 @@ def getParameterList(param1Type, param1Name, param2Type, param2Name):
     separator = ', ' if first and second else ''
     return first + separator + second
 
-def printLexGatewayFile(f: Face, style: CommentLineStyle):
-    """Generate the interface implementation source file."""
-# -------------------------------------------------------------------
-    def translateVariableAccess(name, t, wparam=False):
-        """Get the CLR type of a marshalled parameter."""
-        if not bool(name):
-            return 'UnusedW' if wparam else 'Unused'
-        res = name
-        usign = 'U' if wparam else ''
-        if t == 'bool':
-            return f'new {usign}IntPtr({res} ? 1{usign} : 0{usign})'
-        if t in ['string', 'stringresult', 'Cells']:
-            return f'({usign}IntPtr){res}Ptr'
-        if t in ['Colour', 'ColourAlpha', 'KeyModifier']:
-            res = f'({usign}IntPtr){res}.Value'
-        elif t in ['TextRangeFull', 'TextToFindFull']:
-            res += '.NativePointer'
-        else:
-            res = f'({usign}IntPtr){res}'
-        return res
-# -------------------------------------------------------------------
+def translateVariableAccess(name, t, wparam=False):
+    """Get the CLR type of a marshalled parameter."""
+    if not bool(name):
+        return 'UnusedW' if wparam else 'Unused'
+    res = name
+    usign = 'U' if wparam else ''
+    if t == 'bool':
+        return f'new {usign}IntPtr({res} ? 1{usign} : 0{usign})'
+    if t in ['string', 'stringresult', 'Cells']:
+        return f'({usign}IntPtr){res}Ptr'
+    if t in ['Colour', 'ColourAlpha', 'KeyModifier']:
+        res = f'({usign}IntPtr){res}.Value'
+    elif t in ['TextRangeFull', 'TextToFindFull']:
+        res += '.NativePointer'
+    else:
+        res = f'({usign}IntPtr){res}'
+    return res
+
+def getResultWParam(name, param1Type, firstArg):
+    """Get the WPARAM sent with a message that copies a string into a buffer, if there is one."""
+    if param1Type in ['Position', 'string', 'int'] or \
+        (name not in specs.INFERS_TEXT_LENGTH and bool(firstArg) and firstArg.rfind('Unused') < 0):
+        return firstArg
+    return ''
+
+def getParameterTypes(parameterList):
+    """Get the CLR types of a formatted parameter list, including any `out` modifiers."""
+    return [' '.join(param.split()[:-1]) for param in parameterList.split(', ') if param]
+
+def getCref(name, parameterList):
+    """Format a reference to the overload of an API with the given parameter list."""
+    types = ', '.join(t.replace('<', '{').replace('>', '}') for t in getParameterTypes(parameterList))
+    return f'{name}({types})'
+
+def getByteOverloads(name, returnType, param1Type, param1Name, param2Type, param2Name):
+    """
+    Get the overloads of an API that exchange its text as raw bytes instead of a .NET string,
+    as tuples of their return type, parameter list, implementation and the doc string of their result.
+    The type of a length parameter that is inferred from the text must already be cleared.
+    """
+    featureConstant = f'SciMsg.SCI_{name.upper()}'
+    if name in deprecated.STUBS:
+        return []
+
+    if 'stringresult' in [param1Type, param2Type]:
+        leading = f'{param1Type} {param1Name}, ' if param1Type and param1Type != 'stringresult' else ''
+        wParam = getResultWParam(name, param1Type, translateVariableAccess(param1Name, param1Type, True))
+        wParam = f', {wParam}' if wParam else ''
+        return [
+            ('int', f'{leading}Span<byte> destination',
+             f'GetBytesFromMessageThatReturnsLength({featureConstant}, destination{wParam})',
+             '<returns>The number of bytes copied to <paramref name="destination"/>, '
+             'not counting the terminating NUL.</returns>'),
+            ('int', f'{leading}IBufferWriter<byte> writer',
+             f'WriteBytesFromMessageThatReturnsLength({featureConstant}, writer{wParam})',
+             '<returns>The number of bytes written to <paramref name="writer"/>.</returns>'),
+            ('byte[]', f'{leading}ArrayPool<byte> pool, out int length',
+             f'RentBytesFromMessageThatReturnsLength({featureConstant}, pool, out length{wParam})',
+             '<returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes '
+             'of the result. Return it to the pool when done.</returns>'),
+        ]
+
+    if param2Type == 'TextRangeFull' and not param1Type:
+        cellSize = specs.CELL_SIZES.get(name, 1)
+        return [
+            ('int', 'Position start, Position end, Span<byte> destination',
+             f'GetBytesInRange({featureConstant}, start, end, destination, {cellSize})',
+             '<returns>The number of bytes copied to <paramref name="destination"/>, '
+             'not counting the terminating NULs.</returns>'),
+            ('int', 'Position start, Position end, IBufferWriter<byte> writer',
+             f'WriteBytesInRange({featureConstant}, start, end, writer, {cellSize})',
+             '<returns>The number of bytes written to <paramref name="writer"/>.</returns>'),
+            ('byte[]', 'Position start, Position end, ArrayPool<byte> pool, out int length',
+             f'RentBytesInRange({featureConstant}, start, end, pool, out length, {cellSize})',
+             '<returns>A buffer rented from <paramref name="pool"/>, holding <paramref name="length"/> bytes '
+             'of the result. Return it to the pool when done.</returns>'),
+        ]
+
+    if name in specs.INFERS_TEXT_LENGTH and not param1Type and param2Type == 'string':
+        return [
+            (returnType, f'ReadOnlySpan<byte> {param2Name}', f'SendBytes({featureConstant}, {param2Name})',
+             f'<remarks>The bytes of <paramref name="{param2Name}"/> are sent as they are, without encoding.</remarks>'),
+        ]
+
+    return []
+
+def getBulkName(name):
+    """Name the bulk variant of a per-position getter, e.g. `GetStylesInRange` for `GetStyleAt`."""
+    stem = name[:-2] if name.endswith('At') else name
+    stem = stem[:-5] + 'Indices' if stem.endswith('Index') else stem + 's'
+    return f'{stem}InRange'
+
+def getBulkVariant(f: Face, name, returnType, param1Type, param1Name, param2Type, param2Name):
+    """
+    Detect a getter that takes a single position and returns a scalar, and get the variant that fills
+    a span with its values at consecutive positions, as a tuple of its name, parameter list and statements.
+    An `int` selector before the position, as in `IndicatorValueAt`, is passed through unchanged.
+    """
+    v = f.features[name]
+    if name in deprecated.STUBS or name in deprecated.MESSAGES or v.Category == 'Deprecated' or \
+        not (v.FeatureType == 'get' or name.endswith('At')) or returnType not in ['int', 'Position']:
+        return None
+
+    if v.Param1Type == 'position' and not param2Type:
+        leading, wParam, lParam = '', '(UIntPtr)(start + i)', 'Unused'
+    elif param1Type == 'int' and v.Param2Type == 'position':
+        leading, wParam, lParam = f'int {param1Name}, ', f'(UIntPtr){param1Name}', '(IntPtr)(start + i)'
+    else:
+        return None
+
+    if name in specs.BULK_COPIES:
+        return (getBulkName(name), f'{leading}Position start, Span<byte> destination',
+                [f'{specs.BULK_COPIES[name]}(start, destination);'])
+
+    value = f'Send(SciMsg.SCI_{name.upper()}, {wParam}, {lParam})'
+    return (getBulkName(name), f'{leading}Position start, Span<{returnType}> destination', [
+        'for (int i = 0; i < destination.Length; i++)',
+        '{',
+        f'{_TAB}destination[i] = {"(int)" if returnType == "int" else ""}{value};',
+        '}',
+    ])
+
+def renderBulkVariant(style: CommentLineStyle, name, bulk, original):
+    """
+    Generate the implementation of a per-position getter's bulk variant,
+    which is only available where the CLR has spans.
+    """
+    if not bulk:
+        return []
+
+    bulkName, params, body = bulk
+    out = ['', '#if NETCOREAPP']
+    out.append(style.format('<summary>'))
+    out.append(style.format(f'Bulk variant of <see cref="{original}"/>: gets its value at each position from '
+                            '<paramref name="start"/> on, one per element of <paramref name="destination"/>.'))
+    out.append(style.format('</summary>'))
+    out.append(f'{style.indent}public void {bulkName}({params})')
+    out.append(style.indent + '{')
+    out.extend(f'{style.indent}{_TAB}{line}' for line in body)
+    out.append(style.indent + '}')
+    out.append('#endif')
+    return out
+
+def appendArgumentChecks(style: CommentLineStyle, name, param1Name, out):
+    """Validate arguments that Scintilla doesn't."""
+    if name == 'GetTag':
+        out.append(f'{style.indent}if ({param1Name} < 0)')
+        out.append(style.indent + '{')
+        style.indent += _TAB
+        out.append(f'{style.indent}throw new ArgumentException("{param1Name} must be non-negative integer");')
+        style.indent = style.indent[len(_TAB):]
+        out.append(style.indent + '}')
+
+def renderByteOverloads(f: Face, style: CommentLineStyle, name, param1Type, param1Name, overloads, original):
+    """
+    Generate the implementations of an API's raw byte overloads,
+    which are only available where the CLR has spans and array pools.
+    """
+    out = []
+    if not overloads:
+        return out
+
+    out.append('')
+    out.append('#if NETCOREAPP')
+    for returnType, params, res, resultDoc in overloads:
+        fixed = name in specs.UNSAFE and param1Type == 'string'
+        out.append(style.format(f'<inheritdoc cref="{original}"/>'))
+        out.append(style.format(resultDoc))
+        checkIfDeprecated(f, style, name, out)
+        out.append(f'{style.indent}public {"unsafe " if fixed else ""}{returnType} {name}({params})')
+        out.append(style.indent + '{')
+        style.indent += _TAB
+        appendArgumentChecks(style, name, param1Name, out)
+
+        if fixed:
+            # encode the string argument on the stack, unless it's too long
+            out.append(f'{style.indent}Span<byte> {param1Name}Bytes = EncodeNullTerminated({specs.UNSAFE[name]}, {param1Name}, '
+                       f'stackalloc byte[StackEncodingLength], out byte[] {param1Name}Rented);')
+            out.append(f'{style.indent}try')
+            out.append(style.indent + '{')
+            style.indent += _TAB
+            out.append(f'{style.indent}fixed (byte* {param1Name}Ptr = {param1Name}Bytes)')
+            out.append(style.indent + '{')
+            style.indent += _TAB
+
+        out.append(f'{style.indent}{"return " if returnType != "void" else ""}{res};')
+
+        if fixed:
+            style.indent = style.indent[len(_TAB):]
+            out.append(style.indent + '}')
+            style.indent = style.indent[len(_TAB):]
+            out.append(style.indent + '}')
+            out.append(f'{style.indent}finally')
+            out.append(style.indent + '{')
+            out.append(f'{style.indent}{_TAB}if ({param1Name}Rented != null)')
+            out.append(f'{style.indent}{_TAB}{{')
+            out.append(f'{style.indent}{_TAB * 2}ArrayPool<byte>.Shared.Return({param1Name}Rented);')
+            out.append(f'{style.indent}{_TAB}}}')
+            out.append(style.indent + '}')
+
+        style.indent = style.indent[len(_TAB):]
+        out.append(style.indent + '}')
+        out.append('')
+
+    out[-1] = '#endif'
+    return out
+
+def printLexGatewayFile(f: Face, style: CommentLineStyle, docs=None):
+    """
+    Generate the interface implementation source file.
+    Any ``docs`` map message names to summaries rendered from Scintilla's HTML documentation.
+    """
     out = []
     for name in f.order:
         v = f.features[name]
-        if v['FeatureType'] in ['fun', 'get', 'set']:
-            param1Type = translateType(v['Param1Type'])
-            param1Name = v['Param1Name']
-            param2Type = translateType(v['Param2Type'])
-            param2Name = v['Param2Name']
+        if v.FeatureType in ['fun', 'get', 'set']:
+            param1Type = translateType(v.Param1Type)
+            param1Name = v.Param1Name
+            param2Type = translateType(v.Param2Type)
+            param2Name = v.Param2Name
             returnType = translateReturnType(v, param1Type, param2Type)
 
             # don't clobber custom implementations that are too complex to script
@@ -137,10 +335,10 @@ def printLexGatewayFile(f: Face, style: CommentLineStyle):
                     (param2Name.lower() == 'text' and param2Type in ['string', 'stringresult'])):
                 param1Type = ''
 
-            if v['Category'] == 'Provisional':
+            if v.Category == 'Provisional':
                 out.append('#if !SCI_DISABLE_PROVISIONAL')
 
-            appendComment(style, out, v)
+            appendComment(style, out, v, (docs or {}).get(f'SCI_{name.upper()}', ''))
 
             if name == 'GetTag':
                 out.append(getExceptionDoc(style,'Thrown if <paramref name="tagNumber"/> is less than 0.'))
@@ -159,13 +357,7 @@ def printLexGatewayFile(f: Face, style: CommentLineStyle):
             out.append(style.indent + '{')
             style.indent += _TAB
 
-            if name == 'GetTag':
-                out.append(f'{style.indent}if ({param1Name} < 0)')
-                out.append(style.indent + '{')
-                style.indent += _TAB
-                out.append(f'{style.indent}throw new ArgumentException("{param1Name} must be non-negative integer");')
-                style.indent = style.indent[len(_TAB):]
-                out.append(style.indent + '}')
+            appendArgumentChecks(style, name, param1Name, out)
 
             if 'stringresult' in [param1Type, param2Type] and name in specs.UNSAFE:
                 encoding = specs.UNSAFE.get(name, 'Encoding.UTF8')
@@ -193,11 +385,8 @@ def printLexGatewayFile(f: Face, style: CommentLineStyle):
 
             if 'stringresult' in [param1Type, param2Type]:
                 atMethodEnd = True
-                params = ''
-
-                if param1Type in ['Position', 'string', 'int'] or \
-                    (name not in specs.INFERS_TEXT_LENGTH and bool(firstArg) and firstArg.rfind('Unused') < 0):
-                    params = f', {firstArg}'
+                params = getResultWParam(name, param1Type, firstArg)
+                params = f', {params}' if params else ''
 
                 encoding = \
                     'Encoding.UTF8' \
@@ -211,7 +400,7 @@ def printLexGatewayFile(f: Face, style: CommentLineStyle):
                     out.append(style.indent[2*len(_TAB):] + '}')
 
             else:
-                res = f'SendMessage(_scintilla, {featureConstant}, {firstArg}, {secondArg})'
+                res = f'Send({featureConstant}, {firstArg}, {secondArg})'
 
             if (param2Type in ['string', 'RepresentationAppearance'] and \
                     returnType in ['Position', 'void']) or \
@@ -262,6 +451,9 @@ def printLexGatewayFile(f: Face, style: CommentLineStyle):
             elif not atMethodEnd:
                 out.append(f'{style.indent}{res};')
 
+            if name in specs.RESETS_CODEPAGE:
+                out.append(f'{style.indent}ForgetCodePage();')
+
             if param1Type in ['string', 'Cells', 'stringresult']:
                 style.indent = style.indent[len(_TAB):]
 
@@ -273,22 +465,29 @@ def printLexGatewayFile(f: Face, style: CommentLineStyle):
             style.indent = style.indent[len(_TAB):]
             out.append(style.indent + '}')
 
-            if v['Category'] == 'Provisional':
+            params = getParameterList(param1Type, param1Name, param2Type, param2Name)
+            overloads = getByteOverloads(name, returnType, param1Type, param1Name, param2Type, param2Name)
+            out.extend(renderByteOverloads(f, style, name, param1Type, param1Name, overloads, getCref(name, params)))
+
+            bulk = getBulkVariant(f, name, returnType, param1Type, param1Name, param2Type, param2Name)
+            out.extend(renderBulkVariant(style, name, bulk, getCref(name, params) if overloads else name))
+
+            if v.Category == 'Provisional':
                 out.append('#endif')
 
             out.append('')
     return out
 
-def printLexIGatewayFile(f: Face, style: CommentLineStyle):
+def printLexIGatewayFile(f: Face, style: CommentLineStyle, docs=None):
     """Generate the interface definition source file."""
     out = []
     for name in f.order:
         v = f.features[name]
-        if v['FeatureType'] in ['fun', 'get', 'set']:
-            param1Type = translateType(v['Param1Type'])
-            param1Name = v['Param1Name']
-            param2Type = translateType(v['Param2Type'])
-            param2Name = v['Param2Name']
+        if v.FeatureType in ['fun', 'get', 'set']:
+            param1Type = translateType(v.Param1Type)
+            param1Name = v.Param1Name
+            param2Type = translateType(v.Param2Type)
+            param2Name = v.Param2Name
             returnType = translateReturnType(v, param1Type, param2Type)
 
             if (isTypeUnsupported(param1Type) or isTypeUnsupported(param2Type) or isTypeUnsupported(returnType)):
@@ -299,32 +498,59 @@ def printLexIGatewayFile(f: Face, style: CommentLineStyle):
                     (param2Name.lower() == 'text' and param2Type in ['string', 'stringresult'])):
                 param1Type = ''
 
-            if v['Category'] == 'Provisional':
+            if v.Category == 'Provisional':
                 out.append('#if !SCI_DISABLE_PROVISIONAL')
 
-            out.append(style.format(f'<inheritdoc cref="ScintillaGateway.{name}"/>'))
+            params = getParameterList(param1Type, param1Name, param2Type, param2Name)
+            overloads = getByteOverloads(name, returnType, param1Type, param1Name, param2Type, param2Name)
+
+            # name the overload when there are others
+            out.append(style.format(f'<inheritdoc cref="ScintillaGateway.{getCref(name, params) if overloads else name}"/>'))
 
             checkIfDeprecated(f, style, name, out)
 
             out.append(style.indent
                 + f'{getUnsafeModifier(name, returnType, param1Type, param2Type)}'
-                + f'{returnType} {name}({getParameterList(param1Type, param1Name, param2Type, param2Name)});')
+                + f'{returnType} {name}({params});')
+
+            out.extend(renderInterfaceByteOverloads(f, style, name, param1Type, overloads))
 
-            if v['Category'] == 'Provisional':
+            bulk = getBulkVariant(f, name, returnType, param1Type, param1Name, param2Type, param2Name)
+            if bulk:
+                out.extend(['', '#if NETCOREAPP', style.format(f'<inheritdoc cref="ScintillaGateway.{bulk[0]}"/>'),
+                            f'{style.indent}void {bulk[0]}({bulk[1]});', '#endif'])
+
+            if v.Category == 'Provisional':
                 out.append('#endif')
 
             out.append('')
     return out
 
-def printEnumDefinitions(f: Face, style: CommentLineStyle):
+def renderInterfaceByteOverloads(f: Face, style: CommentLineStyle, name, param1Type, overloads):
+    """Generate the declarations of an API's raw byte overloads."""
+    out = []
+    if not overloads:
+        return out
+
+    out.append('')
+    out.append('#if NETCOREAPP')
+    for returnType, params, _, _ in overloads:
+        out.append(style.format(f'<inheritdoc cref="ScintillaGateway.{getCref(name, params)}"/>'))
+        checkIfDeprecated(f, style, name, out)
+        fixed = 'unsafe ' if name in specs.UNSAFE and param1Type == 'string' else ''
+        out.append(f'{style.indent}{fixed}{returnType} {name}({params});')
+        out.append('')
+
+    out[-1] = '#endif'
+    return out
+
+def printEnumDefinitions(f: Face, style: CommentLineStyle, docs=None):
     """Generate enumerated interface constants."""
     out = []
-    for name in f.order:
+    for name in f.featuresByType.get('enu', []):
         v = f.features[name]
-        if v['FeatureType'] == 'enu' and \
-                name not in ['Keys', 'IndicatorStyle', 'ModificationFlags']: # for all except excluded enums [conflicting]
-
-            if v['Category'] == 'Provisional':
+        if name not in ['Keys', 'IndicatorStyle', 'ModificationFlags']: # for all except excluded enums [conflicting]
+            if v.Category == 'Provisional':
                 out.append('#if !SCI_DISABLE_PROVISIONAL')
 
             appendComment(style, out, v)
@@ -335,66 +561,126 @@ def printEnumDefinitions(f: Face, style: CommentLineStyle):
             out.append(f'{style.indent}public enum {name}')
             out.append(style.indent + '{')
 
-            for ename in f.order:
+            prefix = v.Value
+            for ename in f.enumMembers[name]:
                 ve = f.features[ename]
-                prefix = v['Value']
                 startPos = len(prefix)
 
-                if ve['FeatureType'] == 'val' and ename.startswith(prefix):
-                    style.indent += _TAB
-                    checkIfDeprecated(f, style, ename, out)
-                    style.indent = style.indent[len(_TAB):]
+                style.indent += _TAB
+                checkIfDeprecated(f, style, ename, out)
+                style.indent = style.indent[len(_TAB):]
 
-                    if startPos < len(ename) and ename[startPos] == '_':
-                        startPos += 1
+                if startPos < len(ename) and ename[startPos] == '_':
+                    startPos += 1
 
-                    valname = ename[startPos:]
+                valname = ename[startPos:]
 
-                    if valname[0].isdigit():
-                        valname = '_' + valname	# for enums labels such as char encoding
+                if valname[0].isdigit():
+                    valname = '_' + valname	# for enums labels such as char encoding
 
-                    if ve['Value'] == '0xFFFFFFFF':
-                        ve['Value'] = '-1'	# reset back since these are signed enums
+                value = ve.Value
+                if value == '0xFFFFFFFF':
+                    value = '-1'	# reset back since these are signed enums
 
-                    out.append(f'{style.indent}{_TAB}{valname} = {ve["Value"]},')
+                out.append(f'{style.indent}{_TAB}{valname} = {value},')
 
             out[-1] = out[-1].rstrip(',')
             out.append(style.indent + '}')
 
-            if v['Category'] == 'Provisional':
+            if v.Category == 'Provisional':
                 out.append('#endif')
 
             out.append('')
     return out
 
-def generate():
-    """Write the interface to the corresponding C# source files."""
-    templatePath = os.path.join(os.path.dirname(__file__), '..', 'lib', 'Plugin')
-    scintillaIfacePath = os.path.join(tempfile.gettempdir(), 'Scintilla.iface')
+def parseFace(iface: bytes, typed=True) -> Face.Face:
+    """
+    Parse the given Scintilla.iface content, or load the result of parsing identical content before.
+    Features are typed records unless ``typed`` is false; the generators read their fields as attributes.
+    """
+    key = cache.artifact_key(iface, Face.__file__)
+    data = cache.load_artifact(key)
+    if isinstance(data, dict):
+        try:
+            return Face.Face.FromData(data, typed)
+        except (KeyError, TypeError):
+            pass
+    f = Face.Face(typed)
+    f.Parse(iface)
+    cache.store_artifact(key, f.ToData())
+    return f
+
+# Source files generated from Scintilla.iface, mapped to their generators
+GENERATORS = {
+    'IScintillaGateway.cs': printLexIGatewayFile,
+    'ScintillaGateway.cs': printLexGatewayFile,
+    'GatewayDomain.cs': printEnumDefinitions,
+}
+
+def regenerateFile(outFile, generator, f: Face, docs=None):
+    """
+    Render one C# source file from the given interface and write it with CRLF line endings and a BOM.
+    """
+    lines = generator(f, CommentLineStyle(), docs)
+    return FileGenerator.Regenerate(outFile, '/* ', lines, eol='\r\n', bom=True)
+
+def describeApis(f: Face):
+    """
+    Map the messages of all API functions to their summaries in Scintilla's HTML documentation,
+    rendered exactly as they are in SciMsgs.cs.
+    """
+    described = ScintillaDefinitions().describe_many(obsolete=False)
+    messages = [f'SCI_{name.upper()}' for name in f.order if f.features[name].FeatureType in ['fun', 'get', 'set']]
+    return {msg: described[msg] for msg in messages if described.get(msg)}
 
-    if len(sys.argv) > 1:
-        scintillaIfacePath = os.path.realpath(sys.argv[1])
+def generate(scintillaIfacePath=None, parallel=True, sciDocs=False):
+    """
+    Write the interface to the corresponding C# source files.
+    The upstream Scintilla.iface is used unless the path to a local copy is given.
+    Unless ``parallel`` is false, each file is rendered and written by a separate thread, sharing the one Face.
+    If ``sciDocs``, APIs are described by Scintilla's HTML documentation instead of the iface comments.
+    """
+    templatePath = os.path.join(os.path.dirname(__file__), '..', 'lib', 'Plugin')
+    start = time.perf_counter()
 
     try:
-        if not os.path.exists(scintillaIfacePath):
-            with open(scintillaIfacePath, 'w', encoding='utf-8') as iface:
-                iface.write(get_resource(SCINTILLA_IFACE))
-
-        f = Face.Face()
-        f.ReadFromFile(scintillaIfacePath)
-
-        for file, generator in \
-            ({
-                'IScintillaGateway.cs': printLexIGatewayFile,
-                'ScintillaGateway.cs': printLexGatewayFile,
-                'GatewayDomain.cs': printEnumDefinitions,
-             }).items():
-            out_file = os.path.join(templatePath, file)
-            FileGenerator.Regenerate(out_file, '/* ', generator(f, CommentLineStyle()))
-            subprocess.run(['unix2dos', '-k', '-m', '-u', out_file], check=True, encoding='utf-8')
-    except (subprocess.CalledProcessError, IOError) as err:
+        if scintillaIfacePath is None:
+            iface = cache.default_cache().get_bytes(SCINTILLA_IFACE)
+            if iface is None:
+                raise IOError(f'Failed to get {SCINTILLA_IFACE}')
+        else:
+            with open(scintillaIfacePath, 'rb') as ifaceFile:
+                iface = ifaceFile.read()
+
+        f = parseFace(iface)
+        docs = describeApis(f) if sciDocs else None
+        parsed = time.perf_counter()
+
+        jobs = [(os.path.join(templatePath, file), generator, f, docs)
+                for file, generator in GENERATORS.items()]
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+                results = [job.result() for job in [pool.submit(regenerateFile, *job) for job in jobs]]
+        else:
+            results = [regenerateFile(*job) for job in jobs]
+
+        end = time.perf_counter()
+        print(f'{FileGenerator.Summarise(results)}; '
+              f'parsed in {parsed - start:.3f}s, regenerated in {end - parsed:.3f}s ({end - start:.3f}s total)')
+    except IOError as err:
         print(str(err), file=sys.stderr)
 
 # -------------------------------------------------------------------
 if __name__ == '__main__':
-    generate()
+    parser = argparse.ArgumentParser(description='Generate the Scintilla gateway from Scintilla.iface.')
+    parser.add_argument('iface', nargs='?', help='path to a local Scintilla.iface (default: upstream)')
+    parser.add_argument('--offline', action='store_true', help='only use cached upstream sources')
+    parser.add_argument('--serial', action='store_true', help='render one file at a time')
+    parser.add_argument('--sci-docs', action='store_true',
+                        help='describe APIs with the same comments as SciMsgs.cs, from Scintilla\'s HTML documentation')
+    ARGS = parser.parse_args()
+
+    if ARGS.offline:
+        cache.set_offline()
+
+    generate(os.path.realpath(ARGS.iface) if ARGS.iface else None, not ARGS.serial, ARGS.sci_docs)
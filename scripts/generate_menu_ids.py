@@ -3,25 +3,30 @@
  SPDX-FileCopyrightText: (c) 2024 Robert Di Pardo
  SPDX-License-Identifier: 0BSD
 """
+import functools
 import os
 import re
-import subprocess
 import sys
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import StringIO
 from itertools import takewhile
 
+import cache
 import utils as u
-from sources import MENUCMDID_H, RESOURCE_H, PREFERNECE_RC_H, TAG
+from sources import TAG, for_tag
 from get_sci_doc import CommentLineStyle, get_resource
+from scintilla import FileGenerator
 
 OUTPUT=os.path.join(os.path.dirname(__file__), '..', 'lib', 'Plugin', 'NppMenuCmdIds.cs')
 
-CS_FILE_START=f"""/*
- * SPDX-FileCopyrightText: {datetime.today().year} {
- u.cmd_output_or_default('git config --get user.name', u.get_current_user)} <{
- u.cmd_output_or_default('git config --get user.email', u.get_hostname, f'{u.get_current_user()}@localhost')}>
+@functools.cache
+def cs_file_start() -> str:
+    """
+    Return the header of the C# source file, computed on first use.
+    """
+    return f"""/*
+ * SPDX-FileCopyrightText: {datetime.today().year} {u.get_copyright_holder()}
  *
  * SPDX-License-Identifier: Apache-2.0
  */
@@ -31,66 +36,88 @@ using static Npp.DotNet.Plugin.Constants;
 namespace Npp.DotNet.Plugin
 {{"""
 
-def generate(out: StringIO):
+# Upstream headers, keyed by the names of the C# enums they define
+HEADERS = {
+    'MenuCmdId': 'MENUCMDID_H',
+    'Resource': 'RESOURCE_H',
+    'Preference': 'PREFERNECE_RC_H',
+}
+
+# Definitions of strings and version numbers, which have no place in an enum
+_STRING_OR_VERSION = re.compile(r'\s(L?"|_?VERSION)')
+
+def resolve_sources(tag=TAG) -> dict[str, str]:
+    """
+    Fetch every header in `HEADERS` for the given tag concurrently, each one exactly once.
+    """
+    upstream = for_tag(tag)
+    with ThreadPoolExecutor(max_workers=len(HEADERS)) as pool:
+        return dict(zip(HEADERS.keys(),
+                        pool.map(get_resource, [upstream[key] for key in HEADERS.values()], [tag] * len(HEADERS))))
+
+def get_version(resource_h: str, tag=TAG) -> str:
     """
-    Extract definitions from a C++ header and write them to a new C# source file.
+    Extract the Notepad++ version string from the content of resource.h, falling back to the given tag.
+    """
+    version = \
+        re.search(r'(?i)(?:^.*NOTEPAD_PLUS_VERSION L"Notepad\+\+ )?(?P<version>.*)"\s*$',
+                  resource_h[:1024], re.MULTILINE)
+
+    return version.groupdict()['version'] if version is not None else tag
+
+def generate(out: StringIO, sources: dict[str, str] | None = None, tag=TAG):
+    """
+    Extract definitions from C++ headers and write them to a new C# source file.
+    The headers of the given tag are fetched if not given, mapped to the names of their enums.
     """
     try:
+        if sources is None:
+            sources = resolve_sources(tag)
+
         style = CommentLineStyle()
-        for key, val in \
-            ({
-                ('menuCmdID.h', 'MenuCmdId'): MENUCMDID_H,
-                ('resource.h', 'Resource'): RESOURCE_H,
-                ('preference_rc.h', 'Preference'): PREFERNECE_RC_H
-             }).items():
-
-            hdr_path = os.path.join(tempfile.gettempdir(), key[0])
-            if not os.path.exists(hdr_path):
-                with open(hdr_path, 'w', encoding='utf-8') as msgs:
-                    msgs.write(get_resource(val))
-
-            version = \
-                re.search(r'(?i)(?:^.*NOTEPAD_PLUS_VERSION L"Notepad\+\+ )?(?P<version>.*)"\s*$',
-                         get_resource(RESOURCE_H)[:1024], re.MULTILINE)
-
-            version = version.groupdict()['version'] if version is not None else TAG
+        version = get_version(sources['Resource'], tag)
+
+        for enum, hdr in sources.items():
             print(f"\n    /// <remarks>Definitions for Notepad++ {version}</remarks>", file=out)
-            print(f"    public enum {key[1]} : uint\n    {{", file=out)
-
-            with open(hdr_path, 'r', encoding='utf-8') as hdr:
-                for line in hdr.read().splitlines():
-                    try:
-                        macro = re.match(r'^#(if|end)(n?def|if)', line)
-                        if macro is not None:
-                            print(u.c_preproc_to_csharp(line, macro), file=out)
-                        elif re.search(r'^\s*(?!\/\/\s*)#define(?!.*\s+(L?"|_?(VERSION)_?))', line):
-                            decl = re.sub(r'\-1$', '0xFFFFFFFF', line).split()
-                            if len(decl) >= 3:
-                                val = ' '.join(takewhile(lambda s: not s.startswith('/'), decl[2:]))
-                                print(f"{style.indent}{decl[1].upper()} = {val},", file=out)
-
-                    except (IndexError, AttributeError):
-                        pass
+            print(f"    public enum {enum} : uint\n    {{", file=out)
+
+            for token in u.scan_c_header(StringIO(hdr)):
+                try:
+                    if token.kind == u.CONDITIONAL:
+                        print(u.c_preproc_to_csharp(token.line, token.match), file=out)
+                    elif token.kind == u.DEFINE and not _STRING_OR_VERSION.search(token.line, token.match.end()):
+                        decl = token.fields
+                        if len(decl) >= 3:
+                            val = ' '.join(takewhile(lambda s: not s.startswith('/'), decl[2:]))
+                            print(f"{style.indent}{decl[1].upper()} = {val},", file=out)
+
+                except (IndexError, AttributeError):
+                    pass
 
             print('    }', file=out)
 
     except IOError as io_err:
         print(str(io_err), file=sys.stderr)
 
-# -------------------------------------------------------------------
-if __name__ == '__main__':
+def render(sources: dict[str, str] | None = None, tag=TAG) -> list[str]:
+    """
+    Return the lines of the complete C# source file for the given headers, or those of the given tag.
+    """
+    cs_file = StringIO()
     try:
-        cs_file = StringIO()
-        print(CS_FILE_START, end='', file=cs_file)
-        generate(cs_file)
+        print(cs_file_start(), end='', file=cs_file)
+        generate(cs_file, sources, tag)
         print('}', file=cs_file)
-        with open(OUTPUT, 'w', encoding='utf-8') as cs_msgs:
-            cs_msgs.write(cs_file.getvalue())
-
-        subprocess.run(['unix2dos', '-k', '-m', '-u', OUTPUT], check=True, encoding='utf-8')
-
-    except (subprocess.CalledProcessError, IOError) as err:
-        print(str(err), file=sys.stderr)
+        return cs_file.getvalue().splitlines()
 
     finally:
         cs_file.close()
+
+# -------------------------------------------------------------------
+if __name__ == '__main__':
+    cache.strip_offline_flag(sys.argv[1:])
+    try:
+        FileGenerator.UpdateFileFromLines(OUTPUT, render(), '\r\n', bom=True)
+
+    except IOError as err:
+        print(str(err), file=sys.stderr)
@@ -3,25 +3,31 @@
  SPDX-FileCopyrightText: (c) 2024 Robert Di Pardo
  SPDX-License-Identifier: 0BSD
 """
+import functools
 import os
 import re
-import subprocess
 import sys
-import tempfile
 from datetime import datetime
 from io import StringIO
+from typing import Iterable
 
+import cache
 import deprecated
 import utils as u
-from sources import SCINTILLA_H, VERSION_TXT
-from get_sci_doc import ScintillaDefinitions, get_resource
+from sources import TAG, for_tag
+from get_sci_doc import CommentLineStyle, ScintillaDefinitions, get_resource
+from scintilla import FileGenerator
 
 OUTPUT=os.path.join(os.path.dirname(__file__), '..', 'lib', 'Plugin', 'SciMsgs.cs')
 
-CS_FILE_START=f"""/*
- * SPDX-FileCopyrightText: {datetime.today().year} {
- u.cmd_output_or_default('git config --get user.name', u.get_current_user)} <{
- u.cmd_output_or_default('git config --get user.email', u.get_hostname, f'{u.get_current_user()}@localhost')}>
+@functools.cache
+def cs_file_start(version_txt: str) -> str:
+    """
+    Return the header of the C# source file for the given content of Scintilla's version.txt,
+    computed on first use.
+    """
+    return f"""/*
+ * SPDX-FileCopyrightText: {datetime.today().year} {u.get_copyright_holder()}
  *
  * SPDX-License-Identifier: Apache-2.0
  */
@@ -30,7 +36,7 @@ using System;
 
 namespace Npp.DotNet.Plugin
 {{
-    /// <summary>Definitions for Scintilla {'.'.join(re.findall(r'[0-9]', get_resource(VERSION_TXT)))}</summary>
+    /// <summary>Definitions for Scintilla {'.'.join(re.findall(r'[0-9]', version_txt))}</summary>
     /// <remarks>Autogenerated {datetime.today().strftime('%Y-%m-%d')}</remarks>
     public enum SciMsg : uint
     {{
@@ -40,64 +46,76 @@ CS_FILE_END="""    }
 }
 """
 
-def generate(cpp_header: str):
+def render(hdr: Iterable[str], version_txt: str, comments: dict[str, str] | None = None) -> list[str]:
     """
-    Extract definitions from a Scintilla header and write them to a new C# source file.
+    Translate the definitions in a Scintilla header, given as a file object or any other
+    iterable of lines, into the lines of the C# source file.
+    Symbols are described by the given ``comments``, or by Scintilla's HTML documentation.
     """
+    out = StringIO()
     try:
-        if not os.path.exists(cpp_header):
-            with open(cpp_header, 'w', encoding='utf-8') as cpp_msgs:
-                cpp_msgs.write(get_resource(SCINTILLA_H))
-
-        docs = ScintillaDefinitions()
-        out = StringIO()
+        if comments is None:
+            comments = ScintillaDefinitions().describe_many()
+        indent = CommentLineStyle().indent
         skip = True
 
-        print(CS_FILE_START, end='', file=out)
+        print(cs_file_start(version_txt), end='', file=out)
 
-        with open(cpp_header, 'r', encoding='utf-8') as hdr:
-            for line in hdr.read().splitlines():
-                if skip and not bool(re.search(r'\+\+Autogenerated', line)):
-                    continue
-
-                if bool(re.search(r'\-\-Autogenerated', line)):
+        for token in u.scan_c_header(hdr):
+            if token.kind == u.MARKER:
+                if token.match.group(1) == '++':
+                    skip = False
+                elif not skip:
                     break
+                continue
 
-                skip = False
+            if skip:
+                continue
 
-                try:
-                    macro = re.match(r'^#(if|end)(n?def|if)', line)
-                    if macro is not None:
-                        print(u.c_preproc_to_csharp(line, macro), file=out)
-                    elif re.search(r'^\s*(?!\/\/\s*)#define', line):
-                        decl = re.sub(r'\-1$', '0xFFFFFFFF', line).split()
-                        if len(decl) == 3:
-                            sym = decl[1].upper()
-                            comment = docs.describe(sym)
-                            if bool(comment):
-                                print(comment, file=out)
-                            elif sym in deprecated.MESSAGES:
-                                print(f"{docs.style.indent}{deprecated.MESSAGES[sym]}", file=out)
+            try:
+                if token.kind == u.CONDITIONAL:
+                    print(u.c_preproc_to_csharp(token.line, token.match), file=out)
+                else:
+                    decl = token.fields
+                    if len(decl) == 3:
+                        sym = decl[1].upper()
+                        comment = comments.get(sym, '')
+                        if bool(comment):
+                            print(comment, file=out)
+                        elif sym in deprecated.MESSAGES:
+                            print(f"{indent}{deprecated.MESSAGES[sym]}", file=out)
 
-                            print(f"{docs.style.indent}{decl[1]} = {decl[2]},", file=out)
+                        print(f"{indent}{decl[1]} = {decl[2]},", file=out)
 
-                except (IndexError, AttributeError):
-                    pass
+            except (IndexError, AttributeError):
+                pass
 
         print(CS_FILE_END, end='', file=out)
+        return out.getvalue().splitlines()
+
+    finally:
+        out.close()
 
-        with open(OUTPUT, 'w', encoding='utf-8') as cs_msgs:
-            cs_msgs.write(out.getvalue())
+def generate(cpp_header: str | None = None, output=OUTPUT, tag=TAG):
+    """
+    Extract definitions from a Scintilla header and write them to a new C# source file.
+    The upstream header of the given tag is used unless the path to a local copy is given.
+    """
+    try:
+        upstream = for_tag(tag)
+        comments = ScintillaDefinitions().describe_many()
+        hdr = open(cpp_header, 'r', encoding='utf-8') if cpp_header is not None \
+            else StringIO(get_resource(upstream['SCINTILLA_H'], tag))
 
-        subprocess.run(['unix2dos', '-k', '-m', '-u', OUTPUT], check=True, encoding='utf-8')
+        with hdr:
+            lines = render(hdr, get_resource(upstream['VERSION_TXT'], tag), comments)
 
-    except (subprocess.CalledProcessError, IOError) as err:
-        print(str(err), file=sys.stderr)
+        return FileGenerator.UpdateFileFromLines(output, lines, '\r\n', bom=True)
 
-    finally:
-        out.close()
+    except IOError as err:
+        print(str(err), file=sys.stderr)
 
 # -------------------------------------------------------------------
 if __name__ == '__main__':
-    generate(os.path.realpath(sys.argv[1]) if len(sys.argv) > 1 \
-        else os.path.join(tempfile.gettempdir(), 'Scintilla.h'))
+    ARGS = cache.strip_offline_flag(sys.argv[1:])
+    generate(os.path.realpath(ARGS[0]) if ARGS else None)
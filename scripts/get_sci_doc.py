@@ -3,17 +3,16 @@
  SPDX-FileCopyrightText: (c) 2024 Robert Di Pardo
  SPDX-License-Identifier: 0BSD
 """
-import os
+import functools
 import re
 import sys
-import tempfile
 from html import escape as html_escape
 from html.parser import HTMLParser
-from http import client
 from textwrap import TextWrapper
-from urllib import request, error as urllib_error
 
+import cache
 import deprecated
+from sources import SCINTILLA_DOC, TAG
 
 class CommentLineStyle():
     """
@@ -32,74 +31,177 @@ class CommentLineStyle():
         """
         return '\n'.join([f"{self} {line}" for line in text.splitlines() if bool(line.strip())])
 
+# How start tags affect the scraper's state
+_CONTENT, _SKIPPED, _INLINE = 'content', 'skipped', 'inline'
+
+# Elements whose text is never part of a description
+_SKIPPED_TAGS = frozenset(['pre', 'table', 'thead', 'tbody', 'tfoot', 'th', 'td', 'caption'])
+
+# Elements that can name a symbol, or break a description into summary and remarks
+_INLINE_TAGS = frozenset(['a', 'b', 'br', 'code'])
+
+_HEADING = re.compile(r'h[1-6]')
+_SYMBOL_ID = re.compile(r'SC[IN]?_')
+
+_DISCOURAGED = re.compile(r'(discouraged)', re.IGNORECASE)
+_DEPRECATED = re.compile(r'(deprecated)', re.IGNORECASE)
+_SPACE_BEFORE_PUNCTUATION = re.compile(r'\s+((?!-&gt;)\W )')
+_MULTIPLE_SPACES = re.compile(r'\s{2,}')
+_POINTER_STAR = re.compile(r'\*\b')
+
+@functools.cache
+def _tag_kind(tag: str) -> str:
+    """
+    Classify a start tag by how the scraper should treat the element's content.
+    """
+    if tag in _SKIPPED_TAGS or _HEADING.match(tag):
+        return _SKIPPED
+    return _INLINE if tag in _INLINE_TAGS else _CONTENT
+
 class ScintillaDefinitions(HTMLParser):
     """
     Maps message names to their descriptions in Scintilla's HTML documentation.
+
+    Unless a symbol index is given, the documentation is only parsed the first time ``defs`` is
+    accessed, and the result is cached on disk under the digest of the HTML, so later runs skip
+    parsing for as long as the documentation is unchanged.
     """
-    def __init__(self):
+    def __init__(self, defs: dict[str, str] | None = None):
         super().__init__()
         self.text_wrapper = TextWrapper(width=120)
         self.style = CommentLineStyle()
-        self.defs = {}
+        self._defs = defs
+        self._key = None
+        self._comments = {}
         self.current_symbol = ''
         self.skip_content = False
         self.code_span = False
-        self.feed(fetch_docs())
+
+    @property
+    def defs(self) -> dict[str, str]:
+        """
+        The description of each documented symbol.
+        """
+        if self._defs is None:
+            self._defs = self.load(fetch_docs())
+        return self._defs
+
+    def load(self, html: str) -> dict[str, str]:
+        """
+        Return the symbol index of the given HTML, from the artifact cache if possible.
+        """
+        key = self._key = cache.artifact_key(html.encode('utf-8'), __file__)
+        defs = cache.load_artifact(key)
+        if not isinstance(defs, dict):
+            defs = self.parse(html)
+            if defs:
+                cache.store_artifact(key, defs)
+        return defs
+
+    def parse(self, html: str) -> dict[str, str]:
+        """
+        Build the symbol index of the given HTML.
+        """
+        self.reset()
+        self._defs = {}
+        self.current_symbol = ''
+        self.skip_content = False
+        self.code_span = False
+        self.feed(html)
+        return self._defs
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str]]):
         """
         Called once for the start tag of each element.
         """
-        _tag = tag.lower()
+        # tag and attribute names arrive in lower case
+        kind = _tag_kind(tag)
+        self.skip_content = kind is _SKIPPED or \
+            any(name == 'class' and value and value[:1] == 'S' for name, value in attrs)
 
-        self.skip_content = \
-            bool(re.match(r'h[1-6]', _tag)) or \
-            _tag in [ 'pre', 'table', 'thead', 'tbody', 'tfoot', 'th', 'td', 'caption' ] or \
-            bool({ v for a, v in attrs if a.lower() == 'class' and v.startswith('S')})
+        if self.skip_content or kind is not _INLINE:
+            return
 
-        if not self.skip_content and _tag in [ 'a', 'b', 'br', 'code' ]:
-            for name, value in attrs:
-                if name.lower() == 'id' and re.match(r'^SC[IN]?_', value):
-                    self.current_symbol = value.upper()
-                    self.defs[self.current_symbol] = ''
+        for name, value in attrs:
+            if name == 'id' and value and _SYMBOL_ID.match(value):
+                self.current_symbol = value.upper()
+                self._defs[self.current_symbol] = ''
 
-            if _tag == 'br' and bool(self.current_symbol):
-                self.defs[self.current_symbol] += '<br/>'
+        if tag == 'br' and self.current_symbol:
+            self._defs[self.current_symbol] += '<br/>'
 
-            self.code_span = _tag == 'code'
-            # revisit parent element
-            self.handle_starttag('p', [])
+        self.code_span = tag == 'code'
 
     def handle_data(self, data: str):
         """
         Called once for the text content of each element.
         """
+        if self.skip_content or not self.current_symbol:
+            return
+
+        if self.code_span:
+            doc = data
         # except in <code> span, descriptions should be more than just the symbol's name
-        doc = data if self.code_span else re.sub(fr'^({self.current_symbol})$', '', data).strip()
-        if not self.skip_content and bool(self.current_symbol) and bool(doc):
-            self.defs[self.current_symbol] += f"{doc}\r\n"
+        elif data in (self.current_symbol, f'{self.current_symbol}\n'):
+            return
+        else:
+            doc = data.strip()
+
+        if doc:
+            self._defs[self.current_symbol] += f"{doc}\r\n"
 
     def handle_endtag(self, tag: str):
         """
         Called once for the end tag of each element.
         """
         # avoid picking up adjacent paragraphs -- they tend to be lengthy
-        if tag.lower() == 'p':
+        if tag == 'p':
             self.current_symbol = ''
 
-    def describe(self, sym: str) -> str:
+    def describe(self, sym: str, obsolete=True) -> str:
         """
         Return a formatted XML comment for the given symbol, if found.
+        Unless ``obsolete`` is false, deprecated symbols are followed by an ``Obsolete`` attribute.
+        """
+        return self.describe_many([sym], obsolete)[sym]
+
+    def describe_many(self, symbols=None, obsolete=True) -> dict[str, str]:
+        """
+        Map the given symbols, or every documented symbol, to their formatted XML comments.
+        Each comment is only rendered once; rendering every documented symbol also caches
+        the result on disk, for as long as the documentation is unchanged.
+        """
+        if symbols is None:
+            symbols = self.defs.keys()
+            if len(self._comments) < len(symbols) and self._key is not None:
+                key = cache.artifact_key(self._key.encode('utf-8'), deprecated.__file__)
+                comments = cache.load_artifact(key)
+                if not isinstance(comments, dict):
+                    comments = {sym: self._render(sym) for sym in symbols}
+                    cache.store_artifact(key, comments)
+                self._comments.update(comments)
+
+        described = {}
+        for sym in symbols:
+            comment = self._comments.get(sym)
+            if comment is None:
+                comment = self._comments[sym] = self._render(sym)
+            summary, attribute = comment
+            described[sym] = '\n'.join(filter(None, [summary, attribute if obsolete else '']))
+        return described
+
+    def _render(self, sym: str) -> tuple[str, str]:
+        """
+        Return the summary of the given symbol, and its ``Obsolete`` attribute if deprecated.
         """
         doc_lines = []
+        attribute = ''
 
         if sym in self.defs:
             doc = str(self.defs.get(sym))
             summary = doc.split('<br/>')
 
-            is_obsolete = \
-                sym in deprecated.MESSAGES or \
-                bool(re.search(r'(discouraged)', doc, re.IGNORECASE))
+            is_obsolete = sym in deprecated.MESSAGES or bool(_DISCOURAGED.search(doc))
 
             if summary and summary[0].strip():
                 doc_lines.append(self.style.format('<summary>'))
@@ -108,77 +210,52 @@ class ScintillaDefinitions(HTMLParser):
                 if signature:
                     doc_lines.append(self.style.format(signature))
 
-                    is_obsolete = \
-                        bool(re.search(r'(deprecated)', signature, re.IGNORECASE)) or is_obsolete
+                    is_obsolete = bool(_DEPRECATED.search(signature)) or is_obsolete
 
                 if len(summary) > 1:
                     doc_lines[-1] += '<br/>'
                     for ln in self.text_wrapper.wrap('\n'.join(summary[1:])):
-                        doc_line = re.sub(r'\s+((?!-&gt;)\W )', r'\1', xmlify(ln)).strip()
+                        doc_line = _SPACE_BEFORE_PUNCTUATION.sub(r'\1', xmlify(ln)).strip()
                         doc_lines.append(self.style.format(doc_line))
 
                 doc_lines.append(self.style.format('</summary>'))
 
             if is_obsolete:
-                doc_lines.append(
+                attribute = \
                     self.style.indent +\
                     deprecated.MESSAGES.get(
                         sym,
-                        f'[Obsolete("https://www.scintilla.org/ScintillaDoc.html#{sym}")]'))
+                        f'[Obsolete("https://www.scintilla.org/ScintillaDoc.html#{sym}")]')
 
-        return '\n'.join(doc_lines)
+        return '\n'.join(doc_lines), attribute
 
 # -------------------------------------------------------------------
 def fetch_docs() -> str:
     """
     Get the HTML content of Scintilla's documentation.
     """
-    sci_doc = os.path.join(tempfile.gettempdir(), 'ScintillaDoc.html')
-    html = ''
-    try:
-        if not os.path.exists(sci_doc):
-            html = get_resource('https://www.scintilla.org/ScintillaDoc.html')
-            with open(sci_doc, 'w', encoding='utf-8') as doc:
-                doc.write(html)
-        else:
-            with open(sci_doc, 'r', encoding='utf-8') as doc:
-                html = doc.read()
-    except IOError as err:
-        print(repr(err), file=sys.stderr)
-
-    return html
+    # the online docs track the latest release, whatever the current tag
+    return get_resource(SCINTILLA_DOC, tag='')
 
-def get_resource(resource: str) -> str:
+def get_resource(resource: str, tag=TAG) -> str:
     """
     Request a Web resource and return its content.
     """
-    response = ''
-    try:
-        with request.urlopen(request.Request(resource)) as response:
-            if response.status == 200:
-                try:
-                    response = response.read().decode('utf8')
-                except (client.IncompleteRead, IndexError, TypeError):
-                    print(f"Error parsing {resource}")
-            else:
-                print(f"Got response [{response.status_code}] requesting {resource}")
-
-    except (urllib_error.HTTPError, urllib_error.URLError) as err:
-        print(repr(err), file=sys.stderr)
-
-    return response
+    return cache.get_resource(resource, tag)
 
+@functools.cache
 def xmlify(s: str) -> str:
     """
     Render text as valid XML.
     """
     _s = html_escape(s, quote=False).replace('\u2192', '-&gt;')
-    return re.sub(r'\s{2,}', ' ', re.sub(r'\*\b', '\uff0a', _s))
+    return _MULTIPLE_SPACES.sub(' ', _POINTER_STAR.sub('\uff0a', _s))
 
 # -------------------------------------------------------------------
 if __name__ == '__main__':
-    if len(sys.argv) > 1:
-        MSG = sys.argv[1].upper()
+    ARGS = cache.strip_offline_flag(sys.argv[1:])
+    if ARGS:
+        MSG = ARGS[0].upper()
         DESCR = ScintillaDefinitions().describe(MSG)
         if bool(DESCR):
             print(DESCR)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+ SPDX-FileCopyrightText: (c) 2026 Robert Di Pardo
+ SPDX-License-Identifier: 0BSD
+
+Regenerate the bindings for several Notepad++ releases at once, each into its own output tree.
+
+Upstream sources are fetched concurrently, then every distinct output is rendered once by a
+process pool: releases whose sources are identical share the result of parsing and rendering them.
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import StringIO
+
+import cache
+import generate_iface
+import generate_menu_ids
+import generate_sci_msgs
+import sources
+from get_sci_doc import CommentLineStyle, ScintillaDefinitions
+from scintilla import FileGenerator
+
+# Where the checked-in sources are, whose generated sections are replaced in each copy
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), '..', 'lib', 'Plugin')
+
+# Where each tag's output tree is created, unless overridden on the command line
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'bin', 'matrix')
+
+def render_iface(iface: bytes) -> dict[str, list[str]]:
+    """
+    Render every source generated from the given Scintilla.iface content.
+    """
+    f = generate_iface.parseFace(iface)
+    return {file: generator(f, CommentLineStyle()) for file, generator in generate_iface.GENERATORS.items()}
+
+def render_sci_msgs(scintilla_h: str, version_txt: str, comments: dict[str, str]) -> dict[str, list[str]]:
+    """
+    Render the message definitions generated from the given Scintilla.h content.
+    """
+    return {'SciMsgs.cs': generate_sci_msgs.render(StringIO(scintilla_h), version_txt, comments)}
+
+def render_menu_ids(headers: dict[str, str], tag: str) -> dict[str, list[str]]:
+    """
+    Render the command identifiers generated from the given Notepad++ headers.
+    """
+    return {'NppMenuCmdIds.cs': generate_menu_ids.render(headers, tag)}
+
+def content_key(product: str, *parts) -> str:
+    """
+    Return a key that is identical for any two renderings of a product from identical content.
+    """
+    digest = hashlib.sha256(product.encode('utf-8'))
+    for part in parts:
+        digest.update(hashlib.sha256(part if isinstance(part, bytes) else str(part).encode('utf-8')).digest())
+    return digest.hexdigest()
+
+def fetch_all(tags: list[str], jobs=8) -> dict[str, dict[str, bytes]]:
+    """
+    Download the upstream sources of every tag concurrently, mapped to their names in `sources.for_tag`.
+    Tags missing any source are left out.
+    """
+    store = cache.default_cache()
+    wanted = [(tag, name, url) for tag in tags for name, url in sources.for_tag(tag).items()]
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        fetched = list(pool.map(lambda w: store.get_bytes(w[2], w[0]), wanted))
+
+    contents = {tag: {} for tag in tags}
+    for (tag, name, url), data in zip(wanted, fetched):
+        if data is None:
+            print(f'{tag}: failed to get {url}', file=sys.stderr)
+            contents.pop(tag, None)
+        elif tag in contents:
+            contents[tag][name] = data
+    return contents
+
+def plan(contents: dict[str, dict[str, bytes]], comments: dict[str, str]):
+    """
+    Map each tag to the keys of the renderings it needs, and each distinct key to its renderer and arguments.
+    """
+    needs = {}
+    renderings = {}
+    for tag, upstream in contents.items():
+        text = {name: data.decode('utf-8') for name, data in upstream.items()}
+        headers = {enum: text[name] for enum, name in generate_menu_ids.HEADERS.items()}
+        version = generate_menu_ids.get_version(headers['Resource'], tag)
+        jobs = [
+            (content_key('iface', upstream['SCINTILLA_IFACE']),
+             render_iface, (upstream['SCINTILLA_IFACE'],)),
+            (content_key('sci_msgs', upstream['SCINTILLA_H'], upstream['VERSION_TXT']),
+             render_sci_msgs, (text['SCINTILLA_H'], text['VERSION_TXT'], comments)),
+            (content_key('menu_ids', version, *headers.values()),
+             render_menu_ids, (headers, tag)),
+        ]
+        needs[tag] = [key for key, _, _ in jobs]
+        for key, renderer, args in jobs:
+            renderings.setdefault(key, (renderer, args))
+    return needs, renderings
+
+def write_tree(path: str, rendered: list[dict[str, list[str]]]) -> list[str]:
+    """
+    Write one tag's rendered sources under the given directory, starting from copies of the checked-in
+    sources wherever only their generated sections are replaced.
+    """
+    os.makedirs(path, exist_ok=True)
+    results = []
+    for files in rendered:
+        for file, lines in files.items():
+            out_file = os.path.join(path, file)
+            if file in generate_iface.GENERATORS:
+                if not os.path.exists(out_file):
+                    shutil.copyfile(os.path.join(TEMPLATE_DIR, file), out_file)
+                results.append(FileGenerator.Regenerate(out_file, '/* ', lines, eol='\r\n', bom=True))
+            else:
+                results.append(FileGenerator.UpdateFileFromLines(out_file, lines, '\r\n', bom=True))
+    return results
+
+def regenerate(tags: list[str], output_dir=OUTPUT_DIR, jobs=None) -> bool:
+    """
+    Regenerate the bindings of every given tag under its own directory of ``output_dir``.
+    Return ``True`` if every tag's sources could be obtained.
+    """
+    start = time.perf_counter()
+    contents = fetch_all(tags)
+    fetched = time.perf_counter()
+
+    # resolved once, so workers never touch the network
+    comments = ScintillaDefinitions().describe_many()
+    needs, renderings = plan(contents, comments)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {key: pool.submit(renderer, *args) for key, (renderer, args) in renderings.items()}
+        rendered = {key: future.result() for key, future in futures.items()}
+    done = time.perf_counter()
+
+    for tag, keys in needs.items():
+        results = write_tree(os.path.join(output_dir, tag), [rendered[key] for key in keys])
+        print(f'{tag}: {FileGenerator.Summarise(results)}')
+
+    end = time.perf_counter()
+    print(f'{len(needs)} tag(s), {len(renderings)} of {sum(map(len, needs.values()))} renderings distinct; '
+          f'fetched in {fetched - start:.3f}s, rendered in {done - fetched:.3f}s, '
+          f'written in {end - done:.3f}s ({end - start:.3f}s total)')
+    return len(needs) == len(tags)
+
+# -------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Regenerate the bindings for several Notepad++ releases.')
+    parser.add_argument('--tags', default=sources.TAG,
+                        help=f'comma-separated Notepad++ versions (default: {sources.TAG})')
+    parser.add_argument('--out', default=OUTPUT_DIR, help='directory of the per-tag output trees')
+    parser.add_argument('--jobs', type=int, default=None, help='maximum number of rendering processes')
+    parser.add_argument('--offline', action='store_true', help='only use cached upstream sources')
+    ARGS = parser.parse_args()
+
+    if ARGS.offline:
+        cache.set_offline()
+
+    TAGS = list(dict.fromkeys(tag.strip() for tag in ARGS.tags.split(',') if tag.strip()))
+    sys.exit(0 if regenerate(TAGS, os.path.realpath(ARGS.out), ARGS.jobs) else 1)
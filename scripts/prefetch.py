@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+ SPDX-FileCopyrightText: (c) 2026 Robert Di Pardo
+ SPDX-License-Identifier: 0BSD
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cache
+import sources
+
+def prefetch(tag=sources.TAG, jobs=8, retries=3, backoff=0.5) -> bool:
+    """
+    Download every upstream source for the given tag into the shared cache, in parallel.
+    Print a timing report and return ``True`` if all sources could be obtained.
+    """
+    resources = [(url, tag) for url in sources.for_tag(tag).values()]
+    resources.append((sources.SCINTILLA_DOC, ''))
+    store = cache.default_cache()
+
+    def fetch(resource):
+        url, url_tag = resource
+        start = time.perf_counter()
+        for attempt in range(1, retries + 1):
+            data = store.get_bytes(url, url_tag)
+            if data is not None or store.offline or attempt == retries:
+                break
+            time.sleep(backoff * 2 ** (attempt - 1))
+        return url, data, attempt, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        results = list(pool.map(fetch, resources))
+    wall_time = time.perf_counter() - start
+
+    for url, data, attempts, elapsed in results:
+        size = f'{len(data):>9}' if data is not None else '   FAILED'
+        print(f'{elapsed:8.3f}s {size} {"" if attempts == 1 else f"({attempts} tries) "}{url}')
+
+    print(f'{wall_time:8.3f}s total, {sum(r[3] for r in results):.3f}s sequential')
+    return all(r[1] is not None for r in results)
+
+# -------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Fill the resource cache with all upstream sources.',
+        epilog='Set NPP_DOTNET_SOURCE_ROOT and NPP_DOTNET_SCINTILLA_DOC to fetch from a local mirror instead.')
+    parser.add_argument('--tag', default=sources.TAG, help=f'Notepad++ version (default: {sources.TAG})')
+    parser.add_argument('--jobs', type=int, default=8, help='maximum number of concurrent downloads')
+    parser.add_argument('--retries', type=int, default=3, help='attempts per source before giving up')
+    parser.add_argument('--offline', action='store_true', help='only check what is already cached')
+    ARGS = parser.parse_args()
+
+    if ARGS.offline:
+        cache.set_offline()
+
+    sys.exit(0 if prefetch(ARGS.tag, ARGS.jobs, ARGS.retries) else 1)
@@ -4,6 +4,8 @@
 # Released to the public domain.
 # Requires Python 2.7 or later
 
+import io
+
 def sanitiseLine(line):
 	line = line.rstrip('\n')
 	if "##" in line:
@@ -38,6 +40,15 @@ def decodeParam(p):
 			name = nv
 	return type, name, value
 
+def readLines(stream, encoding="utf-8"):
+	""" Yield the lines of a text or binary stream one at a time, decoding bytes.
+	Uses readline() rather than iteration so mmap objects work too. """
+	readline = stream.readline
+	line = readline()
+	while line:
+		yield line.decode(encoding) if isinstance(line, (bytes, bytearray)) else line
+		line = readline()
+
 def IsEnumeration(t):
 	return t[:1].isupper()
 
@@ -58,21 +69,147 @@ def PascalCase(s):
 	pascalCase += capitalized[-1]
 	return pascalCase
 
+_FEATURE_FIELDS = (
+	"FeatureType", "ReturnType", "Value",
+	"Param1Type", "Param1Name", "Param1Value",
+	"Param2Type", "Param2Name", "Param2Value",
+	"Category", "Comment")
+_FEATURE_FIELD_SET = frozenset(_FEATURE_FIELDS)
+_getField = object.__getattribute__
+
+class Feature:
+	""" A feature record with a fixed set of fields, accessed either as attributes or
+	with the same keys as the dicts Face builds by default. Fields that don't apply
+	to the feature's type are absent, as they are from the dicts.
+	Key access is several times slower than a dict's, so hot loops should read
+	fields as attributes. """
+	__slots__ = _FEATURE_FIELDS
+
+	# records are mutable and compare by value
+	__hash__ = None
+
+	def __init__(self, **fields):
+		for key, value in fields.items():
+			self[key] = value
+
+	def __getitem__(self, key):
+		if key in _FEATURE_FIELD_SET:
+			try:
+				return _getField(self, key)
+			except AttributeError:
+				pass
+		raise KeyError(key)
+
+	def __setitem__(self, key, value):
+		if key not in _FEATURE_FIELD_SET:
+			raise KeyError(key)
+		setattr(self, key, value)
+
+	def __contains__(self, key):
+		return key in _FEATURE_FIELD_SET and hasattr(self, key)
+
+	def __iter__(self):
+		return (key for key in _FEATURE_FIELDS if hasattr(self, key))
+
+	def __len__(self):
+		return sum(1 for _ in self)
+
+	def __eq__(self, other):
+		try:
+			return dict(self.items()) == dict(other.items())
+		except AttributeError:
+			return NotImplemented
+
+	def __repr__(self):
+		return "Feature(%s)" % ", ".join("%s=%r" % kv for kv in self.items())
+
+	def get(self, key, default=None):
+		return getattr(self, key, default) if key in _FEATURE_FIELD_SET else default
+
+	def keys(self):
+		return list(self)
+
+	def items(self):
+		return [(key, getattr(self, key)) for key in self]
+
 class Face:
 
-	def __init__(self):
+	def __init__(self, typed=False):
+		# Features are plain dicts unless typed records are requested
+		self.record = Feature if typed else dict
 		self.order = []
 		self.features = {}
 		self.values = {}
 		self.events = {}
 		self.aliases = {}
+		# Secondary indexes, filled once parsing is complete
+		self.featuresByType = {}
+		self.enumMembers = {}
+
+	def BuildIndexes(self):
+		""" Group feature names by type, and map each enumeration to the values
+		whose names start with its prefix, in file order. """
+		self.featuresByType = {}
+		for name in self.order:
+			self.featuresByType.setdefault(self.features[name]["FeatureType"], []).append(name)
+		self.enumMembers = {}
+		enumsByPrefix = {}
+		for name in self.featuresByType.get("enu", []):
+			self.enumMembers[name] = []
+			enumsByPrefix.setdefault(self.features[name]["Value"], []).append(name)
+		for name in self.featuresByType.get("val", []):
+			for end in range(len(name) + 1):
+				for enum in enumsByPrefix.get(name[:end], []):
+					self.enumMembers[enum].append(name)
+
+	def ToData(self):
+		""" Return the parsed features and indexes as plain dicts and lists,
+		which can be stored as JSON and turned back into a Face by FromData. """
+		return {
+			"order": self.order,
+			"features": {name: dict(feature.items()) for name, feature in self.features.items()},
+			"values": self.values,
+			"events": self.events,
+			"aliases": self.aliases,
+			"featuresByType": self.featuresByType,
+			"enumMembers": self.enumMembers,
+		}
+
+	@classmethod
+	def FromData(cls, data, typed=False):
+		""" Rebuild a Face from what ToData returned. """
+		face = cls(typed)
+		face.order = data["order"]
+		face.features = {name: face.record(**fields) for name, fields in data["features"].items()}
+		face.values = data["values"]
+		face.events = data["events"]
+		face.aliases = data["aliases"]
+		face.featuresByType = data["featuresByType"]
+		face.enumMembers = data["enumMembers"]
+		return face
 
 	def ReadFromFile(self, name):
+		with open(name, "rb") as file:
+			self.ReadFromStream(file)
+
+	def ReadFromStream(self, stream, encoding="utf-8"):
+		""" Parse a file object or mmap, in text or binary mode, without loading it all. """
+		self.ReadFromLines(readLines(stream, encoding))
+
+	def Parse(self, buffer, encoding="utf-8"):
+		""" Parse the iface content held in a str, bytes, bytearray, memoryview or mmap. """
+		if isinstance(buffer, str):
+			self.ReadFromStream(io.StringIO(buffer))
+		elif hasattr(buffer, "readline"):
+			self.ReadFromStream(buffer, encoding)
+		else:
+			self.ReadFromStream(io.BytesIO(buffer), encoding)
+
+	def ReadFromLines(self, lines):
 		currentCategory = ""
 		currentComment = []
 		currentCommentFinished = 0
-		file = open(name)
-		for line in file.readlines():
+		for line in lines:
 			line = sanitiseLine(line)
 			if line:
 				if line[0] == "#":
@@ -92,14 +229,14 @@ class Face:
 							raise
 						p1 = decodeParam(param1)
 						p2 = decodeParam(param2)
-						self.features[name] = {
-							"FeatureType": featureType,
-							"ReturnType": retType,
-							"Value": value,
-							"Param1Type": p1[0], "Param1Name": p1[1], "Param1Value": p1[2],
-							"Param2Type": p2[0], "Param2Name": p2[1], "Param2Value": p2[2],
-							"Category": currentCategory, "Comment": currentComment
-						}
+						self.features[name] = self.record(
+							FeatureType=featureType,
+							ReturnType=retType,
+							Value=value,
+							Param1Type=p1[0], Param1Name=p1[1], Param1Value=p1[2],
+							Param2Type=p2[0], Param2Name=p2[1], Param2Value=p2[2],
+							Category=currentCategory, Comment=currentComment
+						)
 						if value in self.values:
 							raise Exception("Duplicate value " + value + " " + name)
 						self.values[value] = 1
@@ -107,12 +244,12 @@ class Face:
 						currentComment = []
 					elif featureType == "evt":
 						retType, name, value = decodeEvent(featureVal)
-						self.features[name] = {
-							"FeatureType": featureType,
-							"ReturnType": retType,
-							"Value": value,
-							"Category": currentCategory, "Comment": currentComment
-						}
+						self.features[name] = self.record(
+							FeatureType=featureType,
+							ReturnType=retType,
+							Value=value,
+							Category=currentCategory, Comment=currentComment
+						)
 						if value in self.events:
 							raise Exception("Duplicate event " + value + " " + name)
 						self.events[value] = 1
@@ -125,18 +262,18 @@ class Face:
 						except ValueError:
 							print("Failure %s" % featureVal)
 							raise Exception()
-						self.features[name] = {
-							"FeatureType": featureType,
-							"Category": currentCategory,
-							"Value": value }
+						self.features[name] = self.record(
+							FeatureType=featureType,
+							Category=currentCategory,
+							Value=value)
 						self.order.append(name)
 					elif featureType == "enu" or featureType == "lex":
 						name, value = featureVal.split("=", 1)
-						self.features[name] = {
-							"FeatureType": featureType,
-							"Category": currentCategory,
-							"Value": value,
-							"Comment": currentComment }
+						self.features[name] = self.record(
+							FeatureType=featureType,
+							Category=currentCategory,
+							Value=value,
+							Comment=currentComment)
 						self.order.append(name)
 						currentComment = []
 					elif featureType == "ali":
@@ -144,4 +281,4 @@ class Face:
 						name, value = featureVal.split("=", 1)
 						self.aliases[name] = value
 						currentComment = []
-		file.close()
+		self.BuildIndexes()
@@ -17,22 +17,70 @@ import codecs, os, re, string, sys
 
 lineEnd = "\r\n" if sys.platform == "win32" else "\n"
 
-def UpdateFile(filename, updated):
+# When true, rewritten files are flushed to disk before they replace the originals
+syncOnWrite = False
+
+def SameContents(filename, data, chunkSize=1 << 16):
+    """ Compare a file with the given bytes, stopping at the first difference.
+    Raises IOError if the file can't be read. """
+    if os.stat(filename).st_size != len(data):
+        return False
+    view = memoryview(data)
+    with open(filename, "rb") as infile:
+        for start in range(0, len(data), chunkSize):
+            if infile.read(chunkSize) != view[start:start+chunkSize]:
+                return False
+    return True
+
+def WriteFileAtomically(filename, data, sync=None):
+    """ Write the given bytes to a temporary file next to filename, then move it into
+    place so the original is never missing or half written. The original's
+    permissions are kept. """
+    if sync is None:
+        sync = syncOnWrite
+    temp = "%s.%d.tmp" % (filename, os.getpid())
+    fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as outfile:
+            outfile.write(data)
+            if sync:
+                outfile.flush()
+                os.fsync(outfile.fileno())
+        try:
+            os.chmod(temp, os.stat(filename).st_mode & 0o7777)
+        except OSError: # File is not there yet
+            pass
+        os.replace(temp, filename)
+    except BaseException:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+
+def UpdateFile(filename, updated, bom=False):
     """ If the file contents are different to updated then copy updated into the
-    file else leave alone so Mercurial and make don't treat it as modified. """
+    file else leave alone so Mercurial and make don't treat it as modified.
+    If bom is true, the file is written with a UTF-8 byte order mark.
+    Returns "New", "Changed" or "Unchanged". """
+    data = updated.encode("utf-8-sig" if bom else "utf-8")
     newOrChanged = "Changed"
     try:
-        with codecs.open(filename, "r", "utf-8") as infile:
-            original = infile.read()
-        if updated == original:
+        if SameContents(filename, data):
             # Same as before so don't write
-            return
-        os.unlink(filename)
+            return "Unchanged"
     except IOError: # File is not there yet
         newOrChanged = "New"
-    with codecs.open(filename, "w", "utf-8") as outfile:
-        outfile.write(updated)
+    WriteFileAtomically(filename, data)
     print("%s:0: %s" % (filename, newOrChanged))
+    return newOrChanged
+
+def Summarise(results):
+    """ Describe how many files were rewritten and how many were left alone,
+    given the values returned by UpdateFile. """
+    rewritten = sum(1 for result in results if result in ("New", "Changed"))
+    unchanged = sum(1 for result in results if result == "Unchanged")
+    return "%d file(s) rewritten, %d unchanged" % (rewritten, unchanged)
 
 # Automatically generated sections contain start and end comments,
 # a definition line and the results.
@@ -45,97 +93,106 @@ def UpdateFile(filename, updated):
 # \* is replaced by each list item. \t, and \n are tab and newline.
 # If there is no definition line than the first list is copied verbatim.
 # If retainDefs then the comments controlling generation are copied.
-def CopyWithInsertion(input, commentPrefix, retainDefs, lists):
+# Lines are terminated with eol, or lineEnd if not given, including lines
+# embedded in list items.
+def ExpandDefinition(definition, commentPrefix, lists):
+    """ Expand a definition line, less its comment prefix and "**", with the items of the
+    list it refers to. """
+    if (commentPrefix == "<!--") and (" -->" in definition):
+        definition = definition.replace(" -->", "")
+    listid = 0
+    if definition[0] in string.digits:
+        listid = int(definition[:1])
+        definition = definition[2:]
+    # Hide double slashes as a control character
+    definition = definition.replace("\\\\", "\001")
+    # Do some normal C style transforms
+    definition = definition.replace("\\n", "\n")
+    definition = definition.replace("\\t", "\t")
+    # Get the doubled backslashes back as single backslashes
+    definition = definition.replace("\001", "\\")
+    startRepeat = definition.find("\\(")
+    endRepeat = definition.find("\\)")
+    intro = definition[:startRepeat]
+    if intro.endswith("\n"):
+        pos = 0
+    else:
+        pos = len(intro)
+    out = [intro]
+    middle = definition[startRepeat+2:endRepeat]
+    for i in lists[listid]:
+        item = middle.replace("\\*", i)
+        if pos and (pos + len(item) >= 80):
+            out.append("\\\n")
+            pos = 0
+        out.append(item)
+        pos += len(item)
+        if item.endswith("\n"):
+            pos = 0
+    out.append(definition[endRepeat+2:])
+    return "".join(out)
+
+def CopyWithInsertion(input, commentPrefix, retainDefs, lists, eol=None):
+    eol = eol or lineEnd
+    # One match per line tells whether, and how, it delimits a generated section
+    marker = re.compile(r"\s*" + re.escape(commentPrefix) + r"(\+\+|--|~~)Autogenerated")
+    definitionPrefix = commentPrefix + "**"
     copying = 1
     generated = False
-    listid = 0
     output = []
+    append = output.append
     for line in input.splitlines(0):
-        isStartGenerated = line.lstrip().startswith(commentPrefix + "++Autogenerated")
-        if copying and not isStartGenerated:
-            output.append(line)
-        if isStartGenerated:
+        # Trailing whitespace is trimmed from every line as it is output
+        trimmed = line.rstrip(" \t")
+        match = marker.match(line)
+        kind = match.group(1) if match else None
+        if kind == "++":
             if retainDefs:
-                output.append(line)
+                append(trimmed)
             copying = 0
             generated = False
-        elif not copying and not generated:
+        elif copying:
+            append(trimmed)
+        elif not generated:
             # Generating
-            if line.startswith(commentPrefix + "**"):
+            if line.startswith(definitionPrefix):
                 # Pattern to transform input data
                 if retainDefs:
-                    output.append(line)
-                definition = line[len(commentPrefix + "**"):]
-                if (commentPrefix == "<!--") and (" -->" in definition):
-                    definition = definition.replace(" -->", "")
-                listid = 0
-                if definition[0] in string.digits:
-                    listid = int(definition[:1])
-                    definition = definition[2:]
-                # Hide double slashes as a control character
-                definition = definition.replace("\\\\", "\001")
-                # Do some normal C style transforms
-                definition = definition.replace("\\n", "\n")
-                definition = definition.replace("\\t", "\t")
-                # Get the doubled backslashes back as single backslashes
-                definition = definition.replace("\001", "\\")
-                startRepeat = definition.find("\\(")
-                endRepeat = definition.find("\\)")
-                intro = definition[:startRepeat]
-                out = ""
-                if intro.endswith("\n"):
-                    pos = 0
-                else:
-                    pos = len(intro)
-                out += intro
-                middle = definition[startRepeat+2:endRepeat]
-                for i in lists[listid]:
-                    item = middle.replace("\\*", i)
-                    if pos and (pos + len(item) >= 80):
-                        out += "\\\n"
-                        pos = 0
-                    out += item
-                    pos += len(item)
-                    if item.endswith("\n"):
-                        pos = 0
-                outro = definition[endRepeat+2:]
-                out += outro
-                out = out.replace("\n", lineEnd) # correct EOLs in generated content
-                output.append(out)
+                    append(trimmed)
+                out = ExpandDefinition(line[len(definitionPrefix):], commentPrefix, lists)
+                append(out.replace("\n", eol).rstrip(" \t")) # correct EOLs in generated content
             else:
                 # Simple form with no rule to transform input
-                output.extend(lists[0])
+                output.extend(item.replace("\n", eol).rstrip(" \t") for item in lists[0])
             generated = True
-        if line.lstrip().startswith(commentPrefix + "--Autogenerated") or \
-            line.lstrip().startswith(commentPrefix + "~~Autogenerated"):
+        if kind == "--" or kind == "~~":
             copying = 1
             if retainDefs:
-                output.append(line)
-    output = [line.rstrip(" \t") for line in output] # trim trailing whitespace
-    return lineEnd.join(output) + lineEnd
+                append(trimmed)
+    return eol.join(output) + eol
 
-def GenerateFile(inpath, outpath, commentPrefix, retainDefs, *lists):
+def GenerateFile(inpath, outpath, commentPrefix, retainDefs, *lists, eol=None, bom=False):
     """Generate 'outpath' from 'inpath'.
     """
 
     try:
-        with codecs.open(inpath, "r", "UTF-8") as infile:
+        with codecs.open(inpath, "r", "utf-8-sig" if bom else "UTF-8") as infile:
             original = infile.read()
         updated = CopyWithInsertion(original, commentPrefix,
-            retainDefs, lists)
-        UpdateFile(outpath, updated)
+            retainDefs, lists, eol)
+        return UpdateFile(outpath, updated, bom)
     except IOError:
         print("Can not open %s" % inpath)
 
-def Generate(inpath, outpath, commentPrefix, *lists):
+def Generate(inpath, outpath, commentPrefix, *lists, eol=None, bom=False):
     """Generate 'outpath' from 'inpath'.
     """
-    GenerateFile(inpath, outpath, commentPrefix, inpath == outpath, *lists)
+    return GenerateFile(inpath, outpath, commentPrefix, inpath == outpath, *lists, eol=eol, bom=bom)
 
-def Regenerate(filename, commentPrefix, *lists):
+def Regenerate(filename, commentPrefix, *lists, eol=None, bom=False):
     """Regenerate the given file.
     """
-    Generate(filename, filename, commentPrefix, *lists)
+    return Generate(filename, filename, commentPrefix, *lists, eol=eol, bom=bom)
 
 def UpdateLineInPlistFile(path, key, value):
     """Replace a single string value preceded by 'key' in an XML plist file.
@@ -172,11 +229,11 @@ def UpdateLineInFile(path, linePrefix, lineReplace):
     contents = lineEnd.join(lines) + lineEnd
     UpdateFile(path, contents)
 
-def UpdateFileFromLines(path, lines, lineEndToUse):
+def UpdateFileFromLines(path, lines, lineEndToUse, bom=False):
     """Join the lines with the lineEndToUse then update file if the result is different.
     """
     contents = lineEndToUse.join(lines) + lineEndToUse
-    UpdateFile(path, contents)
+    return UpdateFile(path, contents, bom)
 
 def ReplaceREInFile(path, match, replace, count=1):
     with codecs.open(path, "r", "utf-8") as f:
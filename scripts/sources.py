@@ -2,15 +2,39 @@
  SPDX-FileCopyrightText: (c) 2025 Robert Di Pardo
  SPDX-License-Identifier: 0BSD
 """
+import os
+
 # Current Notepad++ version
 TAG='v8.9.4'
 
-# Upstream Notepad++ sources
-MENUCMDID_H=f'https://raw.githubusercontent.com/notepad-plus-plus/notepad-plus-plus/refs/tags/{TAG}/PowerEditor/src/menuCmdID.h'
-RESOURCE_H=f'https://raw.githubusercontent.com/notepad-plus-plus/notepad-plus-plus/refs/tags/{TAG}/PowerEditor/src/resource.h'
-PREFERNECE_RC_H=f'https://raw.githubusercontent.com/notepad-plus-plus/notepad-plus-plus/refs/tags/{TAG}/PowerEditor/src/WinControls/Preference/preference_rc.h'
+# Root of the upstream source tree; can be pointed at a local mirror for testing
+NPP_SOURCE_ROOT=os.environ.get('NPP_DOTNET_SOURCE_ROOT',
+                               'https://raw.githubusercontent.com/notepad-plus-plus/notepad-plus-plus/refs/tags')
+
+# Scintilla's online documentation, which always describes the latest release
+SCINTILLA_DOC=os.environ.get('NPP_DOTNET_SCINTILLA_DOC', 'https://www.scintilla.org/ScintillaDoc.html')
+
+def for_tag(tag: str) -> dict[str, str]:
+    """
+    Return the URLs of the upstream sources for the given Notepad++ version.
+    """
+    root = f'{NPP_SOURCE_ROOT}/{tag}'
+    return {
+        # Upstream Notepad++ sources
+        'MENUCMDID_H': f'{root}/PowerEditor/src/menuCmdID.h',
+        'RESOURCE_H': f'{root}/PowerEditor/src/resource.h',
+        'PREFERNECE_RC_H': f'{root}/PowerEditor/src/WinControls/Preference/preference_rc.h',
+        # Upstream Scintilla sources
+        'SCINTILLA_IFACE': f'{root}/scintilla/include/Scintilla.iface',
+        'SCINTILLA_H': f'{root}/scintilla/include/Scintilla.h',
+        'VERSION_TXT': f'{root}/scintilla/version.txt',
+    }
+
+_CURRENT = for_tag(TAG)
 
-# Upstream Scintilla sources
-SCINTILLA_IFACE=f'https://raw.githubusercontent.com/notepad-plus-plus/notepad-plus-plus/refs/tags/{TAG}/scintilla/include/Scintilla.iface'
-SCINTILLA_H=f'https://raw.githubusercontent.com/notepad-plus-plus/notepad-plus-plus/refs/tags/{TAG}/scintilla/include/Scintilla.h'
-VERSION_TXT=f'https://raw.githubusercontent.com/notepad-plus-plus/notepad-plus-plus/refs/tags/{TAG}/scintilla/version.txt'
+MENUCMDID_H=_CURRENT['MENUCMDID_H']
+RESOURCE_H=_CURRENT['RESOURCE_H']
+PREFERNECE_RC_H=_CURRENT['PREFERNECE_RC_H']
+SCINTILLA_IFACE=_CURRENT['SCINTILLA_IFACE']
+SCINTILLA_H=_CURRENT['SCINTILLA_H']
+VERSION_TXT=_CURRENT['VERSION_TXT']
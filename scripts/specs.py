@@ -81,6 +81,24 @@ UNSAFE = {
     'SetRepresentation': 'Encoding.UTF8',
 }
 
+# API methods after which the remembered code page of the document no longer applies
+RESETS_CODEPAGE = [
+    'SetCodePage',
+    'SetDocPointer',
+]
+
+# API methods that copy more than one byte per position into a text range, mapped to the number of bytes
+CELL_SIZES = {
+    'GetStyledTextFull': 2,
+}
+
+# Per-position getters with a native bulk equivalent, mapped to the helper that copies a range of their values
+BULK_COPIES = {
+    'GetCharAt': 'CopyCharactersInRange',
+    'GetStyleAt': 'CopyStylesInRange',
+    'GetStyleIndexAt': 'CopyStylesInRange',
+}
+
 # API enumeratations requiring the `System.FlagsAttribute` annotation
 BITMASKS = [
     'AutomaticFold',
@@ -2,10 +2,12 @@
  SPDX-FileCopyrightText: (c) 2024 Robert Di Pardo
  SPDX-License-Identifier: 0BSD
 """
+import functools
 import os
 import re
 import subprocess
 import sys
+from typing import Iterable, Iterator, NamedTuple
 
 def get_current_user() -> str:
     return os.environ.get('USERNAME', 'user') \
@@ -26,6 +28,15 @@ def cmd_output_or_default(cmd: str, fallback: callable, default='') -> str:
 
     return result.strip()
 
+@functools.cache
+def get_copyright_holder() -> str:
+    """
+    Return the name and e-mail address of the current git user, computed once per process.
+    """
+    name = cmd_output_or_default('git config --get user.name', get_current_user)
+    email = cmd_output_or_default('git config --get user.email', get_hostname, f'{get_current_user()}@localhost')
+    return f'{name} <{email}>'
+
 def c_preproc_to_csharp(line: str, macro: re.Match) -> str:
     _1, _2 = macro.groups()
     if _1 == 'end':
@@ -35,3 +46,48 @@ def c_preproc_to_csharp(line: str, macro: re.Match) -> str:
         result = f"#{_1} {'!' if _2 == 'ndef' else ''}{define[1]}"
 
     return result
+
+# Kinds of significant lines in a C header
+DEFINE, CONDITIONAL, MARKER = 'define', 'conditional', 'marker'
+
+_MARKER = re.compile(r'(\+\+|--)Autogenerated')
+# a conditional captures exactly the groups expected by c_preproc_to_csharp; a #define captures none
+_DIRECTIVE = re.compile(r'#(if|end)(n?def|if)|\s*#define')
+_MINUS_ONE = re.compile(r'\-1$')
+
+class HeaderToken(NamedTuple):
+    """
+    A line of a C header that the generators act on.
+    """
+    kind: str
+    line: str
+    match: re.Match
+
+    @property
+    def fields(self) -> list[str]:
+        """
+        The whitespace-separated fields of a ``#define``, with a value of -1 written as an unsigned int.
+        """
+        return _MINUS_ONE.sub('0xFFFFFFFF', self.line).split()
+
+def scan_c_header(lines: Iterable[str]) -> Iterator[HeaderToken]:
+    """
+    Lazily yield the ``#define`` directives, conditional directives and autogenerated section
+    markers of a C header, given as a file object or any other iterable of lines.
+    The match of a conditional is the one expected by `c_preproc_to_csharp`; the match
+    of a marker captures ``++`` or ``--``.
+    """
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if 'Autogenerated' in line:
+            match = _MARKER.search(line)
+            if match is not None:
+                yield HeaderToken(MARKER, line, match)
+                continue
+
+        if '#' not in line:
+            continue
+
+        match = _DIRECTIVE.match(line)
+        if match is not None:
+            yield HeaderToken(DEFINE if match.group(1) is None else CONDITIONAL, line, match)
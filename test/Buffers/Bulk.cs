@@ -0,0 +1,52 @@
+﻿/*
+ * SPDX-FileCopyrightText: 2026 Robert Di Pardo <https://github.com/rdipardo>
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+namespace Npp.DotNet.Plugin.Tests.Buffers
+{
+    [TestClass]
+    public class BulkGetterTests : Harness
+    {
+        /// <summary>
+        /// Verifies that the bulk getters read past the end of the document as 0, and that styles are read
+        /// correctly across the chunks they are copied in.
+        /// </summary>
+        [TestMethod]
+        public void CopiesPositionsInBulk()
+        {
+            TryExecute(CopyPositionsInBulk);
+        }
+
+        // --------------------------------------------------------------------------------------------------
+        // Test method wrappers
+        // --------------------------------------------------------------------------------------------------
+        private void CopyPositionsInBulk()
+        {
+            // longer than the chunks that styles are copied in
+            byte[] sample = new byte[0x10000 + 100];
+            for (int i = 0; i < sample.Length; i++)
+                sample[i] = (byte)('a' + i % 26);
+            using Editor editor = new(sample);
+            ScintillaGateway sci = new(editor.Handle, false);
+
+            const int start = 0x10000 - 10, padding = 7;
+            editor.MoveGap(start + 20);
+            byte[] chars = new byte[sample.Length - start + padding];
+            sci.GetCharsInRange(start, chars);
+            CollectionAssert.AreEqual(sample[start..], chars[..^padding], "Characters were read across the gap");
+            CollectionAssert.AreEqual(new byte[padding], chars[^padding..], "Positions past the end were not read as 0");
+
+            byte[] styles = new byte[sample.Length + padding];
+            sci.GetStylesInRange(0, styles);
+            for (int i = 0; i < sample.Length; i++)
+                Assert.AreEqual(Editor.StyleOf(i), styles[i], $"Wrong style at position {i}");
+            CollectionAssert.AreEqual(new byte[padding], styles[^padding..], "Positions past the end were not read as 0");
+
+            byte[] outside = [1, 2, 3];
+            sci.GetCharsInRange(sample.Length + 1, outside);
+            CollectionAssert.AreEqual(new byte[3], outside);
+        }
+    }
+}
@@ -0,0 +1,48 @@
+﻿/*
+ * SPDX-FileCopyrightText: 2026 Robert Di Pardo <https://github.com/rdipardo>
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+using System.Text;
+
+namespace Npp.DotNet.Plugin.Tests.Buffers
+{
+    [TestClass]
+    public class DirectAccessTests : Harness
+    {
+        private static readonly byte[] SampleText = Encoding.UTF8.GetBytes("first line\nsecond line\nthird line");
+
+        /// <summary>
+        /// Verifies that a gateway with direct access sends every message through Scintilla's direct function,
+        /// and gets the same results as one that sends them to the window.
+        /// </summary>
+        [TestMethod]
+        public void CallsTheDirectFunction()
+        {
+            TryExecute(CallDirectFunction);
+        }
+
+        // --------------------------------------------------------------------------------------------------
+        // Test method wrappers
+        // --------------------------------------------------------------------------------------------------
+        private void CallDirectFunction()
+        {
+            using Editor editor = new(SampleText);
+            ScintillaGateway sci = new(editor.Handle, true);
+            Assert.IsTrue(sci.IsDirect, "The gateway did not take the direct function");
+            int messagesSent = editor.MessagesSent;
+
+            Assert.AreEqual(SampleText.Length, (int)sci.GetLength());
+            byte[] text = new byte[SampleText.Length + 1];
+            Assert.AreEqual(SampleText.Length, sci.GetText(text));
+            CollectionAssert.AreEqual(SampleText, text[..^1]);
+            byte[] range = new byte[7];
+            Assert.AreEqual(6, sci.GetTextRangeFull(11, 17, range));
+            CollectionAssert.AreEqual(SampleText[11..17], range[..^1]);
+
+            Assert.AreEqual(messagesSent, editor.MessagesSent, "A message was sent to the window instead of the direct function");
+            Assert.AreNotEqual(0, editor.DirectCalls, "The direct function was never called");
+        }
+    }
+}
@@ -0,0 +1,317 @@
+﻿/*
+ * SPDX-FileCopyrightText: 2026 Robert Di Pardo <https://github.com/rdipardo>
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+using System.Collections.Concurrent;
+using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+using System.Text;
+
+namespace Npp.DotNet.Plugin.Tests.Buffers
+{
+    /// <summary>
+    /// A message-only window that answers the Scintilla messages used to copy text out of a document,
+    /// whether they are sent to the window or passed to its direct function.
+    /// Like Scintilla, it keeps the text in a gap buffer, which is reallocated when an insertion doesn't fit in the gap.
+    /// </summary>
+    /// <remarks>
+    /// The window must be used from the thread that created it. Edits made through <see cref="Insert"/> and
+    /// <see cref="MoveGap"/> send no notifications, like edits made while Scintilla's modification event mask is off.
+    /// </remarks>
+    internal sealed unsafe partial class Editor : IDisposable
+    {
+        private const string ClassName = "Npp.DotNet.Plugin.Tests.Editor";
+        private static readonly IntPtr HWND_MESSAGE = new(-3);
+        private static readonly ConcurrentDictionary<IntPtr, Editor> Editors = new();
+        private static readonly Lazy<bool> Registered = new(Register);
+        private static long _documents;
+
+        private byte* _body;
+        private int _capacity;
+        private int _part1Length;
+        private int _gapLength;
+        private byte[] _styles = [];
+        private IntPtr _document;
+
+        public Editor(byte[] text)
+        {
+            _ = Registered.Value;
+            SetDocument(text);
+            Handle = CreateWindowExW(0, ClassName, null, 0, 0, 0, 0, 0, HWND_MESSAGE, IntPtr.Zero, IntPtr.Zero, IntPtr.Zero);
+            if (Handle == IntPtr.Zero)
+                throw new InvalidOperationException($"CreateWindowExW failed with error {Marshal.GetLastPInvokeError()}");
+            Editors[Handle] = this;
+        }
+
+        /// <summary>
+        /// The handle to pass to a <see cref="ScintillaGateway"/>.
+        /// </summary>
+        public IntPtr Handle { get; }
+
+        /// <summary>
+        /// The code page returned by <c>SCI_GETCODEPAGE</c> and set by <c>SCI_SETCODEPAGE</c>.
+        /// </summary>
+        public int CodePage { get; set; } = (int)SciMsg.SC_CP_UTF8;
+
+        /// <summary>
+        /// The values returned by <c>SCI_GETPROPERTY</c>, keyed by property name.
+        /// </summary>
+        public Dictionary<string, string> Properties { get; } = [];
+
+        /// <summary>
+        /// The number of Scintilla messages sent to the window.
+        /// </summary>
+        public int MessagesSent { get; private set; }
+
+        /// <summary>
+        /// The number of calls to the direct function returned by <c>SCI_GETDIRECTFUNCTION</c>.
+        /// </summary>
+        public int DirectCalls { get; private set; }
+
+        /// <summary>
+        /// The number of bytes in the document.
+        /// </summary>
+        public int Length => _capacity - _gapLength;
+
+        /// <summary>
+        /// The style of the byte at <paramref name="position"/> when the document was set.
+        /// </summary>
+        public static byte StyleOf(int position) => (byte)(position % 0xFF + 1);
+
+        /// <summary>
+        /// Replaces the document with a new one holding <paramref name="text"/>, as if the window were given another document.
+        /// </summary>
+        public void SetDocument(byte[] text)
+        {
+            NativeMemory.Free(_body);
+            _gapLength = 16;
+            _capacity = text.Length + _gapLength;
+            _body = (byte*)NativeMemory.AllocZeroed((nuint)_capacity);
+            text.CopyTo(new Span<byte>(_body, _capacity));
+            _part1Length = text.Length;
+            _styles = new byte[text.Length];
+            for (int i = 0; i < text.Length; i++)
+                _styles[i] = StyleOf(i);
+            _document = new IntPtr(Interlocked.Increment(ref _documents));
+        }
+
+        /// <summary>
+        /// Inserts <paramref name="text"/> at <paramref name="position"/>, reallocating the buffer if the gap is too small.
+        /// </summary>
+        public void Insert(int position, byte[] text)
+        {
+            if (text.Length >= _gapLength)
+            {
+                int grownCapacity = _capacity + text.Length + 16;
+                byte* grown = (byte*)NativeMemory.AllocZeroed((nuint)grownCapacity);
+                int part2Length = Length - _part1Length;
+                new Span<byte>(_body, _part1Length).CopyTo(new Span<byte>(grown, grownCapacity));
+                new Span<byte>(_body + _part1Length + _gapLength, part2Length)
+                    .CopyTo(new Span<byte>(grown + grownCapacity - part2Length, part2Length));
+                NativeMemory.Free(_body);
+                _body = grown;
+                _gapLength += grownCapacity - _capacity;
+                _capacity = grownCapacity;
+            }
+            MoveGap(position);
+            text.CopyTo(new Span<byte>(_body + _part1Length, _gapLength));
+            _part1Length += text.Length;
+            _gapLength -= text.Length;
+            byte[] styles = new byte[Length];
+            _styles.AsSpan(0, position).CopyTo(styles);
+            _styles.AsSpan(position).CopyTo(styles.AsSpan(position + text.Length));
+            _styles = styles;
+        }
+
+        /// <summary>
+        /// Moves the gap to <paramref name="position"/>, moving the text between its old and new positions.
+        /// </summary>
+        public void MoveGap(int position)
+        {
+            if (position < _part1Length)
+            {
+                int count = _part1Length - position;
+                Buffer.MemoryCopy(_body + position, _body + position + _gapLength, count, count);
+            }
+            else if (position > _part1Length)
+            {
+                int count = position - _part1Length;
+                Buffer.MemoryCopy(_body + _part1Length + _gapLength, _body + _part1Length, count, count);
+            }
+            _part1Length = position;
+        }
+
+        public void Dispose()
+        {
+            Editors.TryRemove(Handle, out _);
+            DestroyWindow(Handle);
+            NativeMemory.Free(_body);
+            _body = null;
+        }
+
+        private byte CharAt(long position) => position < _part1Length ? _body[position] : _body[position + _gapLength];
+
+        private IntPtr RangePointer(long position, long rangeLength)
+        {
+            if (position < _part1Length)
+            {
+                if (position + rangeLength <= _part1Length)
+                    return (IntPtr)(_body + position);
+                MoveGap((int)position);
+            }
+            return (IntPtr)(_body + position + _gapLength);
+        }
+
+        private long CopyRange(long start, long end, byte* destination, int cellSize)
+        {
+            if (end == -1)
+                end = Length;
+            for (long i = start; i < end; i++)
+            {
+                *destination++ = CharAt(i);
+                if (cellSize == 2)
+                    *destination++ = _styles[i];
+            }
+            for (int i = 0; i < cellSize; i++)
+                *destination++ = 0;
+            return (end - start) * cellSize;
+        }
+
+        private IntPtr Answer(uint msg, UIntPtr wParam, IntPtr lParam)
+        {
+            switch ((SciMsg)msg)
+            {
+                case SciMsg.SCI_GETLENGTH:
+                    return Length;
+                case SciMsg.SCI_GETCODEPAGE:
+                    return CodePage;
+                case SciMsg.SCI_SETCODEPAGE:
+                    CodePage = (int)wParam;
+                    return IntPtr.Zero;
+                case SciMsg.SCI_GETDOCPOINTER:
+                    return _document;
+                case SciMsg.SCI_GETDIRECTFUNCTION:
+                    return (IntPtr)(delegate* unmanaged[Cdecl]<IntPtr, uint, UIntPtr, IntPtr, IntPtr>)&DirectFunction;
+                case SciMsg.SCI_GETDIRECTPOINTER:
+                    return Handle;
+                case SciMsg.SCI_GETGAPPOSITION:
+                    return _part1Length;
+                case SciMsg.SCI_GETTEXT:
+                    {
+                        if (lParam == IntPtr.Zero)
+                            return Length;
+                        long length = Math.Min((long)wParam, Length);
+                        return (IntPtr)CopyRange(0, length, (byte*)lParam, 1);
+                    }
+                case SciMsg.SCI_GETLINE:
+                    {
+                        // copies the line and its end of line, without a terminating NULL
+                        long start = 0;
+                        for (long line = 0; line < (long)wParam && start < Length; start++)
+                        {
+                            if (CharAt(start) == '\n')
+                                line++;
+                        }
+                        long end = start;
+                        while (end < Length && CharAt(end++) != '\n') { }
+                        for (long i = start; lParam != IntPtr.Zero && i < end; i++)
+                            ((byte*)lParam)[i - start] = CharAt(i);
+                        return (IntPtr)(end - start);
+                    }
+                case SciMsg.SCI_GETTEXTRANGEFULL:
+                case SciMsg.SCI_GETSTYLEDTEXTFULL:
+                    {
+                        // read as Sci_TextRangeFull: { { Sci_Position cpMin; Sci_Position cpMax; } chrg; char *lpstrText; }
+                        IntPtr* range = (IntPtr*)lParam;
+                        int cellSize = (SciMsg)msg == SciMsg.SCI_GETSTYLEDTEXTFULL ? 2 : 1;
+                        return (IntPtr)CopyRange(range[0], range[1], (byte*)range[2], cellSize);
+                    }
+                case SciMsg.SCI_GETPROPERTY:
+                    {
+                        byte[] value = Encoding.UTF8.GetBytes(Properties.GetValueOrDefault(Marshal.PtrToStringUTF8((IntPtr)wParam)!, ""));
+                        if (lParam != IntPtr.Zero)
+                            value.CopyTo(new Span<byte>((byte*)lParam, value.Length + 1));
+                        return value.Length;
+                    }
+                case SciMsg.SCI_GETRANGEPOINTER:
+                    return RangePointer((long)wParam, lParam);
+                case SciMsg.SCI_GETCHARACTERPOINTER:
+                    // the gap is never empty, so the text is always followed by a NULL
+                    MoveGap(Length);
+                    _body[Length] = 0;
+                    return (IntPtr)_body;
+                default:
+                    throw new NotSupportedException($"{(SciMsg)msg} is not supported");
+            }
+        }
+
+        [UnmanagedCallersOnly(CallConvs = [typeof(CallConvStdcall)])]
+        private static IntPtr WndProc(IntPtr hWnd, uint msg, UIntPtr wParam, IntPtr lParam)
+        {
+            if (msg < (uint)SciMsg.SCI_START || !Editors.TryGetValue(hWnd, out Editor? editor))
+                return DefWindowProcW(hWnd, msg, wParam, lParam);
+            editor.MessagesSent++;
+            return editor.Answer(msg, wParam, lParam);
+        }
+
+        /// <summary>
+        /// Like Scintilla's <c>SciFnDirect</c>, which is <c>cdecl</c>; the direct pointer is the window's handle.
+        /// </summary>
+        [UnmanagedCallersOnly(CallConvs = [typeof(CallConvCdecl)])]
+        private static IntPtr DirectFunction(IntPtr ptr, uint msg, UIntPtr wParam, IntPtr lParam)
+        {
+            Editor editor = Editors[ptr];
+            editor.DirectCalls++;
+            return editor.Answer(msg, wParam, lParam);
+        }
+
+        private static bool Register()
+        {
+            fixed (char* className = ClassName)
+            {
+                WndClassEx wc = new()
+                {
+                    cbSize = (uint)sizeof(WndClassEx),
+                    lpfnWndProc = (delegate* unmanaged[Stdcall]<IntPtr, uint, UIntPtr, IntPtr, IntPtr>)&WndProc,
+                    lpszClassName = className,
+                };
+                if (RegisterClassExW(&wc) == 0)
+                    throw new InvalidOperationException($"RegisterClassExW failed with error {Marshal.GetLastPInvokeError()}");
+            }
+            return true;
+        }
+
+        [StructLayout(LayoutKind.Sequential)]
+        private struct WndClassEx
+        {
+            public uint cbSize;
+            public uint style;
+            public delegate* unmanaged[Stdcall]<IntPtr, uint, UIntPtr, IntPtr, IntPtr> lpfnWndProc;
+            public int cbClsExtra;
+            public int cbWndExtra;
+            public IntPtr hInstance;
+            public IntPtr hIcon;
+            public IntPtr hCursor;
+            public IntPtr hbrBackground;
+            public char* lpszMenuName;
+            public char* lpszClassName;
+            public IntPtr hIconSm;
+        }
+
+        [LibraryImport("user32", SetLastError = true)]
+        private static partial ushort RegisterClassExW(WndClassEx* lpwcx);
+
+        [LibraryImport("user32", SetLastError = true, StringMarshalling = StringMarshalling.Utf16)]
+        private static partial IntPtr CreateWindowExW(uint dwExStyle, string lpClassName, string? lpWindowName, uint dwStyle,
+            int x, int y, int nWidth, int nHeight, IntPtr hWndParent, IntPtr hMenu, IntPtr hInstance, IntPtr lpParam);
+
+        [LibraryImport("user32")]
+        [return: MarshalAs(UnmanagedType.Bool)]
+        private static partial bool DestroyWindow(IntPtr hWnd);
+
+        [LibraryImport("user32")]
+        private static partial IntPtr DefWindowProcW(IntPtr hWnd, uint msg, UIntPtr wParam, IntPtr lParam);
+    }
+}
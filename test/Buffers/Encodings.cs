@@ -0,0 +1,66 @@
+﻿/*
+ * SPDX-FileCopyrightText: 2026 Robert Di Pardo <https://github.com/rdipardo>
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+using System.Text;
+using Npp.DotNet.Plugin.Scintilla;
+
+namespace Npp.DotNet.Plugin.Tests.Buffers
+{
+    [TestClass]
+    public class CodePageTests : Harness
+    {
+        private static readonly byte[] SampleText = Encoding.UTF8.GetBytes("first line\nsecond line\nthird line");
+
+        /// <summary>
+        /// Lets the code page be remembered, as if the plugin forwarded its notifications.
+        /// </summary>
+        /// <param name="_">Unused</param>
+        [ClassInitialize]
+        public static void Setup(TestContext _)
+        {
+            ScintillaGateway.OnNotification(default);
+        }
+
+        /// <summary>
+        /// Verifies that the code page is queried once, then again only after a modification
+        /// or after it was set through the gateway.
+        /// </summary>
+        [TestMethod]
+        public void RemembersTheCodePage()
+        {
+            TryExecute(RememberCodePage);
+        }
+
+        // --------------------------------------------------------------------------------------------------
+        // Test method wrappers
+        // --------------------------------------------------------------------------------------------------
+        private void RememberCodePage()
+        {
+            using Editor editor = new(SampleText);
+            ScintillaGateway sci = new(editor.Handle, false);
+
+            Assert.AreEqual(Encoding.UTF8, sci.CodePage);
+            int messagesSent = editor.MessagesSent;
+            Assert.AreEqual(Encoding.UTF8, sci.CodePage);
+            Assert.AreEqual(messagesSent, editor.MessagesSent, "The remembered code page was queried again");
+
+            // changed behind the gateway's back, without a notification
+            editor.CodePage = 1252;
+            Assert.AreEqual(Encoding.UTF8, sci.CodePage);
+
+            ScNotification modified = new()
+            {
+                Header = new ScNotificationHeader { Code = (uint)SciMsg.SCN_MODIFIED },
+                ModificationType = (int)ModificationFlags.SC_MOD_INSERTTEXT,
+            };
+            ScintillaGateway.OnNotification(modified);
+            Assert.AreEqual(1252, sci.CodePage.CodePage, "The code page was not queried after a modification");
+
+            sci.SetCodePage((int)SciMsg.SC_CP_UTF8);
+            Assert.AreEqual(Encoding.UTF8, sci.CodePage, "The code page was not queried after it was set");
+        }
+    }
+}
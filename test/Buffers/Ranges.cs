@@ -0,0 +1,156 @@
+﻿/*
+ * SPDX-FileCopyrightText: 2026 Robert Di Pardo <https://github.com/rdipardo>
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+using System.Buffers;
+using System.Text;
+
+namespace Npp.DotNet.Plugin.Tests.Buffers
+{
+    [TestClass]
+    public class RangeTests : Harness
+    {
+        private static readonly byte[] SampleText = Encoding.UTF8.GetBytes("first line\nsecond line\nthird line");
+
+        /// <summary>
+        /// Verifies that a string result is only copied into a buffer with room for its terminating <c>NULL</c>,
+        /// and that trailing <c>NULL</c> bytes are not counted.
+        /// </summary>
+        [TestMethod]
+        public void CopiesStringResultsWithTheirTerminatingNull()
+        {
+            TryExecute(CopyStringResults);
+        }
+
+        /// <summary>
+        /// Verifies that a line is copied whole, although <c>SCI_GETLINE</c> takes a line number instead of a buffer length.
+        /// </summary>
+        [TestMethod]
+        public void CopiesLinesByNumber()
+        {
+            TryExecute(CopyLines);
+        }
+
+        /// <summary>
+        /// Verifies that text ranges are copied one byte per position, and styled text ranges two,
+        /// into buffers with room for the terminating <c>NULL</c>s, and that ranges outside the document are refused.
+        /// </summary>
+        [TestMethod]
+        public void CopiesTextRangesInCells()
+        {
+            TryExecute(CopyTextRanges);
+        }
+
+        /// <summary>
+        /// Verifies that properties are looked up by their whole key, whether it's encoded on the stack
+        /// or in a rented buffer.
+        /// </summary>
+        [TestMethod]
+        public void CopiesPropertiesByKey()
+        {
+            TryExecute(CopyProperties);
+        }
+
+        // --------------------------------------------------------------------------------------------------
+        // Test method wrappers
+        // --------------------------------------------------------------------------------------------------
+        private void CopyStringResults()
+        {
+            using Editor editor = new(SampleText);
+            ScintillaGateway sci = new(editor.Handle, false);
+
+            byte[] buffer = new byte[SampleText.Length + 1];
+            Assert.AreEqual(SampleText.Length, sci.GetText(buffer));
+            CollectionAssert.AreEqual(SampleText, buffer[..SampleText.Length]);
+            Assert.AreEqual(0, buffer[SampleText.Length], "The result is not NULL-terminated");
+
+            byte[] tooShort = new byte[SampleText.Length];
+            Assert.ThrowsExactly<ArgumentException>(() => sci.GetText(tooShort));
+
+            ArrayBufferWriter<byte> writer = new();
+            Assert.AreEqual(SampleText.Length, sci.GetText(writer));
+            CollectionAssert.AreEqual(SampleText, writer.WrittenSpan.ToArray());
+
+            byte[] rented = sci.GetText(ArrayPool<byte>.Shared, out int length);
+            Assert.AreEqual(SampleText.Length, length);
+            CollectionAssert.AreEqual(SampleText, rented[..length]);
+            ArrayPool<byte>.Shared.Return(rented);
+
+            editor.SetDocument([.. SampleText, 0, 0]);
+            Assert.AreEqual(SampleText.Length, sci.GetText(new byte[SampleText.Length + 3]), "Trailing NULL bytes were counted");
+        }
+
+        private void CopyLines()
+        {
+            using Editor editor = new(SampleText);
+            ScintillaGateway sci = new(editor.Handle, false);
+            string[] lines = ["first line\n", "second line\n", "third line"];
+
+            for (int line = 0; line < lines.Length; line++)
+            {
+                byte[] expected = Encoding.UTF8.GetBytes(lines[line]);
+                byte[] buffer = new byte[expected.Length + 1];
+                Assert.AreEqual(expected.Length, sci.GetLine(line, buffer), $"Line {line} has the wrong length");
+                CollectionAssert.AreEqual(expected, buffer[..expected.Length]);
+                Assert.ThrowsExactly<ArgumentException>(() => sci.GetLine(line, new byte[expected.Length]));
+            }
+        }
+
+        private void CopyTextRanges()
+        {
+            using Editor editor = new(SampleText);
+            ScintillaGateway sci = new(editor.Handle, false);
+            const int start = 6, end = 10;
+
+            byte[] text = new byte[end - start + 1];
+            Assert.AreEqual(end - start, sci.GetTextRangeFull(start, end, text));
+            CollectionAssert.AreEqual(SampleText[start..end], text[..^1]);
+            Assert.AreEqual(0, text[^1], "The range is not NULL-terminated");
+            Assert.ThrowsExactly<ArgumentException>(() => sci.GetTextRangeFull(start, end, new byte[end - start]));
+
+            byte[] rest = new byte[SampleText.Length - start + 1];
+            Assert.AreEqual(SampleText.Length - start, sci.GetTextRangeFull(start, -1, rest), "A negative end is not the end of the document");
+            CollectionAssert.AreEqual(SampleText[start..], rest[..^1]);
+            Assert.ThrowsExactly<ArgumentOutOfRangeException>(() => sci.GetTextRangeFull(-1, end, text));
+            Assert.ThrowsExactly<ArgumentOutOfRangeException>(() => sci.GetTextRangeFull(end, start, text));
+
+            byte[] cells = new byte[2 * (end - start + 1)];
+            Assert.AreEqual(2 * (end - start), sci.GetStyledTextFull(start, end, cells));
+            for (int i = 0; i < end - start; i++)
+            {
+                Assert.AreEqual(SampleText[start + i], cells[2 * i], $"Wrong character in cell {i}");
+                Assert.AreEqual(Editor.StyleOf(start + i), cells[2 * i + 1], $"Wrong style in cell {i}");
+            }
+            Assert.AreEqual(0, cells[^2] | cells[^1], "The styled range is not terminated by 2 NULLs");
+            Assert.ThrowsExactly<ArgumentException>(() => sci.GetStyledTextFull(start, end, new byte[2 * (end - start) + 1]));
+
+            ArrayBufferWriter<byte> writer = new();
+            Assert.AreEqual(2 * (end - start), sci.GetStyledTextFull(start, end, writer));
+            CollectionAssert.AreEqual(cells[..^2], writer.WrittenSpan.ToArray());
+        }
+
+        private void CopyProperties()
+        {
+            using Editor editor = new(SampleText);
+            ScintillaGateway sci = new(editor.Handle, false);
+            string longKey = new('k', 1000);
+            editor.Properties["fold"] = "1";
+            editor.Properties[longKey] = "long";
+
+            foreach ((string key, string value) in editor.Properties)
+            {
+                byte[] expected = Encoding.UTF8.GetBytes(value);
+                byte[] buffer = new byte[expected.Length + 1];
+                Assert.AreEqual(expected.Length, sci.GetProperty(key, buffer));
+                CollectionAssert.AreEqual(expected, buffer[..^1]);
+
+                ArrayBufferWriter<byte> writer = new();
+                Assert.AreEqual(expected.Length, sci.GetProperty(key, writer));
+                CollectionAssert.AreEqual(expected, writer.WrittenSpan.ToArray());
+            }
+            Assert.AreEqual(0, sci.GetProperty("fol", new byte[1]), "A key was read past its end");
+        }
+    }
+}
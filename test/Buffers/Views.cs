@@ -0,0 +1,80 @@
+﻿/*
+ * SPDX-FileCopyrightText: 2026 Robert Di Pardo <https://github.com/rdipardo>
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+using System.Text;
+using Npp.DotNet.Plugin.Scintilla;
+
+namespace Npp.DotNet.Plugin.Tests.Buffers
+{
+    [TestClass]
+    public class DocumentViewTests : Harness
+    {
+        private static readonly byte[] SampleText = Encoding.UTF8.GetBytes("first line\nsecond line\nthird line");
+
+        /// <summary>
+        /// Lets document views be created, as if the plugin forwarded its notifications.
+        /// </summary>
+        /// <param name="_">Unused</param>
+        [ClassInitialize]
+        public static void Setup(TestContext _)
+        {
+            ScintillaGateway.OnNotification(default);
+        }
+
+        /// <summary>
+        /// Verifies that document views become invalid when their document is modified, and that revalidating them
+        /// finds text that moved, or changed without a notification.
+        /// </summary>
+        [TestMethod]
+        public void InvalidatesDocumentViews()
+        {
+            TryExecute(InvalidateDocumentViews);
+        }
+
+        // --------------------------------------------------------------------------------------------------
+        // Test method wrappers
+        // --------------------------------------------------------------------------------------------------
+        private void InvalidateDocumentViews()
+        {
+            using Editor editor = new(SampleText);
+            ScintillaGateway sci = new(editor.Handle, false);
+
+            DocumentView document = sci.GetDocumentView();
+            CollectionAssert.AreEqual(SampleText, document.Span.ToArray());
+            Assert.AreSame(document, sci.GetDocumentView(), "A valid whole-document view was not reused");
+
+            DocumentView range = sci.GetDocumentView(6, 4);
+            CollectionAssert.AreEqual(SampleText[6..10], range.Span.ToArray());
+            editor.MoveGap(8);
+            Assert.IsTrue(range.IsValid, "A gap move was found without asking Scintilla");
+            Assert.IsFalse(range.Revalidate(), "The gap moved into the range without invalidating its view");
+            Assert.IsFalse(range.IsValid, "A view found to be invalid became valid again");
+
+            // taking the character pointer moves the gap back to the end, where the whole-document view expects it
+            Assert.IsTrue(document.Revalidate());
+            CollectionAssert.AreEqual(SampleText, document.Span.ToArray());
+
+            editor.Insert(0, Encoding.UTF8.GetBytes("an edit nobody was told about\n"));
+            Assert.IsFalse(document.Revalidate(), "The document changed without invalidating its view");
+            Assert.ThrowsExactly<InvalidOperationException>(() => document.Span.ToArray());
+            DocumentView edited = sci.GetDocumentView();
+            Assert.AreNotSame(document, edited);
+            Assert.AreEqual(editor.Length, edited.Length);
+
+            ScNotification modified = new()
+            {
+                Header = new ScNotificationHeader { Code = (uint)SciMsg.SCN_MODIFIED },
+                ModificationType = (int)ModificationFlags.SC_MOD_DELETETEXT,
+            };
+            ScintillaGateway.OnNotification(modified);
+            Assert.IsFalse(edited.IsValid, "A notified modification did not invalidate the view");
+
+            DocumentView replaced = sci.GetDocumentView();
+            editor.SetDocument(SampleText);
+            Assert.IsFalse(replaced.Revalidate(), "The window was given another document without invalidating its view");
+        }
+    }
+}
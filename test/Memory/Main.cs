@@ -100,6 +100,30 @@ namespace Npp.DotNet.Plugin.Tests.Memory
             TryExecute(TestLayoutOfNotificationStruct);
         }
 
+        /// <summary>
+        /// Verifies that the <c>TextRangeBuffer</c> structs passed to <c>SCI_GETTEXTRANGEFULL</c> and <c>SCI_GETSTYLEDTEXTFULL</c>
+        /// have the memory layout of Scintilla's <c>Sci_TextRangeFull</c>, i.e.:<br/>
+        /// <example>
+        /// <code>
+        /// --------------------------------------------------------------------------------------------------
+        /// |                               |              size              |             offset            |
+        /// |            field              |---------------|----------------|---------------|---------------|
+        /// |                               |      x86      |     x86_64     |      x86      |     x86_64    |
+        /// |-------------------------------|---------------|----------------|---------------|---------------|
+        /// | chrg {cpMin,cpMax}            |  {4,4} == 8   |  {8,8} == 16   |       0       |       0       |
+        /// | lpstrText                     |       4       |       8        |       8       |      16       |
+        /// |-------------------------------|---------------|----------------|---------------|---------------|
+        /// |                            =  |      12       |       24       |      12       |      24       |
+        /// --------------------------------------------------------------------------------------------------
+        /// </code>
+        /// </example>
+        /// </summary>
+        [TestMethod]
+        public void HasProperlyAlignedTextRangeStruct()
+        {
+            TryExecute(TestLayoutOfTextRangeStruct);
+        }
+
         // --------------------------------------------------------------------------------------------------
         // Test method wrappers
         // --------------------------------------------------------------------------------------------------
@@ -131,6 +155,28 @@ namespace Npp.DotNet.Plugin.Tests.Memory
             }
         }
 
+        private void TestLayoutOfTextRangeStruct()
+        {
+            uint pointerSize = _is64bit ? 8U : 4U;
+            int token = GetMetdataTokenForType("Npp.DotNet.Plugin.ScintillaGateway");
+
+            if (_module!.TryLookupMember(token, out IMetadataMember? member))
+            {
+                var typedef = ((TypeDefinition)member!).NestedTypes.FirstOrDefault(t => $"{t.Name}".Equals("TextRangeBuffer"));
+                Assert.IsNotNull(typedef, "The 'ScintillaGateway' type does not declare the 'TextRangeBuffer' type");
+                var layout = typedef.GetImpliedMemoryLayout(_context, !_is64bit);
+                var text = typedef.Fields.FirstOrDefault(f => $"{f.Name}".Equals("LpStrText", StringComparison.OrdinalIgnoreCase));
+                Assert.IsNotNull(text, "The 'TextRangeBuffer' type does not declare the 'LpStrText' field");
+                uint actual = layout[text].Offset;
+                Assert.AreEqual(2 * pointerSize, actual, $"Expected to find 'TextRangeBuffer.LpStrText' after {2 * pointerSize} bytes, not {actual}");
+                Assert.AreEqual(3 * pointerSize, layout.Size, $"Expected 'TextRangeBuffer' to be {3 * pointerSize} bytes, not {layout.Size}");
+            }
+            else
+            {
+                throw new AssertFailedException($"{ModuleName} does not define the 'ScintillaGateway' type");
+            }
+        }
+
         private void TestLayoutOfHotkeyStruct()
         {
             int token = GetMetdataTokenForType("Npp.DotNet.Plugin.ShortcutKey");